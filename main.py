@@ -5,6 +5,7 @@ Zelda-like Game - Main Entry Point
 Запуск игры в стиле классической 2D Zelda с использованием Python и Pygame.
 """
 
+import argparse
 import sys
 import os
 
@@ -14,13 +15,24 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from src.core.game import Game
 
 
+def parse_args(argv=None):
+    """Аргументы командной строки."""
+    parser = argparse.ArgumentParser(description="Zelda-like Game")
+    parser.add_argument(
+        "--stress", type=int, metavar="N", default=None,
+        help="нагрузочный режим «орда»: держать N врагов (1000 / 5000 / 20000)",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """Главная функция запуска игры"""
+    args = parse_args()
     print("Запуск Zelda-подобной игры...")
     print("Управление: WASD/Стрелки - движение, Пробел - атака, F1 - отладка, ESC - выход")
     
     try:
-        game = Game()
+        game = Game(stress_population=args.stress)
         game.run()
     except KeyboardInterrupt:
         print("\nИгра прервана пользователем")
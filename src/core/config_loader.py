@@ -5,6 +5,7 @@ Validates and loads configuration from root config.ini file
 
 import configparser
 import os
+from dataclasses import make_dataclass
 from typing import Dict, Any, Tuple
 
 
@@ -13,6 +14,98 @@ class ConfigValidationError(Exception):
     pass
 
 
+# Опциональные секции, ключи которых грузятся как <PREFIX>_<KEY>
+_GENERIC_SECTIONS = (('enemies', 'ENEMIES'),
+                     ('combat', 'COMBAT'),
+                     ('pickups', 'PICKUPS'),
+                     ('drops', 'DROPS'),
+                     ('progression', 'PROGRESSION'),
+                     ('stress', 'STRESS'),
+                     ('save', 'SAVE'),
+                     ('rewind', 'REWIND'),
+                     ('diagnostics', 'DIAGNOSTICS'))
+
+# Схема опциональных ключей: секция -> {ключ: дефолт}. Единственное место
+# с дефолтами — отсутствующий в config.ini ключ получает значение отсюда,
+# тип поля снимка и значения get_config() — по типу дефолта. Вызывающий
+# код читает cfg.<секция>.<ключ> без своих копий дефолтов.
+_SECTION_DEFAULTS = {
+    'enemies': {
+        'respawn_interval': 5.0,
+        'light_chase_radius': 120.0,
+        'heavy_chase_radius': 100.0,
+        'fast_chase_radius': 180.0,
+        'chase_lose_radius': 280.0,
+    },
+    'pickups': {
+        'coalesce_radius': 24.0,
+        'max_pickups': 400,
+        'storage': 'objects',
+    },
+    'progression': {
+        'heal_on_level_up': True,
+    },
+    'stress': {
+        'enabled': False,
+        'population': 1000,
+        'mix': (5, 2, 3),
+        'spawn_per_frame': 200,
+    },
+    'save': {
+        'format': 'json',
+        'compression': 'zlib',
+        'backend': 'files',
+        'autosave_mode': 'slots',
+        'journal_compact_every': 20,
+        'journal_position_epsilon': 32.0,
+        'journal_timer_tolerance': 0.5,
+        'lazy_restore': True,
+        'restore_radius': 768.0,
+        'restore_region': 256.0,
+        'restore_budget_ms': 4.0,
+        'thumbnails': True,
+        'thumbnail_size': 96,
+        'thumbnail_area': 1024.0,
+    },
+    'rewind': {
+        'enabled': True,
+        'seconds': 10.0,
+        'interval_frames': 6,
+        'memory_kb': 1024,
+    },
+    'diagnostics': {
+        'overlay_hz': 4.0,
+        'profiler': False,
+        'profiler_frames': 240,
+        'trace': False,
+        'trace_max_events': 500000,
+        'hitch_ms': 0.0,
+        'hitch_sample_ms': 5.0,
+        'hitch_stack_depth': 40,
+        'capture': 'off',
+        'capture_seconds': 0.0,
+        'capture_sample_ms': 10.0,
+    },
+}
+
+# Секции без обязательных ключей: всё допустимое объявлено в схеме, и
+# неизвестный ключ (опечатка в config.ini) — ошибка, а не тихий дефолт
+_CLOSED_SECTIONS = ('stress', 'save', 'rewind', 'diagnostics')
+
+
+def _coerce(value, default):
+    """Привести значение опционального ключа к типу его дефолта."""
+    if isinstance(default, bool):
+        if isinstance(value, str):
+            return value.strip().lower() in ('1', 'true', 'yes', 'on')
+        return bool(value)
+    if isinstance(default, (int, float)):
+        return type(default)(value)
+    if isinstance(default, str):
+        return str(value).strip().lower()
+    return value
+
+
 class ConfigLoader:
     """
     Configuration loader and validator class.
@@ -22,6 +115,7 @@ class ConfigLoader:
     def __init__(self):
         self._config = {}
         self._loaded = False
+        self._snapshot = None
         
     def load_config(self) -> Dict[str, Any]:
         """
@@ -57,6 +151,11 @@ class ConfigLoader:
             self._validate_drops_settings(parser)
             self._validate_progression_settings(parser)
             self._validate_autosave_settings(parser)
+            self._validate_stress_settings(parser)
+            self._validate_save_settings(parser)
+            self._validate_rewind_settings(parser)
+            self._validate_diagnostics_settings(parser)
+            self._validate_known_keys(parser)
 
             # Store validated configuration
             self._config = {
@@ -119,11 +218,7 @@ class ConfigLoader:
 
             # Загружаем все ключи из секции [enemies] - они опциональные,
             # подхватятся через get_config() как ENEMIES_<UPPERCASE_KEY>.
-            for section_name, prefix in [('enemies', 'ENEMIES'),
-                                          ('combat', 'COMBAT'),
-                                          ('pickups', 'PICKUPS'),
-                                          ('drops', 'DROPS'),
-                                          ('progression', 'PROGRESSION')]:
+            for section_name, prefix in _GENERIC_SECTIONS:
                 if not parser.has_section(section_name):
                     continue
                 for key, value in parser.items(section_name):
@@ -150,10 +245,20 @@ class ConfigLoader:
                         except ValueError:
                             self._config[upper_key] = value
 
+            # Опциональные ключи — по схеме: дефолт и тип из одного места
+            for section_name, prefix in _GENERIC_SECTIONS:
+                for key, default in _SECTION_DEFAULTS.get(section_name, {}).items():
+                    upper_key = f"{prefix}_{key.upper()}"
+                    self._config[upper_key] = _coerce(
+                        self._config.get(upper_key, default), default
+                    )
+
             # Load colors
             colors = self._load_colors(parser)
             self._config.update(colors)
-            
+
+            # Снимок строится один раз из уже провалидированного словаря
+            self._snapshot = build_config_snapshot(self._config)
             self._loaded = True
             return self._config
             
@@ -365,6 +470,18 @@ class ConfigLoader:
                 raise ConfigValidationError(f"Missing pickups.{key}")
             if parser.getint('pickups', key) <= 0:
                 raise ConfigValidationError(f"pickups.{key} must be positive")
+        # Опциональные: слияние дропа в стаки и жёсткий лимит сущностей
+        if parser.has_option('pickups', 'coalesce_radius'):
+            if parser.getfloat('pickups', 'coalesce_radius') < 0:
+                raise ConfigValidationError("pickups.coalesce_radius must be >= 0")
+        if parser.has_option('pickups', 'max_pickups'):
+            if parser.getint('pickups', 'max_pickups') <= 0:
+                raise ConfigValidationError("pickups.max_pickups must be positive")
+        if parser.has_option('pickups', 'storage'):
+            if parser.get('pickups', 'storage').lower() not in ('objects', 'array'):
+                raise ConfigValidationError(
+                    "pickups.storage must be 'objects' or 'array'"
+                )
 
     def _validate_drops_settings(self, parser):
         """Валидация секции [drops]."""
@@ -445,6 +562,126 @@ class ConfigLoader:
                     "autosave.autosave_limit must be >= 1"
                 )
 
+    def _validate_stress_settings(self, parser):
+        """Валидация секции [stress] (опциональна — режим выключен по умолчанию)."""
+        if not parser.has_section('stress'):
+            return
+        if parser.has_option('stress', 'enabled'):
+            parser.getboolean('stress', 'enabled')
+        for key in ('population', 'spawn_per_frame'):
+            if parser.has_option('stress', key):
+                if parser.getint('stress', key) <= 0:
+                    raise ConfigValidationError(f"stress.{key} must be positive")
+        if parser.has_option('stress', 'mix'):
+            mix_str = parser.get('stress', 'mix')
+            try:
+                parts = [int(x.strip()) for x in mix_str.split(',')]
+                if len(parts) != 3 or any(w < 0 for w in parts) or sum(parts) == 0:
+                    raise ValueError
+            except ValueError:
+                raise ConfigValidationError(
+                    "stress.mix must be 'light,heavy,fast' "
+                    "non-negative integer weights"
+                )
+
+    def _validate_save_settings(self, parser):
+        """Валидация секции [save] (опциональна — по умолчанию JSON)."""
+        if not parser.has_section('save'):
+            return
+        if parser.has_option('save', 'format'):
+            if parser.get('save', 'format').lower() not in ('json', 'binary'):
+                raise ConfigValidationError("save.format must be 'json' or 'binary'")
+        if parser.has_option('save', 'compression'):
+            if parser.get('save', 'compression').lower() not in ('none', 'zlib', 'lzma'):
+                raise ConfigValidationError(
+                    "save.compression must be 'none', 'zlib' or 'lzma'"
+                )
+        if parser.has_option('save', 'backend'):
+            if parser.get('save', 'backend').lower() not in ('files', 'sqlite'):
+                raise ConfigValidationError("save.backend must be 'files' or 'sqlite'")
+        if parser.has_option('save', 'autosave_mode'):
+            if parser.get('save', 'autosave_mode').lower() not in ('slots', 'journal'):
+                raise ConfigValidationError(
+                    "save.autosave_mode must be 'slots' or 'journal'"
+                )
+        if parser.has_option('save', 'journal_compact_every'):
+            if parser.getint('save', 'journal_compact_every') < 1:
+                raise ConfigValidationError("save.journal_compact_every must be >= 1")
+        for key in ('journal_position_epsilon', 'journal_timer_tolerance',
+                    'restore_radius'):
+            if parser.has_option('save', key) and parser.getfloat('save', key) < 0:
+                raise ConfigValidationError(f"save.{key} must be >= 0")
+        for key in ('restore_region', 'restore_budget_ms', 'thumbnail_size',
+                    'thumbnail_area'):
+            if parser.has_option('save', key) and parser.getfloat('save', key) <= 0:
+                raise ConfigValidationError(f"save.{key} must be > 0")
+        for key in ('lazy_restore', 'thumbnails'):
+            if parser.has_option('save', key):
+                parser.getboolean('save', key)
+
+    def _validate_rewind_settings(self, parser):
+        """Валидация секции [rewind] (опциональна — дефолты в _SECTION_DEFAULTS)."""
+        if not parser.has_section('rewind'):
+            return
+        if parser.has_option('rewind', 'enabled'):
+            parser.getboolean('rewind', 'enabled')
+        if parser.has_option('rewind', 'seconds'):
+            if parser.getfloat('rewind', 'seconds') <= 0:
+                raise ConfigValidationError("rewind.seconds must be > 0")
+        for key in ('interval_frames', 'memory_kb'):
+            if parser.has_option('rewind', key):
+                if parser.getint('rewind', key) <= 0:
+                    raise ConfigValidationError(f"rewind.{key} must be positive")
+
+    def _validate_diagnostics_settings(self, parser):
+        """Валидация секции [diagnostics] (опциональна — дефолты в _SECTION_DEFAULTS)."""
+        if not parser.has_section('diagnostics'):
+            return
+        if parser.has_option('diagnostics', 'overlay_hz'):
+            if parser.getfloat('diagnostics', 'overlay_hz') <= 0:
+                raise ConfigValidationError("diagnostics.overlay_hz must be > 0")
+        if parser.has_option('diagnostics', 'profiler'):
+            parser.getboolean('diagnostics', 'profiler')
+        if parser.has_option('diagnostics', 'profiler_frames'):
+            if parser.getint('diagnostics', 'profiler_frames') <= 0:
+                raise ConfigValidationError("diagnostics.profiler_frames must be positive")
+        if parser.has_option('diagnostics', 'trace'):
+            parser.getboolean('diagnostics', 'trace')
+        if parser.has_option('diagnostics', 'trace_max_events'):
+            if parser.getint('diagnostics', 'trace_max_events') <= 0:
+                raise ConfigValidationError("diagnostics.trace_max_events must be positive")
+        if parser.has_option('diagnostics', 'hitch_ms'):
+            if parser.getfloat('diagnostics', 'hitch_ms') < 0:
+                raise ConfigValidationError("diagnostics.hitch_ms must be >= 0 (0 disables)")
+        if parser.has_option('diagnostics', 'hitch_sample_ms'):
+            if parser.getfloat('diagnostics', 'hitch_sample_ms') <= 0:
+                raise ConfigValidationError("diagnostics.hitch_sample_ms must be > 0")
+        if parser.has_option('diagnostics', 'hitch_stack_depth'):
+            if parser.getint('diagnostics', 'hitch_stack_depth') <= 0:
+                raise ConfigValidationError("diagnostics.hitch_stack_depth must be positive")
+        if parser.has_option('diagnostics', 'capture'):
+            capture = parser.get('diagnostics', 'capture').strip().lower()
+            if capture not in ('off', 'cprofile', 'sample'):
+                raise ConfigValidationError(
+                    "diagnostics.capture must be one of: off, cprofile, sample"
+                )
+        if parser.has_option('diagnostics', 'capture_seconds'):
+            if parser.getfloat('diagnostics', 'capture_seconds') < 0:
+                raise ConfigValidationError("diagnostics.capture_seconds must be >= 0")
+        if parser.has_option('diagnostics', 'capture_sample_ms'):
+            if parser.getfloat('diagnostics', 'capture_sample_ms') <= 0:
+                raise ConfigValidationError("diagnostics.capture_sample_ms must be > 0")
+
+    def _validate_known_keys(self, parser):
+        """Закрытые секции: ключи только из _SECTION_DEFAULTS."""
+        for section in _CLOSED_SECTIONS:
+            if not parser.has_section(section):
+                continue
+            known = _SECTION_DEFAULTS[section]
+            for key in parser.options(section):
+                if key not in known:
+                    raise ConfigValidationError(f"Unknown {section}.{key}")
+
     def _load_colors(self, parser) -> Dict[str, Tuple[int, int, int]]:
         """Load and parse color values from INI format"""
         colors = {}
@@ -479,6 +716,116 @@ class ConfigLoader:
             self.load_config()
         return self._config.get(color_name, (255, 255, 255))  # Default to white
 
+    @property
+    def snapshot(self) -> 'ConfigSection':
+        """Типизированный неизменяемый снимок конфигурации."""
+        if not self._loaded:
+            self.load_config()
+        return self._snapshot
+
+
+# --- Типизированный снимок --------------------------------------------------
+#
+# get_config() в горячих циклах — это вызов функции, проверка _loaded и
+# поиск по строковому (часто f-string) ключу на каждый кадр. Снимок —
+# замороженные dataclass-секции с атрибутами: системы забирают нужные
+# значения один раз при создании (cfg.enemies.light.speed,
+# cfg.combat.enemy_knockback_speed), дальше — обычные поля объекта.
+
+# Фиксированные ключи: FLAT_KEY -> (секция, поле)
+_SNAPSHOT_FIXED_KEYS = {
+    'WIDTH': ('display', 'width'),
+    'HEIGHT': ('display', 'height'),
+    'FPS': ('display', 'fps'),
+    'WORLD_WIDTH': ('world', 'width'),
+    'WORLD_HEIGHT': ('world', 'height'),
+    'TILE_SIZE': ('world', 'tile_size'),
+    'PLAYER_SPEED': ('player', 'speed'),
+    'PLAYER_SIZE': ('player', 'size'),
+    'PLAYER_MAX_HEALTH': ('player', 'max_health'),
+    'PLAYER_SPRINT_MULTIPLIER': ('player', 'sprint_multiplier'),
+    'ATTACK_DURATION': ('attack', 'duration'),
+    'ATTACK_COOLDOWN': ('attack', 'cooldown'),
+    'ATTACK_RANGE': ('attack', 'range'),
+    'DEBUG_ENABLED': ('debug', 'enabled'),
+    'DEBUG_FONT_SIZE': ('debug', 'font_size'),
+    'OBSTACLE_COUNT': ('world_generation', 'obstacle_count'),
+    'SAFE_ZONE_SIZE': ('world_generation', 'safe_zone_size'),
+    'AUTOSAVE_ENABLED': ('autosave', 'enabled'),
+    'AUTOSAVE_INTERVAL_MINUTES': ('autosave', 'interval_minutes'),
+    'AUTOSAVE_LIMIT': ('autosave', 'limit'),
+    'AUTOSAVE_ON_LEVEL_UP': ('autosave', 'on_level_up'),
+}
+
+_SNAPSHOT_COLORS = ('WHITE', 'BLACK', 'RED', 'GREEN', 'DARK_GREEN',
+                    'DARK_GRAY', 'BROWN', 'GRAY', 'YELLOW')
+
+# Секции с подсекциями по типу врага: [drops] heavy_coin_max ->
+# cfg.drops.heavy.coin_max
+_SNAPSHOT_SUBSECTIONS = {
+    'enemies': ('light', 'heavy', 'fast'),
+    'drops': ('light', 'heavy', 'fast'),
+}
+
+
+class ConfigSection:
+    """База секций снимка. Опциональные ключи уже заполнены дефолтами
+    из _SECTION_DEFAULTS — опечатка в имени поля даёт AttributeError."""
+
+    __slots__ = ()
+
+
+_SECTION_TYPES: Dict[Tuple, type] = {}
+
+
+def _make_section(name: str, values: Dict[str, Any]) -> ConfigSection:
+    """Замороженный dataclass с полями по ключам и типами по значениям
+    (у опциональных ключей значения уже приведены к типу дефолта)."""
+    fields = tuple((key, type(value)) for key, value in values.items())
+    key = (name, fields)
+    cls = _SECTION_TYPES.get(key)
+    if cls is None:
+        class_name = ''.join(part.title() for part in name.split('_')) + 'Config'
+        cls = _SECTION_TYPES[key] = make_dataclass(
+            class_name, fields, bases=(ConfigSection,), frozen=True, slots=True
+        )
+    return cls(**values)
+
+
+def build_config_snapshot(config: Dict[str, Any]) -> ConfigSection:
+    """Собрать снимок из плоского словаря ConfigLoader."""
+    sections: Dict[str, Dict[str, Any]] = {
+        name: {} for name, _ in sorted(set(_SNAPSHOT_FIXED_KEYS.values()))
+    }
+    sections['colors'] = {}
+    for flat_key, (section, field) in _SNAPSHOT_FIXED_KEYS.items():
+        if flat_key in config:
+            sections[section][field] = config[flat_key]
+    for color in _SNAPSHOT_COLORS:
+        if color in config:
+            sections['colors'][color.lower()] = config[color]
+
+    for section, prefix in _GENERIC_SECTIONS:
+        values = sections.setdefault(section, {})
+        head = prefix + '_'
+        for flat_key, value in config.items():
+            if flat_key.startswith(head):
+                values[flat_key[len(head):].lower()] = value
+        for key, default in _SECTION_DEFAULTS.get(section, {}).items():
+            values[key] = _coerce(values.get(key, default), default)
+
+    for section, groups in _SNAPSHOT_SUBSECTIONS.items():
+        values = sections[section]
+        for group in groups:
+            head = group + '_'
+            nested = {key[len(head):]: values.pop(key)
+                      for key in list(values) if key.startswith(head)}
+            values[group] = _make_section(f'{section}_{group}', nested)
+
+    return _make_section('game', {
+        name: _make_section(name, values) for name, values in sections.items()
+    })
+
 
 # Global config loader instance
 _config_loader = ConfigLoader()
@@ -496,4 +843,9 @@ def get_config(key: str, default=None):
 
 def get_color(color_name: str) -> Tuple[int, int, int]:
     """Get color tuple by name"""
-    return _config_loader.get_color(color_name)
\ No newline at end of file
+    return _config_loader.get_color(color_name)
+
+
+def config_snapshot() -> ConfigSection:
+    """Типизированный снимок конфигурации (cfg.enemies.light.speed)."""
+    return _config_loader.snapshot
\ No newline at end of file
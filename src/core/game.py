@@ -9,38 +9,63 @@ Game - основной класс игрового цикла.
 import pygame
 import sys
 import os
+import time
 
-from src.core.config_loader import load_config, get_config, get_color
+from src.core.config_loader import load_config, config_snapshot
 from src.core.game_states import GameState
 from src.core.game_stats import GameStats
 from src.ui.menu import MainMenu
 from src.ui.game_over import GameOverScreen
+from src.ui.debug_overlay import DebugOverlay
 from src.ui.hud import HUD
+from src.ui.profiler_overlay import ProfilerOverlay
 from src.ui.save_load_menu import SaveLoadMenu
+from src.ui.stress_panel import StressPanel
 from src.utils.debug import debug
+from src.utils.frame_profiler import FrameProfiler
+from src.utils.hitch_detector import HitchDetector
+from src.utils.profile_capture import CAPTURE_MODES, ProfileCapture
 from src.utils.session_logger import SessionLogger
+from src.utils.stage_timer import StageTimer, NULL_STAGE_TIMER
+from src.utils.timer_wheel import TimerWheel
+from src.utils.trace import TRACER, trace_requested
 from src.entities.player import Player
 from src.world.world import World
+from src.systems.rewind import RewindBuffer, decode_state, encode_state
 from src.systems.save_system import SaveSystem
-from src.systems.pickup_manager import PickupManager
+from src.systems.pickup_manager import PickupManager, create_pickup_manager
+from src.systems.stress_mode import StressMode, resolve_stress_population
 
 
 # Размер игрока (32x32) - используется для центрирования в стартовом тайле.
 # В будущем стоит вынести в config.ini.
 _PLAYER_HALF = 16
 
+# Удерживать — перемотка назад ([rewind] в config.ini)
+REWIND_KEY = pygame.K_BACKSPACE
+# Панель профайлера кадра (стадии min/avg/p99 + график)
+PROFILER_KEY = pygame.K_F3
+# Запись trace-таймлайна: повторное нажатие пишет logs/trace_*.json
+TRACE_KEY = pygame.K_F4
+# Профиль живой игры в logs/: cProfile (короткое окно) и сэмплер стеков
+# (длинное окно); повторное нажатие — стоп и запись файлов
+CPROFILE_KEY = pygame.K_F7
+SAMPLER_KEY = pygame.K_F8
+
 
 class Game:
-    def __init__(self):
+    def __init__(self, stress_population: int = None):
         self.logger = SessionLogger()
 
         # Загрузка конфигурации
         self.config = load_config()
+        # Типизированный снимок: в кадре читаем поля, а не get_config()
+        self.cfg = config_snapshot()
 
         # Инициализация Pygame
         pygame.init()
         self.screen = pygame.display.set_mode(
-            (get_config('WIDTH'), get_config('HEIGHT'))
+            (self.cfg.display.width, self.cfg.display.height)
         )
         pygame.display.set_caption("Zelda-like Game")
         self.clock = pygame.time.Clock()
@@ -49,9 +74,6 @@ class Game:
         # Состояние игры
         self.state = GameState.MENU
 
-        # Главное меню
-        self.menu = MainMenu()
-
         # Игровые объекты (инициализируются при начале новой игры)
         self.world: World = None
         self.player: Player = None
@@ -63,22 +85,83 @@ class Game:
         # Тайминги игрового цикла
         self.last_time = pygame.time.get_ticks()
 
-        # Отладочная информация
+        # Отладочная информация: панель F1 снимает значения с частотой
+        # [diagnostics] overlay_hz, а не каждый кадр
         self.show_debug = False
+        diagnostics = self.cfg.diagnostics
+        overlay_hz = diagnostics.overlay_hz
+        self.debug_overlay = DebugOverlay(overlay_hz)
+        # Профайлер кадра (F3): пока панель выключена, в stage_timer стоит
+        # обычный таймер (NULL_STAGE_TIMER или StageTimer stress-режима)
+        self.frame_profiler = FrameProfiler(diagnostics.profiler_frames)
+        self.profiler_overlay = ProfilerOverlay(
+            overlay_hz, budget_ms=1000.0 / self.cfg.display.fps)
+        self.show_profiler = diagnostics.profiler
+        # Детектор фризов — по желанию ([diagnostics] hitch_ms > 0), см.
+        # enable_hitch_detector(); выключенный не стоит ничего
+        self.hitch_detector: HitchDetector = None
+        self._frame_stages: FrameProfiler = None
+        # Trace-таймлайн (F4 или ZELDA_TRACE=1): отрезки копит TRACER
+        TRACER.max_events = diagnostics.trace_max_events
+        if diagnostics.trace or trace_requested():
+            self._start_trace()
+        # Профиль по F7 / F8 или с запуска ([diagnostics] capture)
+        self.profile_capture: ProfileCapture = None
+        if diagnostics.capture in CAPTURE_MODES:
+            self.start_capture(diagnostics.capture)
 
         # Система сохранений
         self.save_system = SaveSystem()
 
+        # Главное меню: каталог сейвов сбрасывается по записям SaveSystem
+        self.menu = MainMenu(self.save_system)
+
         # Меню слотов сохранений (load/save) — создаётся лениво, чтобы не
         # инициализировать pygame.font раньше чем это понадобится. См. v0.3.2.
         self.save_load_menu: SaveLoadMenu = None
         # Куда возвращаться из SAVE_MENU: PLAYING (если открыт по F6) или MENU.
         self._save_menu_return_state = GameState.PLAYING
 
-        # Автосейв (v0.3.3): таймер периодического сейва + детектор level-up.
-        self._autosave_timer = 0.0
+        # Общее колесо таймеров сессии: обратные отсчёты игрока/врагов,
+        # истечение пикапов, периодический автосейв. Двигается только в
+        # update() состояния PLAYING — в меню игровое время стоит.
+        self.timers = TimerWheel()
+
+        # Автосейв (v0.3.3): событие периодического сейва + детектор level-up.
+        self._autosave_handle = None
         self._last_known_level = None
 
+        # Загрузка по регионам: дальние враги/пикапы сейва дозагружаются
+        # в следующих кадрах (LazyRestore). None — восстанавливать нечего.
+        self._restore = None
+
+        # Перемотка: снимок каждые interval_frames кадров, последние
+        # seconds секунд в кольцевом буфере с бюджетом памяти.
+        rewind = self.cfg.rewind
+        self._rewind_interval = rewind.interval_frames
+        self.rewind = None
+        if rewind.enabled:
+            snapshots = rewind.seconds * self.cfg.display.fps
+            self.rewind = RewindBuffer(
+                capacity=max(1, int(snapshots // self._rewind_interval)),
+                budget_bytes=rewind.memory_kb * 1024,
+            )
+        self._rewind_countdown = 0
+        self.rewinding = False
+
+        # Stress-режим «орда»: популяция из --stress или [stress] в config.ini.
+        # None = обычная игра. Замеры стадий идут в StageTimer только здесь
+        # (или для детектора фризов), иначе стоит no-op NULL_STAGE_TIMER.
+        self.stress_population = resolve_stress_population(stress_population)
+        self.stress_mode: StressMode = None
+        self.stress_panel: StressPanel = None
+        self._base_stage_timer = NULL_STAGE_TIMER
+        self.stage_timer = NULL_STAGE_TIMER
+        self._apply_stage_timer()
+
+        if diagnostics.hitch_ms > 0:
+            self.enable_hitch_detector(diagnostics.hitch_ms)
+
     # --- Логирование -------------------------------------------------------
 
     def log(self, message, level="INFO"):
@@ -90,6 +173,8 @@ class Game:
     def start_new_game(self):
         """Начать новую игру: создать мир, игрока, статистику."""
         self.log("=== ЗАПУСК НОВОЙ ИГРЫ ===", "IMPORTANT")
+        self._drop_restore()
+        self._reset_rewind()
 
         # Загружаем основной (и единственный) мир
         self.world = World(map_file=os.path.join('data', 'main_world.txt'))
@@ -97,8 +182,9 @@ class Game:
         self.log(f"Стартовая позиция (центр тайла @): ({start_x}, {start_y})")
 
         # PickupManager — система дропа/сбора пикапов
-        self.pickup_manager = PickupManager()
+        self.pickup_manager = create_pickup_manager(timers=self.timers)
         self.world.enemy_manager.pickup_manager = self.pickup_manager
+        self._apply_stage_timer()
 
         # Игрок спавнится центрированно в тайле, чтобы не пересекать
         # соседние клетки и не застревать у стенок.
@@ -108,6 +194,8 @@ class Game:
             f"оружие='{self.player.current_weapon.name}'"
         )
 
+        self._bind_session_timers()
+
         # Спавн врагов вне зоны видимости игрока
         spawned = self.world.enemy_manager.spawn_initial(
             self.player.x, self.player.y
@@ -117,21 +205,172 @@ class Game:
                  "IMPORTANT")
 
         # Сброс автосейв-таймера и базовый уровень для детектора level-up
-        self._autosave_timer = 0.0
+        self._reset_autosave_timer()
+        self.save_system.restart_journal()
         self._last_known_level = self.player.level
 
+        if self.stress_population:
+            self._start_stress_mode()
+
         # Статистика и Game Over экран
         self.game_stats = GameStats()
         self.game_over_screen = GameOverScreen(
-            get_config('WIDTH'), get_config('HEIGHT'), self.game_stats
+            self.cfg.display.width, self.cfg.display.height, self.game_stats
         )
         self.hud = HUD()
 
+        self._note_frame('new_game', enemies=spawned)
         print("Игра запущена. WASD/стрелки - движение, Space - атака, "
-              "1..4 - оружие, F1 - debug, F5 - quicksave, F6 - save menu, "
-              "F9 - quickload, ESC - меню")
+              "1..4 - оружие, F1 - debug, F4 - trace, F7/F8 - профиль, "
+              "F5 - quicksave, F6 - save menu, F9 - quickload, ESC - меню")
         self.state = GameState.PLAYING
 
+    def _apply_stage_timer(self):
+        """Подставить таймер стадий: профайлер (F3) или обычный.
+
+        Подставленный FrameProfiler начинает окно заново — в кольце только
+        кадры с полным набором замеров.
+        """
+        timer = self.frame_profiler if self.show_profiler else self._base_stage_timer
+        if timer is not self.stage_timer and isinstance(timer, FrameProfiler):
+            timer.reset()
+            if timer is self.frame_profiler:
+                self.profiler_overlay.invalidate()
+        self.stage_timer = timer
+        if self.world is not None:
+            self.world.enemy_manager.stage_timer = self.stage_timer
+
+    # --- Trace-таймлайн ----------------------------------------------------
+
+    def toggle_trace(self):
+        """F4: начать запись таймлайна или остановить и записать файл."""
+        if TRACER.recording:
+            self._finish_trace()
+        else:
+            self._start_trace()
+
+    def _start_trace(self):
+        TRACER.start()
+        self.log(f"⏺ Trace: запись таймлайна (до {TRACER.max_events} событий)",
+                 "IMPORTANT")
+
+    def _finish_trace(self):
+        """Остановить запись и сбросить буфер в logs/trace_*.json."""
+        if not TRACER.recording:
+            return None
+        TRACER.stop()
+        try:
+            path = TRACER.write()
+        except OSError as e:
+            self.log(f"Ошибка записи trace: {e}", "ERROR")
+            return None
+        finally:
+            dropped = TRACER.dropped
+            TRACER.clear()
+        note = f", отброшено {dropped}" if dropped else ""
+        self.log(f"⏹ Trace записан: {path}{note}", "IMPORTANT")
+        return path
+
+    # --- Профиль живой игры ------------------------------------------------
+
+    def toggle_capture(self, mode):
+        """F7 / F8: начать окно профиля или закончить текущее (любого режима)."""
+        if self.profile_capture is not None:
+            self.stop_capture()
+        else:
+            self.start_capture(mode)
+
+    def start_capture(self, mode):
+        diagnostics = self.cfg.diagnostics
+        self.profile_capture = ProfileCapture(
+            mode,
+            seconds=diagnostics.capture_seconds,
+            sample_interval_ms=diagnostics.capture_sample_ms,
+        )
+        self.profile_capture.start(self._world_tags())
+        limit = (f" на {self.profile_capture.seconds:g} с"
+                 if self.profile_capture.seconds > 0 else "")
+        self.log(f"⏺ Профиль ({mode}){limit}", "IMPORTANT")
+
+    def stop_capture(self):
+        """Закончить окно профиля и записать файлы в logs/."""
+        capture, self.profile_capture = self.profile_capture, None
+        if capture is None:
+            return []
+        try:
+            paths = capture.stop(self._world_tags())
+        except OSError as e:
+            self.log(f"Ошибка записи профиля: {e}", "ERROR")
+            return []
+        self.log(f"⏹ Профиль ({capture.mode}) записан: {', '.join(paths)}", "IMPORTANT")
+        return paths
+
+    def _note_frame(self, kind, **info):
+        """Событие кадра: метка на trace-таймлайне и в записи фриза."""
+        TRACER.instant(kind, **info)
+        if self.hitch_detector is not None:
+            self.hitch_detector.note(kind, **info)
+
+    def _world_tags(self):
+        """Состояние игры и население мира — метки фризов и профилей."""
+        entities = {}
+        if self.world is not None:
+            entities['enemies'] = len(self.world.enemy_manager.enemies)
+        if self.pickup_manager is not None:
+            entities['pickups'] = self.pickup_manager.count()
+        tags = {"state": self.state.value, "entities": entities}
+        if self.stress_mode is not None:
+            tags["stress_population"] = self.stress_population
+        return tags
+
+    def enable_hitch_detector(self, threshold_ms):
+        """Включить детектор фризов (до run(): сторож стартует в нём).
+
+        Кадры дольше threshold_ms — в logs/hitches_*.jsonl со стадиями,
+        событиями кадра и стеком. Разбивку по стадиям даёт FrameProfiler
+        на один кадр — он встаёт в stage_timer вместо no-op.
+        """
+        diagnostics = self.cfg.diagnostics
+        self.hitch_detector = HitchDetector(
+            threshold_ms,
+            sample_interval_ms=diagnostics.hitch_sample_ms,
+            stack_depth=diagnostics.hitch_stack_depth,
+        )
+        self._frame_stages = FrameProfiler(capacity=1)
+        self._base_stage_timer = self._frame_stages
+        self._apply_stage_timer()
+
+    def _hitch_context(self):
+        """Поля записи фриза: метки мира и стадии кадра."""
+        stages = {}
+        if isinstance(self.stage_timer, FrameProfiler):
+            stages = {key: round(ms, 3) for key, ms in self.stage_timer.last_frame().items()}
+        context = self._world_tags()
+        context["stages"] = stages
+        return context
+
+    def _trace_counters(self):
+        """Счётчики кадра на таймлайне: население мира и FPS."""
+        if self.world is not None:
+            TRACER.counter(
+                'entities', enemies=len(self.world.enemy_manager.enemies),
+                pickups=self.pickup_manager.count() if self.pickup_manager else 0,
+            )
+        TRACER.counter('fps', fps=round(self.clock.get_fps(), 1))
+
+    def _start_stress_mode(self):
+        """Включить stress-режим для текущего мира (после spawn_initial)."""
+        self._base_stage_timer = self._frame_stages or StageTimer()
+        self._apply_stage_timer()
+        self.stress_mode = StressMode(
+            self.world.enemy_manager, self.stress_population
+        )
+        self.stress_panel = StressPanel()
+        # Снимок тысяч врагов каждые несколько кадров — не для замеров
+        self.rewind = None
+        self.log(f"🔥 Stress-режим: популяция {self.stress_population} "
+                 f"{self.stress_mode.targets}", "IMPORTANT")
+
     # --- Обработка событий -------------------------------------------------
 
     def handle_events(self):
@@ -170,6 +409,16 @@ class Game:
     def _handle_playing_key(self, event):
         if event.key == pygame.K_F1:
             self.show_debug = not self.show_debug
+            self.debug_overlay.invalidate()
+        elif event.key == PROFILER_KEY:
+            self.show_profiler = not self.show_profiler
+            self._apply_stage_timer()
+        elif event.key == TRACE_KEY:
+            self.toggle_trace()
+        elif event.key == CPROFILE_KEY:
+            self.toggle_capture('cprofile')
+        elif event.key == SAMPLER_KEY:
+            self.toggle_capture('sample')
         elif event.key == pygame.K_F5:
             self.quicksave()
         elif event.key == pygame.K_F6:
@@ -251,17 +500,18 @@ class Game:
 
         if atype == "load_slot":
             slot_id = action["slot_id"]
-            save_data = self.save_system.load_from_slot(slot_id)
-            if save_data is None:
+            save = self.save_system.load_from_slot(slot_id, stream=True)
+            if save is None or not self._apply_loaded_save_data(save):
                 print(f"   ❌ Слот {slot_id}: ошибка загрузки")
                 self.save_load_menu.refresh()
                 return
-            self._apply_loaded_save_data(save_data)
             print(f"   ✅ Загружен слот {slot_id}")
             return
 
         if atype == "save_slot":
             slot_id = action["slot_id"]
+            if not self._complete_restore():
+                return
             ok = self.save_system.save_to_slot(
                 slot_id,
                 self.player,
@@ -284,12 +534,11 @@ class Game:
 
         if atype == "load_autosave":
             slot_id = action["slot_id"]
-            save_data = self.save_system.load_from_autosave(slot_id)
-            if save_data is None:
+            save = self.save_system.load_from_autosave(slot_id, stream=True)
+            if save is None or not self._apply_loaded_save_data(save):
                 print(f"   ❌ Автосейв {slot_id}: ошибка загрузки")
                 self.save_load_menu.refresh()
                 return
-            self._apply_loaded_save_data(save_data)
             print(f"   ✅ Загружен автосейв {slot_id}")
             return
 
@@ -300,42 +549,62 @@ class Game:
             self.save_load_menu.refresh()
             return
 
-    def _apply_loaded_save_data(self, save_data):
-        """Применить уже загруженные save_data к текущему состоянию игры.
+    def _apply_loaded_save_data(self, save) -> bool:
+        """Применить загруженный сейв (StreamedSave) к состоянию игры.
 
-        Та же логика, что и в quickload(), но без чтения файла.
+        Голова (игрок, мир) уже проверена; враги и пикапы читаются из
+        файла пачками прямо в менеджеры. При ``[save] lazy_restore`` до
+        первого кадра восстанавливается только то, что рядом с игроком,
+        остальное — в update() (см. LazyRestore). False — файл оборвался
+        на середине: мир восстановлен частично, игра уходит в меню.
         """
+        self._note_frame('load')
         if not self.player or not self.world:
             self.world = World(map_file=os.path.join('data', 'main_world.txt'))
             self.player = Player(0, 0)
+            self._apply_stage_timer()
         if not self.pickup_manager:
-            self.pickup_manager = PickupManager()
+            self.pickup_manager = create_pickup_manager(timers=self.timers)
             self.world.enemy_manager.pickup_manager = self.pickup_manager
         if not self.game_stats:
             self.game_stats = GameStats()
         if not self.game_over_screen:
             self.game_over_screen = GameOverScreen(
-                get_config('WIDTH'), get_config('HEIGHT'), self.game_stats
+                self.cfg.display.width, self.cfg.display.height, self.game_stats
             )
         if not self.hud:
             self.hud = HUD()
-
-        self.save_system.apply_save_data_to_player(self.player, save_data)
-        self.save_system.apply_save_data_to_world(self.world, save_data)
-        self.save_system.apply_save_data_to_enemies(
-            self.world.enemy_manager, save_data
-        )
-        self.save_system.apply_save_data_to_pickups(
-            self.pickup_manager, save_data
-        )
-        self.save_system.apply_save_data_to_game_stats(
-            self.game_stats, save_data
-        )
+        self._bind_session_timers()
+
+        self.save_system.apply_save_data_to_player(self.player, save.head)
+        self.save_system.apply_save_data_to_world(self.world, save.head)
+        self._drop_restore()
+        self._reset_rewind()
+        if self.cfg.save.lazy_restore:
+            self._restore = self.save_system.restore_lazily(
+                save, self.world.enemy_manager, self.pickup_manager,
+                on_streamed=lambda head: self.save_system.apply_save_data_to_game_stats(
+                    self.game_stats, head
+                ),
+            )
+            if not self._step_restore(0.0):
+                return False
+        else:
+            if not self.save_system.apply_save_stream(
+                save, self.world.enemy_manager, self.pickup_manager
+            ):
+                self.state = GameState.MENU
+                return False
+            self.save_system.apply_save_data_to_game_stats(
+                self.game_stats, save.head
+            )
         # Сброс автосейв-состояния под загруженного игрока, чтобы level-up
         # триггер не сработал ложно сразу после загрузки.
-        self._autosave_timer = 0.0
+        self._reset_autosave_timer()
+        self.save_system.restart_journal()
         self._last_known_level = self.player.level
         self.state = GameState.PLAYING
+        return True
 
     def _handle_game_over_key(self, event):
         if not self.game_over_screen:
@@ -359,13 +628,35 @@ class Game:
             return
 
         keys = pygame.key.get_pressed()
+        # Перемотка: пока клавиша зажата, мир идёт назад, время стоит
+        self.rewinding = bool(keys[REWIND_KEY]) and self._step_rewind()
+        if self.rewinding:
+            return
+
+        # Игровое время: дедлайны и события (автосейв, истечение пикапов)
+        self.timers.advance(dt)
+
         self.player.handle_input(keys)
-        self.player.update(dt, self.world, self.game_stats)
+        with self.stage_timer.measure('player'):
+            self.player.update(dt, self.world, self.game_stats)
+
+        # Дозагрузка сейва: регионы рядом с игроком — сразу, прочие — в бюджет
+        if self._restore is not None and not self._step_restore(dt):
+            return
+
+        # Stress-режим: держим популяцию (порционный доспавн)
+        if self.stress_mode and self.stress_mode.update(self.player.x, self.player.y):
+            self._note_frame('stress_spawn', spawned=self.stress_mode.last_spawned)
 
         # Враги патрулируют свои зоны + авто-респавн при удалении игрока
-        self.world.enemy_manager.update(
-            dt, self.player.x, self.player.y, player=self.player
-        )
+        enemy_manager = self.world.enemy_manager
+        respawned = enemy_manager.respawned_total
+        with self.stage_timer.measure('enemies'):
+            enemy_manager.update(
+                dt, self.player.x, self.player.y, player=self.player
+            )
+        if enemy_manager.respawned_total != respawned:
+            self._note_frame('respawn', spawned=enemy_manager.respawned_total - respawned)
 
         # Если игрок атакует - применяем урон врагам.
         # apply_player_attack использует attack_id, чтобы 1 атака
@@ -373,12 +664,13 @@ class Game:
         # 200-400мс на нём).
         if self.player.attacking:
             weapon = self.player.current_weapon
-            hits, kills = self.world.enemy_manager.apply_player_attack(
-                self.player.attack_id,
-                self.player.get_attack_rects(),
-                weapon.damage + self.player.damage_bonus,
-                player=self.player,
-            )
+            with self.stage_timer.measure('collision'):
+                hits, kills = self.world.enemy_manager.apply_player_attack(
+                    self.player.attack_id,
+                    self.player.get_attack_rects(),
+                    weapon.damage + self.player.damage_bonus,
+                    player=self.player,
+                )
             if kills > 0 and self.game_stats:
                 for _ in range(kills):
                     self.game_stats.record_enemy_kill(weapon.damage)
@@ -389,22 +681,73 @@ class Game:
             self.game_stats.update_position(self.player.x, self.player.y)
 
         # Контактный урон от врагов (враг касается игрока = дамаг)
-        self.world.enemy_manager.apply_contact_damage(self.player)
+        with self.stage_timer.measure('contact'):
+            self.world.enemy_manager.apply_contact_damage(self.player)
 
         # Обновление пикапов (магнит + сбор)
         if self.pickup_manager:
-            self.pickup_manager.update(dt, self.player)
+            with self.stage_timer.measure('pickups'):
+                self.pickup_manager.update(dt, self.player)
 
-        # Автосейв (v0.3.3): таймер + level-up trigger
-        self._update_autosave(dt)
+        # Автосейв (v0.3.3): level-up trigger (периодический — событие колеса)
+        self._update_autosave()
 
         # Камера следует за игроком
+        self._follow_camera()
+
+        self._record_rewind()
+
+    def _follow_camera(self):
         self.world.update_camera(
             self.player.x + self.player.width // 2,
             self.player.y + self.player.height // 2,
-            get_config('WIDTH'), get_config('HEIGHT'),
+            self.cfg.display.width, self.cfg.display.height,
         )
 
+    # --- Перемотка ---------------------------------------------------------
+
+    def _record_rewind(self):
+        """Снимок состояния в буфер перемотки раз в interval_frames кадров."""
+        if self.rewind is None or self._restore is not None:
+            return
+        self._rewind_countdown -= 1
+        if self._rewind_countdown > 0:
+            return
+        self._rewind_countdown = self._rewind_interval
+        self.rewind.push(encode_state(self.save_system.capture_state(
+            self.player, self.world, self.game_stats,
+            pickup_manager=self.pickup_manager,
+            enemy_manager=self.world.enemy_manager,
+        )))
+
+    def _step_rewind(self) -> bool:
+        """Кадр перемотки: применить снимок на шаг старше. False — нечего
+        перематывать (буфер пуст или идёт дозагрузка сейва)."""
+        if self.rewind is None or self._restore is not None:
+            return False
+        raw = self.rewind.step_back()
+        if raw is None:
+            return False
+        state = decode_state(raw)
+        ss = self.save_system
+        ss.apply_save_data_to_player(self.player, state, verbose=False)
+        ss.apply_save_data_to_enemies(self.world.enemy_manager, state, verbose=False)
+        ss.apply_save_data_to_pickups(self.pickup_manager, state, verbose=False)
+        ss.apply_save_data_to_game_stats(self.game_stats, state, verbose=False)
+        # Откат уровня — не повод для автосейва при следующем level-up
+        self._last_known_level = self.player.level
+        # После отпускания клавиши первый снимок — не раньше чем через интервал
+        self._rewind_countdown = self._rewind_interval
+        self._follow_camera()
+        return True
+
+    def _reset_rewind(self):
+        """Новая игра / загрузка: прошлое другой сессии не перематывается."""
+        if self.rewind is not None:
+            self.rewind.clear()
+        self._rewind_countdown = 0
+        self.rewinding = False
+
     # --- Отрисовка ---------------------------------------------------------
 
     def draw(self):
@@ -412,34 +755,16 @@ class Game:
             self.menu.draw(self.screen)
 
         elif self.state == GameState.PLAYING and self.player and self.world:
-            self.screen.fill(get_color('BLACK'))
-            # 1) Земля + миникарта
-            self.world.draw(self.screen, self.player.x, self.player.y)
-            # 2) Пикапы поверх земли (но под врагами)
-            if self.pickup_manager:
-                self.pickup_manager.draw(
-                    self.screen, self.world.camera_x, self.world.camera_y
-                )
-            # 3) Враги поверх земли (но под игроком)
-            self.world.enemy_manager.draw(
-                self.screen, self.world.camera_x, self.world.camera_y
-            )
-            # 4) Игрок поверх врагов
-            self.player.draw(self.screen, self.world.camera_x, self.world.camera_y)
-            # 5) Overlay (крыши/холм) поверх игрока с эффектом прозрачности
-            self.world.draw_overlay(self.screen, self.player.rect)
-            # 6) HUD
-            if self.hud:
-                self.hud.draw(self.screen, self.player)
-
-            if self.show_debug:
-                self._draw_debug_info()
-            else:
-                debug(
-                    "WASD | Shift | Space | 1..4 | F1 - Debug | "
-                    "F5 - Quicksave | F6 - Save menu | F9 - Quickload | ESC - Menu",
-                    y=get_config('HEIGHT') - 30,
+            with self.stage_timer.measure('render'):
+                self._draw_playing()
+            if self.stress_panel:
+                self.stress_panel.draw(
+                    self.screen, self.stage_timer, self.stress_mode,
+                    self.pickup_manager.count() if self.pickup_manager else 0,
+                    self.clock.get_fps(),
                 )
+            if self.show_profiler:
+                self.profiler_overlay.draw(self.screen, self.frame_profiler)
 
         elif self.state == GameState.GAME_OVER and self.game_over_screen:
             self.game_over_screen.draw(self.screen)
@@ -448,10 +773,51 @@ class Game:
                 and self.save_load_menu is not None:
             self.save_load_menu.draw(self.screen)
 
-        pygame.display.flip()
+        with self.stage_timer.measure('flip'):
+            pygame.display.flip()
+
+    def _draw_playing(self):
+        """Кадр игрового мира: земля, пикапы, враги, игрок, overlay, HUD."""
+        self.screen.fill(self.cfg.colors.black)
+        # 1) Земля + миникарта
+        with self.stage_timer.measure('world'):
+            self.world.draw(self.screen, self.player.x, self.player.y)
+        # 2) Пикапы поверх земли (но под врагами)
+        if self.pickup_manager:
+            self.pickup_manager.draw(
+                self.screen, self.world.camera_x, self.world.camera_y
+            )
+        # 3) Враги поверх земли (но под игроком)
+        self.world.enemy_manager.draw(
+            self.screen, self.world.camera_x, self.world.camera_y
+        )
+        # 4) Игрок поверх врагов
+        self.player.draw(self.screen, self.world.camera_x, self.world.camera_y)
+        # 5) Overlay (крыши/холм) поверх игрока с эффектом прозрачности
+        with self.stage_timer.measure('overlay'):
+            self.world.draw_overlay(self.screen, self.player.rect)
+        # 6) HUD
+        if self.hud:
+            with self.stage_timer.measure('hud'):
+                self.hud.draw(self.screen, self.player)
+
+        if self.rewinding:
+            debug("<< Перемотка", x=self.cfg.display.width // 2 - 60, y=40)
+        if self.show_debug:
+            self._draw_debug_info()
+        else:
+            debug(
+                "WASD | Shift | Space | 1..4 | Backspace - Rewind | F1 - Debug | "
+                "F3 - Profiler | F5 - Quicksave | F6 - Save menu | F9 - Quickload | ESC - Menu",
+                y=self.cfg.display.height - 30,
+            )
 
     def _draw_debug_info(self):
-        info = [
+        self.debug_overlay.draw(self.screen, self._debug_lines)
+
+    def _debug_lines(self):
+        """Строки панели F1 (вызывается с частотой DebugOverlay)."""
+        return [
             f"Player: ({int(self.player.x)}, {int(self.player.y)})",
             f"HP: {self.player.health}/{self.player.max_health}"
             f" | Lv.{self.player.level}"
@@ -463,59 +829,124 @@ class Game:
             f"Attacking: {self.player.attacking} (id={self.player.attack_id})",
             f"Enemies alive: {self.world.enemy_manager.alive_count()} "
             f"({self.world.enemy_manager.alive_by_type()})",
-            f"Pickups: {self.pickup_manager.count() if self.pickup_manager else 0}",
+            f"Pickups: {self.pickup_manager.count() if self.pickup_manager else 0}"
+            + (f" | Restore pending: {self._restore.pending}" if self._restore else ""),
             f"Kills: {self.game_stats.enemies_killed if self.game_stats else 0}",
             f"FPS: {int(self.clock.get_fps())}",
             "Controls: WASD - Move, Shift - Sprint, Space - Attack, 1..4 - Weapon",
-            "F1 - Debug, F5 - Quicksave, F6 - Save menu, F9 - Quickload, ESC - Menu",
+            "F1 - Debug, F3 - Profiler, F4 - Trace, F7 - cProfile, F8 - Sampler",
+            "F5 - Quicksave, F6 - Save menu, F9 - Quickload, ESC - Menu",
         ]
-        y = 10
-        for line in info:
-            debug(line, y=y)
-            y += 20
+
+    # --- Дозагрузка сейва --------------------------------------------------
+
+    def _step_restore(self, dt, complete=False) -> bool:
+        """Шаг LazyRestore вокруг игрока (``complete`` — до конца).
+
+        False — сейв оборвался, игра уходит в меню.
+        """
+        restore = self._restore
+        if restore is None:
+            return True
+        cx = self.player.x + self.player.width / 2
+        cy = self.player.y + self.player.height / 2
+        with TRACER.span('load.restore_step', cat='save', complete=complete):
+            ok = restore.finish(cx, cy) if complete else restore.step(dt, cx, cy)
+        if self.hitch_detector is not None:
+            self.hitch_detector.note('restore_step', complete=complete)
+        if not ok:
+            self._restore = None
+            self.state = GameState.MENU
+            return False
+        if restore.done:
+            self._restore = None
+        return True
+
+    def _complete_restore(self) -> bool:
+        """Довосстановить мир перед сейвом — в файл должны попасть все
+        враги и пикапы, а не только уже загруженные."""
+        if self._restore is None:
+            return True
+        if self._step_restore(0.0, complete=True):
+            return True
+        print("Сейв оборвался при загрузке — сохранение отменено")
+        return False
+
+    def _drop_restore(self):
+        if self._restore is not None:
+            self._restore.close()
+            self._restore = None
 
     # --- Автосейвы (v0.3.3) -----------------------------------------------
 
-    def _update_autosave(self, dt):
-        """Тик автосейва: периодический по таймеру + триггер на level-up.
+    def _update_autosave(self):
+        """Триггер автосейва на level-up.
+
+        Периодический автосейв — событие колеса таймеров, см.
+        _reset_autosave_timer().
 
         Полностью отключается флагом ``AUTOSAVE_ENABLED=false`` в config.ini.
         """
-        if not get_config('AUTOSAVE_ENABLED', True):
+        autosave = self.cfg.autosave
+        if not autosave.enabled:
             return
         if not self.player or not self.world:
             return
 
         # Триггер по level-up — детектируем по изменению player.level
-        if get_config('AUTOSAVE_ON_LEVEL_UP', True):
+        if autosave.on_level_up:
             current_level = self.player.level
             if self._last_known_level is None:
                 self._last_known_level = current_level
             elif current_level > self._last_known_level:
                 self._last_known_level = current_level
+                self._note_frame('level_up', level=current_level)
                 self.trigger_autosave(reason="level_up")
-                self._autosave_timer = 0.0  # не дублируем периодиком сразу
-                return
+                self._reset_autosave_timer()  # не дублируем периодиком сразу
             else:
                 self._last_known_level = current_level
 
-        # Периодический автосейв
-        interval_min = float(get_config('AUTOSAVE_INTERVAL_MINUTES', 5.0))
+    def _reset_autosave_timer(self):
+        """(Пере)запланировать периодический автосейв на колесе таймеров."""
+        if self._autosave_handle is not None:
+            self._autosave_handle.cancel()
+            self._autosave_handle = None
+        if not self.cfg.autosave.enabled:
+            return
+        interval_min = float(self.cfg.autosave.interval_minutes)
         interval_sec = max(1.0, interval_min * 60.0)
-        self._autosave_timer += dt
-        if self._autosave_timer >= interval_sec:
-            self._autosave_timer = 0.0
-            self.trigger_autosave(reason="periodic")
+        self._autosave_handle = self.timers.schedule(
+            interval_sec, self._on_autosave_due
+        )
+
+    def _on_autosave_due(self):
+        self._autosave_handle = None
+        self.trigger_autosave(reason="periodic")
+        self._reset_autosave_timer()
+
+    def _bind_session_timers(self):
+        """Перевести игрока, врагов и пикапы на общее колесо таймеров."""
+        if self.player:
+            self.player.bind_timers(self.timers)
+        if self.world:
+            self.world.enemy_manager.bind_timers(self.timers)
+        if self.pickup_manager:
+            self.pickup_manager.bind_timers(self.timers)
 
     def trigger_autosave(self, reason: str = "manual") -> bool:
         """Записать автосейв с указанной причиной (periodic / level_up / ...).
 
-        Безопасно вызывать вне игры (вернёт False).
+        В кадре — только снимок состояния; запись идёт в фоне, результат
+        попадает в лог из колбэка. Возвращает True, если автосейв поставлен
+        в очередь. Безопасно вызывать вне игры (вернёт False).
         """
         if not self.player or not self.world:
             return False
-        limit = int(get_config('AUTOSAVE_LIMIT', 3))
-        ok = self.save_system.autosave(
+        if not self._complete_restore():
+            return False
+        limit = int(self.cfg.autosave.limit)
+        self._note_frame('autosave', reason=reason)
+        return self.save_system.autosave_async(
             self.player,
             self.world,
             game_stats=self.game_stats,
@@ -523,15 +954,25 @@ class Game:
             enemy_manager=self.world.enemy_manager,
             reason=reason,
             limit=limit,
+            on_complete=lambda path, error: self._on_autosave_written(
+                reason, path, error
+            ),
         )
-        if ok:
-            self.log(f"🕐 Автосейв ({reason})", "INFO")
-        return ok
+
+    def _on_autosave_written(self, reason, filepath, error):
+        """Колбэк фоновой записи (вызывается в потоке SaveWriter)."""
+        if error is None:
+            self.log(f"🕐 Автосейв ({reason}): {os.path.basename(filepath)}", "INFO")
+        else:
+            self.log(f"Ошибка автосейва ({reason}): {error}", "ERROR")
 
     # --- Сохранения --------------------------------------------------------
 
     def quicksave(self):
         if self.player and self.world:
+            if not self._complete_restore():
+                return
+            self._note_frame('save')
             ok = self.save_system.save_game(
                 self.player,
                 self.world,
@@ -549,59 +990,59 @@ class Game:
             print("   ❌ Файл сохранения не найден")
             return
 
-        save_data = self.save_system.load_game()
-        if not save_data:
+        save = self.save_system.load_game(stream=True)
+        if save is None or not self._apply_loaded_save_data(save):
             print("   ❌ Ошибка - данные повреждены")
             return
-
-        # Создаём мир/игрока, если игра ещё не запущена
-        if not self.player or not self.world:
-            self.world = World(map_file=os.path.join('data', 'main_world.txt'))
-            self.player = Player(0, 0)
-        if not self.pickup_manager:
-            self.pickup_manager = PickupManager()
-            self.world.enemy_manager.pickup_manager = self.pickup_manager
-        if not self.game_stats:
-            self.game_stats = GameStats()
-        if not self.game_over_screen:
-            self.game_over_screen = GameOverScreen(
-                get_config('WIDTH'), get_config('HEIGHT'), self.game_stats
-            )
-        if not self.hud:
-            self.hud = HUD()
-
-        self.save_system.apply_save_data_to_player(self.player, save_data)
-        self.save_system.apply_save_data_to_world(self.world, save_data)
-        self.save_system.apply_save_data_to_enemies(
-            self.world.enemy_manager, save_data
-        )
-        self.save_system.apply_save_data_to_pickups(
-            self.pickup_manager, save_data
-        )
-        self.save_system.apply_save_data_to_game_stats(
-            self.game_stats, save_data
-        )
-        # Сброс автосейв-состояния (см. _apply_loaded_save_data)
-        self._autosave_timer = 0.0
-        self._last_known_level = self.player.level
-        self.state = GameState.PLAYING
         print("   ✅ Игра загружена! (F9)")
 
     # --- Главный цикл ------------------------------------------------------
 
+    def _begin_frame(self):
+        """Граница кадров: закрыть замеры прошлого кадра, проверить фриз."""
+        now = time.perf_counter()
+        if isinstance(self.stage_timer, FrameProfiler):
+            self.stage_timer.begin_frame(now)
+        if self.profile_capture is not None and self.profile_capture.expired(now):
+            self.stop_capture()
+        if self.hitch_detector is None:
+            return
+        hitch = self.hitch_detector.begin_frame(now, self._hitch_context)
+        if hitch is not None:
+            events = ", ".join(e["event"] for e in hitch["events"]) or "-"
+            self.log(f"⚠ Фриз {hitch['frame_ms']:.0f} мс (события: {events}) "
+                     f"-> {self.hitch_detector.log_path}", "INFO")
+
     def run(self):
+        if self.hitch_detector is not None:
+            self.hitch_detector.start()
         while self.running:
             current_time = pygame.time.get_ticks()
             dt = (current_time - self.last_time) / 1000.0
             self.last_time = current_time
             dt = min(dt, 1.0 / 30.0)  # capping для физической стабильности
 
-            self.handle_events()
-            self.update(dt)
-            self.draw()
-
-            self.clock.tick(get_config('FPS'))
-
+            self._begin_frame()
+            with TRACER.span('frame'):
+                with TRACER.span('events'), self.stage_timer.measure('events'):
+                    self.handle_events()
+                with TRACER.span('update'):
+                    self.update(dt)
+                with TRACER.span('draw'):
+                    self.draw()
+            if TRACER.recording:
+                self._trace_counters()
+
+            with TRACER.span('tick'):
+                self.clock.tick(self.cfg.display.fps)
+
+        if self.hitch_detector is not None:
+            self.hitch_detector.stop()
+        # Недописанный автосейв не теряем
+        self.save_system.shutdown()
+        # Запись сейва выше тоже попадает в trace
+        self._finish_trace()
+        self.stop_capture()
         self.log("=== СЕССИЯ ЗАВЕРШЕНА ===", "IMPORTANT")
         self.logger.close()
         pygame.quit()
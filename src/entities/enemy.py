@@ -4,16 +4,20 @@
 - Композиция > наследование: Enemy агрегирует EnemyStats и AIBehavior.
   Подклассы только меняют дефолты статов и стратегии. Это позволяет
   легко добавить десятки врагов без иерархии классов.
-- Стат-данные читаются из config.ini через get_config() - баланс
+- Стат-данные читаются из config.ini (снимок config_snapshot()) - баланс
   меняется без правки кода.
 - Каждый враг имеет patrol_zone (pygame.Rect) - замкнутая область
   патрулирования. Поведение уважает зону.
 """
+import itertools
 from dataclasses import dataclass
 from typing import Tuple
 import pygame
-from src.core.config_loader import get_config
+from src.core.config_loader import config_snapshot
 from src.entities.enemy_ai import AIBehavior, PatrolBehavior, ChaseBehavior
+from src.utils.timer_wheel import Clock, Countdown, bind_countdowns
+# Сквозной номер врага: по нему журнал автосейвов сопоставляет строки
+_UIDS = itertools.count(1)
 @dataclass
 class EnemyStats:
     """Статы одного типа врага. Берутся из config.ini."""
@@ -26,8 +30,16 @@ class EnemyStats:
     damage: int  # урон игроку при будущем контактном бое
 class Enemy:
     """Базовый враг с HP, AI и базовой отрисовкой."""
+    # Обратные отсчёты — дедлайны на self.timers, каждый кадр не тикают
+    knockback_timer = Countdown()
+    attack_cooldown_timer = Countdown()
+    _patrol_timer = Countdown()  # таймаут текущей цели PatrolBehavior
     def __init__(self, x, y, stats: EnemyStats, ai: AIBehavior,
-                 patrol_zone: pygame.Rect):
+                 patrol_zone: pygame.Rect, timers=None):
+        # Свои часы двигаем в update(); общие (EnemyManager/Game) — владелец
+        self._owns_timers = timers is None
+        self.timers = timers if timers is not None else Clock()
+        self.uid = next(_UIDS)
         self.x = float(x)
         self.y = float(y)
         self.stats = stats
@@ -50,22 +62,27 @@ class Enemy:
         self.attack_cooldown_timer = 0.0
         # Флаг: враг вплотную к игроку (позиция откачена из-за коллизии)
         self.touching_player = False
+    def bind_timers(self, timers) -> None:
+        """Перейти на общие часы, сохранив остаток обратных отсчётов."""
+        self._owns_timers = False
+        bind_countdowns(self, timers)
     def take_damage(self, amount: int) -> None:
         self.health = max(0, self.health - amount)
         self.last_hit_time = pygame.time.get_ticks()
     def is_dead(self) -> bool:
         return self.health <= 0
+    def is_flashing(self, now_ms: int) -> bool:
+        """Идёт ли hit-flash (белая вспышка после попадания)."""
+        return now_ms - self.last_hit_time < self.HIT_FLASH_DURATION_MS
     def update(self, dt: float, world, player=None) -> None:
+        if self._owns_timers:
+            self.timers.advance(dt)
         if self.is_dead():
             return
-        # Тик attack cooldown
-        if self.attack_cooldown_timer > 0:
-            self.attack_cooldown_timer = max(0.0, self.attack_cooldown_timer - dt)
         # Запоминаем позицию до движения
         old_x, old_y = self.x, self.y
         # Knockback приоритетнее AI
         if self.knockback_timer > 0:
-            self.knockback_timer -= dt
             new_x = self.x + self.knockback_vx * dt
             new_y = self.y + self.knockback_vy * dt
             import pygame as _pg
@@ -79,10 +96,11 @@ class Enemy:
                 self.y = new_y
                 self.rect.x = int(new_x)
                 self.rect.y = int(new_y)
-            if self.knockback_timer <= 0:
-                self.knockback_vx = 0.0
-                self.knockback_vy = 0.0
             return
+        if self.knockback_vx or self.knockback_vy:
+            # Knockback истёк — гасим скорость один раз
+            self.knockback_vx = 0.0
+            self.knockback_vy = 0.0
         self.ai.update(self, dt, world, player)
         # После AI: не допускаем пересечения с хитбоксом игрока
         if player is not None and self.rect.colliderect(player.rect):
@@ -103,8 +121,7 @@ class Enemy:
                 sx > screen.get_width() or sy > screen.get_height()):
             return
         # Flash при попадании
-        now = pygame.time.get_ticks()
-        if now - self.last_hit_time < self.HIT_FLASH_DURATION_MS:
+        if self.is_flashing(pygame.time.get_ticks()):
             color = (255, 255, 255)
         else:
             color = self.stats.color
@@ -127,22 +144,26 @@ class Enemy:
                 f"pos=({int(self.x)}, {int(self.y)}))")
 def _stats_from_config(prefix: str, name: str) -> EnemyStats:
     """Прочитать EnemyStats из секции [enemies] config.ini."""
+    cfg = getattr(config_snapshot().enemies, prefix.lower())
     return EnemyStats(
         name=name,
-        max_health=get_config(f'ENEMIES_{prefix}_MAX_HEALTH'),
-        speed=float(get_config(f'ENEMIES_{prefix}_SPEED')),
-        width=get_config(f'ENEMIES_{prefix}_SIZE'),
-        height=get_config(f'ENEMIES_{prefix}_SIZE'),
-        color=get_config(f'ENEMIES_{prefix}_COLOR'),
-        damage=get_config(f'ENEMIES_{prefix}_DAMAGE'),
+        max_health=cfg.max_health,
+        speed=float(cfg.speed),
+        width=cfg.size,
+        height=cfg.size,
+        color=cfg.color,
+        damage=cfg.damage,
     )
+def _chase_radii(prefix: str) -> Tuple[float, float]:
+    """Радиусы погони типа врага: (chase_radius, lose_radius)."""
+    enemies = config_snapshot().enemies
+    return getattr(enemies, prefix).chase_radius, enemies.chase_lose_radius
 class LightEnemy(Enemy):
     """Лёгкий враг: малый, средний по скорости, 1 HP."""
     TYPE_ID = 'light'
     @classmethod
     def create(cls, x, y, patrol_zone) -> 'LightEnemy':
-        chase_r = get_config('ENEMIES_LIGHT_CHASE_RADIUS', 120)
-        lose_r = get_config('ENEMIES_CHASE_LOSE_RADIUS', 280)
+        chase_r, lose_r = _chase_radii('light')
         ai = ChaseBehavior(chase_radius=chase_r, lose_radius=lose_r,
                            patrol_fallback=PatrolBehavior())
         return cls(x, y,
@@ -154,8 +175,7 @@ class HeavyEnemy(Enemy):
     TYPE_ID = 'heavy'
     @classmethod
     def create(cls, x, y, patrol_zone) -> 'HeavyEnemy':
-        chase_r = get_config('ENEMIES_HEAVY_CHASE_RADIUS', 100)
-        lose_r = get_config('ENEMIES_CHASE_LOSE_RADIUS', 280)
+        chase_r, lose_r = _chase_radii('heavy')
         ai = ChaseBehavior(chase_radius=chase_r, lose_radius=lose_r,
                            patrol_fallback=PatrolBehavior(repath_interval=3.0))
         return cls(x, y,
@@ -167,8 +187,7 @@ class FastEnemy(Enemy):
     TYPE_ID = 'fast'
     @classmethod
     def create(cls, x, y, patrol_zone) -> 'FastEnemy':
-        chase_r = get_config('ENEMIES_FAST_CHASE_RADIUS', 180)
-        lose_r = get_config('ENEMIES_CHASE_LOSE_RADIUS', 280)
+        chase_r, lose_r = _chase_radii('fast')
         ai = ChaseBehavior(chase_radius=chase_r, lose_radius=lose_r,
                            patrol_fallback=PatrolBehavior(repath_interval=1.2))
         return cls(x, y,
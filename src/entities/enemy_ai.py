@@ -92,8 +92,8 @@ class PatrolBehavior(AIBehavior):
             enemy._patrol_timer = t
 
     def update(self, enemy, dt, world, player=None):
+        # _patrol_timer — Countdown на часах врага: сам убывает со временем
         self._ensure_target(enemy)
-        enemy._patrol_timer -= dt
 
         target_x, target_y = enemy._patrol_target
         dx = target_x - enemy.x
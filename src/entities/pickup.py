@@ -7,35 +7,112 @@ Pickup — предметы, выпадающие из врагов.
 - XPOrbPickup: даёт XP
 
 Каждый пикап рисуется простой геометрией (без спрайтов).
+
+Пикап несёт value — сколько «штук» в нём слито. Монеты и XP стакаются
+(STACKABLE): PickupManager сливает близкий дроп одного типа в один пикап,
+эффект при сборе умножается на value.
 """
+import itertools
 import math
 import pygame
 from abc import ABC, abstractmethod
-from src.core.config_loader import get_config
+from src.core.config_loader import config_snapshot
+from src.utils.timer_wheel import Clock
+
+# Сквозной номер пикапа: по нему журнал автосейвов сопоставляет строки
+_UIDS = itertools.count(1)
 
 
 class Pickup(ABC):
     """Базовый класс пикапа."""
 
     SIZE = 12  # размер хитбокса
+    # Можно ли сливать близкие пикапы этого типа в стак
+    STACKABLE = False
+    # Поле [pickups] с наградой за одну штуку (читается при создании)
+    REWARD_KEY = None
 
-    def __init__(self, x: float, y: float):
+    def __init__(self, x: float, y: float, value: int = 1):
+        self.uid = next(_UIDS)
         self.x = x
         self.y = y
         self.rect = pygame.Rect(int(x), int(y), self.SIZE, self.SIZE)
-        self.lifetime = get_config('PICKUPS_LIFETIME', 30.0)
+        # Lifetime — дедлайн на часах: одиночный пикап владеет своими и
+        # двигает их в update(), PickupManager переводит пикап на общие
+        # часы и планирует истечение событием TimerWheel.
+        self.timers = Clock()
+        self._owns_timers = True
+        # Колбэк менеджера: вызывается при ручной смене lifetime,
+        # чтобы перепланировать истечение.
+        self._on_lifetime_change = None
+        self._expiry_handle = None
+        cfg = self._cfg = config_snapshot().pickups
+        self._expires_at = float(cfg.lifetime)
         self.collected = False
+        self.value = int(value)
+        # Награда за штуку — apply() не ходит в конфиг на каждый сбор
+        self.amount = getattr(cfg, self.REWARD_KEY) if self.REWARD_KEY else 0
+
+    def absorb(self, other: 'Pickup') -> None:
+        """Влить другой пикап того же типа в этот стак.
+
+        Срок жизни стака — по более «свежему» из двух.
+        """
+        self.value += other.value
+        if other.lifetime > self.lifetime:
+            self.lifetime = other.lifetime
+        other.value = 0
+        other.collected = True
+
+    # --- Lifetime -------------------------------------------------------------
+
+    @property
+    def lifetime(self) -> float:
+        """Оставшееся время жизни (сек)."""
+        return self._expires_at - self.timers.now
+
+    @lifetime.setter
+    def lifetime(self, value: float) -> None:
+        self._expires_at = self.timers.now + float(value)
+        if self._on_lifetime_change is not None:
+            self._on_lifetime_change(self)
+
+    @property
+    def expires_at(self) -> float:
+        """Момент истечения на текущих часах пикапа."""
+        return self._expires_at
+
+    def bind_timers(self, timers, on_lifetime_change=None) -> None:
+        """Перейти на внешние часы, сохранив оставшийся lifetime."""
+        remaining = self.lifetime
+        self.timers = timers
+        self._owns_timers = False
+        self._expires_at = timers.now + remaining
+        self._on_lifetime_change = on_lifetime_change
+
+    # --- Обновление -------------------------------------------------------------
 
     def update(self, dt: float, player) -> None:
-        """Обновление: магнит + сбор + lifetime."""
-        self.lifetime -= dt
+        """Автономное обновление: lifetime + магнит + сбор.
+
+        PickupManager этот метод не вызывает — истечение приходит событием
+        его колеса таймеров, а attract() зовётся только рядом с игроком.
+        """
+        if self._owns_timers:
+            self.timers.advance(dt)
         if self.lifetime <= 0:
             self.collected = True
             return
 
-        magnet_r = get_config('PICKUPS_MAGNET_RADIUS', 60)
-        magnet_s = get_config('PICKUPS_MAGNET_SPEED', 260)
+        self.attract(dt, player, self._cfg.magnet_radius, self._cfg.magnet_speed)
 
+    def attract(self, dt: float, player, magnet_r: float, magnet_s: float) -> bool:
+        """Магнит к игроку + сбор по коллизии.
+
+        Возвращает True если пикап сдвинулся (менеджеру нужно обновить
+        его ячейку в сетке).
+        """
+        moved = False
         dx = player.x + player.width / 2 - (self.x + self.SIZE / 2)
         dy = player.y + player.height / 2 - (self.y + self.SIZE / 2)
         dist = math.hypot(dx, dy)
@@ -48,11 +125,13 @@ class Pickup(ABC):
             self.y += ny * magnet_s * dt
             self.rect.x = int(self.x)
             self.rect.y = int(self.y)
+            moved = True
 
         # Сбор по коллизии
         if self.rect.colliderect(player.rect):
             self.apply(player)
             self.collected = True
+        return moved
 
     @abstractmethod
     def apply(self, player) -> None:
@@ -71,9 +150,10 @@ class Pickup(ABC):
 class HeartPickup(Pickup):
     """Восстанавливает HP."""
 
+    REWARD_KEY = 'heart_heal_amount'
+
     def apply(self, player) -> None:
-        amount = get_config('PICKUPS_HEART_HEAL_AMOUNT', 1)
-        player.heal(amount)
+        player.heal(self.amount * self.value)
 
     def draw(self, screen, camera_x, camera_y):
         sx = int(self.x - camera_x) + self.SIZE // 2
@@ -84,11 +164,13 @@ class HeartPickup(Pickup):
 
 
 class CoinPickup(Pickup):
-    """Добавляет монету."""
+    """Добавляет монету (value монет для стака)."""
+
+    STACKABLE = True
+    REWARD_KEY = 'coin_value'
 
     def apply(self, player) -> None:
-        amount = get_config('PICKUPS_COIN_VALUE', 1)
-        player.stats.add_coins(amount)
+        player.stats.add_coins(self.amount * self.value)
 
     def draw(self, screen, camera_x, camera_y):
         sx = int(self.x - camera_x) + self.SIZE // 2
@@ -105,11 +187,13 @@ class CoinPickup(Pickup):
 
 
 class XPOrbPickup(Pickup):
-    """Даёт XP."""
+    """Даёт XP (value орбов для стака)."""
+
+    STACKABLE = True
+    REWARD_KEY = 'xp_orb_value'
 
     def apply(self, player) -> None:
-        amount = get_config('PICKUPS_XP_ORB_VALUE', 5)
-        player.stats.gain_xp(amount)
+        player.stats.gain_xp(self.amount * self.value)
 
     def draw(self, screen, camera_x, camera_y):
         sx = int(self.x - camera_x) + self.SIZE // 2
@@ -1,12 +1,16 @@
 import pygame
 import math
-from src.core.config_loader import get_config, get_color
+from src.core.config_loader import get_config, config_snapshot
 from src.entities.weapons import Weapon, default_loadout
 from src.entities.player_stats import PlayerStats
 from src.entities.player_combat import PlayerCombat
+from src.utils.timer_wheel import Countdown, bind_countdowns
 
 
 class Player:
+    # Остаток knockback — дедлайн на self.timers (часы PlayerStats)
+    knockback_timer = Countdown()
+
     def __init__(self, x, y):
         # Позиция игрока
         self.x = x
@@ -30,6 +34,8 @@ class Player:
         # Делегаты: здоровье и боевая система
         self._stats = PlayerStats(get_config('PLAYER_MAX_HEALTH'))
         self._combat = PlayerCombat()
+        # Общие часы с PlayerStats: их двигает stats.update() в update()
+        self.timers = self._stats.timers
 
         # Cooldown урона от окружения
         self.last_damage_time = 0
@@ -44,6 +50,13 @@ class Player:
         self.knockback_timer = 0.0
         self._kb_duration = get_config('COMBAT_PLAYER_KNOCKBACK_DURATION', 0.15)
         self._kb_speed = get_config('COMBAT_PLAYER_KNOCKBACK_SPEED', 220)
+        # Палитра берётся из снимка конфига один раз, а не на каждый кадр
+        self._colors = config_snapshot().colors
+
+    def bind_timers(self, timers) -> None:
+        """Перевести игрока и его PlayerStats на общие часы игры."""
+        self._stats.bind_timers(timers)
+        bind_countdowns(self, timers)
 
     # --- Backward-compatible API для здоровья (делегирует PlayerStats) ------
 
@@ -263,7 +276,7 @@ class Player:
 
     def update(self, dt, world, game_stats=None):
         """Обновление состояния игрока"""
-        # Тик i-frame таймера
+        # Ход часов i-frames/knockback (no-op на общих часах игры)
         self._stats.update(dt)
 
         # Обновление атаки
@@ -271,7 +284,6 @@ class Player:
 
         # Knockback приоритетнее ввода
         if self.knockback_timer > 0:
-            self.knockback_timer -= dt
             new_x = self.x + self.knockback_vx * dt
             new_y = self.y + self.knockback_vy * dt
             new_x = max(0, min(new_x, world.width - self.width))
@@ -282,10 +294,11 @@ class Player:
                 self.y = new_y
                 self.rect.x = int(self.x)
                 self.rect.y = int(self.y)
-            if self.knockback_timer <= 0:
-                self.knockback_vx = 0.0
-                self.knockback_vy = 0.0
             return
+        if self.knockback_vx or self.knockback_vy:
+            # Knockback истёк — гасим скорость один раз
+            self.knockback_vx = 0.0
+            self.knockback_vy = 0.0
 
         # Движение
         if not self.attacking:
@@ -331,7 +344,8 @@ class Player:
         screen_x = int(self.x - camera_x)
         screen_y = int(self.y - camera_y)
         
-        color = get_color('RED') if self.attacking else get_color('GREEN')
+        colors = self._colors
+        color = colors.red if self.attacking else colors.green
         pygame.draw.rect(screen, color, (screen_x, screen_y, self.width, self.height))
         
         # Направление взгляда
@@ -339,21 +353,21 @@ class Player:
         center_y = screen_y + self.height // 2
         
         if self.facing_direction == 'up':
-            pygame.draw.circle(screen, get_color('WHITE'), (center_x, screen_y + 5), 3)
+            pygame.draw.circle(screen, colors.white, (center_x, screen_y + 5), 3)
         elif self.facing_direction == 'down':
-            pygame.draw.circle(screen, get_color('WHITE'), (center_x, screen_y + self.height - 5), 3)
+            pygame.draw.circle(screen, colors.white, (center_x, screen_y + self.height - 5), 3)
         elif self.facing_direction == 'left':
-            pygame.draw.circle(screen, get_color('WHITE'), (screen_x + 5, center_y), 3)
+            pygame.draw.circle(screen, colors.white, (screen_x + 5, center_y), 3)
         elif self.facing_direction == 'right':
-            pygame.draw.circle(screen, get_color('WHITE'), (screen_x + self.width - 5, center_y), 3)
+            pygame.draw.circle(screen, colors.white, (screen_x + self.width - 5, center_y), 3)
         elif self.facing_direction == 'up_left':
-            pygame.draw.circle(screen, get_color('WHITE'), (screen_x + 5, screen_y + 5), 3)
+            pygame.draw.circle(screen, colors.white, (screen_x + 5, screen_y + 5), 3)
         elif self.facing_direction == 'up_right':
-            pygame.draw.circle(screen, get_color('WHITE'), (screen_x + self.width - 5, screen_y + 5), 3)
+            pygame.draw.circle(screen, colors.white, (screen_x + self.width - 5, screen_y + 5), 3)
         elif self.facing_direction == 'down_left':
-            pygame.draw.circle(screen, get_color('WHITE'), (screen_x + 5, screen_y + self.height - 5), 3)
+            pygame.draw.circle(screen, colors.white, (screen_x + 5, screen_y + self.height - 5), 3)
         elif self.facing_direction == 'down_right':
-            pygame.draw.circle(screen, get_color('WHITE'), (screen_x + self.width - 5, screen_y + self.height - 5), 3)
+            pygame.draw.circle(screen, colors.white, (screen_x + self.width - 5, screen_y + self.height - 5), 3)
         
         # Зоны атаки
         if self.attacking:
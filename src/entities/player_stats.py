@@ -6,12 +6,20 @@ Single Responsibility: хранить HP/XP/Level/Coins, наносить/леч
 Не знает про pygame, ввод, рендер или мир.
 """
 from src.core.config_loader import get_config
+from src.utils.timer_wheel import Clock, Countdown, bind_countdowns
 
 
 class PlayerStats:
     """Здоровье, прогрессия и базовые характеристики игрока."""
 
-    def __init__(self, max_health: int):
+    # Остаток i-frames — дедлайн на self.timers
+    iframe_timer = Countdown()
+
+    def __init__(self, max_health: int, timers=None):
+        # Свои часы двигает update(); общие часы игры — их владелец
+        self._owns_timers = timers is None
+        self.timers = timers if timers is not None else Clock()
+
         # HP
         self.max_health = max_health
         self.health = max_health
@@ -63,9 +71,17 @@ class PlayerStats:
         return self.health / self.max_health if self.max_health > 0 else 0.0
 
     def update(self, dt: float) -> None:
-        """Тик таймеров (вызывать каждый кадр)."""
-        if self.iframe_timer > 0:
-            self.iframe_timer = max(0.0, self.iframe_timer - dt)
+        """Ход собственных часов (вызывать каждый кадр).
+
+        На общих часах игры — no-op: их двигает владелец.
+        """
+        if self._owns_timers:
+            self.timers.advance(dt)
+
+    def bind_timers(self, timers) -> None:
+        """Перейти на общие часы, сохранив остаток i-frames."""
+        self._owns_timers = False
+        bind_countdowns(self, timers)
 
     @property
     def is_invulnerable(self) -> bool:
@@ -0,0 +1,375 @@
+"""
+ArrayPickupManager — хранилище пикапов в массивах NumPy.
+
+Тот же интерфейс, что у PickupManager (spawn / update / draw / count /
+serialize / deserialize), но пикап — это строка в параллельных массивах
+(тип, x, y, момент истечения, value), а не объект с pygame.Rect. Тик
+lifetime, магнит к игроку и проверка сбора — несколько операций над
+массивами за кадр; истёкшие и собранные строки вычищаются одной
+компактизацией. Рассчитан на десятки тысяч пикапов.
+
+Слияние в стаки приближённое: сливаются стакаемые пикапы одного типа
+в одной ячейке coalesce_radius x coalesce_radius (np.unique по ключу
+ячейки), а не строго по расстоянию. Слияние и лимит max_pickups
+применяются в начале следующего update().
+
+numpy — опциональная зависимость: выбирается через ``[pickups] storage
+= array`` и create_pickup_manager(), без numpy используется PickupManager.
+"""
+from typing import List
+import pygame
+
+from src.core.config_loader import config_snapshot
+from src.entities.pickup import Pickup
+from src.systems.pickup_manager import _PICKUP_TYPES, pickup_from_dict
+from src.systems.save_stream import ROW_BATCH, CollectionSnapshot
+from src.utils.sprite_cache import SpriteCache, blit_batch
+from src.utils.timer_wheel import Clock
+
+try:
+    import numpy as np
+except ImportError:  # numpy не установлен — менеджер недоступен
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+# Индекс типа в массиве <-> type_id сейва / класс пикапа
+_TYPE_IDS = tuple(_PICKUP_TYPES)
+_CLASS_INDEX = {cls: i for i, cls in enumerate(_PICKUP_TYPES.values())}
+
+# Сколько «жертв» лимита сравнивать с целями за один проход (память d2)
+_CAP_CHUNK = 1024
+
+
+class ArrayPickupManager:
+    """Пикапы в параллельных массивах NumPy (порядок строк = порядок спавна)."""
+
+    INITIAL_CAPACITY = 256
+    _COLUMNS = ('_type', '_x', '_y', '_expires', '_value', '_uid')
+
+    def __init__(self, timers=None):
+        if np is None:
+            raise RuntimeError("ArrayPickupManager requires numpy")
+        cfg = config_snapshot().pickups
+        self.magnet_radius = float(cfg.magnet_radius)
+        self.magnet_speed = float(cfg.magnet_speed)
+        self.coalesce_radius = cfg.coalesce_radius
+        self.max_pickups = cfg.max_pickups
+
+        # Дедлайны в массиве считаются по этим часам; общие часы игры
+        # двигает Game, свои — update()
+        self._owns_timers = timers is None
+        self.timers = timers if timers is not None else Clock()
+        self._n = 0
+        # Номер строки для журнала автосейвов; стак наследует номер головы
+        self._next_uid = 1
+        self._alloc(self.INITIAL_CAPACITY)
+        self._stackable = np.array(
+            [cls.STACKABLE for cls in _PICKUP_TYPES.values()], dtype=bool
+        )
+        # Есть новые стакаемые строки — в начале update() нужен проход слияния
+        self._needs_coalesce = False
+        # Шаблон на тип: через него работает apply() без объекта на пикап
+        self._templates = [cls(0, 0) for cls in _PICKUP_TYPES.values()]
+        self.sprites = SpriteCache()
+
+    # --- Хранилище ----------------------------------------------------------
+
+    def _alloc(self, capacity: int) -> None:
+        self._type = np.zeros(capacity, dtype=np.int8)
+        self._x = np.zeros(capacity, dtype=np.float64)
+        self._y = np.zeros(capacity, dtype=np.float64)
+        self._expires = np.zeros(capacity, dtype=np.float64)
+        self._value = np.zeros(capacity, dtype=np.int64)
+        self._uid = np.zeros(capacity, dtype=np.int64)
+
+    def _reserve(self, need: int) -> None:
+        capacity = len(self._x)
+        if need <= capacity:
+            return
+        new_capacity = max(need, capacity * 2)
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=old.dtype)
+            grown[:self._n] = old[:self._n]
+            setattr(self, name, grown)
+
+    def _compact(self, keep) -> None:
+        """Оставить строки по маске keep, сохранив их порядок."""
+        n = self._n
+        k = int(np.count_nonzero(keep))
+        for name in self._COLUMNS:
+            arr = getattr(self, name)
+            arr[:k] = arr[:n][keep]
+        self._n = k
+
+    def _append_row(self, t: int, x: float, y: float,
+                    lifetime: float, value: int) -> None:
+        self._reserve(self._n + 1)
+        i = self._n
+        self._type[i] = t
+        self._x[i] = x
+        self._y[i] = y
+        self._expires[i] = self.now + lifetime
+        self._value[i] = value
+        self._uid[i] = self._next_uid
+        self._next_uid += 1
+        self._n += 1
+
+    # --- API PickupManager --------------------------------------------------
+
+    def spawn(self, pickup: Pickup, coalesce: bool = True) -> Pickup:
+        """Записать пикап строкой в массивы. Сам объект не хранится."""
+        t = _CLASS_INDEX.get(type(pickup))
+        if t is None:
+            return pickup
+        self._append_row(t, pickup.x, pickup.y, pickup.lifetime, pickup.value)
+        if coalesce and pickup.STACKABLE and self.coalesce_radius > 0:
+            self._needs_coalesce = True
+        return pickup
+
+    @property
+    def now(self) -> float:
+        return self.timers.now
+
+    def bind_timers(self, timers) -> None:
+        """Перейти на общие часы, сохранив остаток lifetime."""
+        self._expires[:self._n] += timers.now - self.timers.now
+        self.timers = timers
+        self._owns_timers = False
+
+    def update(self, dt: float, player) -> None:
+        """Lifetime, магнит и сбор — векторно по всем строкам."""
+        if self._owns_timers:
+            self.timers.advance(dt)
+        self._settle()
+        n = self._n
+        if n == 0:
+            return
+
+        x = self._x[:n]
+        y = self._y[:n]
+        alive = self._expires[:n] > self.now
+
+        half = Pickup.SIZE / 2
+        dx = (player.x + player.width / 2) - (x + half)
+        dy = (player.y + player.height / 2) - (y + half)
+        dist = np.hypot(dx, dy)
+        pull = alive & (dist < self.magnet_radius) & (dist > 1)
+        if pull.any():
+            step = self.magnet_speed * dt / dist[pull]
+            x[pull] += dx[pull] * step
+            y[pull] += dy[pull] * step
+
+        # Сбор — то же условие, что pygame.Rect.colliderect для int-позиций
+        pr = player.rect
+        rx = x.astype(np.int64)
+        ry = y.astype(np.int64)
+        hit = (alive
+               & (rx < pr.right) & (rx + Pickup.SIZE > pr.left)
+               & (ry < pr.bottom) & (ry + Pickup.SIZE > pr.top))
+        if hit.any():
+            self._apply_rewards(player, hit)
+
+        keep = alive & ~hit
+        if not keep.all():
+            self._compact(keep)
+
+    def _apply_rewards(self, player, hit) -> None:
+        """Одна выдача награды на тип: сумма value собранных строк."""
+        n = self._n
+        totals = np.bincount(self._type[:n][hit], weights=self._value[:n][hit],
+                             minlength=len(_TYPE_IDS))
+        for t, total in enumerate(totals):
+            if total > 0:
+                template = self._templates[t]
+                template.value = int(total)
+                template.apply(player)
+
+    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float) -> None:
+        n = self._n
+        if n == 0:
+            return
+        x = self._x[:n]
+        y = self._y[:n]
+        visible = np.flatnonzero(
+            (x > camera_x - Pickup.SIZE) & (x < camera_x + screen.get_width())
+            & (y > camera_y - Pickup.SIZE) & (y < camera_y + screen.get_height())
+        )
+        if visible.size == 0:
+            return
+        sprites = [self.sprites.pickup(cls) for cls in _PICKUP_TYPES.values()]
+        # astype(int) отбрасывает дробь к нулю — как int() в PickupManager
+        sx = (x[visible] - camera_x).astype(np.int64).tolist()
+        sy = (y[visible] - camera_y).astype(np.int64).tolist()
+        blit_batch(screen, [
+            (sprites[t], (px, py))
+            for t, px, py in zip(self._type[visible].tolist(), sx, sy)
+        ])
+
+    def count(self) -> int:
+        return self._n
+
+    def positions_in(self, left: float, top: float,
+                     right: float, bottom: float) -> list:
+        """Координаты пикапов в прямоугольнике (превью сейва) — маской."""
+        x, y = self._x[:self._n], self._y[:self._n]
+        inside = (x >= left) & (x < right) & (y >= top) & (y < bottom)
+        return list(zip(x[inside].tolist(), y[inside].tolist()))
+
+    def clear(self) -> None:
+        self._n = 0
+        self._needs_coalesce = False
+
+    @property
+    def pickups(self) -> List[Pickup]:
+        """Снимок в виде объектов Pickup — для совместимости и отладки.
+
+        Изменения этих объектов в массивы не попадают.
+        """
+        return [pickup_from_dict(item) for item in self.serialize()]
+
+    # --- Слияние и лимит ----------------------------------------------------
+
+    def _settle(self) -> None:
+        if self._needs_coalesce:
+            self._needs_coalesce = False
+            self._coalesce()
+        if self._n > self.max_pickups:
+            self._enforce_cap()
+
+    def _coalesce(self) -> None:
+        """Слить стакаемые строки одного типа в одной ячейке сетки слияния."""
+        n = self._n
+        idx = np.flatnonzero(self._stackable[self._type[:n]])
+        if idx.size < 2:
+            return
+        r = self.coalesce_radius
+        keys = np.stack((
+            self._type[idx].astype(np.int64),
+            np.floor(self._x[idx] / r).astype(np.int64),
+            np.floor(self._y[idx] / r).astype(np.int64),
+        ), axis=1)
+        _, first, inverse = np.unique(keys, axis=0, return_index=True,
+                                      return_inverse=True)
+        if first.size == idx.size:
+            return
+        inverse = inverse.reshape(-1)
+
+        # Стак остаётся в самой старой строке группы (первое вхождение)
+        heads = idx[first]
+        self._value[heads] = np.bincount(
+            inverse, weights=self._value[idx], minlength=first.size
+        ).astype(np.int64)
+        latest = np.full(first.size, -np.inf)
+        np.maximum.at(latest, inverse, self._expires[idx])
+        self._expires[heads] = latest
+
+        keep = np.ones(n, dtype=bool)
+        keep[idx] = False
+        keep[heads] = True
+        self._compact(keep)
+
+    def _enforce_cap(self) -> None:
+        """Влить самые старые стакаемые строки сверх лимита в ближайшую
+        строку того же типа. Сердца не сливаются (лечение упирается в
+        max HP), тип без единой «цели» остаётся как есть — награда не
+        теряется."""
+        n = self._n
+        excess = n - self.max_pickups
+        types = self._type[:n]
+        x = self._x[:n]
+        y = self._y[:n]
+        keep = np.ones(n, dtype=bool)
+        keep[np.flatnonzero(self._stackable[types])[:excess]] = False
+        for t in np.flatnonzero(self._stackable):
+            victims = np.flatnonzero((types == t) & ~keep)
+            if victims.size == 0:
+                continue
+            targets = np.flatnonzero((types == t) & keep)
+            if targets.size == 0:
+                # Весь тип — в числе старейших: младший из них станет целью
+                keep[victims[-1]] = True
+                targets, victims = victims[-1:], victims[:-1]
+                if victims.size == 0:
+                    continue
+            for start in range(0, victims.size, _CAP_CHUNK):
+                chunk = victims[start:start + _CAP_CHUNK]
+                d2 = ((x[chunk, None] - x[None, targets]) ** 2
+                      + (y[chunk, None] - y[None, targets]) ** 2)
+                dest = targets[np.argmin(d2, axis=1)]
+                np.add.at(self._value, dest, self._value[chunk])
+                np.maximum.at(self._expires, dest, self._expires[chunk])
+        self._compact(keep)
+
+    # --- Сериализация ------------------------------------------------------
+
+    def serialize(self) -> list:
+        """Сохранить пикапы прямо из массивов."""
+        return self.capture()()
+
+    def capture(self, live: bool = False) -> CollectionSnapshot:
+        """Снимок для записи сейва: копии столбцов сейчас (по 40 байт на
+        пикап), dict строк — кусками по ходу записи, в любом потоке.
+        ``live=True`` — срезы без копий (синхронная запись)."""
+        n = self._n
+        types, xs, ys, values, uids = (
+            col[:n] if live else col[:n].copy()
+            for col in (self._type, self._x, self._y, self._value, self._uid)
+        )
+        lifetimes = self._expires[:n] - self.now
+
+        def rows(with_uid: bool = False):
+            # tolist() кусками: dict строк не копятся на весь список
+            for lo in range(0, n, ROW_BATCH):
+                hi = min(lo + ROW_BATCH, n)
+                chunk = zip(types[lo:hi].tolist(), xs[lo:hi].tolist(),
+                            ys[lo:hi].tolist(), lifetimes[lo:hi].tolist(),
+                            values[lo:hi].tolist(), uids[lo:hi].tolist())
+                for t, x, y, lt, v, uid in chunk:
+                    item = {"type": _TYPE_IDS[t], "x": x, "y": y,
+                            "lifetime": lt, "value": v}
+                    if with_uid:
+                        item["uid"] = uid
+                    yield item
+
+        def positions_in(left, top, right, bottom):
+            inside = (xs >= left) & (xs < right) & (ys >= top) & (ys < bottom)
+            return list(zip(xs[inside].tolist(), ys[inside].tolist()))
+        return CollectionSnapshot(
+            rows, positions_in=None if live else positions_in
+        )
+
+    def deserialize(self, data: list) -> None:
+        """Восстановить пикапы из списка (заменяет текущие, без слияния)."""
+        self.clear()
+        if not data:
+            return
+        self.restore_rows(data)
+
+    def restore_rows(self, rows) -> None:
+        """Дописать пикапы из строк сейва в конец массивов (без слияния)."""
+        default_lifetime = float(config_snapshot().pickups.lifetime)
+        type_index = {tid: i for i, tid in enumerate(_TYPE_IDS)}
+        rows = [
+            (type_index[item.get("type")],
+             float(item.get("x", 0)), float(item.get("y", 0)),
+             float(item.get("lifetime", default_lifetime)),
+             int(item.get("value", 1)))
+            for item in rows if item.get("type") in type_index
+        ]
+        if not rows:
+            return
+        n = self._n
+        k = len(rows)
+        self._reserve(n + k)
+        t, xs, ys, lts, vals = zip(*rows)
+        self._type[n:n + k] = t
+        self._x[n:n + k] = xs
+        self._y[n:n + k] = ys
+        self._expires[n:n + k] = np.asarray(lts) + self.now
+        self._value[n:n + k] = vals
+        self._uid[n:n + k] = np.arange(self._next_uid, self._next_uid + k)
+        self._next_uid += k
+        self._n = n + k
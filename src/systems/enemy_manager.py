@@ -15,19 +15,42 @@ from typing import List, Tuple
 
 import pygame
 
-from src.core.config_loader import get_config
+from src.core.config_loader import config_snapshot
 from src.entities.enemy import Enemy
 from src.entities.enemy_factory import EnemyFactory
 from src.entities.pickup import HeartPickup, CoinPickup, XPOrbPickup
+from src.systems.save_stream import CollectionSnapshot, IncrementalCapture
+from src.utils.sprite_cache import (
+    SpriteCache, blit_batch, HEALTH_BAR_HEIGHT, HEALTH_BAR_GAP,
+)
+from src.utils.stage_timer import NULL_STAGE_TIMER
+from src.utils.timer_wheel import TimerWheel, Countdown, bind_countdowns
+from src.utils.trace import TRACER
 
 
 class EnemyManager:
     """Контейнер врагов для одного мира."""
 
     TILE_SIZE = 32  # размер тайла (для расчёта patrol_zone)
+    # Врагов, копируемых в снимок сейва за кадр (~0.3 мс): время снимка
+    # в кадре не растёт с численностью
+    CAPTURE_BATCH = 512
 
-    def __init__(self, world, pickup_manager=None):
+    # Время до следующей попытки респавна (секунды) — дедлайн на self.timers
+    _respawn_timer = Countdown()
+
+    def __init__(self, world, pickup_manager=None, timers: TimerWheel = None):
         self.world = world
+        # Конфиг забираем один раз: в кадре — только чтение полей
+        cfg = config_snapshot()
+        self._enemies_cfg = cfg.enemies
+        self._combat_cfg = cfg.combat
+        self._drops_cfg = cfg.drops
+        self._patrol_radius_px = self._enemies_cfg.patrol_radius_tiles * self.TILE_SIZE
+        # Часы врагов менеджера: своё колесо двигаем в update(),
+        # общее игровое (bind_timers) двигает Game
+        self._owns_timers = timers is None
+        self.timers = timers if timers is not None else TimerWheel()
         self.enemies: List[Enemy] = []
         self.pickup_manager = pickup_manager
         # Целевое количество врагов по типам - устанавливается при
@@ -35,18 +58,45 @@ class EnemyManager:
         # уходит далеко и убитые враги "забываются", новые появляются
         # чтобы восстановить численность.
         self.target_counts: dict = {}
-        # Таймер до следующей попытки респавна (секунды)
         self._respawn_timer = 0.0
+        # Всего доспавнено авто-респавном (Game сравнивает до/после update,
+        # чтобы отметить волну респавна в кадре)
+        self.respawned_total = 0
         # Координаты игрока обновляются из update() - нужны для проверки
         # минимальной дистанции при респавне.
         self._last_player_pos = (0.0, 0.0)
+        # Сколько врагов максимум доспавнивать за один тик респавна.
+        # None = без лимита. Stress-режим ставит лимит, чтобы восстановление
+        # тысяч врагов растягивалось на несколько кадров.
+        self.respawn_batch_limit = None
+        # Замер времени стадий (ai / loot). По умолчанию no-op.
+        self.stage_timer = NULL_STAGE_TIMER
+        # Готовые поверхности тел врагов и полосок HP
+        self.sprites = SpriteCache()
+        # Снимок для сейва, который ещё копируется по кадрам (capture())
+        self._capturing = None
+
+    def bind_timers(self, timers: TimerWheel) -> None:
+        """Перевести менеджер и всех его врагов на общее колесо таймеров."""
+        if timers is self.timers:
+            # Уже на нём: враги привязаны к self.timers при добавлении
+            self._owns_timers = False
+            return
+        self._owns_timers = False
+        bind_countdowns(self, timers)
+        for enemy in self.enemies:
+            enemy.bind_timers(timers)
+
+    def _add_enemy(self, enemy: Enemy) -> None:
+        enemy.bind_timers(self.timers)
+        self.enemies.append(enemy)
 
     # --- Спавн -------------------------------------------------------------
 
     def _make_patrol_zone(self, cx: float, cy: float) -> pygame.Rect:
         """Построить квадрат патрулирования (radius_tiles*2 x radius_tiles*2)
         вокруг точки (cx, cy)."""
-        radius = get_config('ENEMIES_PATROL_RADIUS_TILES') * self.TILE_SIZE
+        radius = self._patrol_radius_px
         return pygame.Rect(
             int(cx - radius), int(cy - radius),
             radius * 2, radius * 2,
@@ -83,12 +133,12 @@ class EnemyManager:
         # Размер врага нужен заранее для проверки коллизий - создаём
         # временный Enemy чтобы прочитать размер из его статов.
         # Cheaper: используем константный максимум size из конфига.
-        size_key = f'ENEMIES_{type_id.upper()}_SIZE'
-        size = get_config(size_key)
+        cfg = self._enemies_cfg
+        size = getattr(cfg, type_id).size
 
-        min_distance = get_config('ENEMIES_SPAWN_MIN_DISTANCE')
-        max_attempts = get_config('ENEMIES_SPAWN_MAX_ATTEMPTS')
-        radius_px = get_config('ENEMIES_PATROL_RADIUS_TILES') * self.TILE_SIZE
+        min_distance = cfg.spawn_min_distance
+        max_attempts = cfg.spawn_max_attempts
+        radius_px = self._patrol_radius_px
 
         for _ in range(max_attempts):
             x = random.uniform(radius_px, self.world.width - radius_px - size)
@@ -99,7 +149,7 @@ class EnemyManager:
                 cy = y + size / 2
                 patrol_zone = self._make_patrol_zone(cx, cy)
                 enemy = EnemyFactory.create(type_id, x, y, patrol_zone)
-                self.enemies.append(enemy)
+                self._add_enemy(enemy)
                 return enemy
 
         return None
@@ -111,18 +161,20 @@ class EnemyManager:
         Запоминает целевые количества для последующего авто-респавна.
         """
         targets = {
-            'light': get_config('ENEMIES_INITIAL_COUNT_LIGHT'),
-            'heavy': get_config('ENEMIES_INITIAL_COUNT_HEAVY'),
-            'fast':  get_config('ENEMIES_INITIAL_COUNT_FAST'),
+            'light': self._enemies_cfg.initial_count_light,
+            'heavy': self._enemies_cfg.initial_count_heavy,
+            'fast':  self._enemies_cfg.initial_count_fast,
         }
         # Сохраняем для респавна
         self.target_counts = dict(targets)
 
         total_spawned = 0
-        for type_id, count in targets.items():
-            for _ in range(count):
-                if self.spawn_enemy(type_id, player_x, player_y) is not None:
-                    total_spawned += 1
+        with TRACER.span('spawn_initial', cat='enemies') as span:
+            for type_id, count in targets.items():
+                for _ in range(count):
+                    if self.spawn_enemy(type_id, player_x, player_y) is not None:
+                        total_spawned += 1
+            span.annotate(spawned=total_spawned)
         return total_spawned
 
     # --- Респавн -----------------------------------------------------------
@@ -136,16 +188,42 @@ class EnemyManager:
 
         Возвращает количество реально заспавненных врагов.
         """
+        return self.top_up(player_x, player_y, self.respawn_batch_limit)
+
+    def top_up(self, player_x: float, player_y: float, limit: int = None) -> int:
+        """Доспавнить недостающих до target_counts, не более ``limit`` за вызов.
+
+        Попытки распределяются между типами по очереди, чтобы при лимите
+        ни один тип не «голодал». Возвращает количество заспавненных.
+        """
         if not self.target_counts:
             return 0
 
         current = self.alive_by_type()
+        missing = {
+            type_id: target - current.get(type_id, 0)
+            for type_id, target in self.target_counts.items()
+        }
+        budget = sum(m for m in missing.values() if m > 0)
+        if limit is not None:
+            budget = min(budget, limit)
+
         spawned = 0
-        for type_id, target in self.target_counts.items():
-            missing = target - current.get(type_id, 0)
-            for _ in range(missing):
+        attempts = 0
+        while attempts < budget:
+            progressed = False
+            for type_id in missing:
+                if attempts >= budget:
+                    break
+                if missing[type_id] <= 0:
+                    continue
+                missing[type_id] -= 1
+                attempts += 1
+                progressed = True
                 if self.spawn_enemy(type_id, player_x, player_y) is not None:
                     spawned += 1
+            if not progressed:
+                break
         return spawned
 
     # --- Обновление --------------------------------------------------------
@@ -159,24 +237,31 @@ class EnemyManager:
         соблюдает spawn_min_distance, поэтому игрок увидит "новых" врагов
         только когда отойдёт от зачищенной зоны.
         """
-        for enemy in self.enemies:
-            enemy.update(dt, self.world, player)
+        if self._owns_timers:
+            self.timers.advance(dt)
+        if self._capturing is not None:
+            # Пачка снимка сейва — до того, как AI сдвинет врагов
+            if self._capturing.step():
+                self._capturing = None
+        with self.stage_timer.measure('ai'):
+            for enemy in self.enemies:
+                enemy.update(dt, self.world, player)
         # Drop loot с мёртвых ПЕРЕД удалением
-        self._drop_loot_from_dead(player)
+        with self.stage_timer.measure('loot'):
+            self._drop_loot_from_dead(player)
         # Чистим мёртвых
         self.enemies = [e for e in self.enemies if not e.is_dead()]
 
         # Авто-респавн (опционально - если переданы координаты игрока)
         if player_x is not None and player_y is not None:
             self._last_player_pos = (player_x, player_y)
-            self._respawn_timer -= dt
             if self._respawn_timer <= 0:
                 # Сброс таймера ДО спавна (не зациклиться даже если нет места)
-                try:
-                    self._respawn_timer = float(get_config('ENEMIES_RESPAWN_INTERVAL'))
-                except KeyError:
-                    self._respawn_timer = 5.0  # default
-                self._try_respawn_missing(player_x, player_y)
+                self._respawn_timer = self._enemies_cfg.respawn_interval
+                with TRACER.span('respawn', cat='enemies') as span:
+                    spawned = self._try_respawn_missing(player_x, player_y)
+                    span.annotate(spawned=spawned)
+                self.respawned_total += spawned
 
     # --- Урон от атаки игрока ---------------------------------------------
 
@@ -197,8 +282,8 @@ class EnemyManager:
 
         hits = 0
         kills = 0
-        kb_speed = get_config('COMBAT_ENEMY_KNOCKBACK_SPEED', 180)
-        kb_dur = get_config('COMBAT_ENEMY_KNOCKBACK_DURATION', 0.12)
+        kb_speed = self._combat_cfg.enemy_knockback_speed
+        kb_dur = self._combat_cfg.enemy_knockback_duration
 
         for enemy in self.enemies:
             if enemy.is_dead():
@@ -209,6 +294,7 @@ class EnemyManager:
             # Любая из зон атаки попадает по врагу?
             for r in attack_rects:
                 if r.colliderect(enemy.rect):
+                    self._preserve(enemy)
                     enemy.take_damage(damage)
                     enemy.last_hit_attack_id = attack_id
                     # Knockback от игрока
@@ -243,9 +329,9 @@ class EnemyManager:
         if player.is_invulnerable:
             return 0
 
-        atk_cd = get_config('COMBAT_ENEMY_ATTACK_COOLDOWN', 1.2)
-        retreat_speed = get_config('COMBAT_ENEMY_RETREAT_SPEED', 150)
-        retreat_dur = get_config('COMBAT_ENEMY_RETREAT_DURATION', 0.2)
+        atk_cd = self._combat_cfg.enemy_attack_cooldown
+        retreat_speed = self._combat_cfg.enemy_retreat_speed
+        retreat_dur = self._combat_cfg.enemy_retreat_duration
 
         total_damage = 0
         for enemy in self.enemies:
@@ -259,6 +345,7 @@ class EnemyManager:
                 dmg = enemy.stats.damage
                 hit = player.take_damage(dmg)
                 if hit:
+                    self._preserve(enemy)
                     # Knockback игрока от врага
                     player.apply_knockback(enemy.x, enemy.y)
                     # Retreat врага от игрока (отскок назад)
@@ -280,8 +367,30 @@ class EnemyManager:
     # --- Отрисовка ---------------------------------------------------------
 
     def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float) -> None:
+        """Видимые враги двумя батчами: тела, затем полоски HP."""
+        sprites = self.sprites
+        view_w, view_h = screen.get_size()
+        now = pygame.time.get_ticks()
+        bar_dy = HEALTH_BAR_HEIGHT + HEALTH_BAR_GAP
+        bodies = []
+        bars = []
         for enemy in self.enemies:
-            enemy.draw(screen, camera_x, camera_y)
+            if enemy.is_dead():
+                continue
+            stats = enemy.stats
+            sx = int(enemy.x - camera_x)
+            sy = int(enemy.y - camera_y)
+            if (sx + stats.width < 0 or sy + stats.height < 0 or
+                    sx > view_w or sy > view_h):
+                continue
+            bodies.append((sprites.enemy(stats, enemy.is_flashing(now)), (sx, sy)))
+            if enemy.health < stats.max_health:
+                bars.append((
+                    sprites.health_bar(stats.width, enemy.health, stats.max_health),
+                    (sx, sy - bar_dy),
+                ))
+        blit_batch(screen, bodies)
+        blit_batch(screen, bars)
 
     # --- Drop loot ---------------------------------------------------------
 
@@ -306,12 +415,14 @@ class EnemyManager:
         Это создаёт интуитивную петлю: раненый игрок получает хил,
         здоровый — копит золото.
         """
-        prefix = enemy.stats.name.lower()  # light / heavy / fast
+        # Подсекция дропа типа: light / heavy / fast
+        drops = getattr(self._drops_cfg, enemy.stats.name.lower(), None)
+        if drops is None:
+            return
         cx, cy = enemy.x, enemy.y
 
         # XP — всегда (фиксированное количество)
-        xp_amount = get_config(f'DROPS_{prefix.upper()}_XP_AMOUNT', 0)
-        if xp_amount > 0:
+        if drops.xp_amount > 0:
             self.pickup_manager.spawn(
                 XPOrbPickup(cx + random.uniform(-8, 8),
                             cy + random.uniform(-8, 8))
@@ -325,19 +436,15 @@ class EnemyManager:
 
         if player_needs_heal:
             # Сердечко — шанс (только при неполном HP)
-            heart_chance = get_config(f'DROPS_{prefix.upper()}_HEART_CHANCE', 0.0)
-            if random.random() < heart_chance:
+            if random.random() < drops.heart_chance:
                 self.pickup_manager.spawn(
                     HeartPickup(cx + random.uniform(-8, 8),
                                 cy + random.uniform(-8, 8))
                 )
         else:
             # Монеты — шанс + случайное количество (только при полном HP)
-            coin_chance = get_config(f'DROPS_{prefix.upper()}_COIN_CHANCE', 0.0)
-            if random.random() < coin_chance:
-                coin_min = get_config(f'DROPS_{prefix.upper()}_COIN_MIN', 1)
-                coin_max = get_config(f'DROPS_{prefix.upper()}_COIN_MAX', 1)
-                count = random.randint(coin_min, coin_max)
+            if random.random() < drops.coin_chance:
+                count = random.randint(drops.coin_min, drops.coin_max)
                 for _ in range(count):
                     self.pickup_manager.spawn(
                         CoinPickup(cx + random.uniform(-12, 12),
@@ -358,33 +465,90 @@ class EnemyManager:
                 result[tid] = result.get(tid, 0) + 1
         return result
 
+    def positions_in(self, left: float, top: float,
+                     right: float, bottom: float) -> list:
+        """Координаты живых врагов в прямоугольнике (превью сейва)."""
+        return [(e.x, e.y) for e in self.enemies
+                if e.health > 0 and left <= e.x < right and top <= e.y < bottom]
+
     # --- Сериализация ------------------------------------------------------
 
     def serialize(self) -> dict:
         """Сохранить живых врагов с HP/позицией + target_counts для респавна."""
-        enemies_data = []
-        for e in self.enemies:
-            if e.is_dead():
-                continue
-            enemies_data.append({
-                "type": e.stats.name.lower(),  # 'light' / 'heavy' / 'fast'
-                "x": float(e.x),
-                "y": float(e.y),
-                "health": int(e.health),
-                "attack_cooldown_timer": float(e.attack_cooldown_timer),
-            })
-        return {
-            "enemies": enemies_data,
+        return self.capture()()
+
+    def capture(self, live: bool = False) -> CollectionSnapshot:
+        """Снимок для записи сейва (CollectionSnapshot).
+
+        По умолчанию копируются только сырые поля живых врагов (без dict
+        на врага), и не сразу: сейчас фиксируется список, а строки
+        копирует update() по CAPTURE_BATCH за кадр (IncrementalCapture).
+        Урон и удар по игроку сначала снимают ещё не скопированного
+        врага. Снимок можно кодировать в другом потоке — он дождётся
+        конца копии; complete() снимка докопирует сразу.
+        ``live=True`` (синхронная запись) не копирует ничего: строки
+        генерируются из самих врагов по ходу записи. ``with_uid=True``
+        у снимка добавляет в строки uid врага (журнал автосейвов).
+        """
+        captured = None
+        if not live:
+            if self._capturing is not None:
+                self._capturing.complete()
+            captured = IncrementalCapture(self.enemies, self._raw_row, self.CAPTURE_BATCH)
+            self._capturing = None if captured.done else captured
+
+        def rows(with_uid: bool = False):
+            source = self._raw_rows() if captured is None else captured.rows()
+            for uid, name, x, y, health, deadline, now in source:
+                remaining = deadline - now if deadline is not None else 0.0
+                item = {
+                    "type": name.lower(),  # 'light' / 'heavy' / 'fast'
+                    "x": float(x),
+                    "y": float(y),
+                    "health": int(health),
+                    "attack_cooldown_timer": float(max(remaining, 0.0)),
+                }
+                if with_uid:
+                    item["uid"] = uid
+                yield item
+
+        def positions_in(left, top, right, bottom):
+            return [(x, y) for _, _, x, y, *_ in captured.rows()
+                    if left <= x < right and top <= y < bottom]
+        return CollectionSnapshot(rows, fields={
             "target_counts": dict(self.target_counts),
             "respawn_timer": float(self._respawn_timer),
-        }
+        }, rows_key="enemies", positions_in=None if live else positions_in,
+            complete=None if live else captured.complete)
+
+    def _preserve(self, enemy: Enemy) -> None:
+        """Враг меняется скачком — снять его в копируемый снимок до этого."""
+        if self._capturing is not None:
+            self._capturing.preserve(enemy)
+
+    @staticmethod
+    def _raw_row(e: Enemy):
+        if e.health <= 0:
+            return None
+        return (e.uid, e.stats.name, e.x, e.y, e.health,
+                Enemy.attack_cooldown_timer.deadline(e), e.timers.now)
+
+    def _raw_rows(self):
+        cooldown = Enemy.attack_cooldown_timer.deadline
+        return ((e.uid, e.stats.name, e.x, e.y, e.health, cooldown(e), e.timers.now)
+                for e in self.enemies if e.health > 0)
 
     def deserialize(self, data: dict) -> None:
         """Восстановить врагов и параметры респавна (заменяет текущих)."""
         self.enemies = []
         if not data:
             return
-        for item in data.get("enemies", []):
+        self.restore_rows(data.get("enemies", []))
+        self.restore_state(data)
+
+    def restore_rows(self, rows) -> None:
+        """Добавить врагов из строк сейва (потоковая загрузка — пачками)."""
+        for item in rows:
             type_id = item.get("type")
             x = float(item.get("x", 0))
             y = float(item.get("y", 0))
@@ -395,9 +559,13 @@ class EnemyManager:
                 enemy = EnemyFactory.create(type_id, x, y, patrol_zone)
             except Exception:
                 continue
+            enemy.bind_timers(self.timers)
             enemy.health = int(item.get("health", enemy.stats.max_health))
             enemy.attack_cooldown_timer = float(item.get("attack_cooldown_timer", 0))
             self.enemies.append(enemy)
+
+    def restore_state(self, data: dict) -> None:
+        """target_counts и таймер респавна из сейва."""
         self.target_counts = dict(data.get("target_counts", {}))
         self._respawn_timer = float(data.get("respawn_timer", 0.0))
 
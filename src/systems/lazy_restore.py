@@ -0,0 +1,221 @@
+"""
+LazyRestore — загрузка сейва «сначала то, что рядом с игроком».
+
+Single Responsibility: разложить восстановление врагов и пикапов из
+StreamedSave во времени. Строки в радиусе restore_radius от игрока
+попадают в менеджеры сразу; дальние ждут в корзинах по регионам
+(квадраты restore_region px) и восстанавливаются в следующих кадрах:
+регион, к которому подошёл игрок, — целиком в том же кадре, остальные
+— от ближних к дальним, не дольше restore_budget_ms за кадр. Файл тоже
+читается в пределах бюджета (не меньше пачки за кадр), поэтому время от
+F9 до первого игрового кадра не зависит от числа сущностей в сейве.
+
+Пока восстановление не закончено:
+- target_counts врагов пустые — авто-респавн не доспавнивает тех, кто
+  ещё лежит в очереди;
+- строки в очереди стареют на прошедшее игровое время: lifetime пикапа
+  и кулдаун врага уменьшаются, истёкший пикап не появляется;
+- перед сейвом Game вызывает finish(), чтобы в файл попал весь мир.
+
+Что делать с головой сейва — решают колбэки: on_streamed — файл дочитан
+(в старом JSON поля после строк только теперь в head), on_done — все
+строки в менеджерах (target_counts, см. SaveSystem.restore_lazily).
+"""
+import json
+import math
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.core.config_loader import config_snapshot
+from src.systems.save_codec import SaveFormatError
+from src.systems.save_stream import StreamedSave
+
+# Строк за один restore_rows при разборе очереди — шаг проверки бюджета
+_CHUNK = 64
+
+# Таймер строки, который стареет, пока строка ждёт в очереди
+_AGING = {"enemies": "attack_cooldown_timer", "pickups": "lifetime"}
+
+
+class LazyRestore:
+    """Восстановление врагов и пикапов по регионам, ближние — первыми."""
+
+    def __init__(self, save: StreamedSave, enemy_manager, pickup_manager,
+                 on_streamed: Callable[[dict], None] = None,
+                 on_done: Callable[[dict, set], None] = None,
+                 radius: float = None, region: float = None,
+                 budget_ms: float = None):
+        cfg = config_snapshot().save
+        self.radius = float(cfg.restore_radius if radius is None else radius)
+        self.region = float(cfg.restore_region if region is None else region)
+        budget_ms = cfg.restore_budget_ms if budget_ms is None else budget_ms
+        self.budget = float(budget_ms) / 1000.0
+        self._save = save
+        self._batches = save.batches()
+        self._managers = {"enemies": enemy_manager, "pickups": pickup_manager}
+        self._on_streamed = on_streamed
+        self._on_done = on_done
+        # Коллекции, которые есть в сейве (менеджер уже очищен)
+        self.started = set()
+        # (rx, ry) -> {коллекция: [(игровое время чтения, строка)]}
+        self._regions: Dict[Tuple[int, int], Dict[str, List[tuple]]] = {}
+        self._pending = 0
+        self._clock = 0.0
+        self.streaming = True
+        self.failed = False
+        self.done = False
+
+    @property
+    def pending(self) -> int:
+        """Строк, прочитанных, но ещё не отданных менеджерам."""
+        return self._pending
+
+    def step(self, dt: float, x: float, y: float, budget: float = None) -> bool:
+        """Кадр восстановления вокруг точки (x, y) — центра игрока.
+
+        ``budget`` — секунды (по умолчанию restore_budget_ms). False —
+        сейв оборвался на середине: мир восстановлен частично.
+        """
+        if self.failed:
+            return False
+        if self.done:
+            return True
+        self._clock += dt
+        deadline = time.perf_counter() + (self.budget if budget is None else budget)
+        if self.streaming and not self._read(x, y, deadline):
+            return False
+        self._activate(x, y)
+        self._drain(x, y, deadline)
+        if not self.streaming and not self._pending:
+            self.done = True
+            if self._on_done is not None:
+                self._on_done(self._save.head, self.started)
+        return True
+
+    def finish(self, x: float, y: float) -> bool:
+        """Дочитать и восстановить всё сразу (перед сейвом)."""
+        return self.step(0.0, x, y, budget=math.inf)
+
+    def close(self) -> None:
+        """Бросить восстановление (новая игра / другая загрузка)."""
+        self._save.close()
+        self._regions.clear()
+        self._pending = 0
+        self.streaming = False
+
+    # --- Чтение -----------------------------------------------------------
+
+    def _read(self, x: float, y: float, deadline: float) -> bool:
+        try:
+            for name, rows in self._batches:
+                self._take(name, rows, x, y)
+                if time.perf_counter() >= deadline:
+                    return True
+        except (json.JSONDecodeError, SaveFormatError, OSError) as e:
+            print(f"Ошибка загрузки (повреждённый файл): {e}")
+            self.failed = True
+            self.close()
+            return False
+        self.streaming = False
+        self._save.close()
+        if self._on_streamed is not None:
+            self._on_streamed(self._save.head)
+        return True
+
+    def _take(self, name: str, rows: list, x: float, y: float) -> None:
+        """Пачка из файла: ближние строки — в менеджер, дальние — в очередь."""
+        manager = self._managers.get(name)
+        if manager is None:
+            return
+        if name not in self.started:
+            self.started.add(name)
+            manager.deserialize(None)
+            if name == "enemies":
+                manager.restore_state({})  # без респавна до конца загрузки
+        near = []
+        r2 = self.radius * self.radius
+        size = self.region
+        regions = self._regions
+        for row in rows:
+            rx = float(row.get("x", 0))
+            ry = float(row.get("y", 0))
+            if (rx - x) ** 2 + (ry - y) ** 2 <= r2:
+                near.append(row)
+                continue
+            key = (int(rx // size), int(ry // size))
+            regions.setdefault(key, {}).setdefault(name, []).append((self._clock, row))
+            self._pending += 1
+        if near:
+            manager.restore_rows(near)
+
+    # --- Очередь ----------------------------------------------------------
+
+    def _distance(self, key: Tuple[int, int], x: float, y: float) -> float:
+        """Расстояние от точки до ближайшего края региона."""
+        size = self.region
+        left, top = key[0] * size, key[1] * size
+        dx = max(left - x, 0.0, x - (left + size))
+        dy = max(top - y, 0.0, y - (top + size))
+        return math.hypot(dx, dy)
+
+    def _activate(self, x: float, y: float) -> None:
+        """Регионы, в радиус которых вошёл игрок, — целиком и сразу."""
+        if not self._regions:
+            return
+        size = self.region
+        r = self.radius
+        for gx in range(int((x - r) // size), int((x + r) // size) + 1):
+            for gy in range(int((y - r) // size), int((y + r) // size) + 1):
+                key = (gx, gy)
+                if key in self._regions and self._distance(key, x, y) <= r:
+                    for name, items in self._regions.pop(key).items():
+                        self._restore(name, items)
+
+    def _drain(self, x: float, y: float, deadline: float) -> None:
+        """Остальные регионы — от ближнего к дальнему, пока есть бюджет.
+        Файл дочитан — кусок в каждом кадре, чтобы очередь не стояла."""
+        regions = self._regions
+        first = not self.streaming
+        while regions and (first or time.perf_counter() < deadline):
+            first = False
+            key = min(regions, key=lambda k: self._distance(k, x, y))
+            bucket = regions[key]
+            name = next(iter(bucket))
+            items = bucket[name]
+            chunk, bucket[name] = items[-_CHUNK:], items[:-_CHUNK]
+            self._restore(name, chunk)
+            if not bucket[name]:
+                del bucket[name]
+                if not bucket:
+                    del regions[key]
+
+    def _restore(self, name: str, items: List[tuple]) -> None:
+        rows = []
+        for stamp, row in items:
+            age = self._clock - stamp
+            if age > 0:
+                row = _aged(name, row, age)
+                if row is None:
+                    continue
+            rows.append(row)
+        self._pending -= len(items)
+        if rows:
+            self._managers[name].restore_rows(rows)
+
+
+def _aged(name: str, row: dict, age: float) -> Optional[dict]:
+    """Строка, пролежавшая в очереди ``age`` секунд игрового времени.
+
+    None — пикап за это время истёк бы.
+    """
+    key = _AGING.get(name)
+    if key is None or key not in row:
+        return row
+    left = float(row[key]) - age
+    if left <= 0:
+        if name == "pickups":
+            return None
+        left = 0.0
+    row = dict(row)
+    row[key] = left
+    return row
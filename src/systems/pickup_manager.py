@@ -1,10 +1,34 @@
 """
 PickupManager — спавн, обновление и рендер всех пикапов в мире.
+
+Пикапы лежат в SpatialGrid с ячейкой ~ радиус магнита: магнит и сбор
+считаются только для ячеек рядом с игроком, поэтому крупный дроп на
+другом конце карты ничего не стоит, пока игрок не подойдёт.
+
+Истечение lifetime вынесено отдельно: пикапы живут на колесе таймеров
+(своём или общем игровом), истечение — событие колеса. За кадр снимаются
+только те, чей срок реально наступил.
+
+Монеты и XP при спавне сливаются со стаком того же типа в радиусе
+coalesce_radius, а сверх max_pickups самые старые стакаемые пикапы
+вливаются в ближайший пикап своего типа — число сущностей ограничено,
+а сумма наград (value) сохраняется. Лимит применяется одним проходом
+в начале update(), а не на каждый спавн: волна дропа не платит за
+пересборку списка на каждый пикап. Сердца не сливаются — их лечение
+упирается в max HP, и слитая награда пропала бы.
 """
+from collections import Counter
 from typing import List
 import pygame
 
-from src.entities.pickup import Pickup, HeartPickup, CoinPickup, XPOrbPickup
+from src.core.config_loader import get_config, config_snapshot
+from src.entities.pickup import (
+    Pickup, HeartPickup, CoinPickup, XPOrbPickup,
+)
+from src.systems.save_stream import CollectionSnapshot
+from src.utils.spatial_grid import SpatialGrid
+from src.utils.sprite_cache import SpriteCache, blit_batch
+from src.utils.timer_wheel import TimerWheel
 
 
 # Регистр (type_id -> класс) для сериализации/десериализации.
@@ -16,58 +40,290 @@ _PICKUP_TYPES = {
 }
 _PICKUP_TYPE_IDS = {cls: tid for tid, cls in _PICKUP_TYPES.items()}
 
+# Сколько раз удваивать радиус поиска цели слияния по сетке, прежде чем
+# перебрать весь список
+_CAP_SEARCH_STEPS = 4
+
+
+def pickup_from_dict(item: dict):
+    """Собрать Pickup из записи сейва (или None для неизвестного типа)."""
+    cls = _PICKUP_TYPES.get(item.get("type"))
+    if cls is None:
+        return None
+    p = cls(float(item.get("x", 0)), float(item.get("y", 0)),
+            value=int(item.get("value", 1)))
+    if "lifetime" in item:
+        p.lifetime = float(item["lifetime"])
+    return p
+
+
+def create_pickup_manager(timers=None):
+    """Менеджер пикапов по ``[pickups] storage``.
+
+    'objects' (по умолчанию) — PickupManager, 'array' — ArrayPickupManager
+    на NumPy. Без установленного numpy 'array' откатывается на объекты.
+    ``timers`` — общее колесо таймеров игры (None — менеджер ведёт своё).
+    """
+    if get_config('PICKUPS_STORAGE') == 'array':
+        from src.systems.array_pickup_manager import ArrayPickupManager, HAS_NUMPY
+        if HAS_NUMPY:
+            return ArrayPickupManager(timers=timers)
+        print("numpy не установлен — пикапы хранятся объектами")
+    return PickupManager(timers=timers)
+
 
 class PickupManager:
     """Контейнер всех пикапов."""
 
-    def __init__(self):
+    def __init__(self, timers: TimerWheel = None):
         self.pickups: List[Pickup] = []
+        # Параметры магнита читаются один раз, а не в каждом пикапе за кадр
+        cfg = config_snapshot().pickups
+        self.magnet_radius = float(cfg.magnet_radius)
+        self.magnet_speed = float(cfg.magnet_speed)
+        self.coalesce_radius = cfg.coalesce_radius
+        self.max_pickups = cfg.max_pickups
+
+        # Своё колесо двигаем сами; общее игровое двигает Game
+        self._owns_timers = timers is None
+        self.timers = timers if timers is not None else TimerWheel()
+        self._grid = SpatialGrid(max(self.magnet_radius, Pickup.SIZE * 2))
+        # Кто-то истёк между кадрами — список нужно перестроить
+        self._expired_since_update = False
+        # Число пикапов превысило лимит — слияние в начале update()
+        self._over_cap = False
+        self.sprites = SpriteCache()
+
+    def spawn(self, pickup: Pickup, coalesce: bool = True) -> Pickup:
+        """Добавить пикап в мир.
+
+        Возвращает пикап, в котором теперь лежит награда: сам ``pickup``
+        или стак, в который он слился.
+        """
+        pickup.bind_timers(self.timers, self._schedule_expiry)
+        if coalesce and pickup.STACKABLE and self.coalesce_radius > 0:
+            stack = self._find_stack(pickup)
+            if stack is not None:
+                stack.absorb(pickup)
+                return stack
 
-    def spawn(self, pickup: Pickup) -> None:
         self.pickups.append(pickup)
+        self._grid.insert(pickup, pickup.x, pickup.y)
+        self._schedule_expiry(pickup)
+        if len(self.pickups) > self.max_pickups:
+            self._over_cap = True
+        return pickup
 
-    def update(self, dt: float, player) -> None:
-        """Обновить все пикапы (магнит + сбор + expire)."""
+    def _find_stack(self, pickup: Pickup):
+        """Ближайший пикап того же типа в радиусе слияния (или None)."""
+        r = self.coalesce_radius
+        best, best_d2 = None, r * r
+        for other in self._grid.query_rect(pickup.x - r, pickup.y - r,
+                                           pickup.x + r, pickup.y + r):
+            if type(other) is not type(pickup) or other.collected:
+                continue
+            d2 = (other.x - pickup.x) ** 2 + (other.y - pickup.y) ** 2
+            if d2 <= best_d2:
+                best, best_d2 = other, d2
+        return best
+
+    def _enforce_cap(self) -> bool:
+        """Сверх max_pickups: вливать самые старые стакаемые пикапы в
+        ближайший пикап того же типа. Одиночек своего типа и сердца не
+        трогаем — награду не выбрасываем. True — что-то слилось."""
+        excess = len(self.pickups) - self.max_pickups
+        alive = Counter(type(p) for p in self.pickups
+                        if p.STACKABLE and not p.collected)
+        merged = 0
+        for oldest in self.pickups:  # список в порядке спавна
+            if merged >= excess:
+                break
+            kind = type(oldest)
+            if not oldest.STACKABLE or oldest.collected or alive[kind] < 2:
+                continue
+            target = self._nearest_same_type(oldest)
+            target.absorb(oldest)
+            self._forget(oldest)
+            alive[kind] -= 1
+            merged += 1
+        return merged > 0
+
+    def _nearest_same_type(self, pickup: Pickup):
+        """Ближайший живой пикап того же типа: по сетке с удвоением радиуса,
+        в разреженном мире — перебором списка."""
+        r = self._grid.cell_size
+        for _ in range(_CAP_SEARCH_STEPS):
+            best, best_d2 = self._closest(
+                pickup, self._grid.query_rect(pickup.x - r, pickup.y - r,
+                                              pickup.x + r, pickup.y + r))
+            # В квадрате могут быть дальние углы — верим только кругу r
+            if best is not None and best_d2 <= r * r:
+                return best
+            r *= 2
+        return self._closest(pickup, self.pickups)[0]
+
+    @staticmethod
+    def _closest(pickup: Pickup, candidates):
+        best, best_d2 = None, None
+        for other in candidates:
+            if other is pickup or other.collected or type(other) is not type(pickup):
+                continue
+            d2 = (other.x - pickup.x) ** 2 + (other.y - pickup.y) ** 2
+            if best_d2 is None or d2 < best_d2:
+                best, best_d2 = other, d2
+        return best, best_d2
+
+    def bind_timers(self, timers: TimerWheel) -> None:
+        """Перейти на общее колесо таймеров, сохранив остаток lifetime."""
+        if timers is self.timers:
+            self._owns_timers = False
+            return
+        for p in self.pickups:
+            if p._expiry_handle is not None:
+                p._expiry_handle.cancel()
+                p._expiry_handle = None
+        self.timers = timers
+        self._owns_timers = False
         for p in self.pickups:
-            p.update(dt, player)
-        self.pickups = [p for p in self.pickups if not p.is_expired]
+            p.bind_timers(timers, self._schedule_expiry)
+            self._schedule_expiry(p)
+
+    def _schedule_expiry(self, pickup: Pickup) -> None:
+        """(Пере)планировать событие истечения пикапа на колесе."""
+        if pickup._expiry_handle is not None:
+            pickup._expiry_handle.cancel()
+        pickup._expiry_handle = self.timers.schedule(
+            pickup.lifetime, self._on_expired, pickup
+        )
+
+    def _on_expired(self, pickup: Pickup) -> None:
+        pickup._expiry_handle = None
+        if pickup.collected:
+            return
+        pickup.collected = True
+        self._grid.remove(pickup)
+        self._expired_since_update = True
+
+    def _forget(self, pickup: Pickup) -> None:
+        """Убрать собранный/слитый пикап из сетки и снять его событие."""
+        self._grid.remove(pickup)
+        if pickup._expiry_handle is not None:
+            pickup._expiry_handle.cancel()
+            pickup._expiry_handle = None
+
+    def update(self, dt: float, player) -> None:
+        """Обновить пикапы: магнит + сбор только рядом с игроком.
+
+        Истечение приходит событиями колеса таймеров.
+        """
+        if self._owns_timers:
+            self.timers.advance(dt)
+        removed = self._expired_since_update
+        self._expired_since_update = False
+        if self._over_cap:
+            self._over_cap = False
+            removed = self._enforce_cap() or removed
+
+        grid = self._grid
+        half = max(player.width, player.height) / 2
+        reach = max(self.magnet_radius, half) + Pickup.SIZE
+        cx = player.x + player.width / 2
+        cy = player.y + player.height / 2
+        for p in grid.query_rect(cx - reach, cy - reach, cx + reach, cy + reach):
+            moved = p.attract(dt, player, self.magnet_radius, self.magnet_speed)
+            if p.collected:
+                self._forget(p)
+                removed = True
+            elif moved:
+                grid.move(p, p.x, p.y)
+
+        if removed:
+            self.pickups = [p for p in self.pickups if not p.is_expired]
 
     def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float) -> None:
-        for p in self.pickups:
-            p.draw(screen, camera_x, camera_y)
+        """Пикапы из ячеек в кадре — одним батчем готовых спрайтов."""
+        pad = Pickup.SIZE
+        visible = self._grid.query_rect(
+            camera_x - pad, camera_y - pad,
+            camera_x + screen.get_width(), camera_y + screen.get_height(),
+        )
+        sprite = self.sprites.pickup
+        blit_batch(screen, [
+            (sprite(type(p)), (int(p.x - camera_x), int(p.y - camera_y)))
+            for p in visible
+        ])
 
     def count(self) -> int:
         return len(self.pickups)
 
+    def positions_in(self, left: float, top: float,
+                     right: float, bottom: float) -> list:
+        """Координаты пикапов в прямоугольнике (превью сейва) — по сетке."""
+        return [(p.x, p.y) for p in self._grid.query_rect(left, top, right, bottom)
+                if left <= p.x < right and top <= p.y < bottom]
+
+    def clear(self) -> None:
+        for p in self.pickups:
+            if p._expiry_handle is not None:
+                p._expiry_handle.cancel()
+                p._expiry_handle = None
+        self.pickups = []
+        self._grid.clear()
+        self._expired_since_update = False
+
     # --- Сериализация ------------------------------------------------------
 
     def serialize(self) -> list:
         """Сохранить лежащие на земле пикапы."""
-        out = []
-        for p in self.pickups:
-            tid = _PICKUP_TYPE_IDS.get(type(p))
-            if tid is None:
-                continue  # неизвестный тип — пропускаем
-            out.append({
-                "type": tid,
-                "x": float(p.x),
-                "y": float(p.y),
-                "lifetime": float(p.lifetime),
-            })
-        return out
+        return self.capture()()
+
+    def capture(self, live: bool = False) -> CollectionSnapshot:
+        """Снимок для записи сейва: сырые поля сейчас, dict строк — по
+        ходу записи (в любом потоке). ``live=True`` — без копии, строки
+        из самих пикапов (синхронная запись).
+        ``with_uid=True`` добавляет uid пикапа (журнал автосейвов)."""
+        captured = None if live else list(self._raw_rows())
+
+        def rows(with_uid: bool = False):
+            source = self._raw_rows() if captured is None else captured
+            for uid, cls, x, y, expires_at, now, value in source:
+                tid = _PICKUP_TYPE_IDS.get(cls)
+                if tid is None:
+                    continue  # неизвестный тип — пропускаем
+                item = {
+                    "type": tid,
+                    "x": float(x),
+                    "y": float(y),
+                    "lifetime": float(expires_at - now),
+                    "value": int(value),
+                }
+                if with_uid:
+                    item["uid"] = uid
+                yield item
+
+        def positions_in(left, top, right, bottom):
+            return [(x, y) for _, _, x, y, *_ in captured
+                    if left <= x < right and top <= y < bottom]
+        return CollectionSnapshot(
+            rows, positions_in=None if live else positions_in
+        )
+
+    def _raw_rows(self):
+        return ((p.uid, type(p), p.x, p.y, p.expires_at, p.timers.now, p.value)
+                for p in self.pickups)
 
     def deserialize(self, data: list) -> None:
         """Восстановить пикапы из списка (заменяет текущие)."""
-        self.pickups = []
+        self.clear()
         if not data:
             return
-        for item in data:
-            tid = item.get("type")
-            cls = _PICKUP_TYPES.get(tid)
-            if cls is None:
-                continue
-            p = cls(float(item.get("x", 0)), float(item.get("y", 0)))
-            if "lifetime" in item:
-                p.lifetime = float(item["lifetime"])
-            self.pickups.append(p)
+        self.restore_rows(data)
 
+    def restore_rows(self, rows) -> None:
+        """Добавить пикапы из строк сейва (потоковая загрузка — пачками)."""
+        for item in rows:
+            p = pickup_from_dict(item)
+            if p is None:
+                continue
+            # Стаки из сейва уже слиты — восстанавливаем как есть
+            self.spawn(p, coalesce=False)
@@ -0,0 +1,95 @@
+"""
+RewindBuffer — кольцевой буфер снимков состояния для перемотки назад.
+
+Single Responsibility: хранить последние N секунд игры компактно и
+отдавать их от нового к старому. Что снимать и как применять — решает
+Game через SaveSystem (capture_state / apply_save_data_*), буфер видит
+только байты.
+
+Снимок — save_data без метаданных (игрок, враги, пикапы, статистика),
+сериализованный marshal: буфер живёт только в памяти процесса, поэтому
+нужен самый быстрый кодек без схемы, а не переносимый формат.
+
+Дельты: новейший снимок лежит целиком (head), каждый более старый —
+zlib-ом со словарём (zdict) из следующего за ним снимка. Соседние кадры
+почти совпадают, и дельта занимает десятки–сотни байт. Кодируется
+«старый относительно нового», поэтому:
+- перемотка идёт ровно в нужную сторону — шаг назад распаковывает
+  предыдущий снимок словарём из текущего;
+- вытеснение самого старого снимка ничего не ломает — от него не
+  зависит ни один другой.
+
+Память: буфер держит не больше ``budget_bytes`` (head + дельты) и не
+больше ``capacity`` снимков — лишнее вытесняется с хвоста при записи.
+"""
+import marshal
+import zlib
+from collections import deque
+from typing import Optional
+
+# Уровень zlib: 1 — быстрее всего, дельте соседних кадров хватает
+_LEVEL = 1
+
+
+def encode_state(state: dict) -> bytes:
+    """Снимок состояния -> байты (только для этого процесса)."""
+    return marshal.dumps(state)
+
+
+def decode_state(raw: bytes) -> dict:
+    return marshal.loads(raw)
+
+
+class RewindBuffer:
+    """Снимки от старого к новому: дельты в deque + новейший целиком."""
+
+    def __init__(self, capacity: int, budget_bytes: int):
+        if capacity < 1 or budget_bytes <= 0:
+            raise ValueError("capacity and budget_bytes must be positive")
+        self.capacity = int(capacity)
+        self.budget_bytes = int(budget_bytes)
+        self._head: Optional[bytes] = None
+        self._deltas: deque = deque()
+        self._delta_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._deltas) + (self._head is not None)
+
+    @property
+    def nbytes(self) -> int:
+        """Сколько байт занимают снимки сейчас."""
+        return self._delta_bytes + (len(self._head) if self._head is not None else 0)
+
+    def clear(self) -> None:
+        self._head = None
+        self._deltas.clear()
+        self._delta_bytes = 0
+
+    def push(self, raw: bytes) -> None:
+        """Добавить новейший снимок; прежний head становится дельтой."""
+        head = self._head
+        if head is not None:
+            packer = zlib.compressobj(_LEVEL, zdict=raw)
+            delta = packer.compress(head) + packer.flush()
+            self._deltas.append(delta)
+            self._delta_bytes += len(delta)
+        self._head = raw
+        deltas = self._deltas
+        while deltas and (len(deltas) + 1 > self.capacity
+                          or self._delta_bytes + len(raw) > self.budget_bytes):
+            self._delta_bytes -= len(deltas.popleft())
+
+    def step_back(self) -> Optional[bytes]:
+        """Новейший снимок; следующий вызов вернёт снимок старше.
+
+        Самый старый снимок не удаляется: перемотка упирается в него.
+        None — буфер пуст.
+        """
+        head = self._head
+        if head is None or not self._deltas:
+            return head
+        delta = self._deltas.pop()
+        self._delta_bytes -= len(delta)
+        unpacker = zlib.decompressobj(zdict=head)
+        self._head = unpacker.decompress(delta) + unpacker.flush()
+        return head
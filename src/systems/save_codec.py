@@ -0,0 +1,489 @@
+"""
+Бинарный формат сохранений (.sav).
+
+Single Responsibility: превратить save_data (тот же dict, что пишет JSON)
+в компактные байты и обратно. Что сохранять и куда — решает SaveSystem.
+
+Файл::
+
+    header   "ZSAV" | u16 версия контейнера | u8 сжатие | u8 резерв |
+             u32 длина несжатого тела                      (little-endian)
+    summary  (с версии 2) 72 байта сводки для меню: timestamp (32 байта
+             ASCII), autosave_reason (16 байт UTF-8), u32 уровень,
+             i32 HP, i32 max HP, f64 время игры
+    body     сжатая (zlib / lzma / none) последовательность секций:
+             4 байта тега | u32 длина | данные
+
+Заголовок и сводка имеют фиксированный размер (HEAD_SIZE): меню читает
+только их, не распаковывая тело (read_summary).
+
+Секции (META первой, строки коллекций — последними):
+
+- META — компактный JSON всего, что не ушло в столбцы (версия схемы,
+  игрок, мир, target_counts, произвольные доп. поля).
+- STAT — game_stats как типизированные пары имя → значение.
+- ENMY / PKUP — кусок врагов/пикапов (до ROW_BATCH строк) по столбцам:
+  число строк, затем каждый столбец целиком (строки — словарь
+  уникальных значений + u16 коды, числа — массив f64 / i64).
+- ENMJ / PKUJ — кусок, который не укладывается в схему столбцов
+  (лишние ключи, другие типы), как JSON-список — формат никогда не
+  теряет данные.
+- CRC  — последняя секция: u32 CRC32 всех байт тела (в несжатом виде)
+  до этой секции. Сводка в него не входит — она лишь копия данных тела
+  для меню. Ловит порчу и при сжатии none;
+  файлы без неё (записанные раньше) читаются без этой проверки, а
+  старые читатели пропускают её как незнакомую секцию.
+
+С версии 3 коллекция пишется несколькими кусками подряд, а тело
+сжимается и распаковывается потоково (write_save / iter_save_events):
+память при записи и чтении не зависит от размера мира. Версии 1–2 —
+тот же формат с одним куском на коллекцию, они читаются как есть.
+Декодер возвращает dict, равный исходному save_data, поэтому валидация
+и apply_* не знают, из какого формата пришёл сейв.
+"""
+import io
+import json
+import lzma
+import struct
+import sys
+import zlib
+from array import array
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from src.systems.save_stream import (
+    StreamedSave, batched, data_events, split_save_data,
+)
+
+
+class SaveFormatError(ValueError):
+    """Бинарный сейв повреждён или имеет неизвестный формат."""
+
+
+MAGIC = b"ZSAV"
+CONTAINER_VERSION = 3
+
+_HEADER = struct.Struct("<4sHBBI")
+_SUMMARY = struct.Struct("<32s16sIiid")
+# Сколько байт прочитать с начала файла, чтобы получить сводку
+HEAD_SIZE = _HEADER.size + _SUMMARY.size
+_SECTION = struct.Struct("<4sI")
+_U32 = struct.Struct("<I")
+
+COMPRESSION_IDS = {"none": 0, "zlib": 1, "lzma": 2}
+_COMPRESSION_NAMES = {v: k for k, v in COMPRESSION_IDS.items()}
+
+# Схемы столбцов: (ключ, тип) — 's' строка, 'd' float64, 'q' int64
+ENEMY_COLUMNS = (("type", "s"), ("x", "d"), ("y", "d"),
+                 ("health", "q"), ("attack_cooldown_timer", "d"))
+PICKUP_COLUMNS = (("type", "s"), ("x", "d"), ("y", "d"),
+                  ("lifetime", "d"), ("value", "q"))
+
+# Секции строк: коллекция -> (тег столбцов, тег JSON-куска)
+_ROW_TAGS = {"enemies": (b"ENMY", b"ENMJ"), "pickups": (b"PKUP", b"PKUJ")}
+_ROW_COLUMNS = {"enemies": ENEMY_COLUMNS, "pickups": PICKUP_COLUMNS}
+_TAG_ROWS = {}
+for _name, (_table_tag, _json_tag) in _ROW_TAGS.items():
+    _TAG_ROWS[_table_tag] = (_name, _ROW_COLUMNS[_name])
+    _TAG_ROWS[_json_tag] = (_name, None)
+
+_READ_SIZE = 1 << 16
+_SWAP = sys.byteorder != "little"
+
+
+def is_binary_save(head: bytes) -> bool:
+    """Начинаются ли байты с сигнатуры бинарного сейва."""
+    return head[:len(MAGIC)] == MAGIC
+
+
+def save_summary(save_data: dict) -> dict:
+    """Сводка сейва для списков в меню (общая для JSON и .sav).
+
+    Кидает ValueError / TypeError / AttributeError на битых данных.
+    """
+    player = save_data.get("player") or {}
+    stats = save_data.get("game_stats") or {}
+    return {
+        "timestamp": save_data.get("timestamp", "") or "",
+        "level": int(player.get("level", 0) or 0),
+        "hp": int(player.get("health", 0) or 0),
+        "max_hp": int(player.get("max_health", 0) or 0),
+        "play_time": float(stats.get("play_time", 0.0) or 0.0),
+        "reason": save_data.get("autosave_reason", "") or "",
+    }
+
+
+def _pack_summary(save_data: dict) -> bytes:
+    try:
+        summary = save_summary(save_data)
+        return _SUMMARY.pack(
+            _fixed(str(summary["timestamp"]), 32), _fixed(str(summary["reason"]), 16),
+            max(0, min(summary["level"], 0xFFFFFFFF)),
+            max(-2**31, min(summary["hp"], 2**31 - 1)),
+            max(-2**31, min(summary["max_hp"], 2**31 - 1)),
+            summary["play_time"],
+        )
+    except (ValueError, TypeError, AttributeError):
+        return _SUMMARY.pack(b"", b"", 0, 0, 0, 0.0)
+
+
+def _fixed(text: str, size: int) -> bytes:
+    """UTF-8, обрезанный до size байт по границе символа."""
+    return text.encode("utf-8")[:size].decode("utf-8", "ignore").encode("utf-8")
+
+
+def read_summary(head: bytes) -> Optional[dict]:
+    """Сводка из первых HEAD_SIZE байт .sav; None — контейнер v1 без сводки."""
+    if len(head) < _HEADER.size or not is_binary_save(head):
+        raise SaveFormatError("нет сигнатуры бинарного сейва")
+    version = _HEADER.unpack_from(head)[1]
+    if version < 2:
+        return None
+    if len(head) < HEAD_SIZE:
+        raise SaveFormatError("обрезанная сводка")
+    timestamp, reason, level, hp, max_hp, play_time = _SUMMARY.unpack_from(
+        head, _HEADER.size
+    )
+    return {
+        "timestamp": timestamp.rstrip(b"\0").decode("utf-8", "replace"),
+        "level": level,
+        "hp": hp,
+        "max_hp": max_hp,
+        "play_time": play_time,
+        "reason": reason.rstrip(b"\0").decode("utf-8", "replace"),
+    }
+
+
+# --- Кодирование -------------------------------------------------------------
+
+def encode_save(save_data: dict, compression: str = "zlib") -> bytes:
+    """save_data -> байты файла .sav."""
+    out = io.BytesIO()
+    write_save(out, save_data, compression)
+    return out.getvalue()
+
+
+def write_save(out, save_data: dict, compression: str = "zlib") -> None:
+    """Записать save_data в ``out`` (бинарный поток с seek) потоково.
+
+    Строки коллекций (списки или RowStream) кодируются кусками по
+    ROW_BATCH и сразу уходят в компрессор, поэтому память не зависит
+    от числа врагов/пикапов. Длина тела известна только в конце —
+    заголовок дописывается после тела.
+    """
+    if compression not in COMPRESSION_IDS:
+        raise SaveFormatError(f"неизвестное сжатие: {compression}")
+    head, collections = split_save_data(save_data)
+    meta = dict(head)
+    sections = []
+    stats = _encode_stats(meta.get("game_stats"))
+    if stats is not None:
+        del meta["game_stats"]
+    sections.append((b"META", json.dumps(meta, ensure_ascii=False,
+                                         separators=(",", ":")).encode("utf-8")))
+    if stats is not None:
+        sections.append((b"STAT", stats))
+
+    start = out.tell()
+    out.write(_HEADER.pack(MAGIC, CONTAINER_VERSION, COMPRESSION_IDS[compression],
+                           0, 0))
+    out.write(_pack_summary(save_data))
+    body = _BodyWriter(out, compression)
+    for tag, data in sections:
+        body.write_section(tag, data)
+    for name, rows in collections:
+        table_tag, json_tag = _ROW_TAGS[name]
+        columns = _ROW_COLUMNS[name]
+        for batch in batched(rows):
+            table = _encode_table(batch, columns)
+            if table is not None:
+                body.write_section(table_tag, table)
+            else:
+                # Кусок не укладывается в схему столбцов — JSON-список
+                body.write_section(json_tag, json.dumps(
+                    batch, ensure_ascii=False, separators=(",", ":")
+                ).encode("utf-8"))
+    body.write_section(b"CRC ", _U32.pack(body.crc))
+    body.close()
+    if body.size > 0xFFFFFFFF:
+        raise SaveFormatError("тело сейва больше 4 ГБ")
+    end = out.tell()
+    out.seek(start)
+    out.write(_HEADER.pack(MAGIC, CONTAINER_VERSION, COMPRESSION_IDS[compression],
+                           0, body.size))
+    out.seek(end)
+
+
+class _BodyWriter:
+    """Секции тела через инкрементальный компрессор (+ CRC32 несжатых байт)."""
+
+    def __init__(self, out, compression: str):
+        self._out = out
+        self._compressor = (zlib.compressobj(6) if compression == "zlib"
+                            else lzma.LZMACompressor() if compression == "lzma"
+                            else None)
+        self.size = 0
+        self.crc = 0
+
+    def write_section(self, tag: bytes, data: bytes) -> None:
+        for part in (_SECTION.pack(tag, len(data)), data):
+            self.size += len(part)
+            self.crc = zlib.crc32(part, self.crc)
+            if self._compressor is not None:
+                part = self._compressor.compress(part)
+            self._out.write(part)
+
+    def close(self) -> None:
+        if self._compressor is not None:
+            self._out.write(self._compressor.flush())
+
+
+def _to_bytes(arr: array) -> bytes:
+    if _SWAP:
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _encode_table(rows, columns: Sequence[Tuple[str, str]]) -> Optional[bytes]:
+    """Список dict -> столбцы. None, если строки не подходят под схему."""
+    if not isinstance(rows, list):
+        return None
+    keys = {name for name, _ in columns}
+    for row in rows:
+        if not isinstance(row, dict) or row.keys() != keys:
+            return None
+    parts = [_U32.pack(len(rows))]
+    for name, kind in columns:
+        values = [row[name] for row in rows]
+        if kind == "s":
+            if not all(isinstance(v, str) for v in values):
+                return None
+            table = sorted(set(values))
+            if len(table) > 0xFFFF:
+                return None
+            index = {v: i for i, v in enumerate(table)}
+            table_bytes = json.dumps(table, ensure_ascii=False).encode("utf-8")
+            parts.append(_U32.pack(len(table_bytes)))
+            parts.append(table_bytes)
+            parts.append(_to_bytes(array("H", [index[v] for v in values])))
+        else:
+            expected = float if kind == "d" else int
+            if not all(type(v) is expected for v in values):
+                return None
+            try:
+                parts.append(_to_bytes(array(kind, values)))
+            except OverflowError:
+                return None
+    return b"".join(parts)
+
+
+_STAT_TYPES = {float: b"d", int: b"q", bool: b"?"}
+
+
+def _encode_stats(stats) -> Optional[bytes]:
+    """game_stats -> пары имя/тип/значение. None, если есть не-числа."""
+    if not isinstance(stats, dict):
+        return None
+    parts = [_U32.pack(len(stats))]
+    for name, value in stats.items():
+        code = _STAT_TYPES.get(type(value))
+        if code is None or not isinstance(name, str):
+            return None
+        name_bytes = name.encode("utf-8")
+        if len(name_bytes) > 0xFF:
+            return None
+        try:
+            packed = struct.pack("<" + code.decode(), value)
+        except struct.error:
+            return None
+        parts.append(bytes((len(name_bytes),)) + name_bytes + code + packed)
+    return b"".join(parts)
+
+
+# --- Декодирование -----------------------------------------------------------
+
+def decode_save(blob: bytes) -> dict:
+    """Байты файла .sav -> save_data."""
+    return StreamedSave(iter_save_events(io.BytesIO(blob))).materialize()
+
+
+def iter_save_events(fileobj) -> Iterator[tuple]:
+    """События чтения .sav из потока (см. save_stream): голова, затем
+    строки кусками — распаковка идёт блоками, файл целиком не читается.
+
+    Повреждение тела обнаруживается не раньше испорченного места (а
+    контрольная сумма — только в конце): часть событий к этому моменту
+    уже выдана.
+    """
+    for tag, view in _sections(fileobj):
+        try:
+            if tag == b"META":
+                meta = json.loads(bytes(view).decode("utf-8"))
+                if not isinstance(meta, dict):
+                    raise SaveFormatError("META должна быть объектом")
+                yield from data_events(meta)
+            elif tag == b"STAT":
+                yield ("field", "game_stats", _decode_stats(view))
+            elif tag in _TAG_ROWS:
+                name, columns = _TAG_ROWS[tag]
+                if columns is not None:
+                    rows = _decode_table(view, columns)
+                else:
+                    rows = json.loads(bytes(view).decode("utf-8"))
+                    if not isinstance(rows, list):
+                        raise SaveFormatError(f"секция {tag!r} должна быть списком")
+                yield ("rows", name, rows)
+        except SaveFormatError:
+            raise
+        except (ValueError, struct.error, IndexError) as e:
+            raise SaveFormatError(f"повреждённая секция: {e}")
+
+
+def verify_save(fileobj) -> bool:
+    """Цел ли .sav: секции, длина тела и CRC — без разбора столбцов."""
+    try:
+        for _ in _sections(fileobj):
+            pass
+    except SaveFormatError:
+        return False
+    return True
+
+
+def _sections(fileobj) -> Iterator[Tuple[bytes, memoryview]]:
+    """(тег, данные) секций тела по порядку; проверяет заголовок, META
+    первой, CRC и длину тела. Кидает SaveFormatError."""
+    head = fileobj.read(_HEADER.size)
+    if len(head) < _HEADER.size or not is_binary_save(head):
+        raise SaveFormatError("нет сигнатуры бинарного сейва")
+    _, version, compression_id, _, body_len = _HEADER.unpack(head)
+    if version > CONTAINER_VERSION:
+        raise SaveFormatError(f"неподдерживаемая версия контейнера: {version}")
+    compression = _COMPRESSION_NAMES.get(compression_id)
+    if compression is None:
+        raise SaveFormatError(f"неизвестное сжатие: {compression_id}")
+    if version >= 2 and len(fileobj.read(_SUMMARY.size)) < _SUMMARY.size:
+        raise SaveFormatError("обрезанная сводка")
+
+    body = _BodyReader(fileobj, compression)
+    seen_meta = False
+    # Куски одной коллекции идут подряд; v1/v2 — ровно один кусок
+    while not body.at_end():
+        crc = body.crc
+        tag, size = _SECTION.unpack(body.read(_SECTION.size))
+        view = memoryview(body.read(size))
+        if not seen_meta:
+            if tag != b"META":
+                raise SaveFormatError("нет секции META")
+            seen_meta = True
+        if tag == b"CRC ":
+            if size != _U32.size or _U32.unpack(view)[0] != crc:
+                raise SaveFormatError("контрольная сумма не совпадает")
+            continue
+        yield tag, view
+    if not seen_meta:
+        raise SaveFormatError("нет секции META")
+    body.finish()
+    if body.size != body_len:
+        raise SaveFormatError("длина тела не совпадает с заголовком")
+
+
+class _BodyReader:
+    """Распаковка тела блоками по мере чтения секций."""
+
+    def __init__(self, fileobj, compression: str):
+        self._f = fileobj
+        self._decompressor = (zlib.decompressobj() if compression == "zlib"
+                              else lzma.LZMADecompressor() if compression == "lzma"
+                              else None)
+        self._zlib = compression == "zlib"
+        self._buf = bytearray()
+        self._eof = False
+        self.size = 0
+        self.crc = 0
+
+    def _more(self) -> None:
+        # Выход распаковки ограничен: сейв сжимается в десятки раз, и
+        # блок файла целиком раздулся бы в мегабайты
+        d = self._decompressor
+        try:
+            if d is None:
+                out = self._f.read(_READ_SIZE)
+                self._eof = not out
+            elif self._zlib:
+                data = d.unconsumed_tail or self._f.read(_READ_SIZE)
+                out = d.decompress(data, _READ_SIZE) if data else b""
+                self._eof = not data
+            else:
+                data = self._f.read(_READ_SIZE) if d.needs_input else b""
+                out = d.decompress(data, _READ_SIZE)
+                self._eof = d.eof or (d.needs_input and not data)
+        except (zlib.error, lzma.LZMAError) as e:
+            raise SaveFormatError(f"тело не распаковывается: {e}")
+        self._buf += out
+
+    def read(self, n: int) -> bytes:
+        while len(self._buf) < n and not self._eof:
+            self._more()
+        if len(self._buf) < n:
+            raise SaveFormatError("обрезанное тело")
+        chunk = bytes(self._buf[:n])
+        del self._buf[:n]
+        self.size += n
+        self.crc = zlib.crc32(chunk, self.crc)
+        return chunk
+
+    def at_end(self) -> bool:
+        while not self._buf and not self._eof:
+            self._more()
+        return not self._buf
+
+    def finish(self) -> None:
+        """Поток сжатия должен закончиться (иначе файл обрезан)."""
+        if self._decompressor is not None and not self._decompressor.eof:
+            raise SaveFormatError("тело не распаковывается: обрезанный поток")
+
+
+def _read_array(view: memoryview, offset: int, kind: str, count: int):
+    arr = array(kind)
+    end = offset + arr.itemsize * count
+    if end > len(view):
+        raise SaveFormatError("обрезанный столбец")
+    arr.frombytes(view[offset:end])
+    if _SWAP:
+        arr.byteswap()
+    return arr, end
+
+
+def _decode_table(view: memoryview, columns: Sequence[Tuple[str, str]]) -> List[dict]:
+    (count,) = _U32.unpack_from(view, 0)
+    offset = _U32.size
+    decoded = []
+    for _, kind in columns:
+        if kind == "s":
+            (table_len,) = _U32.unpack_from(view, offset)
+            offset += _U32.size
+            table = json.loads(bytes(view[offset:offset + table_len]).decode("utf-8"))
+            offset += table_len
+            codes, offset = _read_array(view, offset, "H", count)
+            decoded.append([table[c] for c in codes])
+        else:
+            values, offset = _read_array(view, offset, kind, count)
+            decoded.append(values.tolist())
+    names = [name for name, _ in columns]
+    return [dict(zip(names, row)) for row in zip(*decoded)] if count else []
+
+
+def _decode_stats(view: memoryview) -> dict:
+    (count,) = _U32.unpack_from(view, 0)
+    offset = _U32.size
+    stats = {}
+    for _ in range(count):
+        name_len = view[offset]
+        offset += 1
+        name = bytes(view[offset:offset + name_len]).decode("utf-8")
+        offset += name_len
+        code = chr(view[offset])
+        offset += 1
+        fmt = struct.Struct("<" + code)
+        (stats[name],) = fmt.unpack_from(view, offset)
+        offset += fmt.size
+    return stats
@@ -0,0 +1,102 @@
+"""
+SaveIndex — индекс сводок сейвов (saves/index.meta).
+
+Single Responsibility: помнить сводку (timestamp, уровень, HP, время
+игры, причина автосейва) каждого файла сохранения, чтобы списки в меню
+не разбирали сейвы целиком. Что в сводке — save_codec.save_summary;
+когда обновлять — решает SaveSystem (после записи и после чтения).
+
+Запись индекса привязана к (mtime_ns, size) файла: если сейв
+подменили снаружи, запись считается устаревшей и SaveSystem читает
+файл заново. Индекс — только кэш: его можно удалить, он пересоберётся.
+Файл без расширения сейва, чтобы меню не принимало его за сохранение.
+
+Потокобезопасен: пишут поток записи сейвов и фоновый загрузчик меню.
+"""
+import json
+import os
+import tempfile
+import threading
+from typing import Optional
+
+
+class SaveIndex:
+    """Сводки сейвов по относительному пути, с проверкой по stat()."""
+
+    FILENAME = "index.meta"
+
+    def __init__(self, saves_dir: str):
+        self.saves_dir = saves_dir
+        self.path = os.path.join(saves_dir, self.FILENAME)
+        self._lock = threading.Lock()
+        self._entries: Optional[dict] = None  # читается при первом обращении
+        self._dirty = False
+
+    def _key(self, filepath: str) -> str:
+        return os.path.relpath(filepath, self.saves_dir).replace(os.sep, "/")
+
+    @staticmethod
+    def _stamp(filepath: str):
+        st = os.stat(filepath)
+        return [st.st_mtime_ns, st.st_size]
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    entries = json.load(f)
+                self._entries = entries if isinstance(entries, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, filepath: str) -> Optional[dict]:
+        """Сводка файла, если он не менялся с момента put(); иначе None."""
+        try:
+            stamp = self._stamp(filepath)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._load().get(self._key(filepath))
+        if not isinstance(entry, dict) or entry.get("stamp") != stamp:
+            return None
+        summary = entry.get("summary")
+        return dict(summary) if isinstance(summary, dict) else None
+
+    def put(self, filepath: str, summary: dict) -> None:
+        """Запомнить сводку для текущего состояния файла."""
+        try:
+            stamp = self._stamp(filepath)
+        except OSError:
+            return
+        with self._lock:
+            self._load()[self._key(filepath)] = {"stamp": stamp,
+                                                 "summary": dict(summary)}
+            self._dirty = True
+
+    def discard(self, filepath: str) -> None:
+        with self._lock:
+            if self._load().pop(self._key(filepath), None) is not None:
+                self._dirty = True
+
+    def flush(self) -> None:
+        """Записать индекс на диск, если он менялся (атомарно)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            payload = json.dumps(self._entries, ensure_ascii=False,
+                                 separators=(",", ":")).encode("utf-8")
+            try:
+                os.makedirs(self.saves_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", dir=self.saves_dir)
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(payload)
+                    os.replace(tmp_path, self.path)
+                except OSError:
+                    os.remove(tmp_path)
+                    raise
+            except OSError as e:
+                # Индекс — кэш: без него меню просто читает сейвы целиком
+                print(f"Не удалось записать индекс сейвов: {e}")
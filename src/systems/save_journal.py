@@ -0,0 +1,419 @@
+"""
+SaveJournal — журналируемые автосейвы: база + дельты.
+
+Single Responsibility: хранить последовательность автосейвов одной
+сессии как «полный снимок изредка + что изменилось с прошлого раза»
+и собирать из них обычный save_data. Что снимать и когда — решает
+SaveSystem; кодирование базы — её же _encode/_read_save_file.
+
+Файлы (saves/autosave/journal/)::
+
+    base.json | base.sav   полный save_data на момент последней
+                           компактации (+ uid строк и поле "journal")
+    journal.log            по строке компактного JSON на автосейв
+
+Запись дельты::
+
+    {"seq": 7, "clock": 812.5,
+     "doc": {"put": {...}, "patch": {"player": {"x": 10.0}}, "drop": [...],
+             "unset": {"player": ["old_key"]}},
+     "enemies": {"add": [строки], "upd": [[uid, {поле: значение}]],
+                 "del": [uid]},
+     "pickups": {...}}
+
+Враги и пикапы сопоставляются по uid. Позиция считается изменённой,
+если сдвиг больше ``position_epsilon`` пикселей; таймеры (lifetime,
+attack_cooldown_timer) хранятся как дедлайны на игровых часах и
+меняются, только если остаток отличается больше чем на
+``timer_tolerance``. Стоящий пикап и бездействующий враг в дельту не
+попадают; погрешность восстановления не больше этих допусков.
+
+Компактация переписывает базу текущим состоянием и обнуляет журнал.
+Строки журнала с seq не больше seq базы пропускаются, поэтому сбой
+между записью базы и очисткой журнала безопасен; оборванная последняя
+строка (сбой во время дозаписи) отбрасывается.
+"""
+import json
+import os
+from typing import Callable, Optional
+
+_UNCHANGED = object()
+
+# Коллекции с построчным сравнением: имя -> (поля-позиции, поля-таймеры)
+_COLLECTIONS = {
+    "enemies": (("x", "y"), ("attack_cooldown_timer",)),
+    "pickups": (("x", "y"), ("lifetime",)),
+}
+
+
+def _rows_of(save_data: dict, name: str):
+    if name == "enemies":
+        enemies = save_data.get("enemies")
+        return enemies.get("enemies") if isinstance(enemies, dict) else None
+    rows = save_data.get(name)
+    return rows if isinstance(rows, list) else None
+
+
+def _split(save_data: dict, clock: float):
+    """save_data -> (doc без коллекций, {имя: {uid: строка} | None}).
+
+    Таймеры строк переводятся в дедлайны на часах ``clock``. Строки без
+    uid (менеджер без capture) получают отрицательный номер по индексу.
+    """
+    doc = dict(save_data)
+    collections = {}
+    for name, (_, timers) in _COLLECTIONS.items():
+        rows = _rows_of(save_data, name)
+        if rows is None:
+            collections[name] = None
+            continue
+        if name == "enemies":
+            doc["enemies"] = {k: v for k, v in doc["enemies"].items()
+                              if k != "enemies"}
+        else:
+            del doc[name]
+        table = {}
+        for index, row in enumerate(rows):
+            row = dict(row)
+            uid = row.pop("uid", None)
+            if uid is None:
+                uid = -(index + 1)
+            for field in timers:
+                if field in row:
+                    row[field] = clock + float(row[field])
+            table[uid] = row
+        collections[name] = table
+    return doc, collections
+
+
+class JournalState:
+    """Текущее состояние журнала в памяти (только поток записи)."""
+
+    __slots__ = ("doc", "collections", "clock", "seq")
+
+    def __init__(self, doc: dict, collections: dict, clock: float, seq: int):
+        self.doc = doc
+        self.collections = collections
+        self.clock = clock
+        self.seq = seq
+
+    @classmethod
+    def from_save_data(cls, save_data: dict, clock: float, seq: int = 0):
+        doc, collections = _split(save_data, clock)
+        return cls(doc, collections, clock, seq)
+
+    def to_save_data(self, with_uid: bool = False) -> dict:
+        """Собрать обычный save_data на часах self.clock."""
+        save_data = dict(self.doc)
+        for name, (_, timers) in _COLLECTIONS.items():
+            table = self.collections.get(name)
+            if table is None:
+                continue
+            rows = []
+            for uid, row in table.items():
+                row = dict(row)
+                for field in timers:
+                    if field in row:
+                        row[field] = max(0.0, row[field] - self.clock)
+                if with_uid and uid >= 0:
+                    row["uid"] = uid
+                rows.append(row)
+            if name == "enemies":
+                enemies = save_data.get("enemies")
+                save_data["enemies"] = dict(
+                    enemies if isinstance(enemies, dict) else {}, enemies=rows
+                )
+            else:
+                save_data[name] = rows
+        return save_data
+
+    # --- Дельты -----------------------------------------------------------
+
+    def diff(self, new: "JournalState", position_epsilon: float,
+             timer_tolerance: float) -> dict:
+        """Запись журнала, переводящая self в new (self не меняется)."""
+        record = {"seq": new.seq, "clock": new.clock}
+        doc = _diff_doc(self.doc, new.doc)
+        if doc:
+            record["doc"] = doc
+        for name, (positions, timers) in _COLLECTIONS.items():
+            delta = _diff_collection(
+                self.collections.get(name), new.collections.get(name),
+                positions, timers, new.clock, position_epsilon, timer_tolerance,
+            )
+            if delta is not _UNCHANGED:
+                record[name] = delta
+        return record
+
+    def apply(self, record: dict) -> None:
+        """Применить запись журнала (replay и ведение состояния)."""
+        doc = record.get("doc") or {}
+        for key, value in (doc.get("put") or {}).items():
+            self.doc[key] = value
+        for key, fields in (doc.get("patch") or {}).items():
+            section = dict(self.doc.get(key) or {})
+            section.update(fields)
+            self.doc[key] = section
+        for key, names in (doc.get("unset") or {}).items():
+            section = dict(self.doc.get(key) or {})
+            for name in names:
+                section.pop(name, None)
+            self.doc[key] = section
+        for key in doc.get("drop") or ():
+            self.doc.pop(key, None)
+
+        for name in _COLLECTIONS:
+            if name not in record:
+                continue
+            delta = record[name]
+            if delta is None:
+                self.collections[name] = None
+                continue
+            table = self.collections.get(name)
+            if table is None or delta.get("reset"):
+                table = self.collections[name] = {}
+            for uid in delta.get("del") or ():
+                table.pop(uid, None)
+            for uid, fields in delta.get("upd") or ():
+                row = table.get(uid)
+                if row is not None:
+                    row.update(fields)
+            for row in delta.get("add") or ():
+                row = dict(row)
+                table[row.pop("uid")] = row
+        self.clock = record.get("clock", self.clock)
+        self.seq = record.get("seq", self.seq)
+
+
+def _diff_doc(old: dict, new: dict) -> dict:
+    put, patch, unset = {}, {}, {}
+    for key, value in new.items():
+        if key not in old:
+            put[key] = value
+            continue
+        before = old[key]
+        if before == value:
+            continue
+        if isinstance(before, dict) and isinstance(value, dict):
+            changed = {k: v for k, v in value.items()
+                       if k not in before or before[k] != v}
+            removed = [k for k in before if k not in value]
+            if changed:
+                patch[key] = changed
+            if removed:
+                unset[key] = removed
+        else:
+            put[key] = value
+    drop = [key for key in old if key not in new]
+    out = {}
+    if put:
+        out["put"] = put
+    if patch:
+        out["patch"] = patch
+    if unset:
+        out["unset"] = unset
+    if drop:
+        out["drop"] = drop
+    return out
+
+
+def _diff_collection(old: Optional[dict], new: Optional[dict], positions,
+                     timers, clock: float, position_epsilon: float,
+                     timer_tolerance: float):
+    """Дельта коллекции; None — коллекция пропала, _UNCHANGED — без изменений."""
+    if new is None:
+        return _UNCHANGED if old is None else None
+    reset = old is None
+    if reset:
+        old = {}
+    add, upd = [], []
+    for uid, row in new.items():
+        before = old.get(uid)
+        if before is None or before.keys() != row.keys():
+            add.append(dict(row, uid=uid))
+            continue
+        changed = {}
+        for field, value in row.items():
+            prev = before[field]
+            if field in positions:
+                if abs(value - prev) > position_epsilon:
+                    changed[field] = value
+            elif field in timers:
+                if abs(max(0.0, value - clock) - max(0.0, prev - clock)) > timer_tolerance:
+                    changed[field] = value
+            elif value != prev:
+                changed[field] = value
+        if changed:
+            upd.append([uid, changed])
+    removed = [uid for uid in old if uid not in new]
+    if not (add or upd or removed or reset):
+        return _UNCHANGED
+    delta = {}
+    if reset:
+        delta["reset"] = True
+    if add:
+        delta["add"] = add
+    if upd:
+        delta["upd"] = upd
+    if removed:
+        delta["del"] = removed
+    return delta
+
+
+class SaveJournal:
+    """База + журнал дельт в одной папке.
+
+    ``write_save(path, save_data)`` и ``read_save(path)`` — атомарная
+    запись и чтение сейва в формате SaveSystem; ``extensions`` —
+    расширения базы, первое — текущий формат. Все методы, кроме
+    exists/mtime, вызываются из одного потока (SaveWriter).
+    """
+
+    BASE_STEM = "base"
+    LOG_NAME = "journal.log"
+
+    def __init__(self, directory: str, write_save: Callable, read_save: Callable,
+                 extensions, position_epsilon: float = 32.0,
+                 timer_tolerance: float = 0.5, compact_every: int = 20):
+        self.directory = directory
+        self._write_save = write_save
+        self._read_save = read_save
+        self._extensions = tuple(extensions)
+        self.position_epsilon = float(position_epsilon)
+        self.timer_tolerance = float(timer_tolerance)
+        self.compact_every = max(1, int(compact_every))
+        self.log_path = os.path.join(directory, self.LOG_NAME)
+        # Состояние сессии: None — следующая запись пишет новую базу
+        self._state: Optional[JournalState] = None
+        self._base_seq = 0
+        self._base_bytes = 0
+        self._log_bytes = 0
+
+    # --- Пути ---------------------------------------------------------------
+
+    def base_path(self) -> Optional[str]:
+        """Путь существующей базы (в любом формате) или None."""
+        stem = os.path.join(self.directory, self.BASE_STEM)
+        for ext in self._extensions:
+            if os.path.exists(stem + ext):
+                return stem + ext
+        return None
+
+    def exists(self) -> bool:
+        return self.base_path() is not None
+
+    def mtime(self) -> float:
+        """Время последней записи (база или журнал)."""
+        times = []
+        for path in (self.base_path(), self.log_path):
+            try:
+                times.append(os.path.getmtime(path))
+            except (OSError, TypeError):
+                pass
+        return max(times, default=0.0)
+
+    # --- Запись -------------------------------------------------------------
+
+    def restart(self) -> None:
+        """Новая сессия (новая игра / загрузка): следующая запись — база."""
+        self._state = None
+
+    def record(self, save_data: dict, clock: float) -> str:
+        """Записать автосейв: дельту в журнал или, в начале сессии, базу.
+
+        ``save_data`` — с uid в строках врагов/пикапов, ``clock`` — время
+        игровых часов на момент снимка. Возвращает путь записанного файла.
+        """
+        state = self._state
+        seq = state.seq + 1 if state is not None else self._base_seq + 1
+        new = JournalState.from_save_data(save_data, clock, seq)
+        if state is None or clock < state.clock:
+            # Часы пошли заново — дедлайны прежних строк не сравнимы
+            self._state = new
+            return self.compact()
+        record = state.diff(new, self.position_epsilon, self.timer_tolerance)
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+                + "\n").encode("utf-8")
+        with open(self.log_path, "ab") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        # Дальше сравниваем с тем, что восстановит replay, а не с new
+        state.apply(record)
+        self._log_bytes += len(line)
+        return self.log_path
+
+    def needs_compaction(self) -> bool:
+        """Журнал длинный или перерос базу — пора свернуть."""
+        if self._state is None:
+            return False
+        return (self._state.seq - self._base_seq >= self.compact_every
+                or self._log_bytes > self._base_bytes)
+
+    def compact(self) -> str:
+        """Свернуть журнал в новую базу. Возвращает путь базы."""
+        state = self._state
+        save_data = state.to_save_data(with_uid=True)
+        save_data["journal"] = {"seq": state.seq, "clock": state.clock}
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, self.BASE_STEM + self._extensions[0])
+        self._write_save(path, save_data)
+        # База уже содержит всё до state.seq; строки журнала не нужны
+        with open(self.log_path, "wb"):
+            pass
+        self._base_seq = state.seq
+        self._base_bytes = os.path.getsize(path)
+        self._log_bytes = 0
+        return path
+
+    def delete(self) -> bool:
+        """Удалить базу и журнал. False — удалять было нечего."""
+        removed = False
+        stem = os.path.join(self.directory, self.BASE_STEM)
+        for path in [stem + ext for ext in self._extensions] + [self.log_path]:
+            if os.path.exists(path):
+                os.remove(path)
+                removed = True
+        self._state = None
+        return removed
+
+    # --- Чтение -------------------------------------------------------------
+
+    def load(self) -> Optional[dict]:
+        """База + replay журнала -> save_data (None — журнала нет).
+
+        Ошибки чтения базы пробрасываются (SaveSystem считает их
+        повреждённым сейвом); оборванный хвост журнала отбрасывается.
+        """
+        path = self.base_path()
+        if path is None:
+            return None
+        base = self._read_save(path)
+        header = base.pop("journal", None) or {}
+        state = JournalState.from_save_data(
+            base, float(header.get("clock", 0.0)), int(header.get("seq", 0))
+        )
+        for record in self._read_records():
+            seq = record.get("seq")
+            if not isinstance(seq, int) or seq <= state.seq:
+                continue
+            if seq != state.seq + 1:
+                break  # пропуск в последовательности — дальше не доверяем
+            state.apply(record)
+        return state.to_save_data()
+
+    def _read_records(self):
+        try:
+            with open(self.log_path, "rb") as f:
+                lines = f.read().split(b"\n")
+        except OSError:
+            return
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line.decode("utf-8"))
+            except (ValueError, UnicodeDecodeError):
+                return  # оборванная запись — конец журнала
+            if isinstance(record, dict):
+                yield record
@@ -0,0 +1,219 @@
+"""
+SqliteSaveStore — хранилище сейвов в одной базе SQLite (saves/saves.db).
+
+Single Responsibility: хранить записи сохранений (quicksave, ручные
+слоты, автосейвы) и отвечать на вопросы «что есть / что последнее /
+какой слот затереть» индексными запросами. Что сохранять и в каком
+формате кодировать payload (JSON или .sav) — решает SaveSystem.
+
+Таблица ``saves``: ключ (kind, slot_id), столбцы сводки для меню
+(timestamp, level, hp, max_hp, play_time, reason), время записи
+``saved_at`` и сам сейв BLOB-ом (его длина — ``size`` в сводке: по
+saved_at и size SaveSystem кэширует проверку целостности). Индекс (kind, saved_at) обслуживает
+ротацию автосейвов и «последний сейв».
+
+Режим WAL: запись автосейва в фоне не блокирует чтение списка в меню.
+Соединение своё на каждый поток (sqlite3 не разрешает делить их между
+потоками без check_same_thread=False) — поток записи сейвов, загрузчик
+сводок меню и главный поток работают параллельно.
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+QUICKSAVE_SLOT = 0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    kind      TEXT    NOT NULL,
+    slot_id   INTEGER NOT NULL,
+    saved_at  REAL    NOT NULL,
+    timestamp TEXT    NOT NULL DEFAULT '',
+    level     INTEGER NOT NULL DEFAULT 0,
+    hp        INTEGER NOT NULL DEFAULT 0,
+    max_hp    INTEGER NOT NULL DEFAULT 0,
+    play_time REAL    NOT NULL DEFAULT 0,
+    reason    TEXT    NOT NULL DEFAULT '',
+    valid     INTEGER NOT NULL DEFAULT 1,
+    payload   BLOB    NOT NULL,
+    PRIMARY KEY (kind, slot_id)
+);
+CREATE INDEX IF NOT EXISTS saves_by_time ON saves (kind, saved_at);
+"""
+
+_SUMMARY_COLUMNS = ("timestamp", "level", "hp", "max_hp", "play_time", "reason")
+_META_SELECT = ("SELECT kind, slot_id, saved_at, valid, length(payload), "
+                + ", ".join(_SUMMARY_COLUMNS) + " FROM saves")
+
+
+class SqliteSaveStore:
+    """Записи сейвов в SQLite. Все методы потокобезопасны."""
+
+    FILENAME = "saves.db"
+
+    def __init__(self, path: str):
+        self.path = path
+        # Базы не было — SaveSystem может импортировать файловые сейвы
+        self.created = not os.path.exists(path)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # В WAL NORMAL не теряет целостность, только последние
+            # транзакции при отключении питания — для сейвов игры достаточно
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Закрыть соединения всех потоков (выход из игры, тесты)."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass  # соединение чужого потока — закроется вместе с ним
+        self._local = threading.local()
+
+    # --- Запись -----------------------------------------------------------
+
+    def put(self, kind: str, slot_id: int, payload: bytes,
+            summary: Optional[dict], saved_at: float = None) -> None:
+        """Записать (или заменить) сейв ``kind``/``slot_id``."""
+        with self._connect() as conn:
+            self._put(conn, kind, slot_id, payload, summary, saved_at)
+
+    @staticmethod
+    def _put(conn, kind, slot_id, payload, summary, saved_at) -> None:
+        valid = summary is not None
+        summary = summary or {}
+        conn.execute(
+            "INSERT OR REPLACE INTO saves (kind, slot_id, saved_at, valid, "
+            + ", ".join(_SUMMARY_COLUMNS) + ", payload) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (kind, int(slot_id), time.time() if saved_at is None else saved_at,
+             int(valid),
+             str(summary.get("timestamp", "")), int(summary.get("level", 0)),
+             int(summary.get("hp", 0)), int(summary.get("max_hp", 0)),
+             float(summary.get("play_time", 0.0)), str(summary.get("reason", "")),
+             sqlite3.Binary(payload)),
+        )
+
+    def put_autosave(self, payload: bytes, summary: Optional[dict],
+                     limit: int) -> int:
+        """Записать автосейв с ротацией одной транзакцией. Возвращает slot_id.
+
+        Слот — первый свободный в 1..limit, иначе самый старый; слоты
+        больше limit (лимит уменьшили в конфиге) удаляются.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "WITH RECURSIVE n(s) AS (SELECT 1 UNION ALL "
+                "SELECT s + 1 FROM n WHERE s < ?) "
+                "SELECT s FROM n WHERE s NOT IN "
+                "(SELECT slot_id FROM saves WHERE kind = 'autosave') "
+                "ORDER BY s LIMIT 1",
+                (limit,),
+            ).fetchone()
+            if row is None:
+                row = conn.execute(
+                    "SELECT slot_id FROM saves WHERE kind = 'autosave' "
+                    "AND slot_id <= ? ORDER BY saved_at, slot_id LIMIT 1",
+                    (limit,),
+                ).fetchone()
+            slot_id = row[0]
+            self._put(conn, "autosave", slot_id, payload, summary, None)
+            conn.execute(
+                "DELETE FROM saves WHERE kind = 'autosave' AND slot_id > ?",
+                (limit,),
+            )
+        return slot_id
+
+    def delete(self, kind: str, slot_id: int) -> bool:
+        with self._connect() as conn:
+            cur = conn.execute(
+                "DELETE FROM saves WHERE kind = ? AND slot_id = ?",
+                (kind, int(slot_id)),
+            )
+        return cur.rowcount > 0
+
+    # --- Чтение -----------------------------------------------------------
+
+    def payload(self, kind: str, slot_id: int) -> Optional[bytes]:
+        row = self._connect().execute(
+            "SELECT payload FROM saves WHERE kind = ? AND slot_id = ?",
+            (kind, int(slot_id)),
+        ).fetchone()
+        return bytes(row[0]) if row is not None else None
+
+    def saved_at(self, kind: str, slot_id: int) -> Optional[float]:
+        row = self._connect().execute(
+            "SELECT saved_at FROM saves WHERE kind = ? AND slot_id = ?",
+            (kind, int(slot_id)),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def exists(self, kind: str, slot_id: int) -> bool:
+        return self._connect().execute(
+            "SELECT 1 FROM saves WHERE kind = ? AND slot_id = ?",
+            (kind, int(slot_id)),
+        ).fetchone() is not None
+
+    def entries(self, kind: str = None) -> List[dict]:
+        """Сводки без payload: автосейвы — свежие сверху, слоты — по номеру."""
+        sql = _META_SELECT
+        params = ()
+        if kind is not None:
+            sql += " WHERE kind = ?"
+            params = (kind,)
+        sql += (" ORDER BY CASE kind WHEN 'quicksave' THEN 0 "
+                "WHEN 'autosave' THEN 1 ELSE 2 END, "
+                "CASE kind WHEN 'autosave' THEN -saved_at ELSE slot_id END")
+        return [self._meta(row) for row in self._connect().execute(sql, params)]
+
+    def latest(self, kind: str) -> Optional[dict]:
+        row = self._connect().execute(
+            _META_SELECT + " WHERE kind = ? ORDER BY saved_at DESC LIMIT 1",
+            (kind,),
+        ).fetchone()
+        return self._meta(row) if row is not None else None
+
+    @staticmethod
+    def _meta(row) -> dict:
+        kind, slot_id, saved_at, valid, size = row[:5]
+        meta = dict(zip(_SUMMARY_COLUMNS, row[5:]))
+        meta.update(kind=kind, slot_id=slot_id, mtime=saved_at, valid=bool(valid),
+                    size=size)
+        return meta
+
+
+def store_has_saves(path: str, kind: str = None) -> bool:
+    """Есть ли в базе сейвы (kind или любые), не создавая её. Для меню."""
+    if not os.path.exists(path):
+        return False
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=1.0)
+        try:
+            if kind is None:
+                row = conn.execute("SELECT 1 FROM saves LIMIT 1").fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT 1 FROM saves WHERE kind = ? LIMIT 1", (kind,)
+                ).fetchone()
+            return row is not None
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
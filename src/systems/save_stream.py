@@ -0,0 +1,530 @@
+"""
+Потоковая запись и чтение сейвов — память не растёт с числом сущностей.
+
+Single Responsibility: провести строки врагов и пикапов между
+менеджерами и файлом пачками, не собирая save_data целиком. Формат
+байтов решают save_codec (.sav) и функции JSON ниже; что сохранять и
+куда — SaveSystem.
+
+Сейв делится на «голову» (версия, игрок, мир, статистика, target_counts
+— всё небольшое) и коллекции строк (COLLECTIONS). При записи коллекции
+приходят как RowStream — генераторы, которые менеджер строит из своего
+снимка (CollectionSnapshot), и уходят в кодировщик пачками по
+ROW_BATCH. При чтении кодировщик выдаёт события::
+
+    ("field", key, value)   — значение головы верхнего уровня
+    ("rows", name, [dict])  — очередная пачка строк коллекции name
+
+StreamedSave собирает из них голову (её можно проверить до того, как
+трогать мир) и отдаёт строки пачками — SaveSystem.apply_save_stream
+кладёт их прямо в менеджеры. Коллекция, которая есть в сейве, даёт хотя
+бы одну пачку (пусть пустую) — так пустой список отличается от
+отсутствующего.
+
+JSON-запись ставит коллекции в конец файла, по строке на врага/пикап;
+чтение понимает и старый порядок ключей (json.dumps всего save_data).
+Последний член объекта — ``"checksum": "crc32:…"``, CRC32 всех байт
+файла до него (verify_json); в голову при чтении он не попадает.
+"""
+import codecs
+import json
+import re
+import threading
+import zlib
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+# Строк в пачке записи/чтения (и в одном куске столбцов .sav)
+ROW_BATCH = 4096
+_READ_SIZE = 1 << 16
+
+# Коллекции строк: имя в save_data -> ключ списка внутри объекта
+# (None — сама коллекция и есть список)
+COLLECTIONS = {"enemies": "enemies", "pickups": None}
+
+# Контрольная сумма JSON-сейва: последний член объекта
+CHECKSUM_KEY = "checksum"
+_CHECKSUM_TAIL = re.compile(
+    rb',?\n  "checksum": "crc32:([0-9a-f]{8})"\n}\s*\Z'
+)
+# Хвост файла, в котором ищется член checksum (с запасом)
+_TAIL_SIZE = 64
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = json.decoder.WHITESPACE
+
+
+class RowStream:
+    """Коллекция строк сейва, ещё не собранная в список.
+
+    Итерируется заново при каждом проходе: ``rows()`` строит генератор.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows: Callable[[], Iterator[dict]]):
+        self._rows = rows
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._rows())
+
+
+class CollectionSnapshot:
+    """Снимок коллекции менеджера для записи сейва.
+
+    ``rows(with_uid)`` — генератор dict строк; ``fields`` — прочие поля
+    объекта коллекции (у врагов target_counts/respawn_timer), None если
+    коллекция — просто список. Вызов снимка возвращает то же, что
+    serialize() (списком); stream() — ту же форму, но с RowStream.
+    ``positions_in(left, top, right, bottom)`` — координаты строк в
+    прямоугольнике из той же копии (превью сейва рисуется в фоне); у
+    снимка без копии (live) его нет — frozen=False. ``complete`` —
+    докопировать снимок, который снимается по кадрам (IncrementalCapture),
+    прямо сейчас.
+    """
+
+    def __init__(self, rows: Callable[[bool], Iterator[dict]],
+                 fields: Optional[dict] = None, rows_key: str = None,
+                 positions_in: Callable[[float, float, float, float], list] = None,
+                 complete: Callable[[], None] = None):
+        self._rows = rows
+        self.fields = fields
+        self.rows_key = rows_key
+        self._positions_in = positions_in
+        self._complete = complete
+
+    def complete(self) -> None:
+        """Докопировать строки на вызывающем (игровом) потоке."""
+        if self._complete is not None:
+            self._complete()
+
+    @property
+    def frozen(self) -> bool:
+        """Снимок держит свою копию координат (positions_in в любом потоке)."""
+        return self._positions_in is not None
+
+    def positions_in(self, left: float, top: float,
+                     right: float, bottom: float) -> list:
+        if self._positions_in is None:
+            return []
+        return self._positions_in(left, top, right, bottom)
+
+    def __call__(self, with_uid: bool = False):
+        return self._shape(list(self._rows(with_uid)))
+
+    def stream(self, with_uid: bool = False):
+        return self._shape(RowStream(lambda: self._rows(with_uid)))
+
+    def _shape(self, rows):
+        if self.fields is None:
+            return rows
+        data = dict(self.fields)
+        data[self.rows_key] = rows
+        return data
+
+
+class IncrementalCapture:
+    """Копия сырых строк коллекции, снимаемая по частям в нескольких кадрах.
+
+    Список объектов фиксируется сразу (копия ссылок), а ``raw(obj)`` —
+    кортеж строки или None (пропустить) — вызывается из step() не больше
+    чем для ``batch`` объектов за кадр. Время снимка в кадре не зависит
+    от размера коллекции; позиции в копии — на кадр своей пачки. Объект,
+    который до своей пачки меняется скачком (урон, смерть, кулдаун),
+    владелец копирует заранее — preserve().
+
+    step()/preserve()/complete() — на потоке владельца. rows() из другого
+    потока ждёт конца копии, на потоке владельца — докопирует сам.
+    """
+
+    def __init__(self, items: Iterable, raw: Callable, batch: int):
+        self._items = list(items)
+        self._raw = raw
+        self._batch = max(1, int(batch))
+        self._cursor = 0
+        self._rows: list = []
+        # id(obj) -> строка, снятая до скачка (объекты держит _items)
+        self._early: dict = {}
+        self._owner = threading.get_ident()
+        self._done = threading.Event()
+        if not self._items:
+            self._finish()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def preserve(self, item) -> None:
+        """Снять строку ``item`` сейчас, если она ещё не скопирована."""
+        if self._done.is_set() or id(item) in self._early:
+            return
+        self._early[id(item)] = self._raw(item)
+
+    def step(self, batch: int = None) -> bool:
+        """Скопировать следующую пачку. True — копия закончена."""
+        if self._done.is_set():
+            return True
+        end = min(len(self._items), self._cursor + (batch or self._batch))
+        early, raw, rows = self._early, self._raw, self._rows
+        for item in self._items[self._cursor:end]:
+            row = early.pop(id(item), None) if early else None
+            if row is None:
+                row = raw(item)
+            if row is not None:
+                rows.append(row)
+        self._cursor = end
+        if end == len(self._items):
+            self._finish()
+        return self._done.is_set()
+
+    def complete(self) -> None:
+        """Докопировать всё, что осталось (в этом кадре)."""
+        if not self._done.is_set():
+            self.step(len(self._items) - self._cursor)
+
+    def rows(self) -> list:
+        """Готовая копия строк (ждёт её конца)."""
+        if threading.get_ident() == self._owner:
+            self.complete()
+        self._done.wait()
+        return self._rows
+
+    def _finish(self) -> None:
+        self._items = ()
+        self._early = {}
+        self._done.set()
+
+
+def _is_rows(value) -> bool:
+    return isinstance(value, (list, RowStream))
+
+
+def split_save_data(save_data: dict) -> Tuple[dict, List[Tuple[str, Iterable]]]:
+    """save_data -> (голова без строк, [(имя коллекции, строки)]).
+
+    Коллекции неожиданной формы остаются в голове как есть.
+    """
+    head = dict(save_data)
+    collections = []
+    for name, key in COLLECTIONS.items():
+        value = head.get(name)
+        if key is None:
+            if _is_rows(value):
+                del head[name]
+                collections.append((name, value))
+        elif isinstance(value, dict) and _is_rows(value.get(key)):
+            head[name] = {k: v for k, v in value.items() if k != key}
+            collections.append((name, value[key]))
+    return head, collections
+
+
+def batched(rows: Iterable, size: int = None) -> Iterator[list]:
+    """Пачки по size (ROW_BATCH) строк; пустая коллекция — одна пустая пачка."""
+    size = size or ROW_BATCH
+    it = iter(rows)
+    batch = list(islice(it, size))
+    yield batch
+    while len(batch) == size:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def data_events(save_data: dict) -> Iterator[tuple]:
+    """События чтения для готового dict (журнал, SQLite, старые секции)."""
+    head, collections = split_save_data(save_data)
+    for key, value in head.items():
+        yield ("field", key, value)
+    for name, rows in collections:
+        for batch in batched(rows):
+            yield ("rows", name, batch)
+
+
+# --- JSON ----------------------------------------------------------------------
+
+def write_json(out, save_data: dict) -> None:
+    """Записать save_data в ``out`` (бинарный поток) как JSON с отступами.
+
+    Голова — как json.dumps(indent=2), коллекции — в конце, по строке
+    на запись; строки пишутся пачками по мере генерации. Последним
+    идёт член checksum.
+    """
+    out = _Crc32Writer(out)
+    head, collections = split_save_data(save_data)
+    streamed = dict(collections)
+    items = [(k, v) for k, v in head.items()
+             if k not in streamed and k != CHECKSUM_KEY]
+    out.write(b"{")
+    first = True
+    for key, value in items:
+        out.write((("\n" if first else ",\n") + "  " + _dumps(key) + ": "
+                   + _indented(value, 2)).encode("utf-8"))
+        first = False
+    for name, rows in collections:
+        out.write((("\n" if first else ",\n") + "  " + _dumps(name) + ": ").encode("utf-8"))
+        first = False
+        key = COLLECTIONS[name]
+        if key is None:
+            _write_json_rows(out, rows, 2)
+            continue
+        out.write(b"{")
+        for field, value in head[name].items():
+            out.write(("\n    " + _dumps(field) + ": " + _indented(value, 4)
+                       + ",").encode("utf-8"))
+        out.write(("\n    " + _dumps(key) + ": ").encode("utf-8"))
+        _write_json_rows(out, rows, 4)
+        out.write(b"\n  }")
+    out.write((("," if not first else "") + "\n  " + _dumps(CHECKSUM_KEY)
+               + f': "crc32:{out.crc:08x}"\n}}').encode("ascii"))
+
+
+class _Crc32Writer:
+    """Обёртка потока записи: CRC32 всего записанного."""
+
+    __slots__ = ("_out", "crc")
+
+    def __init__(self, out):
+        self._out = out
+        self.crc = 0
+
+    def write(self, data: bytes) -> None:
+        self.crc = zlib.crc32(data, self.crc)
+        self._out.write(data)
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _indented(value, level: int) -> str:
+    text = json.dumps(value, indent=2, ensure_ascii=False)
+    return text.replace("\n", "\n" + " " * level)
+
+
+def _write_json_rows(out, rows: Iterable, level: int) -> None:
+    pad = "\n" + " " * (level + 2)
+    written = False
+    for batch in batched(rows):
+        if not batch:
+            break
+        # Строка без отступов — C-кодировщик json, в разы быстрее indent=2
+        text = ("," if written else "[") + ",".join(pad + _dumps(row) for row in batch)
+        out.write(text.encode("utf-8"))
+        written = True
+    out.write(("\n" + " " * level + "]").encode("utf-8") if written else b"[]")
+
+
+class _JsonScanner:
+    """Чтение JSON-значений из потока с подкачкой буфера."""
+
+    def __init__(self, fileobj):
+        self._f = fileobj
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        # Рост вдвое: большое значение разбирается за O(n) попыток, а не O(n²)
+        data = self._f.read(max(_READ_SIZE, len(self._buf)))
+        if not data:
+            self._eof = True
+            self._buf += self._utf8.decode(b"", final=True)
+            return False
+        self._buf += self._utf8.decode(data)
+        return True
+
+    def peek(self) -> str:
+        """Следующий непробельный символ ('' в конце файла)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"ожидался '{char}'", self._buf, self._pos)
+        self._pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            if end == len(self._buf) and not self._eof:
+                # Число могло оборваться на границе буфера — дочитать
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def members(self) -> Iterator[str]:
+        """Ключи объекта; значение после каждого ключа читает вызывающий."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("ключ должен быть строкой", self._buf, self._pos)
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self.expect("}")
+            return
+
+    def items(self) -> Iterator:
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self.expect("]")
+            return
+
+    def end(self) -> None:
+        if self.peek() != "":
+            raise json.JSONDecodeError("лишние данные после JSON", self._buf, self._pos)
+
+
+def iter_json_events(fileobj) -> Iterator[tuple]:
+    """События чтения JSON-сейва из бинарного потока (любой порядок ключей)."""
+    scanner = _JsonScanner(fileobj)
+    for key in scanner.members():
+        rows_key = COLLECTIONS.get(key, False)
+        if key == CHECKSUM_KEY:
+            scanner.value()  # проверяет verify_json, в сейв не попадает
+        elif rows_key is None and scanner.peek() == "[":
+            yield from _json_rows(scanner, key)
+        elif rows_key and scanner.peek() == "{":
+            fields = {}
+            for sub in scanner.members():
+                if sub == rows_key and scanner.peek() == "[":
+                    yield from _json_rows(scanner, key)
+                else:
+                    fields[sub] = scanner.value()
+            yield ("field", key, fields)
+        else:
+            yield ("field", key, scanner.value())
+    scanner.end()
+
+
+def _json_rows(scanner: _JsonScanner, name: str) -> Iterator[tuple]:
+    for batch in batched(scanner.items()):
+        yield ("rows", name, batch)
+
+
+def verify_json(fileobj) -> bool:
+    """Цел ли JSON-сейв: CRC32 из члена checksum сходится с байтами до него.
+
+    Файл без checksum (записан до его появления) проверяется разбором
+    целиком — так ловится хотя бы обрыв. Поток читается с начала.
+    """
+    crc = 0
+    tail = b""
+    while True:
+        data = fileobj.read(_READ_SIZE)
+        if not data:
+            break
+        tail += data
+        if len(tail) > _TAIL_SIZE:
+            crc = zlib.crc32(tail[:-_TAIL_SIZE], crc)
+            tail = tail[-_TAIL_SIZE:]
+    match = _CHECKSUM_TAIL.search(tail)
+    if match is None:
+        fileobj.seek(0)
+        try:
+            for _ in iter_json_events(fileobj):
+                pass
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return False
+        return True
+    crc = zlib.crc32(tail[:match.start()], crc)
+    return crc == int(match.group(1), 16)
+
+
+# --- Чтение ----------------------------------------------------------------------
+
+class StreamedSave:
+    """Сейв, читаемый потоком: голова сразу, строки коллекций — пачками.
+
+    ``head`` — save_data без строк; полный (с полями, стоящими в файле
+    после строк) — после того, как batches() дочитан. batches()
+    проходится один раз; close() закрывает файл (или with-блок).
+    """
+
+    def __init__(self, events: Iterable[tuple], close: Callable[[], None] = None):
+        self._events = iter(events)
+        self._close = close
+        self.head = {}
+        self._pending = None
+        for event in self._events:
+            if event[0] == "rows":
+                self._pending = event
+                break
+            self.head[event[1]] = event[2]
+
+    @classmethod
+    def from_data(cls, save_data: dict) -> "StreamedSave":
+        """Обёртка над уже прочитанным dict (журнал, SQLite)."""
+        return cls(data_events(save_data))
+
+    def batches(self) -> Iterator[Tuple[str, list]]:
+        """(имя коллекции, пачка строк) в порядке файла."""
+        if self._pending is not None:
+            _, name, rows = self._pending
+            self._pending = None
+            yield name, rows
+        for kind, key, value in self._events:
+            if kind == "rows":
+                yield key, value
+            else:
+                self.head[key] = value
+
+    def materialize(self) -> dict:
+        """Прочитать всё и вернуть обычный save_data."""
+        collected = {}
+        for name, rows in self.batches():
+            collected.setdefault(name, []).extend(rows)
+        data = self.head
+        for name, rows in collected.items():
+            key = COLLECTIONS[name]
+            if key is None:
+                data[name] = rows
+                continue
+            if not isinstance(data.get(name), dict):
+                data[name] = {}
+            data[name][key] = rows
+        self.close()
+        return data
+
+    def close(self) -> None:
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -11,10 +11,81 @@ v0.3.1 — фикс F9: теперь сериализуем
 
 Загрузка валидирует схему: повреждённые файлы возвращают None и
 не крашат игру (см. _validate_save_data).
+
+Формат файла — ``[save] format`` в config.ini: ``json`` (по умолчанию,
+читаемый) или ``binary`` (.sav, столбцы + сжатие, см. save_codec).
+Загрузка определяет формат по сигнатуре, а не по расширению, поэтому
+старые JSON-сейвы 1.0/1.1 читаются при любой настройке; export_json()
+выгружает любой сейв в JSON для отладки.
+
+Запись атомарна: данные пишутся во временный файл рядом с целевым и
+подменяют его через os.replace — оборванная запись не портит сейв.
+Автосейв из игрового кадра (autosave_async) снимает состояние в dict на
+главном потоке, а кодирование и запись отдаёт фоновому SaveWriter.
+
+``[save] autosave_mode = journal`` вместо ротации слотов пишет автосейвы
+журналом (save_journal): база изредка, дальше — только дельты, поэтому
+объём записи зависит от того, что изменилось, а не от размера мира.
+
+Запись и загрузка потоковые (save_stream): строки врагов и пикапов
+идут генераторами прямо в кодировщик, а при загрузке с ``stream=True``
+— пачками в менеджеры (apply_save_stream), поэтому пиковая память не
+растёт с числом сущностей. restore_lazily() делает то же по кадрам:
+сначала то, что рядом с игроком, остальное — в следующих кадрах.
+
+Списки для меню не разбирают сейвы: list_saves() — только listdir/stat,
+сводку (время, уровень, HP) даёт read_entry_metadata() из индекса
+saves/index.meta, из заголовка .sav или, в крайнем случае, из файла
+целиком — после чего она попадает в индекс.
+
+``[save] backend = sqlite`` хранит quicksave, слоты и автосейвы не
+файлами, а записями saves/saves.db (save_store): сводка лежит в
+столбцах, поэтому списки, ротация и «последний автосейв» — по одному
+индексному запросу. Публичный API тот же; журнал автосейвов остаётся
+файловым. Новая база один раз импортирует уже лежащие файловые сейвы.
+
+Каждый сейв несёт CRC32 содержимого (член checksum в JSON, секция CRC
+в .sav). verify_all() проверяет quicksave, слоты и автосейвы разом на
+пуле потоков; результат кэшируется по (mtime, размер), поэтому меню
+показывает битый слот сразу, а повторная проверка не читает файлы.
+
+Сейв из игры (quicksave, слот, автосейв) получает превью миникарты —
+PNG рядом со слотом (save_thumbnail): снимок области вокруг игрока в
+кадре сейва, отрисовка и кодирование — в отдельном фоновом потоке, чтобы
+превью не задерживало ни кадр, ни запись следующего сейва.
 """
+import io
 import json
 import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Optional
+
+from src.core.config_loader import config_snapshot
+from src.systems.save_codec import (
+    COMPRESSION_IDS, HEAD_SIZE, SaveFormatError, decode_save, is_binary_save,
+    iter_save_events, read_summary, save_summary, verify_save, write_save,
+)
+from src.systems.lazy_restore import LazyRestore
+from src.systems.save_index import SaveIndex
+from src.systems.save_journal import SaveJournal
+from src.systems.save_stream import (
+    CHECKSUM_KEY, StreamedSave, iter_json_events, verify_json, write_json,
+)
+from src.systems.save_store import QUICKSAVE_SLOT, SqliteSaveStore
+from src.systems.save_thumbnail import (
+    capture_thumbnail, load_thumbnail, remove_thumbnail, write_thumbnail,
+)
+from src.systems.save_writer import SaveWriter
+from src.utils.trace import TRACER
+
+
+# Буфер файла при потоковой записи: пачки строк уходят на диск крупно
+_WRITE_BUFFER = 1 << 16
 
 
 class SaveValidationError(ValueError):
@@ -40,18 +111,57 @@ class SaveSystem:
     MANUAL_SLOT_LIMIT = 10
     # Подпапка для ручных слотов, чтобы они не смешивались с quicksave/autosave
     MANUAL_SUBDIR = "manual"
-    # Имя файла слота: slot_01.json ... slot_10.json
-    _SLOT_FILENAME_FMT = "slot_{:02d}.json"
+    # Имя файла слота без расширения: slot_01 ... slot_10
+    _SLOT_STEM_FMT = "slot_{:02d}"
 
     # Автосохранения (v0.3.3) — отдельная подпапка, ротация по mtime.
     AUTOSAVE_SUBDIR = "autosave"
     AUTOSAVE_DEFAULT_LIMIT = 3
-    _AUTOSAVE_FILENAME_FMT = "autosave_{:02d}.json"
+    _AUTOSAVE_STEM_FMT = "autosave_{:02d}"
+    # Журнал автосейвов: режим, папка и slot_id записи в списке автосейвов
+    AUTOSAVE_MODES = ("slots", "journal")
+    JOURNAL_SUBDIR = "journal"
+    JOURNAL_SLOT_ID = 0
+
+    # Формат записи -> расширение. Читаются оба независимо от настройки.
+    FORMAT_EXTENSIONS = {"json": ".json", "binary": ".sav"}
+    SAVE_EXTENSIONS = (".json", ".sav")
+    EXPORT_SUBDIR = "export"
+    # Где лежат сейвы: файлы в saves/ или записи saves/saves.db
+    BACKENDS = ("files", "sqlite")
+    # Потоков проверки целостности: чтение, crc32 и распаковка отпускают GIL
+    VERIFY_WORKERS = 4
+    # Превью миникарты: slot_01.png рядом с slot_01.json
+    THUMBNAIL_EXT = ".png"
+
+    def __init__(self, save_format: str = None, compression: str = None,
+                 autosave_mode: str = None, backend: str = None):
+        save_cfg = config_snapshot().save
+        if save_format is None:
+            save_format = save_cfg.format
+        if compression is None:
+            compression = save_cfg.compression
+        if save_format not in self.FORMAT_EXTENSIONS:
+            raise ValueError(f"Неизвестный формат сохранений: {save_format}")
+        if compression not in COMPRESSION_IDS:
+            raise ValueError(f"Неизвестное сжатие сохранений: {compression}")
+        if autosave_mode is None:
+            autosave_mode = save_cfg.autosave_mode
+        if autosave_mode not in self.AUTOSAVE_MODES:
+            raise ValueError(f"Неизвестный режим автосейвов: {autosave_mode}")
+        if backend is None:
+            backend = save_cfg.backend
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Неизвестное хранилище сохранений: {backend}")
+        self.autosave_mode = autosave_mode
+        self.backend = backend
+        self.save_format = save_format
+        self.compression = compression
+        self._ext = self.FORMAT_EXTENSIONS[save_format]
 
-    def __init__(self):
         self.save_version = self.SAVE_VERSION
         self.saves_dir = "saves"
-        self.quicksave_file = "quicksave.json"
+        self.quicksave_file = "quicksave" + self._ext
         self.manual_dir = os.path.join(self.saves_dir, self.MANUAL_SUBDIR)
         self.autosave_dir = os.path.join(self.saves_dir, self.AUTOSAVE_SUBDIR)
 
@@ -63,6 +173,46 @@ class SaveSystem:
         if not os.path.exists(self.autosave_dir):
             os.makedirs(self.autosave_dir)
 
+        # Фоновая запись автосейвов (поток стартует при первой задаче)
+        self._writer = SaveWriter()
+        # Автосейвы в очереди записи (pending_autosaves): первый счётчик
+        # растит только игровой поток, второй — только поток записи
+        self._autosaves_queued = 0
+        self._autosaves_written = 0
+        # Снимки коллекций последнего автосейва, которые менеджеры ещё
+        # докопируют по кадрам (CollectionSnapshot.complete)
+        self._captures = []
+        # Превью — своей очередью: не задерживает запись сейвов
+        self._thumbnailer = SaveWriter(name="save-thumbnails")
+        self.thumbnails = save_cfg.thumbnails
+        self.thumbnail_size = save_cfg.thumbnail_size
+        self.thumbnail_area = save_cfg.thumbnail_area
+        self.index = SaveIndex(self.saves_dir)
+        self.journal = SaveJournal(
+            os.path.join(self.autosave_dir, self.JOURNAL_SUBDIR),
+            self._write_save_data,
+            self._read_save_file,
+            (self._ext,) + tuple(e for e in self.SAVE_EXTENSIONS if e != self._ext),
+            position_epsilon=save_cfg.journal_position_epsilon,
+            timer_tolerance=save_cfg.journal_timer_tolerance,
+            compact_every=save_cfg.journal_compact_every,
+        )
+        # Счётчик изменений каталога: растёт при каждой записи/удалении
+        # сейва (в т.ч. из фонового потока). Главное меню сверяет его
+        # вместо опроса папок сейвов каждый кадр.
+        self.catalog_revision = 0
+        # Проверка целостности: ключ записи -> ((mtime, размер), цел ли)
+        self._verified = {}
+        self._verify_lock = threading.Lock()
+        self._verify_pool = None
+        self.store = None
+        if backend == "sqlite":
+            self.store = SqliteSaveStore(
+                os.path.join(self.saves_dir, SqliteSaveStore.FILENAME)
+            )
+            if self.store.created:
+                self._import_file_saves()
+
     # --- Сохранение --------------------------------------------------------
 
     def save_game(self, player, world, game_stats=None, pickup_manager=None,
@@ -72,14 +222,30 @@ class SaveSystem:
         Manual-слоты сохраняются через :meth:`save_to_slot` — это сделано
         специально, чтобы quicksave (`saves/quicksave.json`) и слоты
         (`saves/manual/slot_NN.json`) физически не пересекались.
+        Расширение — по формату (.json / .sav).
         """
         try:
-            if filename is None:
-                filename = self.quicksave_file
-            filepath = os.path.join(self.saves_dir, filename)
-            return self._write_save(
-                filepath, player, world, game_stats, pickup_manager, enemy_manager
-            )
+            if filename is None and self.store is not None:
+                ok = self._store_write(
+                    "quicksave", QUICKSAVE_SLOT, self._build_save_data(
+                        player, world, game_stats, pickup_manager, enemy_manager
+                    )
+                )
+            else:
+                quicksave = filename is None
+                if quicksave:
+                    filename = self.quicksave_file
+                filepath = os.path.join(self.saves_dir, filename)
+                ok = self._write_save(
+                    filepath, player, world, game_stats, pickup_manager, enemy_manager
+                )
+                if not quicksave:
+                    return ok
+            if ok:
+                self._queue_thumbnail(self._capture_thumbnail(
+                    player, world, pickup_manager, enemy_manager
+                ), "quicksave", QUICKSAVE_SLOT)
+            return ok
         except Exception as e:
             print(f"Ошибка сохранения: {e}")
             return False
@@ -92,25 +258,46 @@ class SaveSystem:
         ``extra_data`` — опциональный dict, который добавляется в save_data
         верхним уровнем (используется автосейвом для поля ``autosave_reason``).
         """
-        # Авто-определение enemy_manager из world
-        if enemy_manager is None and world is not None:
-            enemy_manager = getattr(world, "enemy_manager", None)
+        save_data = self._build_save_data(
+            player, world, game_stats, pickup_manager, enemy_manager, extra_data
+        )
+        return self._write_save_data(filepath, save_data)
+
+    def _build_save_data(self, player, world, game_stats=None,
+                         pickup_manager=None, enemy_manager=None,
+                         extra_data=None) -> dict:
+        """save_data для немедленной записи на этом потоке.
 
+        Коллекции — RowStream поверх живых врагов/пикапов: строки
+        создаются по ходу кодирования, копии мира в памяти нет.
+        """
+        return self._capture_save_data(
+            player, world, game_stats, pickup_manager, enemy_manager, extra_data,
+            live=True,
+        )(stream=True)
+
+    def _capture_save_data(self, player, world, game_stats=None,
+                           pickup_manager=None, enemy_manager=None,
+                           extra_data=None, live: bool = False,
+                           collections=None):
+        """Снять состояние и вернуть функцию, собирающую save_data.
+
+        Менеджеры с ``capture()`` копируют сейчас только сырые поля, а
+        dict на каждого врага/пикап строится при вызове результата. Он
+        не ссылается на живые объекты игры, поэтому его можно вызывать,
+        кодировать и писать в другом потоке. ``live=True`` — без копии
+        (результат нужно использовать сразу, на том же потоке).
+        ``stream=True`` у результата — коллекции как RowStream вместо
+        списков (для потоковой записи). ``collections`` — уже снятые
+        (_capture_collections) снимки врагов и пикапов.
+        """
         save_data = {
             "version": self.save_version,
             "timestamp": datetime.now().isoformat() + "Z",
             "player": self._serialize_player(player),
             "world": self._serialize_world(world),
-            "enemies": (
-                enemy_manager.serialize()
-                if enemy_manager is not None and hasattr(enemy_manager, "serialize")
-                else None
-            ),
-            "pickups": (
-                pickup_manager.serialize()
-                if pickup_manager is not None and hasattr(pickup_manager, "serialize")
-                else []
-            ),
+            "enemies": None,
+            "pickups": [],
             "game_stats": (
                 game_stats.to_dict()
                 if game_stats is not None and hasattr(game_stats, "to_dict")
@@ -121,66 +308,322 @@ class SaveSystem:
                 "gold": getattr(player, "coins", 0) if player else 0,
             },
         }
-
         if extra_data:
             for k, v in extra_data.items():
                 save_data[k] = v
 
+        if collections is None:
+            collections = self._capture_collections(
+                world, pickup_manager, enemy_manager, live
+            )
+        enemies, pickups = collections
+
+        def collect(snapshot, with_uid, stream):
+            if stream and hasattr(snapshot, "stream"):
+                return snapshot.stream(with_uid)
+            return snapshot(with_uid)
+
+        def build(with_uid: bool = False, stream: bool = False) -> dict:
+            if enemies is not None:
+                save_data["enemies"] = collect(enemies, with_uid, stream)
+            if pickups is not None:
+                save_data["pickups"] = collect(pickups, with_uid, stream)
+            return save_data
+        return build
+
+    def capture_state(self, player, world, game_stats=None,
+                      pickup_manager=None, enemy_manager=None) -> dict:
+        """Состояние для перемотки (RewindBuffer): игрок, враги, пикапы,
+        статистика — в форме save_data, без метаданных файла. Применяется
+        теми же apply_save_data_*."""
+        state = self._capture_save_data(
+            player, world, game_stats, pickup_manager, enemy_manager, live=True,
+        )()
+        for key in ("version", "timestamp", "world", "inventory"):
+            del state[key]
+        return state
+
+    def _capture_collections(self, world, pickup_manager=None,
+                             enemy_manager=None, live: bool = False):
+        """(враги, пикапы) — снимки коллекций для _capture_save_data."""
+        # Авто-определение enemy_manager из world
+        if enemy_manager is None and world is not None:
+            enemy_manager = getattr(world, "enemy_manager", None)
+        return (self._capture_collection(enemy_manager, live),
+                self._capture_collection(pickup_manager, live))
+
+    @staticmethod
+    def _capture_collection(manager, live: bool = False):
+        """capture() менеджера или готовый serialize() в обёртке (None — нет)."""
+        if manager is None:
+            return None
+        if hasattr(manager, "capture"):
+            return manager.capture(live=True) if live else manager.capture()
+        if hasattr(manager, "serialize"):
+            data = manager.serialize()
+            return lambda with_uid=False: data
+        return None
+
+    @staticmethod
+    def _capture_clock(world, pickup_manager=None, enemy_manager=None) -> float:
+        """Время игровых часов (общий TimerWheel менеджеров) для журнала.
+
+        Без часов — монотонное время процесса: дедлайны в журнале
+        останутся согласованными в пределах сессии.
+        """
+        if enemy_manager is None and world is not None:
+            enemy_manager = getattr(world, "enemy_manager", None)
+        for manager in (enemy_manager, pickup_manager):
+            now = getattr(getattr(manager, "timers", None), "now", None)
+            if isinstance(now, (int, float)):
+                return float(now)
+        return time.monotonic()
+
+    def _encode(self, save_data) -> bytes:
+        """save_data -> байты файла в формате self.save_format."""
+        out = io.BytesIO()
+        self._write_stream(out, save_data)
+        return out.getvalue()
+
+    def _write_stream(self, out, save_data) -> None:
+        """Записать save_data в поток в формате self.save_format.
+
+        Коллекции-генераторы (RowStream) кодируются по мере чтения.
+        """
+        if self.save_format == "binary":
+            write_save(out, save_data, self.compression)
+        else:
+            write_json(out, save_data)
+
+    def _write_save_data(self, filepath, save_data) -> bool:
+        """Атомарно записать готовый save_data: temp-файл + os.replace.
+
+        Файл того же сейва в другом формате (slot_01.json рядом с новым
+        slot_01.sav) после записи удаляется.
+        """
         # Папка должна существовать (для произвольных filepath)
         parent = os.path.dirname(filepath)
         if parent and not os.path.exists(parent):
-            os.makedirs(parent)
+            os.makedirs(parent, exist_ok=True)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=2, ensure_ascii=False)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".tmp_", suffix=self._ext, dir=parent or "."
+        )
+        try:
+            with TRACER.span('save.write', cat='save',
+                             file=os.path.basename(filepath)), \
+                    os.fdopen(fd, "wb", buffering=_WRITE_BUFFER) as f:
+                self._write_stream(f, save_data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._remove_siblings(filepath)
+        self._index_summary(filepath, save_data)
+        self._catalog_changed()
 
         print(f"Игра сохранена: {os.path.basename(filepath)}")
         return True
 
-    # --- Загрузка ----------------------------------------------------------
+    def _catalog_changed(self) -> None:
+        """Набор сейвов изменился (запись/удаление) — см. catalog_revision."""
+        self.catalog_revision += 1
 
-    def load_game(self, filename=None):
-        """Загрузка игрового состояния из JSON файла.
+    # --- SQLite-хранилище ------------------------------------------------------
 
-        Возвращает dict или None при ошибке/повреждённом файле.
-        """
+    def _store_label(self, kind: str, slot_id) -> str:
+        """Имя записи базы для логов и меню (как имя файла без расширения)."""
+        if kind == "quicksave":
+            return "quicksave"
+        if kind == "manual":
+            return self._SLOT_STEM_FMT.format(int(slot_id))
+        return self._AUTOSAVE_STEM_FMT.format(int(slot_id))
+
+    @staticmethod
+    def _summary_or_none(save_data):
         try:
-            if filename is None:
-                filename = self.quicksave_file
+            return save_summary(save_data)
+        except (ValueError, TypeError, AttributeError):
+            return None
 
-            filepath = os.path.join(self.saves_dir, filename)
+    def _store_write(self, kind: str, slot_id: int, save_data) -> bool:
+        with TRACER.span('save.store', cat='save', kind=kind):
+            self.store.put(kind, slot_id, self._encode(save_data),
+                           self._summary_or_none(save_data))
+        self._catalog_changed()
+        print(f"Игра сохранена: {self._store_label(kind, slot_id)}")
+        return True
 
-            if not os.path.exists(filepath):
-                print(f"Файл сохранения не найден: {filename}")
-                return None
+    def _store_load(self, kind: str, slot_id: int, stream: bool = False):
+        """save_data записи базы (с валидацией) или None."""
+        payload = self.store.payload(kind, slot_id)
+        if payload is None:
+            print(f"Сохранение не найдено: {self._store_label(kind, slot_id)}")
+            return None
+        return self._load_from_path(self._store_label(kind, slot_id),
+                                    loader=lambda: self._decode(payload),
+                                    stream=stream)
+
+    def _store_entry(self, row: dict) -> dict:
+        """Запись каталога list_saves() со сводкой из столбцов базы."""
+        slot_id = None if row["kind"] == "quicksave" else row["slot_id"]
+        entry = self._catalog_entry(
+            row["kind"], slot_id, self.store.path, mtime=row["mtime"]
+        )
+        entry["filename"] = self._store_label(row["kind"], row["slot_id"])
+        entry["summary"] = row
+        return entry
 
-            with open(filepath, "r", encoding="utf-8") as f:
-                save_data = json.load(f)
+    def _import_file_saves(self) -> None:
+        """Перенести файловые сейвы в только что созданную базу.
 
-            # Валидация схемы — порченный файл не должен крашнуть игру
+        Файлы не удаляются: вернуть ``backend = files`` можно без потерь.
+        Порядок автосейвов сохраняется — saved_at берётся из mtime.
+        """
+        sources = []
+        quicksave = self._quicksave_path()
+        if os.path.exists(quicksave):
+            sources.append(("quicksave", QUICKSAVE_SLOT, quicksave))
+        for slot_id in range(1, self.MANUAL_SLOT_LIMIT + 1):
+            filepath = self._slot_filepath(slot_id)
+            if os.path.exists(filepath):
+                sources.append(("manual", slot_id, filepath))
+        if os.path.isdir(self.autosave_dir):
+            for filename in sorted(os.listdir(self.autosave_dir)):
+                slot_id = self._parse_autosave_filename(filename)
+                if slot_id is not None:
+                    sources.append(("autosave", slot_id,
+                                    os.path.join(self.autosave_dir, filename)))
+        for kind, slot_id, filepath in sources:
             try:
-                self._validate_save_data(save_data)
-            except SaveValidationError as ve:
-                print(f"Сохранение повреждено: {ve}")
-                return None
+                with open(filepath, "rb") as f:
+                    payload = f.read()
+                saved_at = os.path.getmtime(filepath)
+            except OSError:
+                continue
+            try:
+                summary = save_summary(self._decode(payload))
+            except (ValueError, TypeError, AttributeError):
+                # Повреждённый файл переносится как есть, с valid=0
+                summary = None
+            self.store.put(kind, slot_id, payload, summary, saved_at=saved_at)
+
+    def _index_summary(self, filepath, save_data) -> None:
+        """Запомнить сводку только что записанного сейва в индексе."""
+        try:
+            self.index.put(filepath, save_summary(save_data))
+        except (ValueError, TypeError, AttributeError):
+            self.index.discard(filepath)
+        self.index.flush()
+
+    # --- Файлы и форматы ---------------------------------------------------
+
+    def _split_ext(self, filepath: str):
+        """(stem, ext) если расширение — формат сейва, иначе (filepath, None)."""
+        stem, ext = os.path.splitext(filepath)
+        if ext in self.SAVE_EXTENSIONS:
+            return stem, ext
+        return filepath, None
+
+    def _remove_siblings(self, filepath: str) -> None:
+        stem, ext = self._split_ext(filepath)
+        if ext is None:
+            return
+        for other in self.SAVE_EXTENSIONS:
+            if other != ext and os.path.exists(stem + other):
+                try:
+                    os.remove(stem + other)
+                except OSError:
+                    pass
+                self.index.discard(stem + other)
 
-            version = save_data.get("version")
-            if version not in self.SUPPORTED_VERSIONS:
-                print(
-                    f"Предупреждение: версия сохранения {version} "
-                    f"не поддерживается ({sorted(self.SUPPORTED_VERSIONS)}). "
-                    f"Попытка загрузить как best-effort."
-                )
+    def _resolve(self, stem: str) -> str:
+        """Путь существующего сейва stem.* (сначала текущий формат).
 
-            print(f"Игра загружена: {filename}")
-            return save_data
+        Если файла нет ни в одном формате — путь для записи в текущем.
+        """
+        preferred = stem + self._ext
+        if os.path.exists(preferred):
+            return preferred
+        for ext in self.SAVE_EXTENSIONS:
+            if os.path.exists(stem + ext):
+                return stem + ext
+        return preferred
+
+    def _quicksave_path(self) -> str:
+        stem, _ = self._split_ext(os.path.join(self.saves_dir, self.quicksave_file))
+        return self._resolve(stem)
+
+    def _read_save_file(self, filepath: str):
+        """Прочитать сейв любого формата: бинарный — по сигнатуре, иначе JSON."""
+        with open(filepath, "rb") as f:
+            return self._decode(f.read())
+
+    def _open_stream(self, filepath: str) -> StreamedSave:
+        """Открыть сейв любого формата для потокового чтения (голова
+        прочитана, строки — по мере StreamedSave.batches())."""
+        f = open(filepath, "rb")
+        try:
+            binary = is_binary_save(f.read(4))
+            f.seek(0)
+            events = iter_save_events(f) if binary else iter_json_events(f)
+            return StreamedSave(events, close=f.close)
+        except BaseException:
+            f.close()
+            raise
+
+    @staticmethod
+    def _decode(raw: bytes):
+        """Байты сейва -> save_data (формат по сигнатуре)."""
+        if is_binary_save(raw):
+            return decode_save(raw)
+        save_data = json.loads(raw.decode("utf-8"))
+        if isinstance(save_data, dict):
+            save_data.pop(CHECKSUM_KEY, None)
+        return save_data
+
+    def export_json(self, filepath: str, target: str = None) -> str:
+        """Выгрузить сейв любого формата в читаемый JSON (отладка).
+
+        По умолчанию пишет в saves/export/<имя>.json. Возвращает путь.
+        """
+        save_data = self._read_save_file(filepath)
+        if target is None:
+            name = os.path.splitext(os.path.basename(filepath))[0] + ".json"
+            target = os.path.join(self.saves_dir, self.EXPORT_SUBDIR, name)
+        parent = os.path.dirname(target)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(save_data, f, indent=2, ensure_ascii=False)
+        return target
 
-        except (json.JSONDecodeError, OSError) as e:
-            print(f"Ошибка загрузки (повреждённый файл): {e}")
-            return None
-        except Exception as e:
-            print(f"Ошибка загрузки: {e}")
+    # --- Загрузка ----------------------------------------------------------
+
+    def load_game(self, filename=None, stream: bool = False):
+        """Загрузка игрового состояния из файла (JSON или .sav).
+
+        Возвращает dict или None при ошибке/повреждённом файле.
+        ``stream=True`` — StreamedSave с проверенной головой (строки
+        врагов/пикапов читаются потом, см. apply_save_stream).
+        """
+        if filename is None and self.store is not None:
+            return self._store_load("quicksave", QUICKSAVE_SLOT, stream=stream)
+        if filename is None:
+            filepath = self._quicksave_path()
+            filename = os.path.basename(filepath)
+        else:
+            filepath = os.path.join(self.saves_dir, filename)
+
+        if not os.path.exists(filepath):
+            print(f"Файл сохранения не найден: {filename}")
             return None
+        return self._load_from_path(filepath, stream=stream)
 
     # --- Валидация ---------------------------------------------------------
 
@@ -253,8 +696,11 @@ class SaveSystem:
 
     # --- Применение к объектам --------------------------------------------
 
-    def apply_save_data_to_player(self, player, save_data):
-        """Применение загруженных данных к объекту игрока."""
+    def apply_save_data_to_player(self, player, save_data, verbose: bool = True):
+        """Применение загруженных данных к объекту игрока.
+
+        ``verbose=False`` — без отчёта в консоль (перемотка, каждый кадр).
+        """
         try:
             player_data = save_data["player"]
             player.x = float(player_data["x"])
@@ -284,8 +730,9 @@ class SaveSystem:
             player.rect.x = int(player.x)
             player.rect.y = int(player.y)
 
-            print(f"Позиция игрока восстановлена: ({player.x}, {player.y})")
-            print(f"Здоровье игрока: {player.health}/{player.max_health}")
+            if verbose:
+                print(f"Позиция игрока восстановлена: ({player.x}, {player.y})")
+                print(f"Здоровье игрока: {player.health}/{player.max_health}")
 
         except Exception as e:
             print(f"Ошибка применения данных игрока: {e}")
@@ -302,7 +749,8 @@ class SaveSystem:
         except Exception as e:
             print(f"Ошибка применения данных мира: {e}")
 
-    def apply_save_data_to_enemies(self, enemy_manager, save_data):
+    def apply_save_data_to_enemies(self, enemy_manager, save_data,
+                                   verbose: bool = True):
         """Восстановить EnemyManager (живых врагов + target_counts)."""
         if enemy_manager is None:
             return
@@ -311,11 +759,13 @@ class SaveSystem:
             return  # старый сейв без врагов — оставляем как есть
         try:
             enemy_manager.deserialize(enemies_data)
-            print(f"Враги восстановлены: {len(enemy_manager.enemies)}")
+            if verbose:
+                print(f"Враги восстановлены: {len(enemy_manager.enemies)}")
         except Exception as e:
             print(f"Ошибка восстановления врагов: {e}")
 
-    def apply_save_data_to_pickups(self, pickup_manager, save_data):
+    def apply_save_data_to_pickups(self, pickup_manager, save_data,
+                                   verbose: bool = True):
         """Восстановить лежащие на земле пикапы."""
         if pickup_manager is None:
             return
@@ -324,11 +774,70 @@ class SaveSystem:
             return
         try:
             pickup_manager.deserialize(pickups_data)
-            print(f"Пикапы восстановлены: {pickup_manager.count()}")
+            if verbose:
+                print(f"Пикапы восстановлены: {pickup_manager.count()}")
         except Exception as e:
             print(f"Ошибка восстановления пикапов: {e}")
 
-    def apply_save_data_to_game_stats(self, game_stats, save_data):
+    def apply_save_stream(self, save: StreamedSave, enemy_manager,
+                          pickup_manager) -> bool:
+        """Восстановить врагов и пикапы пачками из StreamedSave.
+
+        Менеджер очищается при первой пачке своей коллекции; коллекции,
+        которой нет в сейве, он не трогает (как apply_save_data_to_*).
+        После вызова ``save.head`` — полный save_data без строк: поля,
+        стоящие в файле после строк (старый JSON), тоже в нём.
+        False — сейв оборвался на середине (мир восстановлен частично).
+        """
+        managers = {"enemies": enemy_manager, "pickups": pickup_manager}
+        started = set()
+        try:
+            with TRACER.span('load.apply', cat='save'):
+                for name, rows in save.batches():
+                    manager = managers.get(name)
+                    if manager is None:
+                        continue
+                    if name not in started:
+                        started.add(name)
+                        manager.deserialize(None)
+                    manager.restore_rows(rows)
+        except (json.JSONDecodeError, SaveFormatError, OSError) as e:
+            print(f"Ошибка загрузки (повреждённый файл): {e}")
+            return False
+        finally:
+            save.close()
+        self._finish_save_stream(save.head, started, enemy_manager, pickup_manager)
+        return True
+
+    def restore_lazily(self, save: StreamedSave, enemy_manager, pickup_manager,
+                       on_streamed=None) -> LazyRestore:
+        """Как apply_save_stream, но по кадрам: ближние к игроку враги и
+        пикапы — сразу, дальние — в следующих кадрах (см. LazyRestore).
+
+        ``on_streamed(head)`` — файл дочитан, голова полная.
+        """
+        return LazyRestore(
+            save, enemy_manager, pickup_manager, on_streamed=on_streamed,
+            on_done=lambda head, started: self._finish_save_stream(
+                head, started, enemy_manager, pickup_manager
+            ),
+        )
+
+    def _finish_save_stream(self, head: dict, started: set, enemy_manager,
+                            pickup_manager) -> None:
+        """Строки в менеджерах — остаток головы (target_counts врагов)."""
+        enemies_data = head.get("enemies")
+        if enemy_manager is not None and enemies_data:
+            if "enemies" in started:
+                enemy_manager.restore_state(enemies_data)
+                print(f"Враги восстановлены: {len(enemy_manager.enemies)}")
+            else:
+                self.apply_save_data_to_enemies(enemy_manager, head)
+        if pickup_manager is not None and "pickups" in started:
+            print(f"Пикапы восстановлены: {pickup_manager.count()}")
+
+    def apply_save_data_to_game_stats(self, game_stats, save_data,
+                                      verbose: bool = True):
         """Восстановить GameStats."""
         if game_stats is None:
             return
@@ -337,6 +846,8 @@ class SaveSystem:
             return
         try:
             game_stats.apply_dict(stats_data)
+            if not verbose:
+                return
             print(
                 f"Статистика восстановлена: kills={game_stats.enemies_killed}, "
                 f"distance={game_stats.distance_traveled:.0f}, "
@@ -349,18 +860,24 @@ class SaveSystem:
 
     def quicksave_exists(self):
         """Проверка существования файла быстрого сохранения."""
-        filepath = os.path.join(self.saves_dir, self.quicksave_file)
-        return os.path.exists(filepath)
+        if self.store is not None:
+            return self.store.exists("quicksave", QUICKSAVE_SLOT)
+        return os.path.exists(self._quicksave_path())
 
     # --- Manual-слоты (v0.3.2) --------------------------------------------
 
     def _slot_filepath(self, slot_id: int) -> str:
-        """Полный путь к файлу slot_id (1..MANUAL_SLOT_LIMIT)."""
-        return os.path.join(
-            self.manual_dir, self._SLOT_FILENAME_FMT.format(int(slot_id))
-        )
+        """Полный путь к файлу slot_id (1..MANUAL_SLOT_LIMIT).
+
+        Существующий файл слота в любом формате, иначе — путь для записи.
+        """
+        return self._resolve(os.path.join(
+            self.manual_dir, self._SLOT_STEM_FMT.format(int(slot_id))
+        ))
 
     def slot_exists(self, slot_id: int) -> bool:
+        if self.store is not None:
+            return self.store.exists("manual", slot_id)
         return os.path.exists(self._slot_filepath(slot_id))
 
     def save_to_slot(self, slot_id: int, player, world, game_stats=None,
@@ -377,29 +894,56 @@ class SaveSystem:
             )
             return False
         try:
-            return self._write_save(
-                self._slot_filepath(slot_id),
-                player, world, game_stats, pickup_manager, enemy_manager,
-            )
+            if self.store is not None:
+                ok = self._store_write("manual", int(slot_id), self._build_save_data(
+                    player, world, game_stats, pickup_manager, enemy_manager
+                ))
+            else:
+                target = os.path.join(
+                    self.manual_dir, self._SLOT_STEM_FMT.format(int(slot_id))
+                ) + self._ext
+                ok = self._write_save(
+                    target,
+                    player, world, game_stats, pickup_manager, enemy_manager,
+                )
+            if ok:
+                self._queue_thumbnail(self._capture_thumbnail(
+                    player, world, pickup_manager, enemy_manager
+                ), "manual", int(slot_id))
+            return ok
         except Exception as e:
             print(f"Ошибка сохранения в слот {slot_id}: {e}")
             return False
 
-    def load_from_slot(self, slot_id: int):
-        """Загрузить save_data из manual-слота. None при ошибке."""
+    def load_from_slot(self, slot_id: int, stream: bool = False):
+        """Загрузить save_data из manual-слота. None при ошибке.
+
+        ``stream`` — как в :meth:`load_game`.
+        """
+        if self.store is not None:
+            return self._store_load("manual", slot_id, stream=stream)
         filepath = self._slot_filepath(slot_id)
         if not os.path.exists(filepath):
             print(f"Слот {slot_id} пуст")
             return None
-        return self._load_from_path(filepath)
+        return self._load_from_path(filepath, stream=stream)
 
     def delete_slot(self, slot_id: int) -> bool:
         """Удалить файл manual-слота."""
+        if self.store is not None:
+            if not self.store.delete("manual", slot_id):
+                return False
+            self._catalog_changed()
+            self._drop_thumbnail("manual", slot_id)
+            return True
         filepath = self._slot_filepath(slot_id)
         if not os.path.exists(filepath):
             return False
         try:
             os.remove(filepath)
+            self._remove_siblings(filepath)
+            self._catalog_changed()
+            self._drop_thumbnail("manual", slot_id)
             print(f"Слот {slot_id} удалён")
             return True
         except OSError as e:
@@ -416,42 +960,65 @@ class SaveSystem:
 
         Пустые слоты в список не попадают. Сортировка по slot_id ASC.
         """
-        result = []
-        for slot_id in range(1, self.MANUAL_SLOT_LIMIT + 1):
-            filepath = self._slot_filepath(slot_id)
-            if not os.path.exists(filepath):
-                continue
-            meta = self._read_metadata(filepath)
-            meta["slot_id"] = slot_id
-            meta["filename"] = os.path.basename(filepath)
-            result.append(meta)
-        return result
+        return [self.read_entry_metadata(e) for e in self._manual_entries()]
 
     def get_quicksave_metadata(self):
         """Метаданные quicksave (или None если quicksave нет)."""
-        filepath = os.path.join(self.saves_dir, self.quicksave_file)
+        if self.store is not None:
+            row = self.store.latest("quicksave")
+            if row is None:
+                return None
+            meta = self.read_entry_metadata(self._store_entry(row))
+            meta.pop("mtime", None)
+            meta.pop("slot_id", None)
+            return meta
+        filepath = self._quicksave_path()
         if not os.path.exists(filepath):
             return None
-        meta = self._read_metadata(filepath)
-        meta["filename"] = self.quicksave_file
+        meta = self.read_entry_metadata(self._catalog_entry("quicksave", None, filepath))
+        meta.pop("mtime", None)
+        meta.pop("slot_id", None)
         return meta
 
     def get_free_slot(self):
         """Первый свободный slot_id (1..10) или None если все заняты."""
+        if self.store is not None:
+            taken = {row["slot_id"] for row in self.store.entries("manual")}
+            return next((slot_id for slot_id in range(1, self.MANUAL_SLOT_LIMIT + 1)
+                         if slot_id not in taken), None)
         for slot_id in range(1, self.MANUAL_SLOT_LIMIT + 1):
             if not self.slot_exists(slot_id):
                 return slot_id
         return None
 
-    def _load_from_path(self, filepath: str):
-        """Прочитать и провалидировать save_data из произвольного пути."""
+    def _load_from_path(self, filepath: str, loader=None, stream: bool = False):
+        """Прочитать и провалидировать save_data из произвольного пути.
+
+        ``loader()`` — свой способ чтения (журнал автосейвов, SQLite).
+        ``stream=True`` — вернуть StreamedSave: проверяется голова, а
+        строки коллекций остаются в файле до apply_save_stream.
+        """
+        with TRACER.span('load.read', cat='save', file=os.path.basename(filepath)):
+            return self._read_save_path(filepath, loader, stream)
+
+    def _read_save_path(self, filepath: str, loader, stream: bool):
+        if loader is None and self._known_corrupt(filepath):
+            print(f"Сохранение повреждено: {os.path.basename(filepath)} "
+                  f"(контрольная сумма не совпадает)")
+            return None
+        save = None
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                save_data = json.load(f)
+            if stream and loader is None:
+                save = self._open_stream(filepath)
+                save_data = save.head
+            else:
+                save_data = loader() if loader else self._read_save_file(filepath)
             try:
                 self._validate_save_data(save_data)
             except SaveValidationError as ve:
                 print(f"Сохранение повреждено: {ve}")
+                if save is not None:
+                    save.close()
                 return None
             version = save_data.get("version")
             if version not in self.SUPPORTED_VERSIONS:
@@ -460,20 +1027,27 @@ class SaveSystem:
                     f"не поддерживается ({sorted(self.SUPPORTED_VERSIONS)})."
                 )
             print(f"Игра загружена: {os.path.basename(filepath)}")
+            if stream:
+                return save if save is not None else StreamedSave.from_data(save_data)
             return save_data
-        except (json.JSONDecodeError, OSError) as e:
+        except (json.JSONDecodeError, SaveFormatError, OSError) as e:
             print(f"Ошибка загрузки (повреждённый файл): {e}")
-            return None
         except Exception as e:
             print(f"Ошибка загрузки: {e}")
-            return None
+        if save is not None:
+            save.close()
+        return None
 
-    def _read_metadata(self, filepath: str) -> dict:
+    def _read_metadata(self, filepath: str, loader=None) -> dict:
         """Прочитать только метаданные сейва (без полного применения).
 
         Возвращает dict с ключами: timestamp, level, play_time, hp, max_hp,
         valid (bool). Не кидает исключения — повреждённые файлы получают
-        valid=False и плейсхолдеры.
+        valid=False и плейсхолдеры. ``loader`` — как в _load_from_path;
+        тогда ``filepath`` — файл, по которому сводка ищется в индексе.
+
+        Порядок: индекс (если файл не менялся) → заголовок .sav →
+        разбор файла целиком. Прочитанная сводка кладётся в индекс.
         """
         meta = {
             "timestamp": "",
@@ -483,32 +1057,346 @@ class SaveSystem:
             "max_hp": 0,
             "valid": False,
         }
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            meta["timestamp"] = data.get("timestamp", "") or ""
-            player = data.get("player") or {}
-            meta["level"] = int(player.get("level", 0) or 0)
-            meta["hp"] = int(player.get("health", 0) or 0)
-            meta["max_hp"] = int(player.get("max_health", 0) or 0)
-            stats = data.get("game_stats") or {}
-            meta["play_time"] = float(stats.get("play_time", 0.0) or 0.0)
-            # Дополнительные поля для автосейвов
-            meta["reason"] = data.get("autosave_reason", "") or ""
-            meta["valid"] = True
-        except (OSError, json.JSONDecodeError, ValueError, TypeError):
-            # Повреждённый файл — отдаём плейсхолдер с valid=False
-            pass
+        summary = self.index.get(filepath) if filepath else None
+        if summary is None:
+            try:
+                summary = save_summary(loader()) if loader else self._read_summary(filepath)
+            except (OSError, json.JSONDecodeError, ValueError, TypeError,
+                    AttributeError):
+                # Повреждённый файл — отдаём плейсхолдер с valid=False
+                return meta
+            if filepath:
+                self.index.put(filepath, summary)
+        meta.update(summary)
+        meta["valid"] = True
+        return meta
+
+    def _read_summary(self, filepath: str) -> dict:
+        """Сводка файла: у .sav v2 — из заголовка, иначе — из всего файла."""
+        with open(filepath, "rb") as f:
+            head = f.read(HEAD_SIZE)
+            if is_binary_save(head):
+                summary = read_summary(head)
+                if summary is not None:
+                    return summary
+                return save_summary(decode_save(head + f.read()))
+            return save_summary(json.loads((head + f.read()).decode("utf-8")))
+
+    # --- Каталог для меню ----------------------------------------------------
+
+    def list_saves(self):
+        """Все сейвы без чтения содержимого — только listdir/stat.
+
+        Порядок как в меню загрузки: quicksave, автосейвы (свежие сверху),
+        manual-слоты по slot_id. Каждая запись::
+
+            {"kind": "quicksave" | "autosave" | "manual", "slot_id": N | None,
+             "filepath": "...", "filename": "...", "mtime": 1234567.0}
+
+        (у журнала автосейвов ещё ``"journal": True``). Сводку по записи
+        даёт :meth:`read_entry_metadata` — её можно звать в фоне.
+        В режиме sqlite — один запрос, сводка уже в записи (``"summary"``).
+        """
+        if self.store is not None:
+            entries = [self._store_entry(row) for row in self.store.entries()]
+            if self.journal.exists():
+                entries.extend(self._journal_entries())
+                entries.sort(key=self._catalog_order)
+            return entries
+        entries = []
+        quicksave = self._quicksave_path()
+        if os.path.exists(quicksave):
+            entries.append(self._catalog_entry("quicksave", None, quicksave))
+        entries.extend(self._autosave_entries())
+        entries.extend(self._manual_entries())
+        return entries
+
+    @staticmethod
+    def _catalog_order(entry):
+        """Порядок меню: quicksave, автосейвы свежие сверху, слоты по номеру."""
+        rank = {"quicksave": 0, "autosave": 1}.get(entry["kind"], 2)
+        if entry["kind"] == "autosave":
+            return rank, -entry["mtime"]
+        return rank, entry["slot_id"] or 0
+
+    def _manual_entries(self):
+        if self.store is not None:
+            return [self._store_entry(row) for row in self.store.entries("manual")]
+        entries = []
+        for slot_id in range(1, self.MANUAL_SLOT_LIMIT + 1):
+            filepath = self._slot_filepath(slot_id)
+            if os.path.exists(filepath):
+                entries.append(self._catalog_entry("manual", slot_id, filepath))
+        return entries
+
+    @staticmethod
+    def _catalog_entry(kind, slot_id, filepath, mtime=None) -> dict:
+        if mtime is None:
+            try:
+                mtime = os.path.getmtime(filepath)
+            except OSError:
+                mtime = 0.0
+        return {"kind": kind, "slot_id": slot_id, "filepath": filepath,
+                "filename": os.path.basename(filepath), "mtime": mtime}
+
+    def _autosave_entries(self):
+        if self.store is not None:
+            entries = [self._store_entry(row) for row in self.store.entries("autosave")]
+            entries.extend(self._journal_entries())
+            entries.sort(key=lambda e: e["mtime"], reverse=True)
+            return entries
+        entries = []
+        if os.path.isdir(self.autosave_dir):
+            seen = set()
+            for filename in sorted(os.listdir(self.autosave_dir)):
+                slot_id = self._parse_autosave_filename(filename)
+                if slot_id is None or slot_id in seen:
+                    continue
+                seen.add(slot_id)
+                entries.append(self._catalog_entry(
+                    "autosave", slot_id, self._autosave_filepath(slot_id)
+                ))
+        entries.extend(self._journal_entries())
+        # Свежие сверху
+        entries.sort(key=lambda e: e["mtime"], reverse=True)
+        return entries
+
+    def _journal_entries(self):
+        if not self.journal.exists():
+            return []
+        entry = self._catalog_entry(
+            "autosave", self.JOURNAL_SLOT_ID, self.journal.log_path,
+            mtime=self.journal.mtime(),
+        )
+        entry["filename"] = self.JOURNAL_SUBDIR
+        entry["journal"] = True
+        return [entry]
+
+    def read_entry_metadata(self, entry: dict) -> dict:
+        """Метаданные записи list_saves(): сводка + slot_id/filename/mtime.
+
+        Потокобезопасно (индекс под замком), не кидает исключений.
+        Сейв, уже не прошедший verify_entry(), — ``valid=False``.
+        """
+        if "summary" in entry:
+            row = entry["summary"]
+            meta = {key: row[key] for key in
+                    ("timestamp", "level", "play_time", "hp", "max_hp", "reason")}
+            meta["valid"] = row["valid"]
+            for key in ("slot_id", "filename", "mtime"):
+                meta[key] = entry[key]
+        else:
+            loader = self.journal.load if entry.get("journal") else None
+            meta = self._read_metadata(entry["filepath"], loader=loader)
+            for key in ("slot_id", "filename", "mtime", "journal"):
+                if key in entry:
+                    meta[key] = entry[key]
+            self.index.flush()
+        if self.cached_verification(entry) is False:
+            meta["valid"] = False
         return meta
 
+    # --- Целостность ---------------------------------------------------------
+
+    def verify_all(self, entries=None) -> dict:
+        """Проверить контрольные суммы сейвов параллельно.
+
+        ``entries`` — записи list_saves() (по умолчанию — все: quicksave,
+        ручные слоты, автосейвы). Возвращает {(kind, slot_id): цел ли}.
+        Неизменившиеся с прошлой проверки сейвы не перечитываются.
+        """
+        if entries is None:
+            entries = self.list_saves()
+        if not entries:
+            return {}
+        with self._verify_lock:
+            if self._verify_pool is None:
+                self._verify_pool = ThreadPoolExecutor(
+                    max_workers=self.VERIFY_WORKERS,
+                    thread_name_prefix="save-verify",
+                )
+            pool = self._verify_pool
+        results = pool.map(self.verify_entry, entries)
+        return {(e["kind"], e["slot_id"]): ok for e, ok in zip(entries, results)}
+
+    def verify_entry(self, entry: dict) -> bool:
+        """Цел ли сейв записи list_saves() (False и если записи уже нет).
+
+        Потокобезопасно; результат кэшируется по (mtime, размер).
+        """
+        target = self._verify_target(entry)
+        if target is None:
+            return False
+        key, stamp, check = target
+        with self._verify_lock:
+            cached = self._verified.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            ok = check()
+        except (OSError, sqlite3.Error):
+            ok = False
+        with self._verify_lock:
+            self._verified[key] = (stamp, ok)
+        return ok
+
+    def cached_verification(self, entry: dict) -> Optional[bool]:
+        """Результат прошлой проверки, если сейв с тех пор не менялся,
+        иначе None. Без чтения содержимого (только stat)."""
+        target = self._verify_target(entry)
+        if target is None:
+            return None
+        key, stamp, _ = target
+        with self._verify_lock:
+            cached = self._verified.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        return None
+
+    def _known_corrupt(self, filepath: str) -> bool:
+        """Файл уже не прошёл проверку и с тех пор не менялся."""
+        return self.cached_verification({"filepath": filepath}) is False
+
+    def _verify_target(self, entry: dict):
+        """(ключ кэша, (mtime, размер), проверка) записи или None, если
+        сейва уже нет. У журнала проверяется база — оборванный хвост
+        журнала SaveJournal отбрасывает сам."""
+        if "summary" in entry:
+            row = entry["summary"]
+            kind, slot_id = row["kind"], row["slot_id"]
+
+            def check_payload():
+                payload = self.store.payload(kind, slot_id)
+                return payload is not None and self._verify_stream(io.BytesIO(payload))
+            return ("db", kind, slot_id), (row["mtime"], row["size"]), check_payload
+
+        filepath = self.journal.base_path() if entry.get("journal") else entry["filepath"]
+        if filepath is None:
+            return None
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+
+        def check_file():
+            with open(filepath, "rb") as f:
+                return self._verify_stream(f)
+        return filepath, (st.st_mtime_ns, st.st_size), check_file
+
+    @staticmethod
+    def _verify_stream(f) -> bool:
+        binary = is_binary_save(f.read(4))
+        f.seek(0)
+        return verify_save(f) if binary else verify_json(f)
+
+    # --- Превью миникарты ---------------------------------------------------
+
+    def thumbnail_path(self, kind: str, slot_id) -> str:
+        """PNG превью записи: рядом с файлом слота (и при backend=sqlite)."""
+        if kind == "quicksave":
+            stem, _ = self._split_ext(os.path.join(self.saves_dir, self.quicksave_file))
+        elif kind == "manual":
+            stem = os.path.join(self.manual_dir, self._SLOT_STEM_FMT.format(int(slot_id)))
+        elif slot_id == self.JOURNAL_SLOT_ID:
+            stem = os.path.join(self.autosave_dir, self.JOURNAL_SUBDIR)
+        else:
+            stem = self._autosave_stem(slot_id)
+        return stem + self.THUMBNAIL_EXT
+
+    def entry_thumbnail(self, entry: dict, size: int = None):
+        """Превью записи list_saves() (Surface) или None — нет, устарело
+        или ещё рисуется. Ждёт очередь превью: вызывать не на главном
+        потоке (SaveLoadMenu — из фонового загрузчика)."""
+        self._thumbnailer.wait()
+        return load_thumbnail(self.thumbnail_path(entry["kind"], entry["slot_id"]),
+                              entry["mtime"], size)
+
+    def _capture_thumbnail(self, player, world, pickups=None, enemies=None):
+        """Снимок для превью на вызывающем потоке (None — превью не будет).
+        ``pickups``/``enemies`` — менеджеры или их снимки (capture()):
+        координаты снимка отбираются уже при отрисовке, в фоне."""
+        if not self.thumbnails:
+            return None
+        try:
+            return capture_thumbnail(world, player, enemies, pickups,
+                                     self.thumbnail_size, self.thumbnail_area)
+        except Exception as e:  # превью не должно мешать сейву
+            print(f"Ошибка превью сохранения: {e}")
+            return None
+
+    def _queue_thumbnail(self, render, kind: str, slot_id) -> None:
+        """Нарисовать и записать превью в фоне. mtime сейва берётся сейчас,
+        сразу после записи, — PNG привязан именно к этой версии слота."""
+        if render is None:
+            return
+        stamp = self._save_stamp(kind, slot_id)
+        if stamp is None:
+            return
+        path = self.thumbnail_path(kind, slot_id)
+        self._thumbnailer.submit(
+            lambda: write_thumbnail(render(), path, stamp), self._thumbnail_written
+        )
+
+    @staticmethod
+    def _thumbnail_written(path, error) -> None:
+        if error is not None:
+            print(f"Ошибка превью сохранения: {error}")
+
+    def _save_stamp(self, kind: str, slot_id) -> Optional[float]:
+        """mtime записи, как его покажет list_saves() (saved_at в базе)."""
+        if kind == "autosave" and slot_id == self.JOURNAL_SLOT_ID:
+            return self.journal.mtime()
+        if self.store is not None:
+            return self.store.saved_at(kind, QUICKSAVE_SLOT if kind == "quicksave" else slot_id)
+        if kind == "quicksave":
+            filepath = self._quicksave_path()
+        elif kind == "manual":
+            filepath = self._slot_filepath(slot_id)
+        else:
+            filepath = self._autosave_filepath(slot_id)
+        try:
+            return os.path.getmtime(filepath)
+        except OSError:
+            return None
+
+    def _restamp_thumbnail(self, kind: str, slot_id) -> None:
+        """Файл сейва переписан без изменения содержимого (компактация
+        журнала) — превью остаётся свежим с новым mtime."""
+        path = self.thumbnail_path(kind, slot_id)
+        stamp = self._save_stamp(kind, slot_id)
+
+        def restamp():
+            if stamp is not None and os.path.exists(path):
+                os.utime(path, (stamp, stamp))
+        self._thumbnailer.submit(restamp, self._thumbnail_written)
+
+    def _drop_thumbnail(self, kind: str, slot_id) -> None:
+        """Удалить превью удалённого слота — в очереди превью, после уже
+        поставленной отрисовки этого же слота."""
+        path = self.thumbnail_path(kind, slot_id)
+        self._thumbnailer.submit(lambda: remove_thumbnail(path))
+
     # --- Автосейвы (v0.3.3) -----------------------------------------------
 
     def _autosave_filepath(self, slot_id: int) -> str:
-        """Полный путь к файлу автосейв-слота."""
+        """Полный путь к файлу автосейв-слота (существующий — в любом формате)."""
+        return self._resolve(self._autosave_stem(slot_id))
+
+    def _autosave_stem(self, slot_id: int) -> str:
         return os.path.join(
-            self.autosave_dir, self._AUTOSAVE_FILENAME_FMT.format(int(slot_id))
+            self.autosave_dir, self._AUTOSAVE_STEM_FMT.format(int(slot_id))
         )
 
+    def _parse_autosave_filename(self, filename: str):
+        """slot_id из имени autosave_NN.(json|sav), иначе None."""
+        stem, ext = os.path.splitext(filename)
+        if ext not in self.SAVE_EXTENSIONS or not stem.startswith("autosave_"):
+            return None
+        try:
+            return int(stem[len("autosave_"):])
+        except ValueError:
+            return None
+
     def autosave(self, player, world, game_stats=None, pickup_manager=None,
                  enemy_manager=None, reason: str = "periodic",
                  limit: int = None) -> bool:
@@ -520,30 +1408,171 @@ class SaveSystem:
 
         ``reason`` сохраняется в save_data как ``autosave_reason`` и потом
         отображается в UI («periodic», «level_up», ...).
+        В режиме journal слотов нет — пишется дельта журнала.
         """
-        if limit is None:
-            limit = self.AUTOSAVE_DEFAULT_LIMIT
+        limit = self._normalize_autosave_limit(limit)
+        # Синхронная запись не должна гоняться с фоновой за один слот
+        self._wait_writer()
         try:
-            limit = max(1, int(limit))
-        except (TypeError, ValueError):
-            limit = self.AUTOSAVE_DEFAULT_LIMIT
+            # Запись тут же, на этом потоке — копия мира не нужна
+            build = self._capture_save_data(
+                player, world, game_stats, pickup_manager, enemy_manager,
+                extra_data={"autosave_reason": str(reason)}, live=True,
+            )
+            clock = self._capture_clock(world, pickup_manager, enemy_manager)
+            thumbnail = self._capture_thumbnail(
+                player, world, pickup_manager, enemy_manager
+            )
+            self._write_autosave(build, limit, clock, thumbnail)
+            return True
+        except Exception as e:
+            print(f"Ошибка автосейва: {e}")
+            return False
+
+    def autosave_async(self, player, world, game_stats=None,
+                       pickup_manager=None, enemy_manager=None,
+                       reason: str = "periodic", limit: int = None,
+                       on_complete=None) -> bool:
+        """Автосейв без записи в кадре.
 
+        На вызывающем потоке только снимок сырых полей
+        (_capture_save_data); сборка dict, выбор слота, JSON и запись на
+        диск — в потоке SaveWriter. Превью рисуется из того же снимка.
+        ``on_complete(filepath, error)`` вызывается из потока записи.
+
+        Возвращает True, если задача поставлена в очередь.
+        """
+        limit = self._normalize_autosave_limit(limit)
+        self._complete_captures()
         try:
-            slot_id = self._pick_autosave_slot(limit)
-            filepath = self._autosave_filepath(slot_id)
-            ok = self._write_save(
-                filepath, player, world, game_stats,
-                pickup_manager, enemy_manager,
-                extra_data={"autosave_reason": str(reason)},
-            )
-            if ok:
-                # Ротация: если лимит уменьшили в конфиге — почистим хвост.
-                self._enforce_autosave_limit(limit)
-            return ok
+            with TRACER.span('autosave.capture', cat='save', reason=str(reason)):
+                enemies, pickups = collections = self._capture_collections(
+                    world, pickup_manager, enemy_manager
+                )
+                self._captures = [c for c in collections if hasattr(c, "complete")]
+                build = self._capture_save_data(
+                    player, world, game_stats,
+                    extra_data={"autosave_reason": str(reason)},
+                    collections=collections,
+                )
+                clock = self._capture_clock(world, pickup_manager, enemy_manager)
+                thumbnail = self._capture_thumbnail(player, world, pickups, enemies)
         except Exception as e:
             print(f"Ошибка автосейва: {e}")
             return False
 
+        def written(result, error):
+            self._autosaves_written += 1
+            # Меню перечитывает список: строка «запись…» сменяется слотом
+            self._catalog_changed()
+            if on_complete is not None:
+                on_complete(result, error)
+        self._autosaves_queued += 1
+        self._writer.submit(
+            lambda: self._write_autosave(build, limit, clock, thumbnail), written
+        )
+        return True
+
+    @property
+    def pending_autosaves(self) -> int:
+        """Сколько автосейвов поставлено в очередь и ещё не записано."""
+        return self._autosaves_queued - self._autosaves_written
+
+    def wait_for_pending(self) -> None:
+        """Дождаться фоновых записей и превью (тесты). Меню не ждёт:
+        пишущиеся автосейвы в нём — строки pending_autosaves."""
+        self._wait_writer()
+        self._thumbnailer.wait()
+
+    def _wait_writer(self) -> None:
+        """Дождаться очереди записи с игрового потока. Снимок, который
+        менеджер докопировал бы в следующих кадрах, докопировать сейчас:
+        иначе запись ждала бы кадр, а кадр — запись."""
+        self._complete_captures()
+        self._writer.wait()
+
+    def _complete_captures(self) -> None:
+        for snapshot in self._captures:
+            snapshot.complete()
+        self._captures = []
+
+    def shutdown(self) -> None:
+        """Дописать очередь автосейвов и остановить поток записи."""
+        self._complete_captures()
+        self._writer.shutdown()
+        self._thumbnailer.shutdown()
+        if self._verify_pool is not None:
+            self._verify_pool.shutdown(wait=True)
+            self._verify_pool = None
+        if self.store is not None:
+            self.store.close()
+
+    def restart_journal(self) -> None:
+        """Начата новая сессия (новая игра / загрузка): следующий
+        журналируемый автосейв пишет новую базу. Прежний мир больше
+        не обновляется — его снимок докопировать сейчас."""
+        self._complete_captures()
+        self._writer.submit(self.journal.restart)
+
+    def _normalize_autosave_limit(self, limit) -> int:
+        if limit is None:
+            return self.AUTOSAVE_DEFAULT_LIMIT
+        try:
+            return max(1, int(limit))
+        except (TypeError, ValueError):
+            return self.AUTOSAVE_DEFAULT_LIMIT
+
+    def _write_autosave(self, build, limit: int, clock: float,
+                        thumbnail=None) -> str:
+        """Собрать save_data из снимка ``build`` и записать автосейв. Путь файла.
+
+        Слоты: выбрать слот ротации, записать и почистить хвост. Журнал:
+        дописать дельту, а компактацию поставить следующей задачей записи.
+        Выполняется там же, где запись, — очередь SaveWriter гарантирует,
+        что два автосейва не выберут один слот одновременно.
+        ``thumbnail`` — снимок превью (_capture_thumbnail); слот
+        становится известен только здесь.
+        """
+        with TRACER.span('autosave.write', cat='save', mode=self.autosave_mode):
+            return self._write_autosave_data(build, limit, clock, thumbnail)
+
+    def _write_autosave_data(self, build, limit: int, clock: float,
+                             thumbnail) -> str:
+        if self.autosave_mode == "journal":
+            save_data = build(with_uid=True)
+            filepath = self.journal.record(save_data, clock)
+            # Сводка журнала в индексе привязана к journal.log
+            self._index_summary(self.journal.log_path, save_data)
+            self._catalog_changed()
+            self._queue_thumbnail(thumbnail, "autosave", self.JOURNAL_SLOT_ID)
+            if self.journal.needs_compaction():
+                self._writer.submit(lambda: self._compact_journal(save_data))
+            return filepath
+        save_data = build(stream=True)
+        if self.store is not None:
+            slot_id = self.store.put_autosave(
+                self._encode(save_data), self._summary_or_none(save_data), limit
+            )
+            self._catalog_changed()
+            print(f"Игра сохранена: {self._store_label('autosave', slot_id)}")
+            self._queue_thumbnail(thumbnail, "autosave", slot_id)
+            return self.store.path
+        slot_id = self._pick_autosave_slot(limit)
+        filepath = self._autosave_stem(slot_id) + self._ext
+        self._write_save_data(filepath, save_data)
+        self._queue_thumbnail(thumbnail, "autosave", slot_id)
+        # Ротация: если лимит уменьшили в конфиге — почистим хвост.
+        self._enforce_autosave_limit(limit)
+        return filepath
+
+    def _compact_journal(self, save_data: dict) -> str:
+        """Фоновая компактация журнала; сводка та же, меняется только файл."""
+        with TRACER.span('journal.compact', cat='save'):
+            path = self.journal.compact()
+        self._index_summary(self.journal.log_path, save_data)
+        self._restamp_thumbnail("autosave", self.JOURNAL_SLOT_ID)
+        return path
+
     def _pick_autosave_slot(self, limit: int) -> int:
         """Найти slot_id 1..limit для записи автосейва.
 
@@ -566,15 +1595,13 @@ class SaveSystem:
         """Удалить автосейвы со slot_id > limit (если лимит уменьшился)."""
         try:
             for filename in os.listdir(self.autosave_dir):
-                if not filename.startswith("autosave_") \
-                        or not filename.endswith(".json"):
-                    continue
-                try:
-                    slot_id = int(filename[len("autosave_"):-len(".json")])
-                except ValueError:
+                slot_id = self._parse_autosave_filename(filename)
+                if slot_id is None:
                     continue
                 if slot_id > limit:
                     os.remove(os.path.join(self.autosave_dir, filename))
+                    self._catalog_changed()
+                    self._drop_thumbnail("autosave", slot_id)
         except OSError:
             pass
 
@@ -587,45 +1614,59 @@ class SaveSystem:
              "hp": 80, "max_hp": 100, "reason": "level_up",
              "filename": "autosave_01.json", "mtime": 1234567.0, "valid": True}
         """
-        result = []
-        if not os.path.isdir(self.autosave_dir):
-            return result
-        for filename in os.listdir(self.autosave_dir):
-            if not filename.startswith("autosave_") \
-                    or not filename.endswith(".json"):
-                continue
-            try:
-                slot_id = int(filename[len("autosave_"):-len(".json")])
-            except ValueError:
-                continue
-            filepath = os.path.join(self.autosave_dir, filename)
-            meta = self._read_metadata(filepath)
-            meta["slot_id"] = slot_id
-            meta["filename"] = filename
-            try:
-                meta["mtime"] = os.path.getmtime(filepath)
-            except OSError:
-                meta["mtime"] = 0.0
-            result.append(meta)
-        # Свежие сверху
-        result.sort(key=lambda m: m.get("mtime", 0.0), reverse=True)
-        return result
+        return [self.read_entry_metadata(e) for e in self._autosave_entries()]
+
+    def load_from_autosave(self, slot_id: int, stream: bool = False):
+        """Загрузить save_data из автосейв-слота. None при ошибке.
 
-    def load_from_autosave(self, slot_id: int):
-        """Загрузить save_data из автосейв-слота. None при ошибке."""
+        JOURNAL_SLOT_ID — журнал: база + replay дельт (собирается в
+        памяти, ``stream`` отдаёт его пачками уже из dict).
+        """
+        if slot_id == self.JOURNAL_SLOT_ID:
+            self._wait_writer()
+            if not self.journal.exists():
+                print("Журнал автосейвов не найден")
+                return None
+            return self._load_from_path(
+                self.journal.base_path(), loader=self.journal.load, stream=stream
+            )
+        if self.store is not None:
+            self._wait_writer()
+            return self._store_load("autosave", slot_id, stream=stream)
         filepath = self._autosave_filepath(slot_id)
         if not os.path.exists(filepath):
             print(f"Автосейв {slot_id} не найден")
             return None
-        return self._load_from_path(filepath)
+        return self._load_from_path(filepath, stream=stream)
 
     def delete_autosave(self, slot_id: int) -> bool:
-        """Удалить файл автосейв-слота."""
+        """Удалить файл автосейв-слота (JOURNAL_SLOT_ID — весь журнал)."""
+        if slot_id == self.JOURNAL_SLOT_ID:
+            self._wait_writer()
+            try:
+                deleted = self.journal.delete()
+            except OSError as e:
+                print(f"Ошибка удаления журнала автосейвов: {e}")
+                return False
+            if deleted:
+                self._catalog_changed()
+                self._drop_thumbnail("autosave", slot_id)
+            return deleted
+        if self.store is not None:
+            self._wait_writer()
+            if not self.store.delete("autosave", slot_id):
+                return False
+            self._catalog_changed()
+            self._drop_thumbnail("autosave", slot_id)
+            return True
         filepath = self._autosave_filepath(slot_id)
         if not os.path.exists(filepath):
             return False
         try:
             os.remove(filepath)
+            self._remove_siblings(filepath)
+            self._catalog_changed()
+            self._drop_thumbnail("autosave", slot_id)
             print(f"Автосейв {slot_id} удалён")
             return True
         except OSError as e:
@@ -634,5 +1675,8 @@ class SaveSystem:
 
     def get_latest_autosave_metadata(self):
         """Метаданные самого свежего автосейва (или None)."""
+        if self.store is not None and not self.journal.exists():
+            row = self.store.latest("autosave")
+            return self.read_entry_metadata(self._store_entry(row)) if row else None
         items = self.list_autosaves()
         return items[0] if items else None
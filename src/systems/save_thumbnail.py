@@ -0,0 +1,163 @@
+"""
+Превью миникарты для слотов сохранений (v0.3.2, п.9).
+
+Single Responsibility: снять с мира то, что нужно для картинки области
+вокруг игрока, нарисовать её и записать PNG рядом со слотом. Когда и для
+какого слота — решает SaveSystem; показ — SaveLoadMenu.
+
+Разделение по потокам:
+- capture_thumbnail() — на главном потоке, в момент сейва. Берёт только
+  позицию игрока и область; сетка ландшафта неизменна и строится один
+  раз на мир (World.terrain_grid). Координаты врагов/пикапов — из
+  снимков сейва (CollectionSnapshot с копией строк): отбор по области
+  идёт уже в render, в кадре повторного прохода по миру нет. Живой
+  менеджер (синхронная запись) опрашивается ``positions_in`` сразу.
+- возвращённая функция рисует Surface, а write_thumbnail() кодирует PNG —
+  в фоновом потоке, поэтому ни кадр, ни сама запись сейва не ждут.
+
+Свежесть: mtime PNG выставляется равным mtime сейва (saved_at в SQLite),
+на момент которого снята картинка. Перезаписанный слот без нового превью
+даёт несовпадение — is_fresh() такую картинку не показывает.
+"""
+import os
+from typing import Callable, Optional
+
+import pygame
+
+# Цвета точек поверх ландшафта
+_PLAYER_COLOR = (255, 255, 255)
+_ENEMY_COLOR = (220, 60, 60)
+_PICKUP_COLOR = (255, 215, 0)
+_FRAME_COLOR = (0, 0, 0)
+
+# Допуск сравнения mtime (float из stat / saved_at базы)
+_STAMP_EPSILON = 1e-3
+
+
+def capture_thumbnail(world, player, enemies=None, pickups=None,
+                      size: int = 96, area: float = 1024
+                      ) -> Optional[Callable[[], pygame.Surface]]:
+    """Снять область ``area`` x ``area`` px вокруг игрока.
+
+    ``enemies``/``pickups`` — снимки коллекций (``frozen``) или менеджеры
+    с ``positions_in``; враги по умолчанию — world.enemy_manager.
+    Возвращает функцию без аргументов, рисующую превью ``size`` x ``size``
+    (её можно вызывать в любом потоке), или None, если рисовать не из
+    чего (нет мира с ландшафтом или игрока).
+    """
+    if world is None or player is None or not hasattr(world, "terrain_grid"):
+        return None
+    if enemies is None:
+        enemies = getattr(world, "enemy_manager", None)
+    grid = world.terrain_grid()
+    tile = world.tile_size
+    rect = getattr(player, "rect", None)
+    px, py = rect.center if rect is not None else (player.x, player.y)
+    # Область целиком внутри мира (как камера у края карты)
+    area = float(min(area, world.width, world.height))
+    left = min(max(px - area / 2, 0.0), world.width - area)
+    top = min(max(py - area / 2, 0.0), world.height - area)
+    bounds = (left, top, left + area, top + area)
+    enemy_dots = _positions(enemies, bounds)
+    pickup_dots = _positions(pickups, bounds)
+
+    def render() -> pygame.Surface:
+        return _render(grid, tile, bounds, (px, py), enemy_dots(), pickup_dots(),
+                       int(size))
+    return render
+
+
+def _positions(source, bounds) -> Callable[[], list]:
+    """Координаты в области: у снимка — отбор при отрисовке, у живого
+    менеджера — копия сейчас."""
+    if source is None or not hasattr(source, "positions_in"):
+        return list
+    if getattr(source, "frozen", False):
+        return lambda: source.positions_in(*bounds)
+    found = source.positions_in(*bounds)
+    return lambda: found
+
+
+def _render(grid, tile, bounds, player, enemies, pickups, size) -> pygame.Surface:
+    tiles_x, tiles_y, cells, palette = grid
+    left, top, right, bottom = bounds
+    tx0, ty0 = int(left // tile), int(top // tile)
+    tx1 = min(tiles_x, int(-(-right // tile)))
+    ty1 = min(tiles_y, int(-(-bottom // tile)))
+    # Тайл = пиксель, потом масштаб: сотни set_at вместо rect на тайл
+    tiles = pygame.Surface((max(1, tx1 - tx0), max(1, ty1 - ty0)))
+    tiles.fill(palette[0])
+    for ty in range(ty0, ty1):
+        row = ty * tiles_x
+        for tx in range(tx0, tx1):
+            index = cells[row + tx]
+            if index:
+                tiles.set_at((tx - tx0, ty - ty0), palette[index])
+    surface = pygame.Surface((size, size))
+    # Область может начинаться с середины тайла — сдвиг на остаток
+    scale = size / (right - left)
+    offset = (int((tx0 * tile - left) * scale), int((ty0 * tile - top) * scale))
+    surface.blit(pygame.transform.scale(tiles, (
+        int(tiles.get_width() * tile * scale) + 1,
+        int(tiles.get_height() * tile * scale) + 1,
+    )), offset)
+
+    def dot(x, y, color, radius):
+        pygame.draw.circle(surface, color,
+                           (int((x - left) * scale), int((y - top) * scale)), radius)
+    for x, y in pickups:
+        dot(x, y, _PICKUP_COLOR, 1)
+    for x, y in enemies:
+        dot(x, y, _ENEMY_COLOR, 1)
+    dot(player[0], player[1], _PLAYER_COLOR, 3)
+    pygame.draw.rect(surface, _FRAME_COLOR, surface.get_rect(), 1)
+    return surface
+
+
+def write_thumbnail(surface: pygame.Surface, path: str, stamp: float) -> str:
+    """Атомарно записать PNG и выставить ему mtime сейва ``stamp``."""
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pygame.image.save(surface, f, os.path.basename(path))
+        os.utime(tmp_path, (stamp, stamp))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def is_fresh(path: str, stamp: float) -> bool:
+    """PNG снят с сейва с этим mtime (а не с прежней версии слота)."""
+    try:
+        return abs(os.path.getmtime(path) - stamp) < _STAMP_EPSILON
+    except OSError:
+        return False
+
+
+def load_thumbnail(path: str, stamp: float, size: int = None) -> Optional[pygame.Surface]:
+    """Прочитать свежий PNG (None — нет или устарел). ``size`` — сразу
+    уменьшить под строку меню, чтобы не масштабировать в кадре."""
+    if not is_fresh(path, stamp):
+        return None
+    try:
+        surface = pygame.image.load(path)
+    except (pygame.error, OSError):
+        return None
+    if size is not None and surface.get_size() != (size, size):
+        surface = pygame.transform.smoothscale(surface, (size, size))
+    return surface
+
+
+def remove_thumbnail(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
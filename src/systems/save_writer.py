@@ -0,0 +1,75 @@
+"""
+SaveWriter — фоновый поток записи сохранений.
+
+Single Responsibility: выполнять задачи записи (кодирование + диск) вне
+игрового кадра, по одной, в порядке поступления. Что и куда писать —
+решает SaveSystem; SaveWriter только исполняет задачи и сообщает
+результат колбэком.
+
+Колбэк ``on_complete(result, error)`` вызывается В ПОТОКЕ ЗАПИСИ:
+получатель должен быть потокобезопасным (SessionLogger — да).
+"""
+import queue
+import threading
+from typing import Callable, Optional
+
+
+class SaveWriter:
+    """Один daemon-поток + очередь задач. Поток стартует при первой задаче."""
+
+    def __init__(self, name: str = "save-writer"):
+        self._name = name
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, job: Callable, on_complete: Callable = None) -> None:
+        """Поставить задачу ``job()`` в очередь записи."""
+        self._ensure_thread()
+        self._queue.put((job, on_complete))
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                job, on_complete = item
+                result, error = None, None
+                try:
+                    result = job()
+                except Exception as e:  # задача не должна валить поток
+                    error = e
+                if on_complete is not None:
+                    try:
+                        on_complete(result, error)
+                    except Exception as e:
+                        print(f"Ошибка колбэка записи сохранения: {e}")
+            finally:
+                self._queue.task_done()
+
+    @property
+    def pending(self) -> int:
+        """Сколько задач ещё не выполнено (приблизительно)."""
+        return self._queue.unfinished_tasks
+
+    def wait(self) -> None:
+        """Дождаться выполнения всех поставленных задач."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def shutdown(self) -> None:
+        """Дописать очередь и остановить поток. Безопасно вызывать повторно."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join()
@@ -0,0 +1,90 @@
+"""
+StressMode - нагрузочный режим «орда» для пайплайна врагов.
+
+Держит в мире заданную популяцию врагов (1k / 5k / 20k), распределённую
+между light / heavy / fast по весам из config.ini, и каждый кадр доспавнивает
+убитых. Доспавн ограничен ``spawn_per_frame`` — иначе восстановление тысяч
+врагов за один кадр само превратилось бы в стоп-кадр и смазало замеры.
+
+Включается через ``[stress] enabled`` или ``python main.py --stress N``.
+Замеры по подсистемам копит StageTimer, показывает StressPanel.
+"""
+from typing import Dict, Sequence
+
+from src.core.config_loader import config_snapshot
+
+
+# Порядок типов соответствует весам [stress] mix = light,heavy,fast
+STRESS_TYPE_IDS = ('light', 'heavy', 'fast')
+
+
+def split_population(population: int, weights: Sequence[int]) -> Dict[str, int]:
+    """Разбить популяцию по типам пропорционально весам.
+
+    Остаток от округления отдаётся типам с наибольшей дробной частью,
+    поэтому сумма всегда ровно ``population``.
+    """
+    total_w = sum(weights)
+    if population <= 0 or total_w <= 0:
+        return {tid: 0 for tid in STRESS_TYPE_IDS}
+
+    exact = [population * w / total_w for w in weights]
+    counts = [int(v) for v in exact]
+    remainder = population - sum(counts)
+    by_fraction = sorted(range(len(exact)),
+                         key=lambda i: exact[i] - counts[i], reverse=True)
+    for i in by_fraction[:remainder]:
+        counts[i] += 1
+    return dict(zip(STRESS_TYPE_IDS, counts))
+
+
+class StressMode:
+    """Поддерживает популяцию врагов EnemyManager на целевом уровне."""
+
+    def __init__(self, enemy_manager, population: int,
+                 mix: Sequence[int] = None, spawn_per_frame: int = None):
+        self.enemy_manager = enemy_manager
+        self.population = int(population)
+        cfg = config_snapshot().stress
+        if mix is None:
+            mix = cfg.mix
+        if spawn_per_frame is None:
+            spawn_per_frame = cfg.spawn_per_frame
+        self.spawn_per_frame = max(1, int(spawn_per_frame))
+        self.targets = split_population(self.population, tuple(mix))
+
+        # Собственный авто-респавн менеджера тоже должен быть порционным
+        enemy_manager.target_counts = dict(self.targets)
+        enemy_manager.respawn_batch_limit = self.spawn_per_frame
+
+        # Статистика для панели
+        self.spawned_total = 0
+        self.last_spawned = 0
+
+    def update(self, player_x: float, player_y: float) -> int:
+        """Доспавнить недостающих (не больше spawn_per_frame).
+
+        Возвращает количество заспавненных в этом кадре.
+        """
+        self.last_spawned = self.enemy_manager.top_up(
+            player_x, player_y, self.spawn_per_frame
+        )
+        self.spawned_total += self.last_spawned
+        return self.last_spawned
+
+    @property
+    def alive(self) -> int:
+        return len(self.enemy_manager.enemies)
+
+
+def resolve_stress_population(cli_population: int = None):
+    """Итоговая популяция stress-режима или None если режим выключен.
+
+    Флаг командной строки приоритетнее config.ini.
+    """
+    if cli_population is not None:
+        return int(cli_population) if int(cli_population) > 0 else None
+    cfg = config_snapshot().stress
+    if cfg.enabled:
+        return cfg.population
+    return None
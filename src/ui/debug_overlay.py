@@ -0,0 +1,63 @@
+"""
+DebugOverlay — отладочная панель (F1) с редким обновлением.
+
+Single Responsibility: раз в 1/rate_hz секунды забрать строки у Game
+(функция ``sample``), отрисовать их в одну Surface и в остальные кадры
+только блитить её. Что показывать — решает Game._debug_lines.
+
+Зачем: строки панели включают обходы всех врагов (alive_count,
+alive_by_type) и рендер дюжины строк. Делать это каждый кадр — значит
+мерить FPS игры вместе с ценой самой панели. При 4 Гц это 4 сборки в
+секунду вместо 60, кадр с выключенной и включённой панелью почти равен.
+"""
+import time
+from typing import Callable, List, Optional
+
+import pygame
+
+from src.core.config_loader import config_snapshot
+from src.ui.text import render_text
+
+# Как у debug(): шрифт 30, строка каждые 20 px
+FONT_SIZE = 30
+LINE_HEIGHT = 20
+
+
+class DebugOverlay:
+    """Строки отладки, снимаемые с частотой rate_hz, в одной Surface."""
+
+    def __init__(self, rate_hz: float = 4.0):
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        self.period = 1.0 / float(rate_hz)
+        self._surface: Optional[pygame.Surface] = None
+        self._sampled_at = 0.0
+        self._colors = config_snapshot().colors
+
+    def invalidate(self) -> None:
+        """Пересобрать панель в следующем draw (например, при включении F1)."""
+        self._surface = None
+
+    def draw(self, screen: pygame.Surface, sample: Callable[[], List[str]],
+             pos=(10, 10), now: float = None) -> None:
+        if now is None:
+            now = time.perf_counter()
+        if self._surface is None or now - self._sampled_at >= self.period:
+            self._surface = self._render(sample())
+            self._sampled_at = now
+        screen.blit(self._surface, pos)
+
+    def _render(self, lines: List[str]) -> pygame.Surface:
+        rendered = [render_text(str(line), FONT_SIZE, self._colors.white) for line in lines]
+        width = max((surf.get_width() for surf in rendered), default=1)
+        height = LINE_HEIGHT * max(len(rendered) - 1, 0) + max(
+            (surf.get_height() for surf in rendered), default=1)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i, surf in enumerate(rendered):
+            y = i * LINE_HEIGHT
+            # Чёрная подложка под строкой — как у debug()
+            surface.fill(self._colors.black, (0, y, surf.get_width(), surf.get_height()))
+            surface.blit(surf, (0, y))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
@@ -1,5 +1,6 @@
 import pygame
 from src.core.config_loader import get_color
+from src.ui.text import draw_lines, draw_text, get_font
 
 
 class GameOverScreen:
@@ -10,10 +11,10 @@ class GameOverScreen:
         self.screen_height = screen_height
         self.game_stats = game_stats
         
-        # Шрифты
-        self.title_font = pygame.font.Font(None, 72)
-        self.text_font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        # Шрифты (общие, src/ui/text.py)
+        self.title_font = get_font(72)
+        self.text_font = get_font(36)
+        self.small_font = get_font(24)
         
         # Состояние UI
         self.selected_option = 0
@@ -24,6 +25,7 @@ class GameOverScreen:
         self.text_color = get_color('WHITE')
         self.selected_color = get_color('YELLOW')
         self.stats_color = get_color('GRAY')
+        self.title_color = get_color('RED')
     
     def handle_input(self, event):
         """Обработка ввода на экране Game Over"""
@@ -54,19 +56,13 @@ class GameOverScreen:
         center_y = self.screen_height // 2
         
         # Заголовок "💀 GAME OVER"
-        title_text = self.title_font.render("💀 GAME OVER", True, get_color('RED'))
-        title_rect = title_text.get_rect(center=(center_x, center_y - 150))
-        screen.blit(title_text, title_rect)
+        draw_text(screen, "💀 GAME OVER", 72, self.title_color, center=(center_x, center_y - 150))
         
         # Сообщение о смерти
-        death_text = self.text_font.render("Вы погибли!", True, self.text_color)
-        death_rect = death_text.get_rect(center=(center_x, center_y - 100))
-        screen.blit(death_text, death_rect)
+        draw_text(screen, "Вы погибли!", 36, self.text_color, center=(center_x, center_y - 100))
         
         # Статистика игры (если доступна)
         if self.game_stats:
-            stats_y = center_y - 50
-            
             stats_lines = [
                 f"Время игры: {self.game_stats.get_play_time_formatted()}",
                 f"Убито врагов: {self.game_stats.enemies_killed}",
@@ -74,27 +70,20 @@ class GameOverScreen:
                 f"Нанесен урон: {self.game_stats.damage_dealt}",
                 f"Получен урон: {self.game_stats.damage_taken}"
             ]
-            
-            for i, line in enumerate(stats_lines):
-                stats_text = self.small_font.render(line, True, self.stats_color)
-                stats_rect = stats_text.get_rect(center=(center_x, stats_y + i * 25))
-                screen.blit(stats_text, stats_rect)
+            draw_lines(screen, stats_lines, 24, self.stats_color,
+                       center_x, center_y - 50, 25)
         
         # Опции меню
         options_y = center_y + 80
         for i, option in enumerate(self.options):
             color = self.selected_color if i == self.selected_option else self.text_color
-            option_text = self.text_font.render(option, True, color)
-            option_rect = option_text.get_rect(center=(center_x, options_y + i * 50))
-            screen.blit(option_text, option_rect)
+            draw_text(screen, option, 36, color, center=(center_x, options_y + i * 50))
             
             # Стрелка для выбранной опции
             if i == self.selected_option:
-                arrow_text = self.text_font.render("►", True, self.selected_color)
-                arrow_rect = arrow_text.get_rect(center=(center_x - 120, options_y + i * 50))
-                screen.blit(arrow_text, arrow_rect)
+                draw_text(screen, "►", 36, self.selected_color,
+                          center=(center_x - 120, options_y + i * 50))
         
         # Подсказка по управлению
-        help_text = self.small_font.render("WASD/Стрелки: Навигация | Enter/Пробел: Выбор", True, self.stats_color)
-        help_rect = help_text.get_rect(center=(center_x, self.screen_height - 30))
-        screen.blit(help_text, help_rect)
\ No newline at end of file
+        draw_text(screen, "WASD/Стрелки: Навигация | Enter/Пробел: Выбор", 24,
+                  self.stats_color, center=(center_x, self.screen_height - 30))
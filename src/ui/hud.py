@@ -4,22 +4,39 @@ HUD - класс отображения пользовательского ин
 Single Responsibility: рисовать UI поверх игрового мира (полоса HP, слоты оружий,
 монеты, уровень, полоска XP).
 Не знает про игровой цикл, ввод или мир — только про player и screen.
+
+Кадр HUD — несколько blit-ов:
+- статичная рамка (фон и рамка HP, фон XP, слоты с цифрами) собрана в
+  одну Surface и пересобирается только при смене набора оружий;
+- текст (HP, уровень, имя оружия, монеты) рендерится один раз на
+  значение — общий кэш строк текстового слоя (src/ui/text.py);
+- каждый кадр рисуются только заливки HP/XP и рамка активного слота.
 """
 import pygame
 
-from src.core.config_loader import get_color
+from src.core.config_loader import config_snapshot
+from src.ui.text import render_text
+
+# Геометрия HUD (экранные px)
+_BAR_X, _BAR_Y = 10, 10
+_BAR_WIDTH, _BAR_HEIGHT = 200, 20
+_BAR_BORDER = 2
+_XP_Y, _XP_HEIGHT = 33, 5
+_SLOT_SIZE, _SLOT_GAP = 36, 6
+_SLOTS_X, _SLOTS_Y = 10, 46
+
+# Размеры шрифтов
+_PCT_SIZE, _DIGIT_SIZE, _NAME_SIZE, _COINS_SIZE, _LEVEL_SIZE = 24, 20, 22, 26, 22
 
 
 class HUD:
     """Head-Up Display: полоса здоровья + слоты оружий + монеты + level/XP."""
 
     def __init__(self):
-        # Шрифты создаются один раз — pygame.font.Font дорогой по инициализации
-        self._font_pct = pygame.font.Font(None, 24)
-        self._font_digit = pygame.font.Font(None, 20)
-        self._font_name = pygame.font.Font(None, 22)
-        self._font_coins = pygame.font.Font(None, 26)
-        self._font_level = pygame.font.Font(None, 22)
+        # Статичная рамка и набор оружий, под который она собрана
+        self._frame: pygame.Surface = None
+        self._frame_key = None
+        self._colors = config_snapshot().colors
 
     # --- Публичный API ----------------------------------------------------
 
@@ -27,98 +44,104 @@ class HUD:
         """Отрисовать весь HUD."""
         if player is None:
             return
+        screen.blit(self._static_frame(player), (0, 0))
         self._draw_health_bar(screen, player)
         self._draw_xp_bar(screen, player)
         self._draw_level_badge(screen, player)
         self._draw_weapon_slots(screen, player)
         self._draw_coins(screen, player)
 
-    # --- Внутренние методы рендера ---------------------------------------
+    # --- Статичная рамка --------------------------------------------------
 
-    def _draw_health_bar(self, screen: pygame.Surface, player) -> None:
-        """Полоска здоровья игрока в верхнем-левом углу."""
-        bar_width, bar_height = 200, 20
-        bar_x, bar_y = 10, 10
-        border_width = 2
+    def _static_frame(self, player) -> pygame.Surface:
+        """Рамка HUD под текущий набор оружий (собирается при смене набора)."""
+        key = tuple((weapon.name, tuple(weapon.color)) for weapon in player.weapons)
+        if self._frame is None or key != self._frame_key:
+            self._frame = self._build_frame(key)
+            self._frame_key = key
+        return self._frame
 
-        pct = player.health / player.max_health if player.max_health > 0 else 0
-        health_w = int(bar_width * pct)
+    def _build_frame(self, weapons) -> pygame.Surface:
+        slots_right = _SLOTS_X + len(weapons) * (_SLOT_SIZE + _SLOT_GAP)
+        width = max(_BAR_X + _BAR_WIDTH + _BAR_BORDER, slots_right)
+        frame = pygame.Surface((width, _SLOTS_Y + _SLOT_SIZE), pygame.SRCALPHA)
 
-        # Фон
-        pygame.draw.rect(screen, get_color('DARK_GRAY'),
-                         (bar_x, bar_y, bar_width, bar_height))
-        # Заливка
-        if health_w > 0:
-            pygame.draw.rect(screen, get_color('GREEN'),
-                             (bar_x, bar_y, health_w, bar_height))
-        # Рамка
+        # Фон и рамка полоски здоровья
+        pygame.draw.rect(frame, self._colors.dark_gray,
+                         (_BAR_X, _BAR_Y, _BAR_WIDTH, _BAR_HEIGHT))
         pygame.draw.rect(
-            screen, get_color('WHITE'),
-            (bar_x - border_width, bar_y - border_width,
-             bar_width + border_width * 2, bar_height + border_width * 2),
-            border_width,
+            frame, self._colors.white,
+            (_BAR_X - _BAR_BORDER, _BAR_Y - _BAR_BORDER,
+             _BAR_WIDTH + _BAR_BORDER * 2, _BAR_HEIGHT + _BAR_BORDER * 2),
+            _BAR_BORDER,
         )
-        # Текст HP
-        hp_text = f"{player.health}/{player.max_health}"
-        text_surf = self._font_pct.render(hp_text, True, get_color('WHITE'))
+        # Фон полоски XP
+        pygame.draw.rect(frame, (30, 30, 60), (_BAR_X, _XP_Y, _BAR_WIDTH, _XP_HEIGHT))
+
+        # Слоты оружий в неактивном виде
+        for i, (_name, color) in enumerate(weapons):
+            slot_rect = self._slot_rect(i)
+            pygame.draw.rect(frame, self._colors.dark_gray, slot_rect)
+            pygame.draw.rect(frame, color, slot_rect.inflate(-8, -8))
+            pygame.draw.rect(frame, (60, 60, 60), slot_rect, 1)
+            frame.blit(self._slot_digit(i), (slot_rect.x + 3, slot_rect.y + 2))
+        return frame
+
+    @staticmethod
+    def _slot_rect(index: int) -> pygame.Rect:
+        slot_x = _SLOTS_X + index * (_SLOT_SIZE + _SLOT_GAP)
+        return pygame.Rect(slot_x, _SLOTS_Y, _SLOT_SIZE, _SLOT_SIZE)
+
+    def _slot_digit(self, index: int) -> pygame.Surface:
+        return render_text(str(index + 1), _DIGIT_SIZE, self._colors.white)
+
+    # --- Внутренние методы рендера ---------------------------------------
+
+    def _draw_health_bar(self, screen: pygame.Surface, player) -> None:
+        """Заливка здоровья и текст HP (фон и рамка — в статичной рамке)."""
+        pct = player.health / player.max_health if player.max_health > 0 else 0
+        health_w = int(_BAR_WIDTH * pct)
+        if health_w > 0:
+            screen.fill(self._colors.green, (_BAR_X, _BAR_Y, health_w, _BAR_HEIGHT))
+
+        text_surf = render_text(f"{player.health}/{player.max_health}", _PCT_SIZE,
+                                self._colors.white)
         screen.blit(
             text_surf,
-            (bar_x + bar_width + 10,
-             bar_y + (bar_height - text_surf.get_height()) // 2),
+            (_BAR_X + _BAR_WIDTH + 10,
+             _BAR_Y + (_BAR_HEIGHT - text_surf.get_height()) // 2),
         )
 
     def _draw_xp_bar(self, screen: pygame.Surface, player) -> None:
-        """Тонкая полоска XP под полоской здоровья."""
-        bar_x, bar_y = 10, 33
-        bar_width, bar_height = 200, 5
-
+        """Заливка тонкой полоски XP под полоской здоровья."""
         stats = player.stats
         xp_next = stats.xp_to_next_level
         pct = stats.xp / xp_next if xp_next > 0 else 0
-        fill_w = int(bar_width * min(pct, 1.0))
-
-        pygame.draw.rect(screen, (30, 30, 60), (bar_x, bar_y, bar_width, bar_height))
+        fill_w = int(_BAR_WIDTH * min(pct, 1.0))
         if fill_w > 0:
-            pygame.draw.rect(screen, (80, 180, 255), (bar_x, bar_y, fill_w, bar_height))
+            screen.fill((80, 180, 255), (_BAR_X, _XP_Y, fill_w, _XP_HEIGHT))
 
     def _draw_level_badge(self, screen: pygame.Surface, player) -> None:
-        """Уровень игрока слева от HP-бара."""
-        text = f"Lv.{player.level}"
-        surf = self._font_level.render(text, True, (200, 200, 255))
-        # Справа от HP текста (с запасом)
-        screen.blit(surf, (310, 12))
+        """Уровень игрока справа от HP-текста (с запасом)."""
+        screen.blit(render_text(f"Lv.{player.level}", _LEVEL_SIZE, (200, 200, 255)),
+                    (310, 12))
 
     def _draw_weapon_slots(self, screen: pygame.Surface, player) -> None:
-        """Слоты оружий с подсветкой активного — под полоской здоровья."""
-        slot_size, gap = 36, 6
-        start_x, start_y = 10, 46
-
-        for i, weapon in enumerate(player.weapons):
-            slot_x = start_x + i * (slot_size + gap)
-            slot_rect = pygame.Rect(slot_x, start_y, slot_size, slot_size)
-
-            pygame.draw.rect(screen, get_color('DARK_GRAY'), slot_rect)
-            inner = slot_rect.inflate(-8, -8)
-            pygame.draw.rect(screen, weapon.color, inner)
-
-            is_active = (i == player.current_weapon_index)
-            border_color = get_color('WHITE') if is_active else (60, 60, 60)
-            border_w = 3 if is_active else 1
-            pygame.draw.rect(screen, border_color, slot_rect, border_w)
-
-            digit_surf = self._font_digit.render(str(i + 1), True, get_color('WHITE'))
-            screen.blit(digit_surf, (slot_x + 3, start_y + 2))
+        """Подсветка активного слота и имя оружия (слоты — в статичной рамке)."""
+        index = player.current_weapon_index
+        slot_rect = self._slot_rect(index)
+        pygame.draw.rect(screen, self._colors.white, slot_rect, 3)
+        # Цифра поверх рамки, как у неактивных слотов
+        screen.blit(self._slot_digit(index), (slot_rect.x + 3, slot_rect.y + 2))
 
         # Имя активного оружия под слотами
-        active = player.current_weapon
-        name_surf = self._font_name.render(active.name, True, get_color('WHITE'))
-        screen.blit(name_surf, (start_x, start_y + slot_size + 4))
+        name_surf = render_text(player.current_weapon.name, _NAME_SIZE,
+                                self._colors.white)
+        screen.blit(name_surf, (_SLOTS_X, _SLOTS_Y + _SLOT_SIZE + 4))
 
     def _draw_coins(self, screen: pygame.Surface, player) -> None:
         """Счётчик монет в правом верхнем углу (ниже миникарты)."""
-        coins = player.coins
-        text = f"$ {coins}"
-        surf = self._font_coins.render(text, True, (255, 220, 50))
+        surf = render_text(f"$ {player.coins}", _COINS_SIZE, (255, 220, 50))
         x = screen.get_width() - 170
         y = 170  # Под миникартой
         screen.blit(surf, (x, y))
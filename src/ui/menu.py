@@ -1,17 +1,77 @@
+"""
+MainMenu — главное меню (и меню паузы по ESC).
+
+Пункты «Продолжить»/«Загрузить» зависят от наличия сейвов. Скан папок
+сейвов (listdir saves/, manual/, autosave/ + saves.db) не делается в
+кадре: меню держит закэшированный каталог (есть ли quicksave, есть ли
+сейвы) и перечитывает его, только когда
+- SaveSystem записал или удалил сейв (растёт catalog_revision), или
+- раз в CATALOG_POLL_SECONDS изменился mtime папок сейвов (сейвы,
+  появившиеся мимо SaveSystem).
+Сам кадр меню пререндерен в одну Surface и перерисовывается только при
+смене пунктов или выбора.
+"""
+import time
+
 import pygame
 import os
-from src.core.config_loader import get_config, get_color
+from src.core.config_loader import config_snapshot
+from src.systems.save_store import SqliteSaveStore, store_has_saves
+from src.systems.save_system import SaveSystem
+from src.ui.text import draw_lines, draw_text, get_font
+
+# Расширения файлов сейвов (JSON и бинарный .sav)
+SAVE_EXTENSIONS = SaveSystem.SAVE_EXTENSIONS
+# База сейвов при [save] backend = sqlite
+SAVE_STORE_PATH = os.path.join("saves", SqliteSaveStore.FILENAME)
+
+# Период опроса mtime папок сейвов (сек)
+CATALOG_POLL_SECONDS = 1.0
+# Что меняет mtime при появлении/удалении сейва
+_CATALOG_PATHS = (
+    "saves",
+    os.path.join("saves", "manual"),
+    os.path.join("saves", "autosave"),
+    SAVE_STORE_PATH,
+    SAVE_STORE_PATH + "-wal",
+)
+
+
+def _catalog_stamp() -> tuple:
+    """mtime папок сейвов и базы (None — нет такого пути)."""
+    stamp = []
+    for path in _CATALOG_PATHS:
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
 
 
 class MainMenu:
-    def __init__(self):
+    def __init__(self, save_system=None):
+        # SaveSystem, чей catalog_revision сбрасывает кэш каталога (None —
+        # только опрос mtime)
+        self.save_system = save_system
+        # Каталог сейвов: (есть quicksave, есть сейвы) + когда снят
+        self._catalog = None
+        self._catalog_revision = None
+        self._catalog_stamp = None
+        self._catalog_polled_at = 0.0
+        # Пререндеренный кадр и (пункты, выбор), под которые он собран
+        self._frame: pygame.Surface = None
+        self._frame_key = None
+        cfg = config_snapshot()
+        self._colors = cfg.colors
+        self._size = (cfg.display.width, cfg.display.height)
         # Базовые пункты меню
         self.base_menu_items = ["Новая игра"]
         self.selected_index = 0
         # Флаг: идёт ли активная игра (главное меню работает и как пауза по ESC)
         self.game_in_progress = False
-        self.font = pygame.font.Font(None, 48)
-        self.title_font = pygame.font.Font(None, 72)
+        # Общие шрифты текстового слоя (src/ui/text.py)
+        self.font = get_font(48)
+        self.title_font = get_font(72)
         
         # Обновляем список пунктов меню в зависимости от наличия сохранений
         self.update_menu_items()
@@ -21,24 +81,27 @@ class MainMenu:
         saves_dir = "saves"
         if not os.path.exists(saves_dir):
             return False
-        # Quicksave / любые .json в корне
-        if any(f.endswith('.json') for f in os.listdir(saves_dir)):
+        # Quicksave / любые сейвы (.json / .sav) в корне
+        if any(f.endswith(SAVE_EXTENSIONS) for f in os.listdir(saves_dir)):
             return True
         # Manual-слоты в saves/manual/
         manual_dir = os.path.join(saves_dir, "manual")
         if os.path.isdir(manual_dir):
-            if any(f.endswith('.json') for f in os.listdir(manual_dir)):
+            if any(f.endswith(SAVE_EXTENSIONS) for f in os.listdir(manual_dir)):
                 return True
         # Автосейвы в saves/autosave/ (v0.3.3)
         autosave_dir = os.path.join(saves_dir, "autosave")
         if os.path.isdir(autosave_dir):
-            if any(f.endswith('.json') for f in os.listdir(autosave_dir)):
+            if any(f.endswith(SAVE_EXTENSIONS) for f in os.listdir(autosave_dir)):
                 return True
-        return False
+        # Записи в saves/saves.db (backend = sqlite)
+        return store_has_saves(SAVE_STORE_PATH)
     
     def has_quicksave(self):
-        """Проверяет наличие quicksave файла"""
-        return os.path.exists("saves/quicksave.json")
+        """Проверяет наличие quicksave (файл JSON/.sav или запись в saves.db)"""
+        if any(os.path.exists(f"saves/quicksave{ext}") for ext in SAVE_EXTENSIONS):
+            return True
+        return store_has_saves(SAVE_STORE_PATH, "quicksave")
     
     def set_game_in_progress(self, value: bool) -> None:
         """Сообщает меню, что в данный момент запущена игра (пауза по ESC).
@@ -48,16 +111,38 @@ class MainMenu:
         self.game_in_progress = bool(value)
         self.update_menu_items()
 
+    def invalidate_catalog(self) -> None:
+        """Перечитать каталог сейвов при следующем update_menu_items()."""
+        self._catalog = None
+
+    def _saves_catalog(self):
+        """(есть quicksave, есть сейвы) — из кэша, пока каталог не менялся."""
+        revision = getattr(self.save_system, "catalog_revision", None)
+        if self._catalog is not None and revision == self._catalog_revision:
+            now = time.monotonic()
+            if now - self._catalog_polled_at < CATALOG_POLL_SECONDS:
+                return self._catalog
+            self._catalog_polled_at = now
+            if _catalog_stamp() == self._catalog_stamp:
+                return self._catalog
+        # Метка снимается до скана: запись во время скана даст новую метку
+        self._catalog_revision = revision
+        self._catalog_stamp = _catalog_stamp()
+        self._catalog_polled_at = time.monotonic()
+        self._catalog = (self.has_quicksave(), self.has_saves())
+        return self._catalog
+
     def update_menu_items(self):
         """Обновляет список пунктов меню в зависимости от наличия сохранений"""
+        has_quicksave, has_saves = self._saves_catalog()
         self.menu_items = ["Новая игра"]
         
         # Добавляем "Продолжить игру" только если есть quicksave
-        if self.has_quicksave():
+        if has_quicksave:
             self.menu_items.append("Продолжить игру")
         
         # Добавляем "Загрузить игру" если есть любые сохранения
-        if self.has_saves():
+        if has_saves:
             self.menu_items.append("Загрузить игру")
 
         # "Сохранить игру" — показываем всегда; при отсутствии активной игры
@@ -103,22 +188,30 @@ class MainMenu:
         return None
     
     def draw(self, screen):
-        """Отрисовка меню"""
-        # Обновляем список пунктов меню при каждой отрисовке
+        """Отрисовка меню: пререндеренный кадр, пересобираемый при смене
+        пунктов или выбора."""
+        # Пункты — из кэша каталога (без обращения к диску в кадре)
         self.update_menu_items()
+        key = (tuple(self.menu_items), self.selected_index)
+        if self._frame is None or key != self._frame_key:
+            self._frame = pygame.Surface(self._size)
+            if pygame.display.get_surface() is not None:
+                self._frame = self._frame.convert()
+            self._frame_key = key
+            self._render_frame(self._frame)
+        screen.blit(self._frame, (0, 0))
+
+    def _render_frame(self, screen):
+        screen.fill(self._colors.black)
         
-        screen.fill(get_color('BLACK'))
-        
+        center_x = self._size[0] // 2
+
         # Заголовок с улучшенной стилизацией
-        title_text = self.title_font.render("ZELDA-LIKE GAME", True, get_color('WHITE'))
-        title_rect = title_text.get_rect(center=(get_config('WIDTH') // 2, 120))
-        screen.blit(title_text, title_rect)
+        draw_text(screen, "ZELDA-LIKE GAME", 72, self._colors.white, center=(center_x, 120))
         
         # Подзаголовок
-        subtitle_font = pygame.font.Font(None, 32)
-        subtitle_text = subtitle_font.render("🎮 Приключение начинается здесь", True, get_color('GRAY'))
-        subtitle_rect = subtitle_text.get_rect(center=(get_config('WIDTH') // 2, 170))
-        screen.blit(subtitle_text, subtitle_rect)
+        draw_text(screen, "🎮 Приключение начинается здесь", 32, self._colors.gray,
+                  center=(center_x, 170))
         
         # Пункты меню с улучшенной стилизацией
         menu_start_y = 250
@@ -127,35 +220,24 @@ class MainMenu:
             
             # Цвет и эффекты для выбранного пункта
             if i == self.selected_index:
-                color = get_color('YELLOW')
+                color = self._colors.yellow
                 # Рамка вокруг выбранного пункта
-                menu_rect = pygame.Rect(get_config('WIDTH') // 2 - 150, y_pos - 25, 300, 50)
-                pygame.draw.rect(screen, get_color('DARK_GRAY'), menu_rect, 2)
+                menu_rect = pygame.Rect(center_x - 150, y_pos - 25, 300, 50)
+                pygame.draw.rect(screen, self._colors.dark_gray, menu_rect, 2)
                 # Стрелочки для выбранного пункта
-                arrow_font = pygame.font.Font(None, 48)
-                left_arrow = arrow_font.render("►", True, get_color('YELLOW'))
-                right_arrow = arrow_font.render("◄", True, get_color('YELLOW'))
-                screen.blit(left_arrow, (get_config('WIDTH') // 2 - 200, y_pos - 15))
-                screen.blit(right_arrow, (get_config('WIDTH') // 2 + 170, y_pos - 15))
+                draw_text(screen, "►", 48, color, topleft=(center_x - 200, y_pos - 15))
+                draw_text(screen, "◄", 48, color, topleft=(center_x + 170, y_pos - 15))
             else:
-                color = get_color('WHITE')
+                color = self._colors.white
             
             # Отрисовка текста пункта меню
-            text = self.font.render(item, True, color)
-            text_rect = text.get_rect(center=(get_config('WIDTH') // 2, y_pos))
-            screen.blit(text, text_rect)
+            draw_text(screen, item, 48, color, center=(center_x, y_pos))
         
         # Инструкции внизу экрана
-        instruction_font = pygame.font.Font(None, 24)
         instructions = [
             "↑↓ - Навигация по меню",
             "Enter - Выбрать",
             "ESC - Выход (в игре - возврат в меню)"
         ]
-        
-        instruction_y = get_config('HEIGHT') - 80
-        for instruction in instructions:
-            instruction_text = instruction_font.render(instruction, True, get_color('GRAY'))
-            instruction_rect = instruction_text.get_rect(center=(get_config('WIDTH') // 2, instruction_y))
-            screen.blit(instruction_text, instruction_rect)
-            instruction_y += 25
\ No newline at end of file
+        draw_lines(screen, instructions, 24, self._colors.gray,
+                   center_x, self._size[1] - 80, 25)
@@ -0,0 +1,101 @@
+"""
+ProfilerOverlay — панель профайлера кадра (F3): таблица стадий и график.
+
+Single Responsibility: показать FrameProfiler — min / avg / p99 каждой
+стадии за окно кадров и график времени кадра с линией бюджета
+(1000 / FPS мс). Как DebugOverlay, панель пересобирается с частотой
+rate_hz, в остальные кадры — один blit, чтобы сама панель не попадала
+в то, что она меряет.
+"""
+import time
+from typing import Optional
+
+import pygame
+
+from src.core.config_loader import config_snapshot
+from src.ui.text import render_text
+from src.utils.frame_profiler import PROFILE_STAGES
+
+FONT_SIZE = 18
+LINE_HEIGHT = 16
+PADDING = 8
+# Колонки таблицы: подпись, min, avg, p99
+COLUMNS = (0, 110, 170, 230)
+GRAPH_HEIGHT = 60
+
+_LABELS = dict(PROFILE_STAGES)
+_OK_COLOR = (80, 200, 80)
+_SLOW_COLOR = (230, 200, 60)
+_HITCH_COLOR = (230, 70, 70)
+
+
+class ProfilerOverlay:
+    """Таблица стадий FrameProfiler + график времени кадра."""
+
+    def __init__(self, rate_hz: float = 4.0, budget_ms: float = 1000.0 / 60):
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        self.period = 1.0 / float(rate_hz)
+        self.budget_ms = float(budget_ms)
+        self._surface: Optional[pygame.Surface] = None
+        self._sampled_at = 0.0
+        self._colors = config_snapshot().colors
+
+    def invalidate(self) -> None:
+        self._surface = None
+
+    def draw(self, screen: pygame.Surface, profiler, now: float = None) -> None:
+        """Панель в левом нижнем углу (над строкой подсказок)."""
+        if now is None:
+            now = time.perf_counter()
+        if self._surface is None or now - self._sampled_at >= self.period:
+            self._surface = self._render(profiler)
+            self._sampled_at = now
+        screen.blit(self._surface,
+                    (10, screen.get_height() - self._surface.get_height() - 40))
+
+    def _render(self, profiler) -> pygame.Surface:
+        frames = profiler.frame_times()
+        rows = [("stage", "min", "avg", "p99")]
+        for key, low, avg, p99 in profiler.stats():
+            rows.append((_LABELS.get(key, key), f"{low:.2f}", f"{avg:.2f}", f"{p99:.2f}"))
+        frame = profiler.frame_stats()
+        if frame is not None:
+            rows.append(("Frame",) + tuple(f"{ms:.1f}" for ms in frame))
+        graph_w = max(profiler.capacity, COLUMNS[-1] + 50)
+        width = graph_w + PADDING * 2
+        height = PADDING * 3 + len(rows) * LINE_HEIGHT + GRAPH_HEIGHT
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 180))
+
+        white, gray = self._colors.white, self._colors.gray
+        y = PADDING
+        for i, row in enumerate(rows):
+            color = gray if i == 0 else white
+            surface.blits([(render_text(cell, FONT_SIZE, color), (PADDING + x, y))
+                           for cell, x in zip(row, COLUMNS)], doreturn=False)
+            y += LINE_HEIGHT
+        self._draw_graph(surface, frames, pygame.Rect(PADDING, y + PADDING,
+                                                      graph_w, GRAPH_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def _draw_graph(self, surface, frames, rect: pygame.Rect) -> None:
+        """Столбик на кадр; шкала — до двух бюджетов, линия — один бюджет."""
+        pygame.draw.rect(surface, (20, 20, 20), rect)
+        scale = rect.height / (self.budget_ms * 2)
+        x = rect.right - len(frames)
+        for ms in frames:
+            if ms <= self.budget_ms:
+                color = _OK_COLOR
+            elif ms <= self.budget_ms * 2:
+                color = _SLOW_COLOR
+            else:
+                color = _HITCH_COLOR
+            h = min(rect.height, max(1, int(ms * scale)))
+            surface.fill(color, (x, rect.bottom - h, 1, h))
+            x += 1
+        budget_y = rect.bottom - int(self.budget_ms * scale)
+        pygame.draw.line(surface, self._colors.white, (rect.left, budget_y),
+                         (rect.right - 1, budget_y))
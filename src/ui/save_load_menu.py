@@ -20,6 +20,23 @@ SaveLoadMenu — единое меню слотов сохранений (v0.3.2
 Класс **stateful**: вызывайте :meth:`refresh` после изменений на диске
 (вход в меню, после сохранения/удаления).
 
+refresh() только перечисляет файлы (SaveSystem.list_saves — listdir/stat),
+поэтому меню открывается сразу. Сводки строк (дата, уровень, HP) читает
+фоновый поток; до их прихода строка показывает «загрузка…». Следом тот же
+поток сверяет контрольные суммы (SaveSystem.verify_all); сейв, уже
+признанный битым и с тех пор не менявшийся, помечается «[повреждён]»
+прямо в refresh(). Между ними тот же поток читает превью миникарты
+(SaveSystem.entry_thumbnail) — строка показывает картинку, как только
+она готова; превью кэшируются по mtime сейва и при следующем refresh()
+не перечитываются. Результаты забираются на главном потоке в
+draw()/handle_input() (poll_metadata).
+
+Открытие меню не ждёт фоновую запись: автосейв, который ещё пишется
+(SaveSystem.pending_autosaves), виден в load-режиме строкой «запись…» —
+её нельзя ни загрузить, ни удалить. Когда запись заканчивается,
+SaveSystem растит catalog_revision, и меню перечитывает список в
+draw()/handle_input(), оставляя курсор на той же записи.
+
 API ↔ Game:
     handle_input(event) → action dict | None
         {"type": "load_quicksave"}                   — загрузить quicksave
@@ -30,15 +47,30 @@ API ↔ Game:
         {"type": "delete_autosave", "slot_id": N}    — подтверждили удаление автосейва (v0.3.3)
         {"type": "back"}                             — Esc, выход из меню
 """
+import queue
 import pygame
 from datetime import datetime
 
-from src.core.config_loader import get_config, get_color
+from src.core.config_loader import config_snapshot
+from src.systems.save_writer import SaveWriter
+from src.ui.text import draw_lines, draw_text, get_font
 
 
 # Особое значение selected_index для строки quicksave (в load-режиме)
 QUICKSAVE_INDEX = -1
 
+# meta строки, чья сводка ещё читается в фоне (файл существует)
+PENDING_META = {"pending": True, "valid": True}
+
+# meta строки автосейва, который ещё пишется в фоне (файла пока нет)
+WRITING_META = {"writing": True, "valid": True}
+
+# Сторона превью миникарты в строке списка (px)
+THUMBNAIL_SIZE = 46
+
+# Размеры шрифтов меню
+_TITLE_SIZE, _ITEM_SIZE, _META_SIZE, _HELP_SIZE, _MODAL_SIZE = 56, 32, 22, 22, 36
+
 
 def _format_timestamp(iso_ts: str) -> str:
     """ISO-таймстамп → человекочитаемая дата-время."""
@@ -74,11 +106,15 @@ class SaveLoadMenu:
         self.save_system = save_system
         self.mode = mode
 
-        self.font_title = pygame.font.Font(None, 56)
-        self.font_item = pygame.font.Font(None, 32)
-        self.font_meta = pygame.font.Font(None, 22)
-        self.font_help = pygame.font.Font(None, 22)
-        self.font_modal = pygame.font.Font(None, 36)
+        # Общие шрифты текстового слоя (src/ui/text.py)
+        self.font_title = get_font(_TITLE_SIZE)
+        self.font_item = get_font(_ITEM_SIZE)
+        self.font_meta = get_font(_META_SIZE)
+        self.font_help = get_font(_HELP_SIZE)
+        self.font_modal = get_font(_MODAL_SIZE)
+        cfg = config_snapshot()
+        self._colors = cfg.colors
+        self._size = (cfg.display.width, cfg.display.height)
 
         # Состояние списка
         self.selected_index = 0
@@ -89,6 +125,17 @@ class SaveLoadMenu:
         # нужно для маршрутизации delete-action.
         self.modal_kind = None
 
+        # Сводки строк читаются в фоне; поколение отсекает ответы,
+        # пришедшие после следующего refresh()
+        self._meta_loader = SaveWriter(name="save-meta-loader")
+        self._meta_results: "queue.Queue" = queue.Queue()
+        self._generation = 0
+        # Превью: (kind, slot_id) -> (mtime сейва, Surface)
+        self._thumbnails: dict = {}
+        self._thumbnail_results: "queue.Queue" = queue.Queue()
+        # catalog_revision SaveSystem на момент последнего refresh()
+        self._catalog_revision = None
+
         # entries — список словарей, представляющих строки списка.
         # Для load: optional quicksave + только заполненные manual-слоты.
         # Для save: все 10 manual-слотов (включая пустые).
@@ -108,55 +155,186 @@ class SaveLoadMenu:
         self.refresh()
 
     def refresh(self) -> None:
-        """Перечитать состояние слотов с диска."""
+        """Перечитать список сейвов с диска (без чтения их содержимого)."""
         entries: list[dict] = []
+        # Метка снимается до скана: запись во время скана даст новую метку
+        self._catalog_revision = getattr(self.save_system, "catalog_revision", None)
+        writing = getattr(self.save_system, "pending_autosaves", 0)
+        catalog = self.save_system.list_saves()
         if self.mode == self.MODE_LOAD:
-            qs_meta = self.save_system.get_quicksave_metadata()
-            if qs_meta is not None:
+            # quicksave, затем автосейвы (v0.3.3), затем manual-слоты
+            for item in catalog:
                 entries.append({
-                    "kind": "quicksave",
-                    "slot_id": None,
-                    "label": "🕒 Быстрое сохранение (F5)",
-                    "meta": qs_meta,
-                })
-            # Автосейвы (v0.3.3) — после quicksave, до manual-слотов.
-            list_autosaves = getattr(
-                self.save_system, "list_autosaves", None
-            )
-            if callable(list_autosaves):
-                for meta in list_autosaves():
-                    reason = meta.get("reason") or ""
-                    label = f"🕐 Автосохранение #{meta['slot_id']:02d}"
-                    if reason:
-                        label = f"{label}  ({reason})"
-                    entries.append({
-                        "kind": "autosave",
-                        "slot_id": meta["slot_id"],
-                        "label": label,
-                        "meta": meta,
-                    })
-            for meta in self.save_system.list_manual_saves():
-                entries.append({
-                    "kind": "manual",
-                    "slot_id": meta["slot_id"],
-                    "label": f"Слот {meta['slot_id']:02d}",
-                    "meta": meta,
+                    "kind": item["kind"],
+                    "slot_id": item["slot_id"],
+                    "label": self._label(item),
+                    "meta": self._initial_meta(item),
+                    "source": item,
                 })
+            # Пишущиеся автосейвы — над записанными (после quicksave)
+            first = 1 if entries and entries[0]["kind"] == "quicksave" else 0
+            entries[first:first] = [{
+                "kind": "autosave",
+                "slot_id": None,
+                "label": "🕐 Автосохранение",
+                "meta": dict(WRITING_META),
+                "source": None,
+            } for _ in range(writing)]
         else:  # MODE_SAVE
-            existing = {m["slot_id"]: m
-                        for m in self.save_system.list_manual_saves()}
+            existing = {item["slot_id"]: item for item in catalog
+                        if item["kind"] == "manual"}
             for slot_id in range(1, self.save_system.MANUAL_SLOT_LIMIT + 1):
-                meta = existing.get(slot_id)
+                item = existing.get(slot_id)
                 entries.append({
                     "kind": "manual",
                     "slot_id": slot_id,
                     "label": f"Слот {slot_id:02d}",
-                    "meta": meta,  # None если пустой
+                    # None если пустой
+                    "meta": self._initial_meta(item) if item is not None else None,
+                    "source": item,
                 })
 
         self.entries = entries
         if self.selected_index >= len(self.entries):
             self.selected_index = max(0, len(self.entries) - 1)
+        self._request_metadata()
+
+    def _poll_catalog(self) -> None:
+        """Каталог сейвов изменился (дописался автосейв) — перечитать
+        список, оставив курсор на той же записи."""
+        if getattr(self.save_system, "catalog_revision", None) == self._catalog_revision:
+            return
+        selected = self._entry_key(self.selected_index)
+        self.refresh()
+        keys = [self._entry_key(i) for i in range(len(self.entries))]
+        if selected is not None and selected in keys:
+            self.selected_index = keys.index(selected)
+
+    def _entry_key(self, index: int):
+        if not 0 <= index < len(self.entries):
+            return None
+        entry = self.entries[index]
+        return entry["kind"], entry["slot_id"]
+
+    def _initial_meta(self, item: dict) -> dict:
+        """«загрузка…», а для уже известного битого сейва — сразу он."""
+        if self.save_system.cached_verification(item) is False:
+            return {"valid": False}
+        return dict(PENDING_META)
+
+    @staticmethod
+    def _label(item: dict, meta: dict = None) -> str:
+        if item["kind"] == "quicksave":
+            return "🕒 Быстрое сохранение (F5)"
+        if item["kind"] == "manual":
+            return f"Слот {item['slot_id']:02d}"
+        if item.get("journal"):
+            label = "🕐 Автосохранение (журнал)"
+        else:
+            label = f"🕐 Автосохранение #{item['slot_id']:02d}"
+        reason = (meta or {}).get("reason") or ""
+        if reason:
+            label = f"{label}  ({reason})"
+        return label
+
+    def _request_metadata(self) -> None:
+        """Поставить чтение сводок в фоновый поток (сверху вниз)."""
+        self._generation += 1
+        generation = self._generation
+        read = self.save_system.read_entry_metadata
+        items = []
+        for index, entry in enumerate(self.entries):
+            item = entry["source"]
+            if item is None:
+                continue
+            items.append(item)
+            self._meta_loader.submit(
+                lambda item=item: read(item),
+                lambda meta, error, index=index: self._meta_results.put(
+                    (generation, index, meta, error)
+                ),
+            )
+        thumbnail = self.save_system.entry_thumbnail
+        for item in items:
+            if self._thumbnail(item) is not None:
+                continue
+            self._meta_loader.submit(
+                lambda item=item: thumbnail(item, THUMBNAIL_SIZE),
+                lambda surface, error, item=item: self._thumbnail_results.put(
+                    (item, surface)
+                ),
+            )
+        if items:
+            # Контрольные суммы — после сводок, параллельно на пуле SaveSystem
+            self._meta_loader.submit(
+                lambda: self.save_system.verify_all(items),
+                lambda results, error: self._meta_results.put(
+                    (generation, None, results, error)
+                ),
+            )
+
+    def poll_metadata(self) -> int:
+        """Подставить пришедшие сводки в строки. Сколько строк обновлено."""
+        updated = self._poll_thumbnails()
+        while True:
+            try:
+                generation, index, meta, error = self._meta_results.get_nowait()
+            except queue.Empty:
+                return updated
+            if generation != self._generation:
+                continue
+            if index is None:
+                updated += self._apply_verification(meta or {})
+                continue
+            if index >= len(self.entries):
+                continue
+            entry = self.entries[index]
+            if error is not None or meta is None:
+                meta = {"valid": False}
+            entry["meta"] = meta
+            entry["label"] = self._label(entry["source"], meta)
+            updated += 1
+
+    def _poll_thumbnails(self) -> int:
+        """Забрать готовые превью в кэш. Сколько пришло."""
+        received = 0
+        while True:
+            try:
+                item, surface = self._thumbnail_results.get_nowait()
+            except queue.Empty:
+                return received
+            if surface is None:
+                continue
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            self._thumbnails[(item["kind"], item["slot_id"])] = (item["mtime"], surface)
+            received += 1
+
+    def _thumbnail(self, item: dict):
+        """Превью записи из кэша, если сейв с тех пор не менялся."""
+        cached = self._thumbnails.get((item["kind"], item["slot_id"]))
+        if cached is not None and cached[0] == item["mtime"]:
+            return cached[1]
+        return None
+
+    def _apply_verification(self, results: dict) -> int:
+        """Пометить строки, не прошедшие проверку контрольной суммы."""
+        updated = 0
+        for entry in self.entries:
+            item = entry["source"]
+            if item is None or results.get((item["kind"], item["slot_id"])) is not False:
+                continue
+            meta = dict(entry["meta"] or {})
+            meta.pop("pending", None)
+            meta["valid"] = False
+            entry["meta"] = meta
+            updated += 1
+        return updated
+
+    def wait_for_metadata(self) -> None:
+        """Дождаться всех сводок (тесты, скриншоты)."""
+        self._meta_loader.wait()
+        self.poll_metadata()
 
     # --- Ввод --------------------------------------------------------------
 
@@ -164,6 +342,8 @@ class SaveLoadMenu:
         """Обработать KEYDOWN, вернуть action dict или None."""
         if event.type != pygame.KEYDOWN:
             return None
+        self._poll_catalog()
+        self.poll_metadata()
 
         # Модалка перехватывает ввод
         if self.modal is not None:
@@ -193,6 +373,8 @@ class SaveLoadMenu:
 
     def _handle_enter(self, entry):
         if self.mode == self.MODE_LOAD:
+            if entry["source"] is None:
+                return None  # автосейв ещё пишется
             if entry["kind"] == "quicksave":
                 return {"type": "load_quicksave"}
             if entry["kind"] == "autosave":
@@ -212,8 +394,8 @@ class SaveLoadMenu:
         # Quicksave удалять нельзя (см. BACKLOG.md v0.3.2 п.8)
         if entry["kind"] not in ("manual", "autosave"):
             return None
-        if entry["meta"] is None:
-            # пустой слот — нечего удалять
+        if entry["source"] is None:
+            # пустой слот или автосейв, который ещё пишется, — нечего удалять
             return None
         self.modal = "delete"
         self.modal_slot_id = entry["slot_id"]
@@ -243,22 +425,20 @@ class SaveLoadMenu:
     # --- Отрисовка ---------------------------------------------------------
 
     def draw(self, screen):
-        screen.fill(get_color('BLACK'))
-        width = get_config('WIDTH')
-        height = get_config('HEIGHT')
+        self._poll_catalog()
+        self.poll_metadata()
+        screen.fill(self._colors.black)
+        width, height = self._size
 
         # Заголовок
         title = ("ЗАГРУЗИТЬ ИГРУ" if self.mode == self.MODE_LOAD
                  else "СОХРАНИТЬ ИГРУ")
-        title_surf = self.font_title.render(title, True, get_color('WHITE'))
-        screen.blit(title_surf, title_surf.get_rect(center=(width // 2, 60)))
+        draw_text(screen, title, _TITLE_SIZE, self._colors.white, center=(width // 2, 60))
 
         # Список
         if not self.entries:
-            empty = self.font_item.render(
-                "Сохранений нет", True, get_color('GRAY')
-            )
-            screen.blit(empty, empty.get_rect(center=(width // 2, height // 2)))
+            draw_text(screen, "Сохранений нет", _ITEM_SIZE, self._colors.gray,
+                      center=(width // 2, height // 2))
         else:
             self._draw_entries(screen, width, height)
 
@@ -300,23 +480,34 @@ class SaveLoadMenu:
             y = list_top + visible_i * row_h
 
             selected = i == self.selected_index
-            color = (get_color('YELLOW') if selected
-                     else get_color('WHITE'))
+            color = (self._colors.yellow if selected
+                     else self._colors.white)
             if selected:
                 rect = pygame.Rect(width // 2 - 320, y - 5, 640, row_h - 10)
-                pygame.draw.rect(screen, get_color('DARK_GRAY'), rect, 2)
+                pygame.draw.rect(screen, self._colors.dark_gray, rect, 2)
 
-            label_surf = self.font_item.render(entry["label"], True, color)
-            screen.blit(label_surf, (width // 2 - 300, y))
+            draw_text(screen, entry["label"], _ITEM_SIZE, color,
+                      topleft=(width // 2 - 300, y))
+
+            # Превью миникарты — справа в строке, когда загрузилось
+            if entry["source"] is not None:
+                thumbnail = self._thumbnail(entry["source"])
+                if thumbnail is not None:
+                    screen.blit(thumbnail, (width // 2 + 310 - THUMBNAIL_SIZE, y - 3))
 
             # Метаданные / "пустой"
             meta = entry["meta"]
             if meta is None:
                 meta_text = "-- Пустой слот --"
-                meta_color = get_color('GRAY')
+                meta_color = self._colors.gray
+            elif meta.get("writing"):
+                meta_text = "запись…"
+                meta_color = self._colors.dark_gray
+            elif meta.get("pending"):
+                meta_text = "загрузка…"
+                meta_color = self._colors.dark_gray
             elif not meta.get("valid", True):
                 meta_text = "[повреждён]"
-                meta_color = get_color('RED') if 'RED' in dir() else (200, 80, 80)
                 meta_color = (200, 80, 80)
             else:
                 meta_text = (
@@ -325,9 +516,9 @@ class SaveLoadMenu:
                     f"|  HP {meta.get('hp', 0)}/{meta.get('max_hp', 0)}  "
                     f"|  ⏱ {_format_playtime(meta.get('play_time', 0.0))}"
                 )
-                meta_color = get_color('GRAY')
-            meta_surf = self.font_meta.render(meta_text, True, meta_color)
-            screen.blit(meta_surf, (width // 2 - 300, y + 28))
+                meta_color = self._colors.gray
+            draw_text(screen, meta_text, _META_SIZE, meta_color,
+                      topleft=(width // 2 - 300, y + 28))
 
     def _draw_help(self, screen, width, height):
         if self.mode == self.MODE_LOAD:
@@ -338,11 +529,8 @@ class SaveLoadMenu:
             lines = [
                 "↑↓ — Навигация    Enter — Сохранить    Del — Удалить    Esc — Назад",
             ]
-        y = height - 40
-        for line in lines:
-            surf = self.font_help.render(line, True, get_color('GRAY'))
-            screen.blit(surf, surf.get_rect(center=(width // 2, y)))
-            y += 22
+        draw_lines(screen, lines, _HELP_SIZE, self._colors.gray,
+                   width // 2, height - 40, 22)
 
     def _draw_modal(self, screen, width, height, title, detail, hint):
         # Затемняем фон
@@ -353,20 +541,15 @@ class SaveLoadMenu:
         box_w, box_h = 600, 200
         box = pygame.Rect((width - box_w) // 2, (height - box_h) // 2,
                           box_w, box_h)
-        pygame.draw.rect(screen, get_color('DARK_GRAY'), box)
-        pygame.draw.rect(screen, get_color('WHITE'), box, 2)
-
-        title_surf = self.font_modal.render(title, True, get_color('WHITE'))
-        screen.blit(title_surf,
-                    title_surf.get_rect(center=(width // 2, box.y + 50)))
-
-        detail_surf = self.font_meta.render(detail, True, get_color('GRAY'))
-        screen.blit(detail_surf,
-                    detail_surf.get_rect(center=(width // 2, box.y + 100)))
-
-        hint_surf = self.font_help.render(hint, True, get_color('YELLOW'))
-        screen.blit(hint_surf,
-                    hint_surf.get_rect(center=(width // 2, box.y + 150)))
+        pygame.draw.rect(screen, self._colors.dark_gray, box)
+        pygame.draw.rect(screen, self._colors.white, box, 2)
+
+        draw_text(screen, title, _MODAL_SIZE, self._colors.white,
+                  center=(width // 2, box.y + 50))
+        draw_text(screen, detail, _META_SIZE, self._colors.gray,
+                  center=(width // 2, box.y + 100))
+        draw_text(screen, hint, _HELP_SIZE, self._colors.yellow,
+                  center=(width // 2, box.y + 150))
 
     def _slot_detail(self, slot_id, kind=None) -> str:
         if slot_id is None:
@@ -0,0 +1,63 @@
+"""
+StressPanel - HUD-панель stress-режима: время кадра по подсистемам.
+
+Показывает сглаженные замеры StageTimer (AI, коллизии атаки, контактный
+урон, дроп лута, пикапы, рендер) и счётчики популяции. Рисуется только
+в stress-режиме — в обычной игре не создаётся.
+"""
+import pygame
+
+from src.core.config_loader import config_snapshot
+from src.ui.text import render_text
+
+
+# (ключ стадии в StageTimer, подпись на панели)
+STRESS_STAGES = (
+    ('ai', 'AI'),
+    ('collision', 'Collision'),
+    ('contact', 'Contact dmg'),
+    ('loot', 'Loot drops'),
+    ('pickups', 'Pickups'),
+    ('render', 'Render'),
+)
+
+
+class StressPanel:
+    """Полупрозрачная панель с таймингами стадий в правой части экрана."""
+
+    WIDTH = 220
+    LINE_H = 18
+    PADDING = 8
+    FONT_SIZE = 20
+
+    def __init__(self):
+        rows = len(STRESS_STAGES) + 4
+        self._bg = pygame.Surface(
+            (self.WIDTH, rows * self.LINE_H + self.PADDING * 2), pygame.SRCALPHA
+        )
+        self._bg.fill((0, 0, 0, 170))
+        self._colors = config_snapshot().colors
+
+    def draw(self, screen: pygame.Surface, stage_timer, stress_mode,
+             pickup_count: int, fps: float) -> None:
+        x = screen.get_width() - self.WIDTH - 10
+        y = 200  # под миникартой и счётчиком монет
+        screen.blit(self._bg, (x, y))
+
+        lines = [
+            (f"STRESS  target={stress_mode.population}", self._colors.yellow),
+            (f"Enemies: {stress_mode.alive}  (+{stress_mode.last_spawned})",
+             self._colors.white),
+            (f"Pickups: {pickup_count}   FPS: {int(fps)}", self._colors.white),
+        ]
+        total = 0.0
+        for key, label in STRESS_STAGES:
+            ms = stage_timer.get(key)
+            total += ms
+            lines.append((f"{label:<12}{ms:7.2f} ms", self._colors.white))
+        lines.append((f"{'Total':<12}{total:7.2f} ms", self._colors.yellow))
+
+        ty = y + self.PADDING
+        screen.blits([(render_text(text, self.FONT_SIZE, color),
+                       (x + self.PADDING, ty + i * self.LINE_H))
+                      for i, (text, color) in enumerate(lines)], doreturn=False)
@@ -0,0 +1,96 @@
+"""
+Общий текстовый слой UI: кэш шрифтов и кэш отрендеренных строк.
+
+Single Responsibility: превратить (строка, размер, цвет) в готовую
+Surface и нарисовать её. Что и где писать — решают экраны (MainMenu,
+GameOverScreen, SaveLoadMenu, HUD, StressPanel, debug).
+
+Устройство:
+- get_font() — один pygame.font.Font на (имя, размер) на весь процесс,
+  экраны больше не создают шрифты в цикле отрисовки;
+- render_text() — строка рендерится FreeType-ом один раз и живёт в
+  LRU-кэше (в формате дисплея), поэтому неизменный текст в кадре стоит
+  ровно один blit;
+- draw_lines() — пачка строк одним Surface.blits.
+
+Почему строки, а не атлас глифов: сборка строки из глифов — это blit на
+символ, а blit в pygame стоит ~0.7 мкс даже для 10x20 px. Новая строка
+из атласа выходила в ~4 раза дороже одного font.render всей строки (и
+без кернинга), а закэшированная строка дешевле обоих — кэшируется
+готовая строка целиком.
+"""
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+
+# Предел кэша строк: счётчики (монеты, FPS) дают новые строки
+# каждый кадр, а меню — десятки постоянных
+_STRING_CACHE_LIMIT = 512
+
+_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+_strings: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+# clear_cache зарегистрирован в pygame.register_quit (pygame.quit снимает
+# регистрацию — после переинициализации её нужно повторить)
+_quit_hooked = False
+
+
+def get_font(size: int, name: Optional[str] = None) -> pygame.font.Font:
+    """Общий шрифт (name=None — встроенный шрифт pygame)."""
+    global _quit_hooked
+    if not pygame.font.get_init():
+        # Шрифты прежней инициализации недействительны (render упадёт)
+        clear_cache()
+        pygame.font.init()
+    if not _quit_hooked:
+        pygame.register_quit(clear_cache)
+        _quit_hooked = True
+    key = (name, int(size))
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(name, int(size))
+    return font
+
+
+def render_text(text: str, size: int, color, name: Optional[str] = None) -> pygame.Surface:
+    """Готовая Surface строки; повторный запрос — из кэша, без рендера."""
+    key = (name, int(size), tuple(color), text)
+    surface = _strings.get(key)
+    if surface is not None:
+        _strings.move_to_end(key)
+        return surface
+    surface = get_font(size, name).render(text, True, color)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    _strings[key] = surface
+    if len(_strings) > _STRING_CACHE_LIMIT:
+        _strings.popitem(last=False)
+    return surface
+
+
+def draw_text(screen: pygame.Surface, text: str, size: int, color,
+              name: Optional[str] = None, **anchor) -> pygame.Rect:
+    """Нарисовать строку; ``anchor`` — как у get_rect (center=, topleft=...)."""
+    surface = render_text(text, size, color, name)
+    rect = surface.get_rect(**anchor)
+    screen.blit(surface, rect)
+    return rect
+
+
+def draw_lines(screen: pygame.Surface, lines: Iterable[str], size: int, color,
+               center_x: int, top: int, spacing: int,
+               name: Optional[str] = None) -> None:
+    """Столбец строк по центру ``center_x`` одним Surface.blits."""
+    batch = []
+    for i, line in enumerate(lines):
+        surface = render_text(line, size, color, name)
+        batch.append((surface, surface.get_rect(center=(center_x, top + i * spacing))))
+    screen.blits(batch, doreturn=False)
+
+
+def clear_cache() -> None:
+    """Сбросить кэши (после pygame.quit шрифты недействительны)."""
+    global _quit_hooked
+    _fonts.clear()
+    _strings.clear()
+    _quit_hooked = False
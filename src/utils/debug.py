@@ -1,14 +1,16 @@
 import pygame
 from src.core.config_loader import get_color
+from src.ui.text import get_font, render_text
 
 
 pygame.init()
-font = pygame.font.Font(None, 30)
+FONT_SIZE = 30
+font = get_font(FONT_SIZE)
 
 
 def debug(info, y=10, x=10):
     display_surface = pygame.display.get_surface()
-    debug_surface = font.render(str(info), True, get_color('WHITE'))
+    debug_surface = render_text(str(info), FONT_SIZE, get_color('WHITE'))
     debug_rectangle = debug_surface.get_rect(topleft=(x, y))
     pygame.draw.rect(display_surface, get_color('BLACK'), debug_rectangle)
     display_surface.blit(debug_surface, debug_rectangle)
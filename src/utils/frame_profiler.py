@@ -0,0 +1,135 @@
+"""
+FrameProfiler - StageTimer с историей: время стадий за последние N кадров.
+
+Single Responsibility: хранить замеры стадий по кадрам в кольцевых
+буферах фиксированного размера и отдавать по ним min / avg / p99 и
+время кадра для графика. Что измеряется и как показывается — решают
+Game и ProfilerOverlay.
+
+Совместим со StageTimer (measure/add/get — EMA остаётся), поэтому
+подставляется туда же, куда и он: Game.stage_timer и
+EnemyManager.stage_timer. Выключенный профайлер не подставлен вовсе —
+там стоит NULL_STAGE_TIMER, и цена замеров в кадре почти нулевая.
+
+Кадр: begin_frame() в начале итерации игрового цикла закрывает
+предыдущий кадр (время между началами — с ожиданием clock.tick) и
+обнуляет слот нового. Несколько замеров стадии за кадр складываются.
+
+Кольца — array('d') без numpy: он опционален ([pickups] storage = array),
+а статистику панель пересчитывает лишь overlay_hz раз в секунду.
+"""
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.utils.stage_timer import StageTimer
+
+
+# Стадии кадра в порядке показа: (ключ, подпись)
+PROFILE_STAGES = (
+    ('events', 'Events'),
+    ('player', 'Player'),
+    ('enemies', 'Enemies'),
+    ('collision', 'Attack'),
+    ('contact', 'Contact dmg'),
+    ('pickups', 'Pickups'),
+    ('world', 'World draw'),
+    ('overlay', 'Overlay'),
+    ('hud', 'HUD'),
+    ('flip', 'Flip'),
+)
+
+
+class FrameProfiler(StageTimer):
+    """Время стадий за последние ``capacity`` кадров."""
+
+    def __init__(self, capacity: int = 240,
+                 smoothing: float = StageTimer.DEFAULT_SMOOTHING):
+        super().__init__(smoothing)
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = int(capacity)
+        # +1 слот: текущий, ещё не закрытый кадр
+        self._size = self.capacity + 1
+        self._rings: Dict[str, array] = {}
+        self._frame_ms = _zeros(self._size)
+        self._index = 0
+        self._filled = 0
+        self._frame_start = None
+
+    def add(self, name: str, ms: float) -> None:
+        super().add(name, ms)
+        ring = self._rings.get(name)
+        if ring is None:
+            ring = self._rings[name] = _zeros(self._size)
+        ring[self._index] += ms
+
+    def begin_frame(self, now: float = None) -> None:
+        """Закрыть предыдущий кадр и начать новый."""
+        if now is None:
+            now = time.perf_counter()
+        if self._frame_start is not None:
+            self._frame_ms[self._index] = (now - self._frame_start) * 1000.0
+            self._filled = min(self._filled + 1, self.capacity)
+            self._index = (self._index + 1) % self._size
+        self._frame_start = now
+        for ring in self._rings.values():
+            ring[self._index] = 0.0
+
+    @property
+    def frames(self) -> int:
+        """Сколько закрытых кадров в окне."""
+        return self._filled
+
+    def _window(self, ring: array) -> List[float]:
+        """Закрытые кадры кольца от старого к новому."""
+        if self._filled < self.capacity:
+            return ring[self._index - self._filled:self._index].tolist()
+        return ring[self._index + 1:].tolist() + ring[:self._index].tolist()
+
+    def last_frame(self) -> Dict[str, float]:
+        """Стадии последнего закрытого кадра (мс), без нулевых."""
+        if not self._filled:
+            return {}
+        prev = self._index - 1
+        return {key: float(ring[prev]) for key, ring in self._rings.items() if ring[prev]}
+
+    def frame_times(self) -> List[float]:
+        """Время кадров окна (мс), от старого к новому."""
+        return self._window(self._frame_ms)
+
+    def stats(self) -> List[Tuple[str, float, float, float]]:
+        """(стадия, min, avg, p99) в мс: сначала PROFILE_STAGES, потом прочие."""
+        if not self._filled:
+            return []
+        order = [key for key, _ in PROFILE_STAGES if key in self._rings]
+        order += [key for key in self._rings if key not in order]
+        return [(key,) + _summary(self._window(self._rings[key])) for key in order]
+
+    def frame_stats(self) -> Optional[Tuple[float, float, float]]:
+        """(min, avg, p99) времени кадра в мс; None — кадров ещё нет."""
+        if not self._filled:
+            return None
+        return _summary(self.frame_times())
+
+    def reset(self) -> None:
+        super().reset()
+        self._rings.clear()
+        self._frame_ms = _zeros(self._size)
+        self._index = 0
+        self._filled = 0
+        self._frame_start = None
+
+
+def _zeros(size: int) -> array:
+    return array('d', bytes(8 * size))
+
+
+def _summary(values: Sequence[float]) -> Tuple[float, float, float]:
+    """(min, среднее, p99); p99 — линейная интерполяция, как numpy.percentile."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * 0.99
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    p99 = ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+    return ordered[0], sum(ordered) / len(ordered), p99
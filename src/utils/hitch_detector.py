@@ -0,0 +1,179 @@
+"""
+HitchDetector - сторож длинных кадров («фризов») с записью в лог.
+
+Single Responsibility: заметить кадр дольше порога и сохранить всё,
+что поможет понять его причину:
+- разбивку кадра по стадиям (её даёт Game — FrameProfiler.last_frame);
+- события кадра (автосейв, волна респавна, level-up, загрузка, сборка
+  мусора) — note();
+- число сущностей и состояние игры — тоже от Game;
+- стеки главного потока, снятые фоновым потоком-сторожем по ходу
+  самого длинного кадра.
+
+Записи — JSON-строки в logs/hitches_<время>.jsonl (файл создаётся при
+первом фризе). Редкий фриз в долгой сессии остаётся в логе со стеком,
+даже если к моменту, когда на него смотрят, всё давно прошло.
+
+Сторож: поток просыпается раз в sample_interval и, если текущий кадр
+идёт дольше половины порога, снимает стек главного потока через
+sys._current_frames(). В обычном кадре он только сравнивает время —
+стеки снимаются лишь в уже затянувшемся кадре, и цена детектора почти
+нулевая.
+
+Блокировок нет: события и стеки копятся в collections.deque (append и
+popleft атомарны), begin_frame() их вычерпывает. Колбэк сборки мусора
+может сработать посреди любой аллокации — в том числе внутри самого
+begin_frame() — и с обычным Lock повесил бы игровой поток.
+"""
+import datetime
+import gc
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Callable, Optional
+
+from src.utils.stack_sampler import collapse_stack
+
+
+def _drain(queue: deque) -> list:
+    """Вычерпать deque, не блокируя тех, кто в него пишет."""
+    items = []
+    while True:
+        try:
+            items.append(queue.popleft())
+        except IndexError:
+            return items
+
+
+class HitchDetector:
+    """Кадры дольше threshold_ms — в JSON lines лог со стеками и событиями."""
+
+    def __init__(self, threshold_ms: float = 50.0, log_dir: str = "logs",
+                 sample_interval_ms: float = 5.0, stack_depth: int = 40,
+                 max_samples: int = 50):
+        if threshold_ms <= 0:
+            raise ValueError("threshold_ms must be positive")
+        if sample_interval_ms <= 0:
+            raise ValueError("sample_interval_ms must be positive")
+        self.threshold_ms = float(threshold_ms)
+        self.log_dir = log_dir
+        self.sample_interval = sample_interval_ms / 1000.0
+        self.stack_depth = int(stack_depth)
+        self.max_samples = int(max_samples)
+        # Стеки снимаются с середины порога: к фризу уже есть картина
+        self._sample_after = self.threshold_ms / 2000.0
+
+        self.hitches = 0
+        self.log_path: Optional[str] = None
+        self._frame_index = 0
+        # (номер кадра, начало) — сторож читает одним присваиванием
+        self._frame = None
+        self._events: deque = deque()
+        # (кадр, стек): стек, снятый под конец кадра, не уедет в следующий
+        self._samples: deque = deque()
+        self._gc_start = None
+        self._main_ident = threading.main_thread().ident
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # --- Жизненный цикл ------------------------------------------------------
+
+    def start(self) -> None:
+        """Запустить сторожа (из потока игрового цикла)."""
+        if self._thread is not None:
+            return
+        self._main_ident = threading.get_ident()
+        self._stop.clear()
+        gc.callbacks.append(self._on_gc)
+        self._thread = threading.Thread(target=self._watch, name="HitchWatchdog",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    # --- Кадр ---------------------------------------------------------------
+
+    def note(self, kind: str, **info) -> None:
+        """Отметить событие текущего кадра (из любого потока)."""
+        event = {"event": kind}
+        event.update(info)
+        self._events.append(event)
+
+    def begin_frame(self, now: float = None,
+                    context: Callable[[], dict] = None) -> Optional[dict]:
+        """Закрыть предыдущий кадр и начать новый.
+
+        ``context()`` вызывается только для фриза — это поля Game
+        (stages, entities, state). Возвращает запись фриза или None.
+        """
+        if now is None:
+            now = time.perf_counter()
+        frame = self._frame
+        self._frame_index += 1
+        self._frame = (self._frame_index, now)
+        events = _drain(self._events)
+        samples = [stack for owner, stack in _drain(self._samples) if owner is frame]
+        if frame is None:
+            return None
+        frame_ms = (now - frame[1]) * 1000.0
+        if frame_ms < self.threshold_ms:
+            return None
+        record = {
+            "time": datetime.datetime.now().isoformat(timespec="milliseconds"),
+            "frame": frame[0],
+            "frame_ms": round(frame_ms, 2),
+            "threshold_ms": self.threshold_ms,
+        }
+        if context is not None:
+            record.update(context())
+        record["events"] = events
+        record["stacks"] = [{"count": count, "stack": stack}
+                            for stack, count in Counter(samples).most_common()]
+        self._write(record)
+        return record
+
+    # --- Сторож -------------------------------------------------------------
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.sample_interval):
+            frame = self._frame
+            if frame is None or time.perf_counter() - frame[1] < self._sample_after:
+                continue
+            if len(self._samples) >= self.max_samples:
+                continue
+            top = sys._current_frames().get(self._main_ident)
+            if top is None:
+                continue
+            # Кадр мог закончиться, пока снимали стек, — begin_frame()
+            # отбросит чужой по метке кадра
+            self._samples.append((frame, collapse_stack(top, self.stack_depth)))
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            ms = (time.perf_counter() - self._gc_start) * 1000.0
+            self._gc_start = None
+            self.note("gc", generation=info.get("generation"),
+                      collected=info.get("collected"), ms=round(ms, 2))
+
+    # --- Лог ----------------------------------------------------------------
+
+    def _write(self, record: dict) -> None:
+        if self.log_path is None:
+            os.makedirs(self.log_dir, exist_ok=True)
+            stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.log_path = os.path.join(self.log_dir, f"hitches_{stamp}.jsonl")
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self.hitches += 1
@@ -0,0 +1,128 @@
+"""
+ProfileCapture - запись профиля живой игры по команде (F7 / F8).
+
+Single Responsibility: одно окно профилирования от start() до stop() и
+его файлы в logs/. Режимы:
+- ``cprofile`` — детерминированный cProfile игрового потока: точные
+  вызовы и время функций, но заметно замедляет кадр — для коротких окон
+  (секунды). Файл .pstats (python -m pstats, snakeviz) и .txt — топ по
+  cumulative;
+- ``sample`` — StackSampler всех потоков раз в interval_ms: почти не
+  влияет на кадр — для длинных окон (минуты). Файл .collapsed.txt для
+  flamegraph.pl / speedscope.
+
+Рядом всегда .meta.json: режим, длительность, состояние игры и число
+сущностей в начале и в конце окна (их передаёт Game).
+"""
+import cProfile
+import datetime
+import io
+import json
+import os
+import pstats
+import time
+from typing import List, Optional
+
+from src.utils.stack_sampler import StackSampler
+
+CAPTURE_MODES = ("cprofile", "sample")
+
+
+class ProfileCapture:
+    """Одно окно профилирования: start() ... stop() -> файлы в log_dir."""
+
+    # Строк в текстовом топе cProfile
+    TOP_FUNCTIONS = 40
+
+    def __init__(self, mode: str, log_dir: str = "logs", seconds: float = 0.0,
+                 sample_interval_ms: float = 10.0, stack_depth: int = 60):
+        if mode not in CAPTURE_MODES:
+            raise ValueError(f"mode must be one of {CAPTURE_MODES}")
+        self.mode = mode
+        self.log_dir = log_dir
+        # 0 — до повторного нажатия, иначе остановка по expired()
+        self.seconds = float(seconds)
+        self._sample_interval_ms = sample_interval_ms
+        self._stack_depth = stack_depth
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+        self._started: Optional[float] = None
+        self._started_at: Optional[datetime.datetime] = None
+        self._start_tags: dict = {}
+
+    @property
+    def active(self) -> bool:
+        return self._started is not None
+
+    def start(self, tags: dict = None) -> None:
+        """Начать окно (cProfile — только для вызывающего потока)."""
+        if self.active:
+            return
+        self._start_tags = dict(tags or {})
+        self._started_at = datetime.datetime.now()
+        self._started = time.perf_counter()
+        if self.mode == "cprofile":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = StackSampler(self._sample_interval_ms, self._stack_depth)
+            self._sampler.start()
+
+    def expired(self, now: float = None) -> bool:
+        """Окно с лимитом seconds закончилось."""
+        if not self.active or self.seconds <= 0:
+            return False
+        if now is None:
+            now = time.perf_counter()
+        return now - self._started >= self.seconds
+
+    def stop(self, tags: dict = None) -> List[str]:
+        """Закончить окно и записать файлы; пути (первый — основной)."""
+        if not self.active:
+            return []
+        # Сначала остановить замер — запись файлов в профиль не попадает
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+        duration = time.perf_counter() - self._started
+        self._started = None
+        meta = {
+            "mode": self.mode,
+            "started": self._started_at.isoformat(timespec="seconds"),
+            "duration_s": round(duration, 3),
+            "start": self._start_tags,
+            "stop": dict(tags or {}),
+        }
+        os.makedirs(self.log_dir, exist_ok=True)
+        stem = os.path.join(
+            self.log_dir,
+            f"profile_{self._started_at.strftime('%Y%m%d_%H%M%S')}_{self.mode}",
+        )
+        if self.mode == "cprofile":
+            paths = self._write_pstats(stem, meta)
+            self._profile = None
+        else:
+            paths = [stem + ".collapsed.txt"]
+            self._sampler.write_collapsed(paths[0])
+            meta["samples"] = self._sampler.samples
+            meta["interval_ms"] = self._sample_interval_ms
+            self._sampler = None
+        meta["files"] = [os.path.basename(path) for path in paths]
+        paths.append(stem + ".meta.json")
+        with open(paths[-1], "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2, default=str)
+        return paths
+
+    def _write_pstats(self, stem: str, meta: dict) -> List[str]:
+        stats_path, text_path = stem + ".pstats", stem + ".txt"
+        self._profile.dump_stats(stats_path)
+        out = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=out)
+        meta["calls"] = stats.total_calls
+        stats.sort_stats("cumulative").print_stats(self.TOP_FUNCTIONS)
+        with open(text_path, "w", encoding="utf-8") as f:
+            for key in ("start", "stop"):
+                f.write(f"# {key}: {json.dumps(meta[key], ensure_ascii=False, default=str)}\n")
+            f.write(out.getvalue())
+        return [stats_path, text_path]
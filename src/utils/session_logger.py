@@ -3,9 +3,12 @@ SessionLogger - отдельный класс для записи логов о
 
 Single Responsibility: создание лог-файла, запись сообщений с уровнями,
 закрытие при завершении. Не знает про pygame и игровой цикл.
+
+Потокобезопасен: в лог пишут и игровой цикл, и фоновая запись сейвов.
 """
 import os
 import datetime
+import threading
 
 
 class SessionLogger:
@@ -20,6 +23,7 @@ class SessionLogger:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         self.filename = os.path.join(log_dir, f"game_session_{timestamp}.log")
         self._file = open(self.filename, 'w', encoding='utf-8')
+        self._lock = threading.Lock()
         self._file.write(
             f"=== ИГРОВАЯ СЕССИЯ НАЧАЛАСЬ: "
             f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===\n\n"
@@ -32,14 +36,18 @@ class SessionLogger:
         timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
         log_entry = f"[{timestamp}] [{level}] {message}\n"
 
-        self._file.write(log_entry)
-        self._file.flush()
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(log_entry)
+            self._file.flush()
 
         if level in self.IMPORTANT_LEVELS:
             print(message)
 
     def close(self) -> None:
         """Закрыть файл логов. Безопасно вызывать повторно."""
-        if self._file and not self._file.closed:
-            self._file.close()
+        with self._lock:
+            if self._file and not self._file.closed:
+                self._file.close()
 
@@ -0,0 +1,90 @@
+"""
+SpatialGrid - равномерная сетка для быстрых запросов «кто рядом».
+
+Single Responsibility: раскладывать объекты по ячейкам cell_size x cell_size
+по их мировым координатам и отвечать на запрос по прямоугольнику. Ничего
+не знает о типах объектов — хранит только ссылки и ключи ячеек.
+
+Объекты должны быть hashable (обычные экземпляры классов — по identity).
+"""
+from typing import Dict, Hashable, List, Set, Tuple
+
+
+CellKey = Tuple[int, int]
+
+
+class SpatialGrid:
+    """Хэш-сетка: ячейка (cx, cy) -> множество объектов."""
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self._cells: Dict[CellKey, Set[Hashable]] = {}
+        # Обратный индекс: объект -> его текущая ячейка
+        self._keys: Dict[Hashable, CellKey] = {}
+
+    def _key(self, x: float, y: float) -> CellKey:
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, obj: Hashable, x: float, y: float) -> None:
+        key = self._key(x, y)
+        self._keys[obj] = key
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = set()
+        cell.add(obj)
+
+    def remove(self, obj: Hashable) -> None:
+        key = self._keys.pop(obj, None)
+        if key is None:
+            return
+        cell = self._cells.get(key)
+        if cell is not None:
+            cell.discard(obj)
+            if not cell:
+                del self._cells[key]
+
+    def move(self, obj: Hashable, x: float, y: float) -> None:
+        """Обновить позицию объекта. Дёшево если ячейка не сменилась."""
+        key = self._key(x, y)
+        old = self._keys.get(obj)
+        if old == key:
+            return
+        if old is not None:
+            self.remove(obj)
+        self.insert(obj, x, y)
+
+    def query_rect(self, left: float, top: float,
+                   right: float, bottom: float) -> List[Hashable]:
+        """Объекты из ячеек, пересекающих прямоугольник [left..right]x[top..bottom].
+
+        Отбор грубый (по ячейкам) — точную проверку делает вызывающий.
+        Возвращает список-снимок, поэтому объекты можно двигать/удалять
+        во время обхода результата.
+        """
+        cx0, cy0 = self._key(left, top)
+        cx1, cy1 = self._key(right, bottom)
+        found = []
+        cells = self._cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.extend(cell)
+        return found
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, obj: Hashable) -> bool:
+        return obj in self._keys
+
+    @property
+    def cell_count(self) -> int:
+        """Количество непустых ячеек."""
+        return len(self._cells)
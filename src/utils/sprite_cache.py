@@ -0,0 +1,90 @@
+"""
+SpriteCache - заранее отрисованные поверхности для плотных сцен.
+
+Single Responsibility: один раз отрисовать геометрию пикапов, тела врагов
+(обычное и hit-flash) и шаги заполнения полоски HP в поверхности формата
+дисплея и отдавать их по ключу. Менеджеры собирают список (surface, pos)
+и рисуют слой одним вызовом blit_batch() вместо десятков draw.* на кадр.
+
+Источник правды для пикапа — его собственный draw(): спрайт получается
+отрисовкой шаблонного экземпляра в (0, 0), поэтому внешний вид не
+дублируется.
+"""
+from typing import Dict, Hashable, Sequence, Tuple
+
+import pygame
+
+
+# Полоска HP над врагом: высота и отступ над телом
+HEALTH_BAR_HEIGHT = 4
+HEALTH_BAR_GAP = 2
+HEALTH_BAR_BG = (40, 40, 40)
+HEALTH_BAR_FILL = (60, 200, 60)
+HIT_FLASH_COLOR = (255, 255, 255)
+
+
+def blit_batch(screen: pygame.Surface, blits: Sequence[Tuple]) -> None:
+    """Нарисовать слой одним вызовом (fblits в pygame-ce / 2.6+, иначе blits)."""
+    if not blits:
+        return
+    fblits = getattr(screen, 'fblits', None)
+    if fblits is not None:
+        fblits(blits)
+    else:
+        screen.blits(blits, doreturn=False)
+
+
+def _to_display_format(surface: pygame.Surface, alpha: bool) -> pygame.Surface:
+    """Конвертировать под формат дисплея, если окно уже создано."""
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surface.convert_alpha() if alpha else surface.convert()
+    return surface
+
+
+class SpriteCache:
+    """Ленивый кэш поверхностей: строится при первом запросе ключа."""
+
+    def __init__(self):
+        self._surfaces: Dict[Hashable, pygame.Surface] = {}
+
+    def pickup(self, pickup_cls) -> pygame.Surface:
+        """Спрайт пикапа: верхний левый угол = (x, y) пикапа."""
+        key = ('pickup', pickup_cls)
+        surf = self._surfaces.get(key)
+        if surf is None:
+            size = pickup_cls.SIZE + 1  # контур полигона задевает пиксель SIZE
+            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            pickup_cls(0, 0).draw(surf, 0, 0)
+            surf = self._surfaces[key] = _to_display_format(surf, alpha=True)
+        return surf
+
+    def enemy(self, stats, flashing: bool = False) -> pygame.Surface:
+        """Тело врага (цвет типа или белая вспышка попадания)."""
+        color = HIT_FLASH_COLOR if flashing else tuple(stats.color)
+        key = ('enemy', stats.width, stats.height, color)
+        surf = self._surfaces.get(key)
+        if surf is None:
+            surf = pygame.Surface((stats.width, stats.height))
+            surf.fill(color)
+            surf = self._surfaces[key] = _to_display_format(surf, alpha=False)
+        return surf
+
+    def health_bar(self, width: int, health: int, max_health: int) -> pygame.Surface:
+        """Полоска HP; шаг заполнения — целый пиксель, как в Enemy.draw."""
+        fill_w = int(width * health / max_health) if max_health > 0 else 0
+        key = ('hp', width, fill_w)
+        surf = self._surfaces.get(key)
+        if surf is None:
+            surf = pygame.Surface((width, HEALTH_BAR_HEIGHT))
+            surf.fill(HEALTH_BAR_BG)
+            if fill_w > 0:
+                surf.fill(HEALTH_BAR_FILL, (0, 0, fill_w, HEALTH_BAR_HEIGHT))
+            surf = self._surfaces[key] = _to_display_format(surf, alpha=False)
+        return surf
+
+    def clear(self) -> None:
+        """Сбросить кэш (например после смены видеорежима)."""
+        self._surfaces.clear()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
@@ -0,0 +1,74 @@
+"""
+StackSampler - периодический сэмплер стеков потоков в фоне.
+
+Single Responsibility: раз в interval снимать стеки потоков процесса
+(sys._current_frames) и считать одинаковые — «collapsed stacks», формат
+flamegraph.pl / speedscope / inferno: строка «поток;внешний;...;внутренний N».
+
+Цена для игры — одно пробуждение фонового потока на интервал и обход
+стеков; код игрового цикла не инструментируется, поэтому сэмплер годится
+для длинных окон (минуты реальной игры), где cProfile слишком дорог.
+"""
+import os
+import sys
+import threading
+import traceback
+from collections import Counter
+from typing import Optional
+
+
+def collapse_stack(top, depth: int = 40) -> str:
+    """Стек кадра ``top`` в строку «внешний;...;внутренний» (до depth кадров)."""
+    frames = traceback.extract_stack(top, limit=depth)
+    return ";".join(f"{os.path.basename(f.filename)}:{f.name}:{f.lineno}"
+                    for f in frames)
+
+
+class StackSampler:
+    """Счётчик collapsed-стеков всех потоков (кроме собственного)."""
+
+    def __init__(self, interval_ms: float = 10.0, depth: int = 60):
+        if interval_ms <= 0:
+            raise ValueError("interval_ms must be positive")
+        self.interval = interval_ms / 1000.0
+        self.depth = int(depth)
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="StackSampler",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def sample(self) -> None:
+        """Один снимок стеков (вызывается потоком сэмплера)."""
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, top in sys._current_frames().items():
+            if ident == own:
+                continue
+            name = names.get(ident, str(ident))
+            self.counts[f"{name};{collapse_stack(top, self.depth)}"] += 1
+        self.samples += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def write_collapsed(self, path: str) -> None:
+        """Строки «стек N», самые частые сверху."""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
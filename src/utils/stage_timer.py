@@ -0,0 +1,92 @@
+"""
+StageTimer - замер времени кадра по подсистемам (AI, коллизии, рендер...).
+
+Single Responsibility: копить сглаженное (EMA) время каждой стадии в мс.
+Не знает про pygame и про то, ЧТО измеряется — стадии это просто имена.
+
+Использование::
+
+    timer = StageTimer()
+    with timer.measure('ai'):
+        enemy_manager.update(dt)
+    timer.get('ai')  # -> мс, сглаженное по кадрам
+
+Когда замер не нужен, вместо StageTimer передаётся NULL_STAGE_TIMER —
+его measure() возвращает готовый no-op контекст и почти ничего не стоит.
+"""
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict
+
+
+class StageTimer:
+    """Сглаженное время по именованным стадиям кадра."""
+
+    # Вес нового замера в EMA: 0.1 ≈ усреднение по последним ~10 кадрам
+    DEFAULT_SMOOTHING = 0.1
+
+    def __init__(self, smoothing: float = DEFAULT_SMOOTHING):
+        self.smoothing = smoothing
+        self._avg_ms: Dict[str, float] = {}
+        self._last_ms: Dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, name: str):
+        """Замерить блок ``with`` как стадию ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000.0)
+
+    def add(self, name: str, ms: float) -> None:
+        """Добавить готовый замер стадии (в миллисекундах)."""
+        self._last_ms[name] = ms
+        prev = self._avg_ms.get(name)
+        if prev is None:
+            self._avg_ms[name] = ms
+        else:
+            self._avg_ms[name] = prev + (ms - prev) * self.smoothing
+
+    def get(self, name: str) -> float:
+        """Сглаженное время стадии в мс (0.0 если ещё не замеряли)."""
+        return self._avg_ms.get(name, 0.0)
+
+    def last(self, name: str) -> float:
+        """Время стадии в последнем кадре (мс)."""
+        return self._last_ms.get(name, 0.0)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Копия сглаженных значений всех стадий."""
+        return dict(self._avg_ms)
+
+    def reset(self) -> None:
+        self._avg_ms.clear()
+        self._last_ms.clear()
+
+
+class _NullStageTimer:
+    """No-op таймер: не меряет ничего, measure() не аллоцирует генератор."""
+
+    _CONTEXT = nullcontext()
+
+    def measure(self, name: str):
+        return self._CONTEXT
+
+    def add(self, name: str, ms: float) -> None:
+        return
+
+    def get(self, name: str) -> float:
+        return 0.0
+
+    def last(self, name: str) -> float:
+        return 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        return {}
+
+    def reset(self) -> None:
+        return
+
+
+NULL_STAGE_TIMER = _NullStageTimer()
@@ -0,0 +1,238 @@
+"""
+TimerWheel - общий сервис таймеров: дедлайны вместо ручных счётчиков.
+
+Single Responsibility: вести игровое время и в нужный момент вызывать
+запланированные события. Ничего не знает о врагах, пикапах и сейвах.
+
+Две части:
+
+- Clock / TimerWheel — часы с полем ``now``. Clock только считает время;
+  TimerWheel вдобавок хранит события в иерархическом колесе (уровни по
+  64 слота): advance(dt) обходит только пересечённые тики и каскадирует
+  дальние уровни раз в 64 тика — стоимость не зависит от того, сколько
+  таймеров ждёт.
+- Countdown — дескриптор «сколько осталось». Хранит дедлайн на часах
+  владельца (``obj.timers``), чтение — одно вычитание, запись — одно
+  сложение. Каждый кадр ничего не уменьшается, поэтому простаивающая
+  сущность не стоит ничего.
+
+Использование::
+
+    class Enemy:
+        knockback_timer = Countdown()
+
+        def __init__(self):
+            self.timers = Clock()          # свои часы (тесты, одиночный объект)
+
+    enemy.knockback_timer = 0.2           # дедлайн = now + 0.2
+    enemy.knockback_timer > 0             # осталось ли время
+
+    wheel = TimerWheel()
+    bind_countdowns(enemy, wheel)         # на общие часы, остаток сохранён
+    handle = wheel.schedule(30.0, on_expire, pickup)
+    wheel.advance(dt)                     # раз за кадр у владельца часов
+"""
+import math
+from typing import Callable, Dict, List
+
+
+class Clock:
+    """Часы без событий: только текущее время."""
+
+    __slots__ = ('now',)
+
+    def __init__(self, now: float = 0.0):
+        self.now = float(now)
+
+    def advance(self, dt: float) -> None:
+        self.now += dt
+
+
+class TimerHandle:
+    """Запланированное событие. cancel() снимает его без поиска по колесу."""
+
+    __slots__ = ('deadline', 'callback', 'args', 'active', '_tick', '_seq', '_wheel')
+
+    def __init__(self, wheel, deadline: float, tick: int, seq: int,
+                 callback: Callable, args: tuple):
+        self._wheel = wheel
+        self.deadline = deadline
+        self._tick = tick
+        self._seq = seq
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def cancel(self) -> None:
+        if self.active:
+            self.active = False
+            self._wheel._active -= 1
+
+
+class TimerWheel(Clock):
+    """Иерархическое колесо таймеров.
+
+    Тик — ``resolution`` секунд. Событие срабатывает на первом тике, не
+    раньше своего дедлайна (опоздание — меньше одного тика). Отменённые
+    события удаляются лениво — при обходе их слота.
+    """
+
+    __slots__ = ('resolution', '_tick', '_levels', '_overflow', '_active', '_seq')
+
+    SLOT_BITS = 6
+    SLOTS = 1 << SLOT_BITS          # 64 слота на уровень
+    LEVELS = 4                      # 64**4 тиков ≈ 19 ч при 1/240 с
+    DEFAULT_RESOLUTION = 1.0 / 240
+
+    def __init__(self, resolution: float = DEFAULT_RESOLUTION, now: float = 0.0):
+        super().__init__(now)
+        self.resolution = float(resolution)
+        self._tick = self._floor_tick(self.now)
+        # Слоты создаются лениво: пустое колесо — это несколько пустых dict
+        self._levels: List[Dict[int, List[TimerHandle]]] = [
+            {} for _ in range(self.LEVELS)
+        ]
+        self._overflow: List[TimerHandle] = []
+        self._active = 0
+        self._seq = 0
+
+    def _floor_tick(self, t: float) -> int:
+        return int(math.floor(t / self.resolution + 1e-9))
+
+    def __len__(self) -> int:
+        """Количество активных (не сработавших и не отменённых) событий."""
+        return self._active
+
+    # --- Планирование -------------------------------------------------------
+
+    def schedule(self, delay: float, callback: Callable, *args) -> TimerHandle:
+        """Вызвать ``callback(*args)`` через ``delay`` секунд игрового времени."""
+        deadline = self.now + max(0.0, float(delay))
+        tick = max(int(math.ceil(deadline / self.resolution - 1e-9)), self._tick + 1)
+        self._seq += 1
+        handle = TimerHandle(self, deadline, tick, self._seq, callback, args)
+        self._active += 1
+        self._insert(handle)
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> None:
+        if handle is not None:
+            handle.cancel()
+
+    def _insert(self, handle: TimerHandle) -> None:
+        delta = handle._tick - self._tick
+        bits = self.SLOT_BITS
+        for level in range(self.LEVELS):
+            if delta < 1 << (bits * (level + 1)):
+                slot = (handle._tick >> (bits * level)) & (self.SLOTS - 1)
+                self._levels[level].setdefault(slot, []).append(handle)
+                return
+        self._overflow.append(handle)
+
+    # --- Ход времени --------------------------------------------------------
+
+    def advance(self, dt: float) -> None:
+        """Сдвинуть время и вызвать наступившие события по порядку дедлайнов."""
+        self.now += dt
+        target = self._floor_tick(self.now)
+        if self._active == 0:
+            # Пустое колесо: просто перескакиваем, мусор отменённых не нужен
+            if target > self._tick:
+                self._tick = target
+                for level in self._levels:
+                    level.clear()
+                self._overflow.clear()
+            return
+        while self._tick < target and self._active > 0:
+            self._tick += 1
+            self._cascade()
+            self._fire_slot()
+        if self._tick < target:
+            self._tick = target
+
+    def _cascade(self) -> None:
+        """На границе блока перенести события старших уровней вниз."""
+        bits = self.SLOT_BITS
+        mask = self.SLOTS - 1
+        tick = self._tick
+        if tick & mask:
+            return
+        # Сначала самый старший из «перевернувшихся» уровней
+        top = 1
+        while top < self.LEVELS and not (tick >> (bits * top)) & mask:
+            top += 1
+        if top == self.LEVELS:
+            pending, self._overflow = self._overflow, []
+            for handle in pending:
+                if handle.active:
+                    self._insert(handle)
+            top = self.LEVELS - 1
+        for level in range(top, 0, -1):
+            slot = (tick >> (bits * level)) & mask
+            bucket = self._levels[level].pop(slot, None)
+            if bucket:
+                for handle in bucket:
+                    if handle.active:
+                        self._insert(handle)
+
+    def _fire_slot(self) -> None:
+        bucket = self._levels[0].pop(self._tick & (self.SLOTS - 1), None)
+        if not bucket:
+            return
+        bucket.sort(key=lambda h: (h.deadline, h._seq))
+        for handle in bucket:
+            if not handle.active:
+                continue
+            handle.active = False
+            self._active -= 1
+            handle.callback(*handle.args)
+
+
+class Countdown:
+    """Дескриптор обратного отсчёта поверх дедлайна на часах ``obj.timers``.
+
+    Чтение возвращает остаток (не меньше 0), запись ставит новый дедлайн.
+    """
+
+    __slots__ = ('_deadline_attr',)
+
+    def __init__(self):
+        self._deadline_attr = None
+
+    def __set_name__(self, owner, name):
+        self._deadline_attr = f'_{name}_deadline'
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        deadline = obj.__dict__.get(self._deadline_attr)
+        if deadline is None:
+            return 0.0
+        remaining = deadline - obj.timers.now
+        return remaining if remaining > 0 else 0.0
+
+    def __set__(self, obj, value):
+        obj.__dict__[self._deadline_attr] = obj.timers.now + float(value)
+
+    def deadline(self, obj):
+        """Сырой дедлайн объекта (None, если не ставился) — для дешёвых снимков."""
+        return obj.__dict__.get(self._deadline_attr)
+
+
+def countdown_names(cls) -> List[str]:
+    """Имена всех Countdown-атрибутов класса (с учётом наследования)."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name, attr in vars(klass).items():
+            if isinstance(attr, Countdown) and name not in names:
+                names.append(name)
+    return names
+
+
+def bind_countdowns(obj, clock) -> None:
+    """Перевести объект на другие часы (obj.timers), сохранив остаток всех Countdown."""
+    names = countdown_names(type(obj))
+    remaining = {name: getattr(obj, name) for name in names}
+    obj.timers = clock
+    for name, value in remaining.items():
+        setattr(obj, name, value)
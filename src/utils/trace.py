@@ -0,0 +1,218 @@
+"""
+Tracer - таймлайн сессии в формате Chrome trace events.
+
+Single Responsibility: копить в памяти именованные отрезки (span),
+мгновенные события и счётчики с отметками времени и потоком, а по
+команде записать их JSON-файлом в logs/. Файл открывается в Perfetto
+(ui.perfetto.dev) или chrome://tracing. Что и где размечать — решают
+Game, EnemyManager, SaveSystem и World.
+
+Использование::
+
+    with TRACER.span('respawn', cat='enemies') as span:
+        spawned = self.top_up(...)
+        span.annotate(spawned=spawned)
+    TRACER.counter('entities', enemies=len(enemies))
+
+Один процессный TRACER: в него пишут и игровой цикл, и поток SaveWriter
+(у каждого потока своя дорожка). Пока запись выключена, span()
+возвращает готовый no-op контекст — как NULL_STAGE_TIMER, разметка в
+кадре почти ничего не стоит. Во время записи сборки мусора попадают на
+таймлайн сами (gc.callbacks).
+
+Включение: переменная окружения ZELDA_TRACE=1 (с первого кадра) или
+клавиша в игре (см. Game.TRACE_KEY).
+"""
+import datetime
+import gc
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+TRACE_ENV = "ZELDA_TRACE"
+
+
+def trace_requested() -> bool:
+    """Запись с запуска: ZELDA_TRACE=1 / true / yes / on."""
+    return os.environ.get(TRACE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class _Span:
+    """Открытый отрезок; закрывается выходом из ``with``."""
+
+    __slots__ = ("_tracer", "name", "cat", "args", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: dict):
+        self._tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def annotate(self, **args) -> None:
+        """Добавить аргументы (видны в панели события на таймлайне)."""
+        self.args.update(args)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._tracer.complete(self.name, self._start, time.perf_counter(),
+                              self.cat, self.args)
+        return False
+
+
+class _NullSpan:
+    """No-op отрезок: ``with`` и annotate() ничего не делают."""
+
+    __slots__ = ()
+
+    def annotate(self, **args) -> None:
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Буфер trace-событий с записью в Chrome trace JSON."""
+
+    # Предел буфера: ~100 событий на кадр — около полутора минут при 60 FPS
+    DEFAULT_MAX_EVENTS = 500_000
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS):
+        if max_events < 1:
+            raise ValueError("max_events must be positive")
+        self.max_events = int(max_events)
+        self.recording = False
+        # (ph, name, cat, ts_us, dur_us, tid, args) — dict-ы только при записи
+        self._events: List[tuple] = []
+        self._thread_names: Dict[int, str] = {}
+        self.dropped = 0
+        self._origin = time.perf_counter()
+        self._started_at: Optional[datetime.datetime] = None
+        self._gc_start: Optional[float] = None
+
+    # --- Запись ------------------------------------------------------------
+
+    def start(self) -> None:
+        """Начать запись с чистого буфера (повторный вызов — no-op)."""
+        if self.recording:
+            return
+        self.clear()
+        self._origin = time.perf_counter()
+        self._started_at = datetime.datetime.now()
+        gc.callbacks.append(self._on_gc)
+        self.recording = True
+
+    def stop(self) -> None:
+        """Остановить запись; буфер остаётся до write()/clear()."""
+        if not self.recording:
+            return
+        self.recording = False
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        self._gc_start = None
+
+    def clear(self) -> None:
+        self._events = []
+        self._thread_names = {}
+        self.dropped = 0
+
+    @property
+    def event_count(self) -> int:
+        return len(self._events)
+
+    # --- Разметка ----------------------------------------------------------
+
+    def span(self, name: str, cat: str = "game", **args):
+        """Контекст-отрезок ``name``; без записи — общий no-op."""
+        if not self.recording:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def complete(self, name: str, start: float, end: float,
+                 cat: str = "game", args: dict = None) -> None:
+        """Готовый отрезок по отметкам time.perf_counter()."""
+        if self.recording:
+            self._record("X", name, cat, start, (end - start) * 1e6, args)
+
+    def instant(self, name: str, cat: str = "game", **args) -> None:
+        """Мгновенное событие (level-up, начало загрузки...)."""
+        if self.recording:
+            self._record("i", name, cat, time.perf_counter(), 0.0, args)
+
+    def counter(self, name: str, **values) -> None:
+        """Счётчик: каждое значение — своя кривая под именем ``name``."""
+        if self.recording:
+            self._record("C", name, "counter", time.perf_counter(), 0.0, values)
+
+    def _record(self, ph: str, name: str, cat: str, when: float,
+                dur_us: float, args) -> None:
+        if len(self._events) >= self.max_events:
+            self.dropped += 1
+            return
+        tid = threading.get_ident()
+        # ident умершего потока переиспользуется — имя берём у текущего
+        name_of_thread = threading.current_thread().name
+        if self._thread_names.get(tid) != name_of_thread:
+            self._thread_names[tid] = name_of_thread
+        # list.append атомарен под GIL — поток записи сейвов пишет сюда же
+        self._events.append((ph, name, cat, (when - self._origin) * 1e6,
+                             dur_us, tid, args))
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        """gc.callbacks: пара start/stop — отрезок сборки поколения."""
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            self.complete("gc", self._gc_start, time.perf_counter(), "gc",
+                          {"generation": info.get("generation"),
+                           "collected": info.get("collected"),
+                           "uncollectable": info.get("uncollectable")})
+            self._gc_start = None
+
+    # --- Экспорт -----------------------------------------------------------
+
+    def to_chrome(self) -> dict:
+        """Буфер в формате Chrome trace (JSON Object Format)."""
+        pid = os.getpid()
+        events = [{"ph": "M", "name": "process_name", "pid": pid, "tid": 0,
+                   "args": {"name": "game"}}]
+        for tid, thread_name in list(self._thread_names.items()):
+            events.append({"ph": "M", "name": "thread_name", "pid": pid,
+                           "tid": tid, "args": {"name": thread_name}})
+        for ph, name, cat, ts, dur, tid, args in list(self._events):
+            event = {"ph": ph, "name": name, "cat": cat, "ts": round(ts, 3),
+                     "pid": pid, "tid": tid}
+            if ph == "X":
+                event["dur"] = round(dur, 3)
+            elif ph == "i":
+                event["s"] = "t"
+            if args:
+                event["args"] = args
+            events.append(event)
+        started = self._started_at.isoformat() if self._started_at else None
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"started": started, "dropped": self.dropped}}
+
+    def write(self, log_dir: str = "logs") -> str:
+        """Записать буфер в logs/trace_<время>.json; путь к файлу."""
+        os.makedirs(log_dir, exist_ok=True)
+        stamp = (self._started_at or datetime.datetime.now()).strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(log_dir, f"trace_{stamp}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome(), f, default=str)
+        return path
+
+
+# Процессный трассировщик: разметка подсистем пишет сюда
+TRACER = Tracer()
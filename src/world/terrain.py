@@ -1,6 +1,6 @@
 import pygame
 from enum import Enum
-from src.core.config_loader import get_color
+from src.core.config_loader import config_snapshot
 
 
 class TerrainType(Enum):
@@ -40,6 +40,46 @@ TRANSLUCENT_OVERLAY_TYPES = frozenset({
 })
 
 
+# Цвета тайлов по типу. Строятся один раз из снимка конфига при первой
+# отрисовке — раньше словарь собирался заново на каждый тайл каждого кадра.
+_PALETTE = None
+
+
+def _terrain_palette() -> dict:
+    global _PALETTE
+    if _PALETTE is None:
+        colors = config_snapshot().colors
+        _PALETTE = {
+            TerrainType.EMPTY: colors.dark_green,
+            TerrainType.MOUNTAIN: colors.dark_gray,
+            TerrainType.WATER: (0, 100, 200),  # Синий
+            TerrainType.TREE: (0, 150, 0),     # Темно-зеленый
+            TerrainType.SWAMP: (100, 50, 0),   # Коричнево-зеленый
+            TerrainType.SAND: (200, 180, 100), # Песочный
+            TerrainType.PLAYER_START: colors.dark_green,
+            TerrainType.CAVE_WALL: (101, 67, 33),  # Темно-коричневый для стен пещеры
+            TerrainType.CAVE_SPECIAL: (255, 215, 0),  # Золотой для специальных элементов
+
+            # Цвета для новых типов terrain (burrow mechanics)
+            TerrainType.BURROW_ENTRANCE: (139, 69, 19),    # Коричневый для входа в нору
+            TerrainType.BURROW_EXIT: (160, 82, 45),        # Светло-коричневый для выхода
+            TerrainType.UNDERGROUND_PATH: (101, 67, 33),   # Темно-коричневый для подземной тропинки
+            TerrainType.HILL_SURFACE: (34, 139, 34),       # Зеленый для поверхности холма
+            TerrainType.TRIGGER_BUTTON: (255, 0, 255),     # Магента для кнопки/переключателя
+            TerrainType.NPC_SPAWN: (255, 165, 0),          # Оранжевый для точки появления NPC
+            TerrainType.QUEST_TRIGGER: (255, 215, 0),      # Золотой для квестового триггера
+            TerrainType.DIALOGUE_ZONE: (173, 216, 230),    # Светло-голубой для зоны диалога
+
+            # Цвет крыши лавки/навеса (палевый - как сухие пальмовые листья)
+            TerrainType.ROOF_TRANSLUCENT: (160, 120, 60),
+
+            # Неизвестный тип и контур гор/воды
+            None: colors.white,
+            'border': colors.black,
+        }
+    return _PALETTE
+
+
 class TerrainTile:
     """Класс для представления тайла ландшафта"""
     def __init__(self, x, y, terrain_type):
@@ -72,31 +112,8 @@ class TerrainTile:
         
     def get_color(self):
         """Получить цвет для отрисовки тайла"""
-        color_map = {
-            TerrainType.EMPTY: get_color('DARK_GREEN'),
-            TerrainType.MOUNTAIN: get_color('DARK_GRAY'),
-            TerrainType.WATER: (0, 100, 200),  # Синий
-            TerrainType.TREE: (0, 150, 0),     # Темно-зеленый
-            TerrainType.SWAMP: (100, 50, 0),   # Коричнево-зеленый
-            TerrainType.SAND: (200, 180, 100), # Песочный
-            TerrainType.PLAYER_START: get_color('DARK_GREEN'),
-            TerrainType.CAVE_WALL: (101, 67, 33),  # Темно-коричневый для стен пещеры
-            TerrainType.CAVE_SPECIAL: (255, 215, 0),  # Золотой для специальных элементов
-            
-            # Цвета для новых типов terrain (burrow mechanics)
-            TerrainType.BURROW_ENTRANCE: (139, 69, 19),    # Коричневый для входа в нору
-            TerrainType.BURROW_EXIT: (160, 82, 45),        # Светло-коричневый для выхода
-            TerrainType.UNDERGROUND_PATH: (101, 67, 33),   # Темно-коричневый для подземной тропинки
-            TerrainType.HILL_SURFACE: (34, 139, 34),       # Зеленый для поверхности холма
-            TerrainType.TRIGGER_BUTTON: (255, 0, 255),     # Магента для кнопки/переключателя
-            TerrainType.NPC_SPAWN: (255, 165, 0),          # Оранжевый для точки появления NPC
-            TerrainType.QUEST_TRIGGER: (255, 215, 0),      # Золотой для квестового триггера
-            TerrainType.DIALOGUE_ZONE: (173, 216, 230),    # Светло-голубой для зоны диалога
-
-            # Цвет крыши лавки/навеса (палевый - как сухие пальмовые листья)
-            TerrainType.ROOF_TRANSLUCENT: (160, 120, 60),
-        }
-        return color_map.get(self.terrain_type, get_color('WHITE'))
+        palette = _terrain_palette()
+        return palette.get(self.terrain_type, palette[None])
     
     def draw(self, screen, camera_x, camera_y):
         """Отрисовка тайла"""
@@ -113,6 +130,6 @@ class TerrainTile:
             
             # Добавляем границу для некоторых типов
             if self.terrain_type in [TerrainType.MOUNTAIN, TerrainType.WATER]:
-                pygame.draw.rect(screen, get_color('BLACK'), (screen_x, screen_y, 32, 32), 1)
+                pygame.draw.rect(screen, _terrain_palette()['border'], (screen_x, screen_y, 32, 32), 1)
 
 
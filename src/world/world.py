@@ -2,11 +2,12 @@ import pygame
 import os
 from typing import List
 
-from src.core.config_loader import get_config, get_color
-from src.world.terrain import TerrainType, TRANSLUCENT_OVERLAY_TYPES
+from src.core.config_loader import config_snapshot
+from src.world.terrain import TerrainTile, TerrainType, TRANSLUCENT_OVERLAY_TYPES
 from src.world.map_loader import load_map_from_file
 from src.world.camera import Camera
 from src.systems.enemy_manager import EnemyManager
+from src.utils.trace import TRACER
 
 
 class World:
@@ -14,6 +15,8 @@ class World:
         """Инициализация игрового мира"""
         self.width = width
         self.height = height
+        # Палитра отрисовки из снимка конфига
+        self._colors = config_snapshot().colors
 
         # Размер тайлов для сетки
         self.tile_size = 32
@@ -21,12 +24,15 @@ class World:
         self.tiles_y = height // self.tile_size
 
         # Загружаем карту из файла (земля + опциональный overlay)
-        self.terrain_tiles, self.overlay_tiles, self.player_start_x, self.player_start_y = \
-            load_map_from_file(map_file)
+        with TRACER.span('world.load', cat='world', map=os.path.basename(map_file)):
+            self.terrain_tiles, self.overlay_tiles, self.player_start_x, self.player_start_y = \
+                load_map_from_file(map_file)
 
-        # Создаем список препятствий для обратной совместимости
-        self.obstacles: List[pygame.Rect] = []
-        self.generate_obstacles_from_terrain()
+            # Создаем список препятствий для обратной совместимости
+            self.obstacles: List[pygame.Rect] = []
+            self.generate_obstacles_from_terrain()
+        # Сетка цветов ландшафта для превью сейвов (terrain_grid, лениво)
+        self._terrain_grid = None
 
         # Камера
         self._camera = Camera()
@@ -75,7 +81,36 @@ class World:
             if tile.x == tile_x and tile.y == tile_y:
                 return tile
         return None
-    
+
+    def terrain_grid(self):
+        """Ландшафт сеткой цветов: (tiles_x, tiles_y, bytes, палитра).
+
+        Байт на тайл — индекс в палитре (0 — пустая земля), overlay поверх
+        земли. Строится один раз: ландшафт не меняется, а неизменяемые
+        bytes можно читать из фонового потока (превью сейвов).
+        """
+        if self._terrain_grid is None:
+            with TRACER.span('world.terrain_grid', cat='world'):
+                self._terrain_grid = self._build_terrain_grid()
+        return self._terrain_grid
+
+    def _build_terrain_grid(self):
+        palette = [TerrainTile(0, 0, TerrainType.EMPTY).get_color()]
+        indices = {}
+        cells = bytearray(self.tiles_x * self.tiles_y)
+        for tile in list(self.terrain_tiles) + list(self.overlay_tiles):
+            tx, ty = tile.x // self.tile_size, tile.y // self.tile_size
+            if tile.terrain_type == TerrainType.EMPTY or not (
+                    0 <= tx < self.tiles_x and 0 <= ty < self.tiles_y):
+                continue
+            color = tile.get_color()
+            index = indices.get(color)
+            if index is None:
+                index = indices[color] = len(palette)
+                palette.append(color)
+            cells[ty * self.tiles_x + tx] = index
+        return (self.tiles_x, self.tiles_y, bytes(cells), tuple(palette))
+
     def get_player_start_position(self):
         """Получить стартовую позицию игрока"""
         return self.player_start_x, self.player_start_y
@@ -105,7 +140,7 @@ class World:
     
     def draw_background(self, screen):
         """Отрисовка фона мира"""
-        screen.fill(get_color('DARK_GREEN'))
+        screen.fill(self._colors.dark_green)
         
         # Рисуем сетку для лучшей ориентации
         screen_width = screen.get_width()
@@ -186,8 +221,8 @@ class World:
         minimap_y = 10
         
         # Фон мини-карты
-        pygame.draw.rect(screen, get_color('BLACK'), (minimap_x, minimap_y, minimap_size, minimap_size))
-        pygame.draw.rect(screen, get_color('WHITE'), (minimap_x, minimap_y, minimap_size, minimap_size), 2)
+        pygame.draw.rect(screen, self._colors.black, (minimap_x, minimap_y, minimap_size, minimap_size))
+        pygame.draw.rect(screen, self._colors.white, (minimap_x, minimap_y, minimap_size, minimap_size), 2)
         
         # Масштаб мини-карты
         scale_x = minimap_size / self.width
@@ -199,19 +234,19 @@ class World:
             mini_y = minimap_y + int(obstacle.y * scale_y)
             mini_w = max(1, int(obstacle.width * scale_x))
             mini_h = max(1, int(obstacle.height * scale_y))
-            pygame.draw.rect(screen, get_color('GRAY'), (mini_x, mini_y, mini_w, mini_h))
+            pygame.draw.rect(screen, self._colors.gray, (mini_x, mini_y, mini_w, mini_h))
         
         # Рисуем игрока на мини-карте
         player_mini_x = minimap_x + int(player_x * scale_x)
         player_mini_y = minimap_y + int(player_y * scale_y)
-        pygame.draw.circle(screen, get_color('RED'), (player_mini_x, player_mini_y), 3)
+        pygame.draw.circle(screen, self._colors.red, (player_mini_x, player_mini_y), 3)
         
         # Рисуем область видимости камеры
         camera_mini_x = minimap_x + int(self.camera_x * scale_x)
         camera_mini_y = minimap_y + int(self.camera_y * scale_y)
         camera_mini_w = int(screen.get_width() * scale_x)
         camera_mini_h = int(screen.get_height() * scale_y)
-        pygame.draw.rect(screen, get_color('YELLOW'), (camera_mini_x, camera_mini_y, camera_mini_w, camera_mini_h), 1)
+        pygame.draw.rect(screen, self._colors.yellow, (camera_mini_x, camera_mini_y, camera_mini_w, camera_mini_h), 1)
     
     def draw(self, screen, player_x, player_y):
         """Отрисовка ЗЕМЛЯНОГО слоя мира (без overlay).
@@ -220,6 +255,9 @@ class World:
         после отрисовки игрока через World.draw_overlay(screen, player_rect).
         Это позволяет холму/крыше визуально перекрывать игрока.
         """
-        self.draw_background(screen)
-        self.draw_obstacles(screen)
-        self.draw_minimap(screen, player_x, player_y)
\ No newline at end of file
+        with TRACER.span('world.background', cat='world'):
+            self.draw_background(screen)
+        with TRACER.span('world.obstacles', cat='world'):
+            self.draw_obstacles(screen)
+        with TRACER.span('world.minimap', cat='world'):
+            self.draw_minimap(screen, player_x, player_y)
\ No newline at end of file
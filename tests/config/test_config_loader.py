@@ -6,7 +6,11 @@ import os
 import tempfile
 import configparser
 from unittest.mock import patch, mock_open
-from src.core.config_loader import ConfigLoader, ConfigValidationError, load_config, get_config, get_color
+from dataclasses import FrozenInstanceError
+from src.core.config_loader import (
+    ConfigLoader, ConfigValidationError, load_config, get_config, get_color,
+    config_snapshot, build_config_snapshot,
+)
 
 
 class TestConfigLoader:
@@ -128,6 +132,61 @@ class TestGlobalFunctions:
         assert red == (255, 0, 0)
 
 
+class TestConfigSnapshot:
+    """Test cases for the typed config snapshot"""
+
+    def test_snapshot_matches_flat_config(self):
+        """Snapshot fields mirror get_config values"""
+        cfg = config_snapshot()
+        assert cfg.display.width == get_config('WIDTH')
+        assert cfg.autosave.limit == get_config('AUTOSAVE_LIMIT')
+        assert cfg.combat.enemy_knockback_speed == get_config('COMBAT_ENEMY_KNOCKBACK_SPEED')
+        assert cfg.colors.white == get_color('WHITE')
+
+    def test_nested_enemy_sections(self):
+        """Per-type keys are grouped into subsections"""
+        cfg = config_snapshot()
+        assert cfg.enemies.light.speed == get_config('ENEMIES_LIGHT_SPEED')
+        assert cfg.drops.heavy.coin_max == get_config('DROPS_HEAVY_COIN_MAX')
+        assert cfg.enemies.spawn_min_distance == get_config('ENEMIES_SPAWN_MIN_DISTANCE')
+
+    def test_snapshot_is_frozen(self):
+        """Snapshot sections cannot be modified"""
+        cfg = config_snapshot()
+        with pytest.raises(FrozenInstanceError):
+            cfg.display.width = 1
+        with pytest.raises(FrozenInstanceError):
+            cfg.enemies.light.speed = 1
+
+    def test_optional_keys_get_schema_defaults(self):
+        """Keys absent from the config are filled from the declared schema"""
+        cfg = build_config_snapshot({'PICKUPS_LIFETIME': 30.0})
+        assert cfg.pickups.lifetime == 30.0
+        assert cfg.pickups.max_pickups == 400
+        assert cfg.diagnostics.hitch_ms == 0.0
+        assert cfg.enemies.light.chase_radius == 120.0
+        with pytest.raises(AttributeError):
+            cfg.pickups.max_pickup
+
+    def test_optional_key_types_follow_schema(self):
+        """Optional values are coerced to the type of their declared default"""
+        cfg = build_config_snapshot({'DIAGNOSTICS_OVERLAY_HZ': 4,
+                                     'SAVE_FORMAT': 'JSON',
+                                     'REWIND_ENABLED': 'false'})
+        assert type(cfg.diagnostics).__dataclass_fields__['overlay_hz'].type is float
+        assert cfg.diagnostics.overlay_hz == 4.0
+        assert cfg.save.format == 'json'
+        assert cfg.rewind.enabled is False
+        assert get_config('DIAGNOSTICS_HITCH_MS') == config_snapshot().diagnostics.hitch_ms
+
+    def test_field_types_follow_values(self):
+        """Dataclass field annotations reflect parsed value types"""
+        cfg = build_config_snapshot({'WIDTH': 800, 'PICKUPS_LIFETIME': 30.0})
+        fields = type(cfg.display).__dataclass_fields__
+        assert fields['width'].type is int
+        assert type(cfg.pickups).__dataclass_fields__['lifetime'].type is float
+
+
 class TestConfigValidation:
     """Test cases for configuration validation"""
     
@@ -185,4 +244,17 @@ class TestConfigValidation:
         # Test with zero value
         parser.set('world', 'world_width', '0')
         with pytest.raises(ConfigValidationError, match="world_width must be a positive integer"):
-            self.config_loader._validate_world_settings(parser)
\ No newline at end of file
+            self.config_loader._validate_world_settings(parser)
+
+    def test_unknown_key_in_closed_section(self):
+        """A misspelled key in an optional-only section is rejected"""
+        parser = configparser.ConfigParser()
+        parser.add_section('diagnostics')
+        parser.set('diagnostics', 'hitch_ms', '50')
+
+        # Should not raise exception
+        self.config_loader._validate_known_keys(parser)
+
+        parser.set('diagnostics', 'hitch_msec', '50')
+        with pytest.raises(ConfigValidationError, match="Unknown diagnostics.hitch_msec"):
+            self.config_loader._validate_known_keys(parser)
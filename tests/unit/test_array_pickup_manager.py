@@ -0,0 +1,134 @@
+"""
+Тесты для ArrayPickupManager (хранилище пикапов на NumPy).
+"""
+import pytest
+import pygame
+from unittest.mock import MagicMock, patch
+
+np = pytest.importorskip("numpy")
+
+from src.entities.pickup import HeartPickup, CoinPickup, XPOrbPickup
+from src.systems.array_pickup_manager import ArrayPickupManager
+from src.systems.pickup_manager import PickupManager, create_pickup_manager
+
+
+@pytest.fixture
+def player():
+    p = MagicMock()
+    p.x = 100.0
+    p.y = 100.0
+    p.width = 32
+    p.height = 32
+    p.rect = pygame.Rect(100, 100, 32, 32)
+    return p
+
+
+@pytest.fixture
+def pm():
+    m = ArrayPickupManager()
+    m.coalesce_radius = 0
+    m.max_pickups = 100000
+    return m
+
+
+class TestArrayPickupManager:
+
+    def test_lifetime_expires(self, pm, player):
+        p = HeartPickup(999.0, 999.0)
+        p.lifetime = 0.5
+        pm.spawn(p)
+        pm.update(0.4, player)
+        assert pm.count() == 1
+        pm.update(0.2, player)
+        assert pm.count() == 0
+
+    def test_magnet_moves_toward_player(self, pm, player):
+        pm.spawn(CoinPickup(player.x + 45, player.y))
+        pm.update(0.01, player)
+        assert pm.serialize()[0]["x"] < player.x + 45
+
+    def test_collection_aggregates_rewards(self, pm, player):
+        for _ in range(3):
+            pm.spawn(CoinPickup(100.0, 100.0))
+        pm.spawn(XPOrbPickup(105.0, 105.0, value=4))
+        for template in pm._templates:
+            template.amount = 1
+        pm.update(0.01, player)
+        assert pm.count() == 0
+        player.stats.add_coins.assert_called_once_with(3)
+        player.stats.gain_xp.assert_called_once_with(4)
+
+    def test_many_pickups_bulk_compaction(self, pm, player):
+        for i in range(5000):
+            p = XPOrbPickup(2000.0 + i, 2000.0)
+            p.lifetime = 1.0 if i % 2 else 10.0
+            pm.spawn(p)
+        pm.update(1.5, player)
+        assert pm.count() == 2500
+
+    def test_coalesce_same_cell(self, pm, player):
+        pm.coalesce_radius = 24
+        pm.spawn(CoinPickup(1000.0, 1000.0))
+        pm.spawn(CoinPickup(1005.0, 1003.0))
+        pm.spawn(HeartPickup(1000.0, 1000.0))
+        pm.spawn(HeartPickup(1002.0, 1000.0))
+        pm.update(0.0, player)
+        assert pm.count() == 3
+        coins = [r for r in pm.serialize() if r["type"] == "coin"]
+        assert coins[0]["value"] == 2
+
+    def test_cap_preserves_total_value(self, pm, player):
+        pm.max_pickups = 10
+        for i in range(50):
+            pm.spawn(XPOrbPickup(3000.0 + i * 50, 3000.0))
+        pm.update(0.0, player)
+        assert pm.count() == 10
+        assert sum(r["value"] for r in pm.serialize()) == 50
+
+    def test_cap_never_merges_hearts(self, pm, player):
+        pm.max_pickups = 2
+        for i in range(4):
+            pm.spawn(HeartPickup(3000.0 + i * 100, 3000.0))
+        pm.update(0.0, player)
+        assert pm.count() == 4
+        assert all(r["value"] == 1 for r in pm.serialize())
+
+    def test_serialize_roundtrip_with_object_manager(self, pm, player):
+        pm.spawn(CoinPickup(500.0, 600.0, value=3))
+        pm.update(1.0, player)
+        data = pm.serialize()
+        objects = PickupManager()
+        objects.deserialize(data)
+        assert objects.pickups[0].value == 3
+        restored = ArrayPickupManager()
+        restored.deserialize(objects.serialize())
+        row = restored.serialize()[0]
+        assert row["type"] == "coin" and row["value"] == 3
+        assert row["lifetime"] == pytest.approx(data[0]["lifetime"])
+
+
+def _storage(value):
+    """get_config, у которого переопределён только PICKUPS_STORAGE."""
+    from src.core.config_loader import get_config
+
+    def fake(key, default=None):
+        if key == 'PICKUPS_STORAGE':
+            return value
+        return get_config(key, default)
+    return patch('src.systems.pickup_manager.get_config', side_effect=fake)
+
+
+class TestCreatePickupManager:
+
+    def test_default_is_object_manager(self):
+        with _storage('objects'):
+            assert isinstance(create_pickup_manager(), PickupManager)
+
+    def test_array_storage(self):
+        with _storage('array'):
+            assert isinstance(create_pickup_manager(), ArrayPickupManager)
+
+    def test_array_without_numpy_falls_back(self):
+        with _storage('array'), \
+                patch('src.systems.array_pickup_manager.HAS_NUMPY', False):
+            assert isinstance(create_pickup_manager(), PickupManager)
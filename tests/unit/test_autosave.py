@@ -18,6 +18,7 @@ import time
 import pytest
 import pygame
 
+from src.systems.enemy_manager import EnemyManager
 from src.systems.save_system import SaveSystem
 from src.entities.player import Player
 from src.world.world import World
@@ -190,3 +191,103 @@ def test_invalid_limit_falls_back_to_default(save_system, player, world):
     assert ok is True
     items = save_system.list_autosaves()
     assert len(items) == 1
+
+
+# --- Фоновая запись и атомарность ----------------------------------------
+
+def test_autosave_async_writes_in_background(save_system, player, world):
+    results = []
+    queued = save_system.autosave_async(
+        player, world, reason="periodic", limit=3,
+        on_complete=lambda path, error: results.append((path, error)),
+    )
+    assert queued is True
+    save_system.wait_for_pending()
+
+    expected = os.path.join("saves", "autosave", "autosave_01.json")
+    assert results == [(expected, None)]
+    data = save_system.load_from_autosave(1)
+    assert data["autosave_reason"] == "periodic"
+    save_system.shutdown()
+
+
+def test_autosave_async_snapshot_is_taken_immediately(save_system, player, world):
+    player.x = 100
+    save_system.autosave_async(player, world)
+    player.x = 999  # меняем после постановки в очередь
+    save_system.wait_for_pending()
+    assert save_system.load_from_autosave(1)["player"]["x"] == 100
+    save_system.shutdown()
+
+
+def test_autosave_async_error_reaches_callback(save_system, player, world,
+                                               monkeypatch):
+    def broken(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(save_system, "_write_save_data", broken)
+    results = []
+    save_system.autosave_async(
+        player, world, on_complete=lambda path, error: results.append(error)
+    )
+    save_system.wait_for_pending()
+    assert isinstance(results[0], OSError)
+    save_system.shutdown()
+
+
+def test_failed_write_keeps_previous_file(save_system, player, world,
+                                          monkeypatch):
+    save_system.autosave(player, world, limit=1)
+    # Превью пишется в фоне тем же os.replace — дождаться до подмены
+    save_system.wait_for_pending()
+    path = os.path.join("saves", "autosave", "autosave_01.json")
+    with open(path, encoding="utf-8") as f:
+        before = f.read()
+
+    def broken_replace(*args, **kwargs):
+        raise OSError("replace failed")
+    monkeypatch.setattr("src.systems.save_system.os.replace", broken_replace)
+    assert save_system.autosave(player, world, limit=1) is False
+    save_system.wait_for_pending()
+
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == before
+    # Временный файл убран (рядом — только превью слота)
+    assert sorted(os.listdir(os.path.join("saves", "autosave"))) == [
+        "autosave_01.json", "autosave_01.png"]
+
+
+def test_enemy_capture_is_decoupled_from_live_enemies(save_system, player, world):
+    manager = world.enemy_manager
+    manager.spawn_initial(player.x, player.y)
+    expected = manager.serialize()
+    build = manager.capture()
+    # Урон идёт через менеджер: ещё не скопированный враг снимается до удара
+    everything = [pygame.Rect(0, 0, world.width, world.height)]
+    manager.apply_player_attack(1, everything, 99)
+    manager.update(0.1)
+    assert not manager.enemies
+    assert build() == expected
+
+
+@pytest.mark.parametrize("count", [5000, 20000])
+def test_enemy_capture_cost_per_frame_does_not_grow(save_system, world,
+                                                     monkeypatch, count):
+    """В кадре автосейва — только список ссылок; строки копирует update()
+    не больше CAPTURE_BATCH за кадр, сколько бы ни было врагов."""
+    manager = world.enemy_manager
+    manager.restore_rows([{"type": "light", "x": float(i % 1000), "y": float(i // 1000)}
+                          for i in range(count)])
+    expected = manager.serialize()
+    copied = []
+    raw_row = EnemyManager._raw_row
+    monkeypatch.setattr(EnemyManager, "_raw_row",
+                        staticmethod(lambda e: copied.append(e) or raw_row(e)))
+    build = manager.capture()
+    assert copied == []
+    frames = -(-count // manager.CAPTURE_BATCH)
+    for _ in range(frames):
+        before = len(copied)
+        manager.update(0.0)
+        assert len(copied) - before <= manager.CAPTURE_BATCH
+    assert len(copied) == count
+    assert build() == expected
@@ -0,0 +1,61 @@
+"""
+Тесты DebugOverlay: значения снимаются с заданной частотой, между
+снимками кадр — blit готовой Surface; панель F1 в Game не обходит врагов
+каждый кадр.
+"""
+import os
+
+import pygame
+import pytest
+
+from src.ui.debug_overlay import LINE_HEIGHT, DebugOverlay
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_samples_at_rate_and_reuses_surface():
+    overlay = DebugOverlay(rate_hz=4)
+    calls = []
+
+    def sample():
+        calls.append(1)
+        return [f"FPS: {len(calls)}", "second line"]
+    screen = pygame.Surface((400, 200))
+    for frame in range(60):
+        overlay.draw(screen, sample, now=frame / 60)
+    # 1 с при 4 Гц: снимки на 0, 0.25, 0.5, 0.75 с
+    assert len(calls) == 4
+    assert overlay._surface.get_height() >= LINE_HEIGHT * 2
+    overlay.invalidate()
+    overlay.draw(screen, sample, now=1.01)
+    assert len(calls) == 5
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        DebugOverlay(rate_hz=0)
+
+
+def test_game_debug_panel_walks_enemies_at_overlay_rate(tmp_path, monkeypatch):
+    from src.core.game import Game
+    (tmp_path / "data").symlink_to(os.path.abspath("data"))
+    monkeypatch.chdir(tmp_path)
+    game = Game()
+    try:
+        game.start_new_game()
+        game.show_debug = True
+        manager = game.world.enemy_manager
+        walks = []
+        real = manager.alive_by_type
+        monkeypatch.setattr(manager, "alive_by_type", lambda: walks.append(1) or real())
+        for _ in range(10):
+            game.draw()
+        assert len(walks) == 1
+    finally:
+        game.save_system.shutdown()
@@ -0,0 +1,95 @@
+"""
+Тесты FrameProfiler и ProfilerOverlay: окно из последних N кадров,
+min/avg/p99 по стадиям, совместимость со StageTimer, подмена таймера
+в Game по F3.
+"""
+import os
+
+import pygame
+import pytest
+
+from src.ui.profiler_overlay import ProfilerOverlay
+from src.utils.frame_profiler import FrameProfiler
+from src.utils.stage_timer import NULL_STAGE_TIMER
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _run(profiler, frames, stage_ms, frame_ms=16.0, start=0.0):
+    now = start
+    for i in range(frames):
+        profiler.begin_frame(now=now)
+        profiler.add('enemies', stage_ms(i))
+        profiler.add('enemies', 1.0)  # второй замер того же кадра складывается
+        now += frame_ms / 1000.0
+    profiler.begin_frame(now=now)
+    return now
+
+
+class TestFrameProfiler:
+
+    def test_window_keeps_last_frames(self):
+        profiler = FrameProfiler(capacity=10)
+        _run(profiler, 25, lambda i: float(i))
+        assert profiler.frames == 10
+        ((key, low, avg, p99),) = profiler.stats()
+        # Окно — кадры 15..24 (+1 мс второго замера)
+        assert key == 'enemies' and low == 16.0 and avg == 20.5
+        assert 24.0 < p99 <= 25.0
+        times = profiler.frame_times()
+        assert len(times) == 10 and times == pytest.approx([16.0] * 10)
+
+    def test_partial_window_and_stage_order(self):
+        profiler = FrameProfiler(capacity=100)
+        assert profiler.stats() == [] and profiler.frame_stats() is None
+        profiler.begin_frame(now=0.0)
+        profiler.add('render', 3.0)
+        profiler.add('events', 0.5)
+        profiler.begin_frame(now=0.02)
+        assert [row[0] for row in profiler.stats()] == ['events', 'render']
+        assert profiler.frame_stats() == pytest.approx((20.0, 20.0, 20.0))
+        # EMA StageTimer сохраняется — StressPanel читает get()
+        assert profiler.get('render') == 3.0
+
+    def test_overlay_renders_table_and_graph(self):
+        profiler = FrameProfiler(capacity=120)
+        _run(profiler, 120, lambda i: 40.0 if i == 60 else 2.0)
+        overlay = ProfilerOverlay(rate_hz=4)
+        screen = pygame.Surface((1024, 768))
+        overlay.draw(screen, profiler, now=0.0)
+        surface = overlay._surface
+        overlay.draw(screen, profiler, now=0.1)
+        assert overlay._surface is surface
+        overlay.draw(screen, profiler, now=0.3)
+        assert overlay._surface is not surface
+
+
+def test_game_f3_swaps_profiler_in_and_out(tmp_path, monkeypatch):
+    from src.core.game import Game, PROFILER_KEY
+    (tmp_path / "data").symlink_to(os.path.abspath("data"))
+    monkeypatch.chdir(tmp_path)
+    game = Game()
+    try:
+        game.start_new_game()
+        assert game.stage_timer is NULL_STAGE_TIMER
+        press = pygame.event.Event(pygame.KEYDOWN, key=PROFILER_KEY)
+        game._handle_playing_key(press)
+        assert game.stage_timer is game.frame_profiler
+        assert game.world.enemy_manager.stage_timer is game.frame_profiler
+        for _ in range(3):
+            game.frame_profiler.begin_frame()
+            game.update(1 / 60)
+            game.draw()
+        stages = {row[0] for row in game.frame_profiler.stats()}
+        assert {'player', 'enemies', 'contact', 'world', 'overlay', 'hud', 'flip'} <= stages
+        game._handle_playing_key(press)
+        assert game.stage_timer is NULL_STAGE_TIMER
+        assert game.world.enemy_manager.stage_timer is NULL_STAGE_TIMER
+    finally:
+        game.save_system.shutdown()
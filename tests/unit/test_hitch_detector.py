@@ -0,0 +1,123 @@
+"""
+Тесты HitchDetector: порог кадра, стек из потока-сторожа, события кадра,
+JSON lines лог и запись фриза из Game со стадиями и населением мира.
+"""
+import gc
+import json
+import os
+import threading
+import time
+
+import pygame
+import pytest
+
+from src.utils.frame_profiler import FrameProfiler
+from src.utils.hitch_detector import HitchDetector
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _slow_autosave(seconds):
+    time.sleep(seconds)
+
+
+class TestHitchDetector:
+
+    def test_fast_frames_leave_no_log(self, tmp_path):
+        detector = HitchDetector(threshold_ms=50, log_dir=str(tmp_path))
+        assert detector.begin_frame(now=0.0) is None
+        detector.note('autosave')
+        assert detector.begin_frame(now=0.016) is None
+        # События быстрого кадра не переезжают в следующий
+        record = detector.begin_frame(now=0.1, context=lambda: {"state": "playing"})
+        assert record["state"] == "playing" and record["events"] == []
+        assert detector.hitches == 1
+        assert os.listdir(tmp_path) == [os.path.basename(detector.log_path)]
+
+    def test_slow_frame_records_stack_and_events(self, tmp_path):
+        detector = HitchDetector(threshold_ms=40, log_dir=str(tmp_path),
+                                 sample_interval_ms=2)
+        detector.start()
+        try:
+            detector.begin_frame()
+            detector.note('autosave', reason='periodic')
+            _slow_autosave(0.08)
+            record = detector.begin_frame(context=lambda: {"entities": {"enemies": 7}})
+        finally:
+            detector.stop()
+        assert record["frame_ms"] >= 80 and record["entities"] == {"enemies": 7}
+        # Сборка мусора в этом кадре тоже попадает в события — её не считаем
+        events = [e for e in record["events"] if e["event"] != "gc"]
+        assert events == [{"event": "autosave", "reason": "periodic"}]
+        # Стеки сняты сторожем по ходу кадра, самый частый — во сне
+        assert record["stacks"] and "_slow_autosave" in record["stacks"][0]["stack"]
+        with open(detector.log_path, encoding="utf-8") as f:
+            (line,) = f.read().splitlines()
+        assert json.loads(line)["frame"] == record["frame"]
+
+    def test_gc_inside_begin_frame_does_not_deadlock(self, tmp_path):
+        detector = HitchDetector(threshold_ms=1000, log_dir=str(tmp_path),
+                                 sample_interval_ms=1)
+        threshold = gc.get_threshold()
+
+        heap = []
+
+        def frames():
+            for i in range(2000):
+                detector.begin_frame()
+                heap.append([i])  # куча медленно растёт — gc идёт чаще
+
+        # Сборка на каждой аллокации: колбэк gc срабатывает и внутри
+        # begin_frame(). Кадры — в отдельном потоке, чтобы зависание
+        # стало падением теста, а не вечным ожиданием
+        worker = threading.Thread(target=frames, daemon=True)
+        detector.start()
+        gc.set_threshold(1)
+        try:
+            worker.start()
+            worker.join(timeout=20)
+        finally:
+            gc.set_threshold(*threshold)
+            detector.stop()
+        assert not worker.is_alive()
+
+    def test_frame_profiler_last_frame(self):
+        profiler = FrameProfiler(capacity=1)
+        assert profiler.last_frame() == {}
+        for frame in range(3):
+            profiler.begin_frame(now=frame * 0.016)
+            profiler.add('enemies', 2.0 + frame)
+            profiler.add('world', 1.0)
+        profiler.begin_frame(now=0.05)
+        assert profiler.last_frame() == {'enemies': 4.0, 'world': 1.0}
+
+
+def test_game_hitch_record(tmp_path, monkeypatch):
+    from src.core.game import Game
+    (tmp_path / "data").symlink_to(os.path.abspath("data"))
+    monkeypatch.chdir(tmp_path)
+    game = Game()
+    try:
+        # По умолчанию выключен: ни таймера стадий, ни сторожа
+        assert game.hitch_detector is None and game._frame_stages is None
+        game.enable_hitch_detector(20)
+        assert game.stage_timer is game._frame_stages
+        game.hitch_detector.begin_frame(now=0.0)
+        game.start_new_game()
+        game.stage_timer.begin_frame(now=0.0)
+        game.update(1 / 60)
+        game.draw()
+        game.stage_timer.begin_frame(now=0.5)
+        record = game.hitch_detector.begin_frame(now=0.5, context=game._hitch_context)
+        assert record["state"] == "playing"
+        assert {'player', 'enemies', 'world', 'hud'} <= set(record["stages"])
+        assert record["entities"]["enemies"] == len(game.world.enemy_manager.enemies)
+        assert 'new_game' in [e["event"] for e in record["events"]]
+    finally:
+        game.save_system.shutdown()
@@ -0,0 +1,89 @@
+"""
+Тесты HUD: текст рендерится один раз на значение, статичная рамка
+собирается один раз на набор оружий, динамика поверх неё.
+"""
+import os
+
+import pygame
+import pytest
+
+from src.core.config_loader import get_color
+from src.entities.player import Player
+from src.ui import text
+from src.ui.hud import HUD
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture()
+def hud(monkeypatch):
+    """HUD + список строк, которые реально ушли в font.render."""
+    text.clear_cache()
+    renders = []
+    real_get_font = text.get_font
+
+    class _Counting:
+        def __init__(self, font):
+            self.font = font
+
+        def render(self, line, aa, color):
+            renders.append(line)
+            return self.font.render(line, aa, color)
+    monkeypatch.setattr(text, "get_font", lambda size, name=None: _Counting(real_get_font(size, name)))
+    hud = HUD()
+    hud.renders = renders
+    return hud
+
+
+def test_steady_frames_render_no_text(hud):
+    player = Player(100, 100)
+    screen = pygame.Surface((1024, 768))
+    hud.draw(screen, player)
+    first = len(hud.renders)
+    assert first > 0
+    frame = hud._frame
+    for _ in range(5):
+        hud.draw(screen, player)
+    assert len(hud.renders) == first
+    assert hud._frame is frame
+
+    player.stats.coins += 3
+    hud.draw(screen, player)
+    assert hud.renders[first:] == [f"$ {player.coins}"]
+
+
+def test_frame_rebuilt_only_when_loadout_changes(hud):
+    player = Player(100, 100)
+    screen = pygame.Surface((1024, 768))
+    hud.draw(screen, player)
+    frame = hud._frame
+    player.current_weapon_index = 1
+    hud.draw(screen, player)
+    assert hud._frame is frame
+    player.weapons = player.weapons[:2]
+    player.current_weapon_index = 0
+    hud.draw(screen, player)
+    assert hud._frame is not frame
+
+
+def test_dynamic_parts_drawn_over_frame(hud):
+    player = Player(100, 100)
+    player.health = player.max_health
+    screen = pygame.Surface((1024, 768))
+    hud.draw(screen, player)
+    # Полная полоска здоровья, белая рамка вокруг
+    assert screen.get_at((150, 20))[:3] == get_color('GREEN')
+    assert screen.get_at((9, 20))[:3] == get_color('WHITE')
+    # Активный слот 0 — белая рамка 3 px, неактивный слот 1 — серая 1 px
+    assert screen.get_at((11, 60))[:3] == get_color('WHITE')
+    assert screen.get_at((52, 60))[:3] == (60, 60, 60)
+    player.health = 0
+    screen.fill((0, 0, 0))
+    hud.draw(screen, player)
+    assert screen.get_at((150, 20))[:3] == get_color('DARK_GRAY')
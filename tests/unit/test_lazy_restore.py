@@ -0,0 +1,133 @@
+"""
+Тесты загрузки по регионам (LazyRestore): ближние к игроку строки до
+первого кадра, регион при подходе игрока, разбор очереди от ближних к
+дальним, старение пикапов в очереди, респавн выключен до конца,
+оборванный сейв.
+"""
+import io
+
+import pytest
+
+from src.systems import save_stream
+from src.systems.lazy_restore import LazyRestore
+from src.systems.save_stream import StreamedSave, iter_json_events, write_json
+
+
+class _Manager:
+    """Менеджер-приёмник: запоминает строки и state."""
+
+    def __init__(self):
+        self.rows = []
+        self.states = []
+
+    def deserialize(self, data):
+        self.rows = []
+
+    def restore_rows(self, rows):
+        self.rows.extend(rows)
+
+    def restore_state(self, data):
+        self.states.append(data)
+
+    def xs(self):
+        return sorted(r["x"] for r in self.rows)
+
+
+def _save(enemy_xs, pickup_xs=(), lifetime=30.0):
+    return {
+        "version": "1.1",
+        "player": {"x": 0, "y": 0},
+        "enemies": {"enemies": [{"type": "light", "x": float(x), "y": 0.0,
+                                 "attack_cooldown_timer": 1.0} for x in enemy_xs],
+                    "target_counts": {"light": 5}},
+        "pickups": [{"type": "coin", "x": float(x), "y": 0.0, "lifetime": lifetime}
+                    for x in pickup_xs],
+        "game_stats": {"enemies_killed": 3},
+    }
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch):
+    monkeypatch.setattr(save_stream, "ROW_BATCH", 4)
+
+
+def _restore(data, **kwargs):
+    enemies, pickups = _Manager(), _Manager()
+    done = []
+    kwargs.setdefault("radius", 100)
+    kwargs.setdefault("region", 100)
+    restore = LazyRestore(StreamedSave.from_data(data), enemies, pickups,
+                          on_done=lambda head, started: done.append(
+                              (sorted(started), head["enemies"])),
+                          **kwargs)
+    return restore, enemies, pickups, done
+
+
+class TestLazyRestore:
+
+    def test_near_rows_first_far_rows_wait(self):
+        restore, enemies, pickups, done = _restore(
+            _save([10, 50, 1000, 2000], [20, 3000]), budget_ms=1000)
+        assert restore.step(0.0, 0, 0, budget=0) is True
+        # Бюджет 0 — одна пачка, из неё в мир попали только ближние
+        assert enemies.xs() == [10.0, 50.0]
+        assert restore.pending == 2 and restore.streaming
+        # Респавн выключен, пока очередь не разобрана
+        assert enemies.states == [{}]
+        while not restore.done:
+            restore.step(0.0, 0, 0)
+        assert enemies.xs() == [10.0, 50.0, 1000.0, 2000.0]
+        assert pickups.xs() == [20.0, 3000.0]
+        # target_counts — колбэку, когда вся очередь в менеджерах
+        assert done == [(["enemies", "pickups"], {"target_counts": {"light": 5}})]
+
+    def test_first_step_does_not_grow_with_entity_count(self):
+        for n in (100, 10_000):
+            restore, enemies, _, _ = _restore(_save(range(5000, 5000 + n)))
+            restore.step(0.0, 0, 0, budget=0)
+            assert enemies.rows == [] and restore.pending <= 4
+
+    def test_region_restored_when_player_approaches(self):
+        restore, enemies, _, _ = _restore(_save(range(9000, 9100)))
+        while restore.streaming:
+            restore.step(0.0, 0, 0, budget=0)
+        assert len(enemies.rows) == 64 and restore.pending == 36
+        # Игрок подошёл — регион целиком в этом же кадре, даже без бюджета
+        restore.step(0.0, 8950, 0, budget=0)
+        assert enemies.xs() == [float(x) for x in range(9000, 9100)]
+        assert restore.done
+
+    def test_queue_drains_nearest_region_first(self):
+        restore, enemies, _, _ = _restore(_save([9000, 3000, 6000]))
+        seen = []
+        while not restore.done:
+            restore.step(0.0, 0, 0, budget=0)
+            seen.append(enemies.xs())
+        # Пока файл читается, очередь ждёт; потом — по региону за кадр
+        assert seen[0] == []
+        assert seen[-3:] == [[3000.0], [3000.0, 6000.0], [3000.0, 6000.0, 9000.0]]
+
+    def test_queued_rows_age_with_game_time(self):
+        restore, enemies, pickups, _ = _restore(
+            _save([8000], [6000, 7000, 9000], lifetime=5.0))
+        while restore.streaming:
+            restore.step(0.0, 0, 0, budget=0)
+        restore.step(2.0, 0, 0, budget=0)
+        assert [r["lifetime"] for r in pickups.rows] == [5.0, 3.0]
+        restore.step(1.0, 0, 0, budget=0)
+        assert enemies.rows[0]["attack_cooldown_timer"] == 0.0
+        # Пролежал в очереди дольше lifetime — в мир не попадает
+        restore.step(3.0, 0, 0, budget=0)
+        assert pickups.xs() == [6000.0, 7000.0]
+        assert restore.done
+
+    def test_truncated_save_fails_later_frame(self):
+        out = io.BytesIO()
+        write_json(out, _save(range(5000, 5040)))
+        broken = io.BytesIO(out.getvalue()[:len(out.getvalue()) // 2])
+        enemies, pickups = _Manager(), _Manager()
+        restore = LazyRestore(StreamedSave(iter_json_events(broken)), enemies,
+                              pickups, radius=100, region=100)
+        assert restore.step(0.0, 0, 0, budget=0) is True
+        assert restore.finish(0, 0) is False
+        assert restore.failed and restore.pending == 0
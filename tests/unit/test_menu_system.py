@@ -236,13 +236,8 @@ class TestMainMenu(unittest.TestCase):
         # Создаем реальный pygame Surface для тестов
         screen = pygame.Surface((800, 600))
         
-        # Патчим get_config и get_color для тестов
-        with patch('src.ui.menu.get_config') as mock_get_config, \
-             patch('src.ui.menu.get_color') as mock_get_color, \
-             patch('pygame.draw.rect') as mock_draw_rect:
-            
-            mock_get_config.side_effect = lambda key: {'WIDTH': 800, 'HEIGHT': 600}.get(key, 0)
-            mock_get_color.side_effect = lambda color: (255, 255, 255)  # Белый цвет
+        # Цвета и размер экрана меню берёт из конфига при создании
+        with patch('pygame.draw.rect') as mock_draw_rect:
             
             # Изменяем состояние сохранений
             def mock_exists_side_effect(path):
@@ -254,6 +249,8 @@ class TestMainMenu(unittest.TestCase):
             
             self.mock_exists.side_effect = mock_exists_side_effect
             self.mock_listdir.return_value = ["quicksave.json"]
+            # Каталог сейвов кэшируется — сейвы появились мимо SaveSystem
+            menu.invalidate_catalog()
             
             # Вызываем отрисовку, которая должна обновить меню
             menu.draw(screen)
@@ -298,5 +295,64 @@ class TestMainMenu(unittest.TestCase):
         self.assertTrue(menu.has_quicksave())
 
 
+
+class TestMainMenuSaveCatalog(unittest.TestCase):
+    """Каталог сейвов меню: без опроса диска в кадре, сброс по записям SaveSystem"""
+
+    def setUp(self):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.init()
+        self.original_cwd = os.getcwd()
+        self.tmp = tempfile.mkdtemp()
+        os.chdir(self.tmp)
+        from src.systems.save_system import SaveSystem
+        self.save_system = SaveSystem(save_format="json")
+        self.menu = MainMenu(self.save_system)
+        self.screen = pygame.Surface((1024, 768))
+
+    def tearDown(self):
+        self.save_system.shutdown()
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_draw_does_not_touch_filesystem(self):
+        self.menu.draw(self.screen)
+        with patch('src.ui.menu.os.listdir') as listdir, \
+                patch('src.ui.menu.os.path.exists') as exists:
+            for _ in range(30):
+                self.menu.draw(self.screen)
+        self.assertFalse(listdir.called or exists.called)
+
+    def test_save_system_write_and_delete_refresh_items(self):
+        from src.entities.player import Player
+        self.menu.draw(self.screen)
+        self.assertNotIn("Загрузить игру", self.menu.menu_items)
+        self.save_system.save_to_slot(1, Player(100, 100), None)
+        self.menu.draw(self.screen)
+        self.assertIn("Загрузить игру", self.menu.menu_items)
+        self.save_system.delete_slot(1)
+        self.menu.draw(self.screen)
+        self.assertNotIn("Загрузить игру", self.menu.menu_items)
+
+    def test_mtime_poll_catches_external_saves(self):
+        self.menu.draw(self.screen)
+        with open(os.path.join("saves", "quicksave.json"), "w") as f:
+            f.write("{}")
+        os.utime("saves", ns=(1, 1))
+        self.menu._catalog_polled_at -= 10
+        self.menu.draw(self.screen)
+        self.assertIn("Продолжить игру", self.menu.menu_items)
+
+    def test_frame_rerendered_only_on_selection_change(self):
+        with patch.object(self.menu, '_render_frame',
+                          wraps=self.menu._render_frame) as render:
+            for _ in range(5):
+                self.menu.draw(self.screen)
+            self.assertEqual(render.call_count, 1)
+            self.menu.selected_index = 1
+            self.menu.draw(self.screen)
+            self.assertEqual(render.call_count, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -91,3 +91,126 @@ class TestPickupManager:
         # В нашем случае dist=40 < 60, значит магнит работает
         assert p.x != old_x or p.collected
 
+
+    def test_far_pickups_are_not_processed(self, player):
+        """Пикапы вне ячеек магнита не получают attract()."""
+        pm = PickupManager()
+        far = CoinPickup(5000.0, 5000.0)
+        near = CoinPickup(player.x + 40, player.y)
+        pm.spawn(far)
+        pm.spawn(near)
+        with patch.object(CoinPickup, 'attract', autospec=True,
+                          return_value=False) as attract:
+            pm.update(0.1, player)
+        processed = [call.args[0] for call in attract.call_args_list]
+        assert near in processed
+        assert far not in processed
+
+    def test_far_pickup_collected_after_player_approaches(self, player):
+        pm = PickupManager()
+        p = CoinPickup(3000.0, 3000.0)
+        pm.spawn(p)
+        pm.update(0.1, player)
+        assert pm.count() == 1
+        player.x, player.y = 3000.0, 3000.0
+        player.rect = pygame.Rect(3000, 3000, 32, 32)
+        pm.update(0.1, player)
+        assert pm.count() == 0
+        player.stats.add_coins.assert_called_once()
+
+    def test_lifetime_change_after_spawn_reschedules(self, player):
+        """Ручная смена lifetime после spawn учитывается кучей сроков."""
+        pm = PickupManager()
+        p = HeartPickup(999.0, 999.0)
+        pm.spawn(p)
+        p.lifetime = 0.2
+        pm.update(0.1, player)
+        assert pm.count() == 1
+        assert p.lifetime == pytest.approx(0.1)
+        pm.update(0.2, player)
+        assert pm.count() == 0
+
+    def test_serialize_keeps_remaining_lifetime(self, player):
+        pm = PickupManager()
+        pm.spawn(XPOrbPickup(999.0, 999.0))
+        pm.update(2.0, player)
+        data = pm.serialize()
+        restored = PickupManager()
+        restored.deserialize(data)
+        assert restored.pickups[0].lifetime == pytest.approx(data[0]["lifetime"])
+
+
+class TestPickupStacking:
+
+    def test_nearby_coins_coalesce(self):
+        pm = PickupManager()
+        pm.coalesce_radius = 24
+        first = pm.spawn(CoinPickup(500.0, 500.0))
+        second = pm.spawn(CoinPickup(510.0, 505.0))
+        assert second is first
+        assert pm.count() == 1
+        assert first.value == 2
+
+    def test_hearts_and_distant_coins_do_not_coalesce(self):
+        pm = PickupManager()
+        pm.coalesce_radius = 24
+        pm.spawn(HeartPickup(500.0, 500.0))
+        pm.spawn(HeartPickup(502.0, 500.0))
+        pm.spawn(CoinPickup(500.0, 500.0))
+        pm.spawn(CoinPickup(900.0, 900.0))
+        assert pm.count() == 4
+
+    def test_stack_applies_full_value(self, player):
+        coin = CoinPickup(0, 0, value=7)
+        coin.amount = 2
+        coin.apply(player)
+        player.stats.add_coins.assert_called_once_with(14)
+
+    def test_cap_merges_oldest_without_losing_value(self, player):
+        pm = PickupManager()
+        pm.coalesce_radius = 0
+        pm.max_pickups = 5
+        for i in range(20):
+            pm.spawn(XPOrbPickup(3000.0 + i * 100.0, 3000.0))
+        # Лимит применяется одним проходом в update()
+        assert pm.count() == 20
+        pm.update(0.0, player)
+        assert pm.count() == 5
+        assert sum(p.value for p in pm.pickups) == 20
+        assert len(pm._grid) == 5
+
+    def test_cap_merges_into_nearest_of_same_type(self, player):
+        pm = PickupManager()
+        pm.coalesce_radius = 0
+        pm.max_pickups = 3
+        old = XPOrbPickup(3000.0, 3000.0)
+        pm.spawn(old)
+        pm.spawn(CoinPickup(3001.0, 3000.0))
+        near = pm.spawn(XPOrbPickup(3100.0, 3000.0))
+        far = pm.spawn(XPOrbPickup(9000.0, 9000.0))
+        pm.update(0.0, player)
+        assert old not in pm.pickups
+        assert near.value == 2 and far.value == 1
+
+    def test_cap_never_merges_hearts(self, player):
+        pm = PickupManager()
+        pm.coalesce_radius = 0
+        pm.max_pickups = 2
+        hearts = [pm.spawn(HeartPickup(3000.0 + i * 10, 3000.0)) for i in range(4)]
+        pm.update(0.0, player)
+        assert pm.count() == 4
+        assert all(h.value == 1 for h in hearts)
+
+    def test_value_survives_serialize(self):
+        pm = PickupManager()
+        pm.spawn(CoinPickup(10.0, 10.0, value=5))
+        data = pm.serialize()
+        assert data[0]["value"] == 5
+        restored = PickupManager()
+        restored.deserialize(data)
+        assert restored.pickups[0].value == 5
+
+    def test_old_saves_without_value_default_to_one(self):
+        pm = PickupManager()
+        pm.deserialize([{"type": "coin", "x": 1.0, "y": 2.0, "lifetime": 10.0}])
+        assert pm.pickups[0].value == 1
@@ -0,0 +1,109 @@
+"""
+Тесты ProfileCapture и StackSampler: файлы cProfile (.pstats + топ),
+collapsed-стеки сэмплера, метки окна в .meta.json, F7 / F8 в Game.
+"""
+import glob
+import json
+import os
+import pstats
+import time
+
+import pygame
+import pytest
+
+from src.utils.profile_capture import ProfileCapture
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _busy_frame(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+class TestProfileCapture:
+
+    def test_cprofile_writes_pstats_and_tags(self, tmp_path):
+        capture = ProfileCapture("cprofile", log_dir=str(tmp_path))
+        capture.start({"state": "playing", "entities": {"enemies": 5}})
+        _busy_frame(0.01)
+        stats_path, text_path, meta_path = capture.stop({"state": "menu"})
+        assert not capture.active
+        functions = {func[2] for func in pstats.Stats(stats_path).stats}
+        assert "_busy_frame" in functions
+        with open(text_path, encoding="utf-8") as f:
+            assert f.readline().startswith('# start: {"state": "playing"')
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        assert meta["mode"] == "cprofile" and meta["calls"] > 0
+        assert meta["start"]["entities"] == {"enemies": 5}
+        assert meta["stop"] == {"state": "menu"}
+        assert meta["files"] == [os.path.basename(stats_path), os.path.basename(text_path)]
+
+    def test_sampler_writes_collapsed_stacks(self, tmp_path):
+        capture = ProfileCapture("sample", log_dir=str(tmp_path), sample_interval_ms=2)
+        capture.start()
+        _busy_frame(0.1)
+        collapsed_path, meta_path = capture.stop()
+        with open(collapsed_path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        # «поток;внешний;...;внутренний N», самые частые сверху
+        counts = [int(line.rsplit(" ", 1)[1]) for line in lines]
+        assert counts == sorted(counts, reverse=True)
+        main = [line for line in lines if line.startswith("MainThread;")]
+        # Самый частый стек игрового потока — занятый кадр (последний
+        # снимок может застать сам stop())
+        assert main and "_busy_frame" in main[0]
+        with open(meta_path, encoding="utf-8") as f:
+            samples = json.load(f)["samples"]
+        assert samples > 1 and sum(int(line.rsplit(" ", 1)[1]) for line in main) == samples
+
+    def test_seconds_limit(self):
+        capture = ProfileCapture("sample", seconds=2.0)
+        assert not capture.expired()
+        capture.start()
+        try:
+            assert not capture.expired()
+            assert capture.expired(now=time.perf_counter() + 2.0)
+        finally:
+            capture._sampler.stop()
+        with pytest.raises(ValueError):
+            ProfileCapture("perf")
+
+
+def test_game_f7_f8_capture(tmp_path, monkeypatch):
+    from src.core.game import Game, CPROFILE_KEY, SAMPLER_KEY
+    (tmp_path / "data").symlink_to(os.path.abspath("data"))
+    monkeypatch.chdir(tmp_path)
+    game = Game()
+    try:
+        game.start_new_game()
+        for key, mode in ((CPROFILE_KEY, "cprofile"), (SAMPLER_KEY, "sample")):
+            press = pygame.event.Event(pygame.KEYDOWN, key=key)
+            game._handle_playing_key(press)
+            assert game.profile_capture.mode == mode
+            game.update(1 / 60)
+            game.draw()
+            game._handle_playing_key(press)
+            assert game.profile_capture is None
+        metas = sorted(glob.glob(os.path.join("logs", "profile_*.meta.json")))
+        assert len(metas) == 2
+        for path in metas:
+            with open(path, encoding="utf-8") as f:
+                meta = json.load(f)
+            assert meta["start"]["state"] == "playing"
+            assert meta["stop"]["entities"]["enemies"] == len(game.world.enemy_manager.enemies)
+        assert glob.glob(os.path.join("logs", "profile_*_cprofile.pstats"))
+        assert glob.glob(os.path.join("logs", "profile_*_sample.collapsed.txt"))
+    finally:
+        game.stop_capture()
+        game.save_system.shutdown()
@@ -0,0 +1,142 @@
+"""
+Тесты перемотки (RewindBuffer): порядок от нового к старому, упор в
+самый старый снимок, вытеснение по числу снимков и бюджету памяти,
+размер дельт, снимок и откат через SaveSystem.capture_state/apply_*.
+"""
+import os
+import random
+
+import pygame
+import pytest
+
+from src.core.config_loader import config_snapshot
+from src.core.game_stats import GameStats
+from src.entities.pickup import CoinPickup
+from src.entities.player import Player
+from src.systems.pickup_manager import PickupManager
+from src.systems.rewind import RewindBuffer, decode_state, encode_state
+from src.systems.save_system import SaveSystem
+from src.world.world import World
+
+MAP_FILE = os.path.abspath(os.path.join("data", "main_world.txt"))
+
+
+def _raw(i, n=100):
+    """Соседние снимки: те же пикапы, сдвинулся игрок и тикнул lifetime."""
+    rng = random.Random(7)
+    return encode_state({"player": {"x": i, "y": 0},
+                         "pickups": [{"type": "coin", "x": rng.uniform(0, 2000),
+                                      "y": rng.uniform(0, 2000),
+                                      "lifetime": 30.0 - i * 0.1} for _ in range(n)]})
+
+
+class TestRewindBuffer:
+
+    def test_steps_back_newest_first_and_stops_at_oldest(self):
+        buf = RewindBuffer(capacity=10, budget_bytes=1 << 20)
+        assert buf.step_back() is None
+        for i in range(4):
+            buf.push(_raw(i))
+        xs = [decode_state(buf.step_back())["player"]["x"] for _ in range(6)]
+        assert xs == [3, 2, 1, 0, 0, 0]
+        # Запись после перемотки продолжается от достигнутого снимка
+        buf.push(_raw(9))
+        assert [decode_state(buf.step_back())["player"]["x"] for _ in range(3)] == [9, 0, 0]
+
+    def test_capacity_evicts_oldest(self):
+        buf = RewindBuffer(capacity=3, budget_bytes=1 << 20)
+        for i in range(5):
+            buf.push(_raw(i))
+        assert len(buf) == 3
+        assert [decode_state(buf.step_back())["player"]["x"] for _ in range(3)] == [4, 3, 2]
+
+    def test_neighbour_snapshots_cost_a_delta_and_budget_holds(self):
+        size = len(_raw(0))
+        buf = RewindBuffer(capacity=1000, budget_bytes=size + 8000)
+        for i in range(500):
+            buf.push(_raw(i))
+        assert buf.nbytes <= size + 8000
+        deltas = len(buf) - 1
+        # Без словаря zlib ужимает снимок лишь до ~1/3 — дельта в разы меньше
+        assert deltas > 10 and (buf.nbytes - size) / deltas < size / 8
+        assert decode_state(buf.step_back())["player"]["x"] == 499
+
+
+@pytest.fixture(scope="module")
+def session():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    world = World(MAP_FILE)
+    player = Player(*world.get_player_start_position())
+    pickups = PickupManager()
+    world.enemy_manager.pickup_manager = pickups
+    world.enemy_manager.spawn_initial(player.x, player.y)
+    for i in range(40):
+        pickups.spawn(CoinPickup(100.0 + i * 40, 300.0), coalesce=False)
+    yield world, player, pickups, GameStats()
+    pygame.quit()
+
+
+@pytest.fixture()
+def ss(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = SaveSystem()
+    yield system
+    system.shutdown()
+
+
+def test_rewind_restores_world_through_apply_paths(ss, session):
+    world, player, pickups, stats = session
+    enemies = world.enemy_manager
+
+    def capture():
+        return encode_state(ss.capture_state(player, world, stats, pickups, enemies))
+    buf = RewindBuffer(capacity=100, budget_bytes=1 << 20)
+    buf.push(capture())
+    before = (player.x, player.health, enemies.alive_count(), pickups.count())
+    player.x += 96
+    player.health -= 3
+    enemies.enemies[0].health = 0
+    pickups.clear()
+    stats.record_enemy_kill(1)
+    buf.push(capture())
+    buf.step_back()
+    state = decode_state(buf.step_back())
+    ss.apply_save_data_to_player(player, state, verbose=False)
+    ss.apply_save_data_to_enemies(enemies, state, verbose=False)
+    ss.apply_save_data_to_pickups(pickups, state, verbose=False)
+    ss.apply_save_data_to_game_stats(stats, state, verbose=False)
+    assert (player.x, player.health, enemies.alive_count(), pickups.count()) == before
+    assert stats.enemies_killed == 0
+
+
+def test_history_at_pickup_cap_fits_default_budget(ss, session):
+    """Размер вместо секундомера: 10 с истории при лимите пикапов — в
+    бюджете [rewind] целиком, снимок кадра стоит дельту в разы меньше
+    полного."""
+    world, player, _, stats = session
+    cfg = config_snapshot()
+    rewind = cfg.rewind
+    pickups = PickupManager()
+    rng = random.Random(3)
+    for _ in range(pickups.max_pickups):
+        pickups.spawn(CoinPickup(rng.uniform(0, 2000), rng.uniform(0, 2000)),
+                      coalesce=False)
+    # Как в Game: снимок раз в interval_frames кадров, seconds секунд
+    capacity = int(rewind.seconds * cfg.display.fps // rewind.interval_frames)
+    step = rewind.interval_frames / cfg.display.fps
+    buf = RewindBuffer(capacity=capacity, budget_bytes=rewind.memory_kb * 1024)
+    x0 = player.x
+    try:
+        for i in range(capacity * 2):
+            player.x = x0 + i
+            pickups.timers.advance(step)
+            raw = encode_state(ss.capture_state(
+                player, world, stats, pickups, world.enemy_manager))
+            buf.push(raw)
+    finally:
+        player.x = x0
+    assert len(decode_state(raw)["pickups"]) == pickups.max_pickups
+    assert len(buf) == capacity
+    assert buf.nbytes <= buf.budget_bytes
+    assert (buf.nbytes - len(raw)) / (capacity - 1) < len(raw) / 8
@@ -0,0 +1,168 @@
+"""
+Тесты бинарного формата сохранений (save_codec) и его подключения в
+SaveSystem: round-trip, сжатие, fallback на JSON внутри META, порча,
+определение формата при загрузке, размер против JSON.
+"""
+import json
+import os
+import random
+
+import pytest
+
+from src.systems.save_codec import (
+    HEAD_SIZE, SaveFormatError, decode_save, encode_save, is_binary_save,
+    read_summary, save_summary,
+)
+from src.systems.save_system import SaveSystem
+
+
+def _save_data(enemies=50, pickups=30):
+    rng = random.Random(7)
+    return {
+        "version": "1.1",
+        "timestamp": "2025-01-01T00:00:00Z",
+        "player": {"x": 10, "y": 20, "health": 5, "max_health": 10,
+                   "facing_direction": "down", "iframe_timer": 0.0},
+        "world": {"current_map": "main_world", "discovered_areas": ["spawn"]},
+        "enemies": {
+            "enemies": [
+                {"type": rng.choice(["light", "heavy", "fast"]),
+                 "x": rng.uniform(0, 2000), "y": rng.uniform(0, 2000),
+                 "health": rng.randint(1, 3),
+                 "attack_cooldown_timer": rng.random()}
+                for _ in range(enemies)
+            ],
+            "target_counts": {"light": 5, "heavy": 2, "fast": 3},
+            "respawn_timer": 3.5,
+        },
+        "pickups": [
+            {"type": rng.choice(["heart", "coin", "xp_orb"]),
+             "x": rng.uniform(0, 2000), "y": rng.uniform(0, 2000),
+             "lifetime": rng.uniform(0, 30), "value": rng.randint(1, 9)}
+            for _ in range(pickups)
+        ],
+        "game_stats": {"play_time": 12.5, "enemies_killed": 4, "deaths": 0},
+        "inventory": {"items": [], "gold": 3},
+        "autosave_reason": "periodic",
+    }
+
+
+class TestCodec:
+
+    @pytest.mark.parametrize("compression", ["none", "zlib", "lzma"])
+    def test_roundtrip(self, compression):
+        data = _save_data()
+        blob = encode_save(data, compression)
+        assert is_binary_save(blob)
+        assert decode_save(blob) == data
+
+    def test_empty_and_missing_collections(self):
+        data = _save_data(enemies=0, pickups=0)
+        assert decode_save(encode_save(data)) == data
+        data["enemies"] = None
+        del data["pickups"]
+        assert decode_save(encode_save(data)) == data
+
+    def test_rows_outside_schema_stay_in_meta(self):
+        data = _save_data(enemies=3, pickups=3)
+        data["pickups"][0]["extra"] = "новое поле"
+        data["enemies"]["enemies"][1]["health"] = 2.5
+        data["game_stats"]["name"] = "text"
+        assert decode_save(encode_save(data)) == data
+
+    def test_corrupted_blob_raises(self):
+        blob = bytearray(encode_save(_save_data()))
+        blob[-5] ^= 0xFF
+        with pytest.raises(SaveFormatError):
+            decode_save(bytes(blob))
+        with pytest.raises(SaveFormatError):
+            decode_save(b"ZSAV\x01")
+        with pytest.raises(SaveFormatError):
+            decode_save(b'{"version": "1.1"}')
+
+    def test_summary_is_readable_from_fixed_head(self):
+        data = _save_data()
+        data["player"]["level"] = 3
+        blob = encode_save(data, "lzma")
+        assert read_summary(blob[:HEAD_SIZE]) == save_summary(data)
+
+    def test_container_v1_without_summary_still_decodes(self):
+        data = _save_data(enemies=5, pickups=5)
+        blob = encode_save(data, "zlib")
+        # v1: тот же заголовок, но версия 1 и без блока сводки
+        v1 = blob[:4] + (1).to_bytes(2, "little") + blob[6:12] + blob[HEAD_SIZE:]
+        assert read_summary(v1[:HEAD_SIZE]) is None
+        assert decode_save(v1) == data
+
+    def test_much_smaller_than_pretty_json(self):
+        data = _save_data(enemies=2000, pickups=400)
+        pretty = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        assert len(encode_save(data, "zlib")) * 2 < len(pretty)
+        # Позиции — случайные float64, поэтому 10x даёт только
+        # структура + сжатие на реальных (повторяющихся) данных
+        data["enemies"]["enemies"] = [
+            {"type": "light", "x": float(i % 64) * 32, "y": 100.0,
+             "health": 1, "attack_cooldown_timer": 0.0}
+            for i in range(2000)
+        ]
+        pretty = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        assert len(encode_save(data, "zlib")) * 10 < len(pretty)
+
+
+class _Player:
+    x, y, health, max_health = 1.0, 2.0, 3, 4
+    facing_direction = "down"
+    level, xp, coins, damage_bonus = 1, 0, 7, 0
+
+    class stats:
+        iframe_timer = 0.0
+
+
+@pytest.fixture()
+def saves(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestSaveSystemBinary:
+
+    def test_binary_quicksave_roundtrip(self, saves):
+        ss = SaveSystem(save_format="binary")
+        assert ss.save_game(_Player(), None) is True
+        path = os.path.join("saves", "quicksave.sav")
+        with open(path, "rb") as f:
+            assert is_binary_save(f.read(4))
+        data = ss.load_game()
+        assert data["player"]["coins"] == 7
+        assert ss.get_quicksave_metadata()["filename"] == "quicksave.sav"
+
+    def test_json_saves_load_with_binary_setting(self, saves):
+        SaveSystem(save_format="json").save_to_slot(1, _Player(), None)
+        ss = SaveSystem(save_format="binary")
+        assert ss.load_from_slot(1)["player"]["health"] == 3
+        # Перезапись слота в новом формате убирает старый JSON
+        ss.save_to_slot(1, _Player(), None)
+        assert sorted(os.listdir(os.path.join("saves", "manual"))) == ["slot_01.sav"]
+        assert [m["slot_id"] for m in ss.list_manual_saves()] == [1]
+
+    def test_binary_autosave_listing_and_rotation(self, saves):
+        ss = SaveSystem(save_format="binary")
+        for _ in range(3):
+            ss.autosave(_Player(), None, limit=2)
+        items = ss.list_autosaves()
+        assert sorted(i["slot_id"] for i in items) == [1, 2]
+        assert all(i["filename"].endswith(".sav") and i["valid"] for i in items)
+
+    def test_export_json(self, saves):
+        ss = SaveSystem(save_format="binary", compression="lzma")
+        ss.save_game(_Player(), None)
+        target = ss.export_json(os.path.join("saves", "quicksave.sav"))
+        with open(target, encoding="utf-8") as f:
+            assert json.load(f)["player"]["coins"] == 7
+
+    def test_corrupted_binary_returns_none(self, saves):
+        ss = SaveSystem(save_format="binary")
+        ss.save_game(_Player(), None)
+        with open(os.path.join("saves", "quicksave.sav"), "wb") as f:
+            f.write(b"ZSAV" + b"\x00" * 20)
+        assert ss.load_game() is None
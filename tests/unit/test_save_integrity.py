@@ -0,0 +1,138 @@
+"""
+Тесты контрольных сумм сейвов: CRC в JSON и .sav, verify_all() на пуле
+потоков с кэшем по (mtime, размер), отказ загружать битый сейв, старые
+файлы без суммы, SQLite-хранилище и пометка в SaveLoadMenu.
+"""
+import io
+import json
+import os
+import sqlite3
+
+import pygame
+import pytest
+
+from src.systems.save_codec import SaveFormatError, decode_save, encode_save, verify_save
+from src.systems.save_stream import verify_json, write_json
+from src.systems.save_system import SaveSystem
+from src.ui.save_load_menu import SaveLoadMenu
+
+
+class _Player:
+    x, y, health, max_health = 1.0, 2.0, 3, 4
+    facing_direction = "down"
+    level, xp, coins, damage_bonus = 2, 0, 7, 0
+
+    class stats:
+        iframe_timer = 0.0
+
+
+def _flip(path, old: bytes, new: bytes):
+    """Порча «тихая» для разбора: те же длина и синтаксис."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    assert raw.count(old) == 1
+    with open(path, "wb") as f:
+        f.write(raw.replace(old, new))
+
+
+@pytest.fixture()
+def chdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture(params=["json", "binary"])
+def ss(chdir, request):
+    system = SaveSystem(save_format=request.param, compression="none")
+    yield system
+    system.shutdown()
+
+
+class TestFormats:
+
+    def test_json_checksum_detects_rot_that_still_parses(self):
+        out = io.BytesIO()
+        write_json(out, {"version": "1.1", "player": {"coins": 7}, "pickups": []})
+        raw = out.getvalue()
+        assert verify_json(io.BytesIO(raw))
+        rotten = raw.replace(b'"coins": 7', b'"coins": 9')
+        assert json.loads(rotten)["player"]["coins"] == 9
+        assert not verify_json(io.BytesIO(rotten))
+
+    def test_legacy_json_without_checksum_checked_by_parsing(self):
+        raw = json.dumps({"version": "1.1", "player": {}}, indent=2).encode()
+        assert verify_json(io.BytesIO(raw))
+        assert not verify_json(io.BytesIO(raw[:-5]))
+
+    def test_binary_crc_catches_uncompressed_rot(self):
+        data = {"version": "1.1", "player": {"coins": 7}, "pickups": []}
+        blob = encode_save(data, "none")
+        assert verify_save(io.BytesIO(blob))
+        rotten = blob.replace(b'"coins":7', b'"coins":9')
+        assert not verify_save(io.BytesIO(rotten))
+        with pytest.raises(SaveFormatError):
+            decode_save(rotten)
+
+
+class TestVerifyAll:
+
+    def test_reports_every_save_and_refuses_corrupt_load(self, ss):
+        ss.save_game(_Player(), None)
+        ss.save_to_slot(2, _Player(), None)
+        ss.autosave(_Player(), None, reason="periodic")
+        results = ss.verify_all()
+        assert results == {("quicksave", None): True, ("autosave", 1): True,
+                           ("manual", 2): True}
+        # META .sav — компактный JSON, файл .json — с пробелом после ':'
+        sep = b":" if ss.save_format == "binary" else b": "
+        _flip(ss._slot_filepath(2), b'"coins"' + sep + b"7", b'"coins"' + sep + b"9")
+        assert ss.verify_all()[("manual", 2)] is False
+        assert ss.load_from_slot(2) is None
+        assert ss.list_manual_saves()[0]["valid"] is False
+
+    def test_unchanged_saves_are_not_reread(self, ss, monkeypatch):
+        ss.save_to_slot(1, _Player(), None)
+        ss.save_to_slot(3, _Player(), None)
+        calls = []
+        real = SaveSystem._verify_stream
+        monkeypatch.setattr(SaveSystem, "_verify_stream",
+                            staticmethod(lambda f: calls.append(1) or real(f)))
+        ss.verify_all()
+        ss.verify_all()
+        assert len(calls) == 2
+        ss.save_to_slot(3, _Player(), None)
+        os.utime(ss._slot_filepath(3), ns=(1, 1))
+        ss.verify_all()
+        assert len(calls) == 3
+
+    def test_sqlite_payload_checked(self, chdir):
+        ss = SaveSystem(backend="sqlite", save_format="binary", compression="none")
+        try:
+            ss.save_to_slot(4, _Player(), None)
+            assert ss.verify_all() == {("manual", 4): True}
+            with sqlite3.connect(os.path.join("saves", "saves.db")) as conn:
+                (payload,) = conn.execute("SELECT payload FROM saves").fetchone()
+                conn.execute("UPDATE saves SET payload = ?, saved_at = saved_at + 1",
+                             (bytes(payload).replace(b'"coins":7', b'"coins":9'),))
+            assert ss.verify_all() == {("manual", 4): False}
+        finally:
+            ss.shutdown()
+
+
+def test_menu_marks_corrupt_slot(chdir, monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    ss = SaveSystem()
+    try:
+        ss.save_to_slot(1, _Player(), None)
+        ss.save_to_slot(2, _Player(), None)
+        _flip(ss._slot_filepath(2), b'"coins": 7', b'"coins": 9')
+        menu = SaveLoadMenu(ss, mode=SaveLoadMenu.MODE_LOAD)
+        menu.wait_for_metadata()
+        assert [e["meta"]["valid"] for e in menu.entries] == [True, False]
+        # Проверка закэширована — при следующем открытии сразу, без фона
+        menu.refresh()
+        assert menu.entries[1]["meta"] == {"valid": False}
+        assert menu.entries[0]["meta"].get("pending")
+    finally:
+        ss.shutdown()
+        pygame.quit()
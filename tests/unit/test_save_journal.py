@@ -0,0 +1,169 @@
+"""
+Тесты журналируемых автосейвов (save_journal + SaveSystem в режиме
+journal): дельты по uid, допуски позиций/таймеров, replay базы и
+журнала, компактация, оборванный хвост, список/загрузка/удаление.
+"""
+import json
+import os
+
+import pytest
+
+from src.systems.save_journal import JournalState
+from src.systems.save_system import SaveSystem
+
+
+def _save_data(enemies, pickups, x=10.0, kills=0):
+    return {
+        "version": "1.1",
+        "timestamp": "2025-01-01T00:00:00Z",
+        "player": {"x": x, "y": 20.0, "health": 5, "max_health": 10},
+        "world": {"current_map": "main_world"},
+        "enemies": {
+            "enemies": [dict(e) for e in enemies],
+            "target_counts": {"light": 5},
+            "respawn_timer": 0.0,
+        },
+        "pickups": [dict(p) for p in pickups],
+        "game_stats": {"enemies_killed": kills},
+        "autosave_reason": "periodic",
+    }
+
+
+def _enemy(uid, x=100.0, health=3, cooldown=0.0):
+    return {"type": "light", "x": x, "y": 50.0, "health": health,
+            "attack_cooldown_timer": cooldown, "uid": uid}
+
+
+def _pickup(uid, lifetime=30.0, value=1):
+    return {"type": "coin", "x": 5.0, "y": 5.0, "lifetime": lifetime,
+            "value": value, "uid": uid}
+
+
+def _strip(save_data):
+    """save_data без uid — так его отдаёт загрузка."""
+    out = json.loads(json.dumps(save_data))
+    for row in out["enemies"]["enemies"] + out["pickups"]:
+        row.pop("uid", None)
+    return out
+
+
+@pytest.fixture()
+def ss(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return SaveSystem(autosave_mode="journal")
+
+
+def _log_records(ss):
+    with open(ss.journal.log_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class TestJournalDiff:
+
+    def test_unchanged_world_gives_empty_delta(self):
+        enemies = [_enemy(i) for i in range(1, 50)]
+        pickups = [_pickup(i, lifetime=30.0) for i in range(1, 20)]
+        old = JournalState.from_save_data(_save_data(enemies, pickups), 100.0, 1)
+        # Через 10 с пикапы «постарели» ровно на 10 с — это не изменение
+        aged = [_pickup(i, lifetime=20.0) for i in range(1, 20)]
+        new = JournalState.from_save_data(_save_data(enemies, aged), 110.0, 2)
+        record = old.diff(new, position_epsilon=1.0, timer_tolerance=0.1)
+        assert set(record) == {"seq", "clock"}
+
+    def test_delta_lists_only_changes(self):
+        enemies = [_enemy(i) for i in range(1, 6)]
+        old = JournalState.from_save_data(_save_data(enemies, []), 0.0, 1)
+        changed = [_enemy(1), _enemy(2, health=1), _enemy(3, x=100.5),
+                   _enemy(4, x=180.0), _enemy(9)]
+        new = JournalState.from_save_data(
+            _save_data(changed, [_pickup(1)], x=11.0, kills=1), 0.0, 2
+        )
+        record = old.diff(new, position_epsilon=1.0, timer_tolerance=0.1)
+        assert record["enemies"]["upd"] == [[2, {"health": 1}], [4, {"x": 180.0}]]
+        assert [row["uid"] for row in record["enemies"]["add"]] == [9]
+        assert record["enemies"]["del"] == [5]
+        assert record["pickups"]["add"][0]["uid"] == 1
+        assert record["doc"]["patch"] == {"player": {"x": 11.0},
+                                          "game_stats": {"enemies_killed": 1}}
+        old.apply(record)
+        restored = old.to_save_data()
+        assert len(restored["enemies"]["enemies"]) == 5
+        assert restored["player"]["x"] == 11.0
+
+
+class TestSaveSystemJournal:
+
+    def test_first_record_is_base_then_deltas_replay(self, ss):
+        enemies = [_enemy(i) for i in range(1, 101)]
+        first = _save_data(enemies, [_pickup(1)])
+        assert ss.journal.record(first, 0.0).startswith(
+            os.path.join(ss.autosave_dir, "journal", "base")
+        )
+        enemies[0]["health"] = 1
+        del enemies[1]
+        second = _save_data(enemies, [_pickup(1, lifetime=25.0)], kills=1)
+        assert ss.journal.record(second, 5.0) == ss.journal.log_path
+
+        (record,) = _log_records(ss)
+        assert record["enemies"] == {"upd": [[1, {"health": 1}]], "del": [2]}
+        assert "pickups" not in record
+        assert ss.load_from_autosave(SaveSystem.JOURNAL_SLOT_ID) == _strip(second)
+
+    def test_delta_bytes_scale_with_changes(self, ss):
+        enemies = [_enemy(i) for i in range(1, 2001)]
+        ss.journal.record(_save_data(enemies, []), 0.0)
+        enemies[10]["health"] = 1
+        ss.journal.record(_save_data(enemies, []), 1.0)
+        assert os.path.getsize(ss.journal.log_path) * 100 < ss.journal._base_bytes
+
+    def test_compaction_folds_journal_into_base(self, ss):
+        ss.journal.compact_every = 3
+        enemies = [_enemy(i) for i in range(1, 4)]
+        for step in range(5):
+            enemies[0]["health"] = 3 - step % 3
+            data = _save_data(enemies, [], kills=step)
+            # Компактацию _write_autosave ставит в очередь SaveWriter
+            ss._writer.submit(lambda d=data, t=float(step): ss._write_autosave(
+                lambda with_uid=False: d, 1, t))
+        ss.wait_for_pending()
+        assert len(_log_records(ss)) < 3
+        loaded = ss.load_from_autosave(SaveSystem.JOURNAL_SLOT_ID)
+        assert loaded["game_stats"]["enemies_killed"] == 4
+        assert loaded["enemies"]["enemies"][0]["health"] == enemies[0]["health"]
+
+    def test_torn_tail_is_ignored(self, ss):
+        enemies = [_enemy(1)]
+        ss.journal.record(_save_data(enemies, []), 0.0)
+        ss.journal.record(_save_data(enemies, [], kills=1), 1.0)
+        with open(ss.journal.log_path, "ab") as f:
+            f.write(b'{"seq": 3, "clock": 2.0, "doc": {"put"')
+        loaded = ss.load_from_autosave(SaveSystem.JOURNAL_SLOT_ID)
+        assert loaded["game_stats"]["enemies_killed"] == 1
+
+    def test_clock_going_back_writes_new_base(self, ss):
+        ss.journal.record(_save_data([_enemy(1)], []), 50.0)
+        ss.journal.record(_save_data([_enemy(1)], [], kills=1), 60.0)
+        path = ss.journal.record(_save_data([_enemy(7)], [], kills=2), 1.0)
+        assert path != ss.journal.log_path
+        assert _log_records(ss) == []
+        loaded = ss.load_from_autosave(SaveSystem.JOURNAL_SLOT_ID)
+        assert loaded["game_stats"]["enemies_killed"] == 2
+
+    def test_autosave_lists_loads_and_deletes_journal(self, ss):
+        class _Player:
+            x, y, health, max_health = 1.0, 2.0, 3, 4
+            facing_direction = "down"
+            level, xp, coins, damage_bonus = 2, 0, 0, 0
+
+            class stats:
+                iframe_timer = 0.0
+
+        assert ss.autosave(_Player(), None, reason="periodic") is True
+        assert ss.autosave(_Player(), None, reason="level_up") is True
+        assert not os.path.exists(os.path.join(ss.autosave_dir, "autosave_01.json"))
+        (meta,) = ss.list_autosaves()
+        assert meta["slot_id"] == SaveSystem.JOURNAL_SLOT_ID
+        assert meta["journal"] and meta["valid"] and meta["reason"] == "level_up"
+        assert ss.load_from_autosave(SaveSystem.JOURNAL_SLOT_ID)["player"]["level"] == 2
+        assert ss.delete_autosave(SaveSystem.JOURNAL_SLOT_ID) is True
+        assert ss.list_autosaves() == []
@@ -5,6 +5,7 @@ Tests for v0.3.2 SaveLoadMenu UI logic.
 не зависеть от фактического экрана.
 """
 import os
+import threading
 
 import pytest
 import pygame
@@ -232,3 +233,60 @@ def test_load_mode_delete_autosave_via_modal(save_system, player, world):
     assert menu.modal_kind == "autosave"
     action = menu.handle_input(_key(pygame.K_y))
     assert action["type"] == "delete_autosave"
+
+
+def test_autosave_being_written_is_a_pending_row(save_system, player, world):
+    """Меню не ждёт запись: автосейв в очереди — строка «запись…»,
+    после записи список перечитывается сам (catalog_revision)."""
+    save_system.save_to_slot(2, player, world)
+    gate = threading.Event()
+    save_system._writer.submit(gate.wait)
+    try:
+        save_system.autosave_async(player, world, reason="periodic")
+        menu = SaveLoadMenu(save_system, mode=SaveLoadMenu.MODE_LOAD)
+        assert [(e["kind"], e["slot_id"]) for e in menu.entries] == [
+            ("autosave", None), ("manual", 2)]
+        assert menu.entries[0]["meta"].get("writing")
+        # Недописанный автосейв нельзя ни загрузить, ни удалить
+        assert menu.handle_input(_key(pygame.K_RETURN)) is None
+        assert menu.handle_input(_key(pygame.K_DELETE)) is None
+        assert menu.modal is None
+        menu.handle_input(_key(pygame.K_DOWN))
+    finally:
+        gate.set()
+    save_system.wait_for_pending()
+    menu.draw(pygame.display.get_surface())
+    assert [(e["kind"], e["slot_id"]) for e in menu.entries] == [
+        ("autosave", 1), ("manual", 2)]
+    assert menu.entries[0]["source"] is not None
+    assert menu.entries[menu.selected_index]["slot_id"] == 2
+    save_system.shutdown()
+
+
+# --- Ленивые сводки ------------------------------------------------------
+
+def test_rows_appear_before_metadata_and_fill_in_background(
+    save_system, player, world
+):
+    player.health = 5
+    save_system.save_to_slot(2, player, world)
+    save_system.autosave(player, world, reason="level_up")
+    menu = SaveLoadMenu(save_system, mode=SaveLoadMenu.MODE_LOAD)
+    assert [e["kind"] for e in menu.entries] == ["autosave", "manual"]
+
+    menu.wait_for_metadata()
+    autosave, manual = menu.entries
+    assert manual["meta"]["hp"] == 5 and not manual["meta"].get("pending")
+    assert autosave["label"].endswith("(level_up)")
+
+
+def test_stale_metadata_from_previous_refresh_is_ignored(
+    save_system, player, world
+):
+    save_system.save_to_slot(1, player, world)
+    menu = SaveLoadMenu(save_system, mode=SaveLoadMenu.MODE_LOAD)
+    menu.set_mode(SaveLoadMenu.MODE_SAVE)
+    menu.wait_for_metadata()
+    assert len(menu.entries) == 10
+    assert menu.entries[0]["meta"]["valid"] is True
+    assert all(e["meta"] is None for e in menu.entries[1:])
@@ -182,6 +182,37 @@ def test_list_manual_saves_includes_corrupt_with_valid_false(
     assert 2 in slots and slots[2]["valid"] is False
 
 
+# --- Индекс сводок (saves/index.meta) -----------------------------------
+
+def test_metadata_comes_from_index_without_reading_saves(
+    save_system, player, world, monkeypatch
+):
+    player.health = 4
+    save_system.save_to_slot(1, player, world)
+    assert os.path.exists(os.path.join("saves", "index.meta"))
+
+    def _no_parse(path):
+        raise AssertionError(f"сейв разобран целиком: {path}")
+
+    # Новый экземпляр читает индекс с диска, а не из памяти
+    fresh = SaveSystem()
+    monkeypatch.setattr(fresh, "_read_summary", _no_parse)
+    (meta,) = fresh.list_manual_saves()
+    assert meta["valid"] is True and meta["hp"] == 4
+
+
+def test_index_entry_goes_stale_when_file_changes(save_system, player, world):
+    save_system.save_to_slot(1, player, world)
+    path = os.path.join("saves", "manual", "slot_01.json")
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    data["player"]["level"] = 9
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    (meta,) = save_system.list_manual_saves()
+    assert meta["level"] == 9
+
+
 # --- Полная сериализация: с pickups и game_stats -------------------------
 
 def test_round_trip_with_full_state(save_system, player, world):
@@ -0,0 +1,105 @@
+"""
+Тесты SQLite-хранилища сейвов (save_store + SaveSystem с backend=sqlite):
+quicksave/слоты/автосейвы через тот же API, ротация одной транзакцией,
+каталог без разбора payload, импорт файловых сейвов, проверка меню.
+"""
+import os
+import sqlite3
+
+import pytest
+
+from src.systems.save_store import SqliteSaveStore, store_has_saves
+from src.systems.save_system import SaveSystem
+
+
+class _Player:
+    x, y, health, max_health = 1.0, 2.0, 3, 4
+    facing_direction = "down"
+    level, xp, coins, damage_bonus = 2, 0, 7, 0
+
+    class stats:
+        iframe_timer = 0.0
+
+
+@pytest.fixture()
+def ss(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = SaveSystem(backend="sqlite")
+    yield system
+    system.shutdown()
+
+
+def _db_path():
+    return os.path.join("saves", SqliteSaveStore.FILENAME)
+
+
+class TestSqliteBackend:
+
+    def test_quicksave_and_slots_roundtrip_without_files(self, ss):
+        assert ss.quicksave_exists() is False
+        assert ss.save_game(_Player(), None) is True
+        assert ss.save_to_slot(2, _Player(), None) is True
+        assert ss.quicksave_exists() and ss.slot_exists(2)
+        assert not os.path.exists(os.path.join("saves", "quicksave.json"))
+        assert os.listdir(os.path.join("saves", "manual")) == []
+        assert ss.load_game()["player"]["coins"] == 7
+        assert ss.load_from_slot(2)["player"]["health"] == 3
+        assert ss.get_free_slot() == 1
+        meta = ss.get_quicksave_metadata()
+        assert meta["valid"] and meta["level"] == 2 and meta["filename"] == "quicksave"
+        assert ss.delete_slot(2) is True
+        assert ss.load_from_slot(2) is None
+
+    def test_autosave_rotation_replaces_oldest(self, ss):
+        for step in range(5):
+            _Player.coins = step
+            assert ss.autosave(_Player(), None, reason=f"r{step}", limit=3)
+        _Player.coins = 7
+        items = ss.list_autosaves()
+        assert sorted(i["slot_id"] for i in items) == [1, 2, 3]
+        assert [i["reason"] for i in items] == ["r4", "r3", "r2"]
+        assert ss.get_latest_autosave_metadata()["reason"] == "r4"
+        latest = ss.get_latest_autosave_metadata()["slot_id"]
+        assert ss.load_from_autosave(latest)["player"]["coins"] == 4
+        # Уменьшили лимит — лишние слоты удаляются той же транзакцией
+        ss.autosave(_Player(), None, limit=1)
+        assert [i["slot_id"] for i in ss.list_autosaves()] == [1]
+
+    def test_catalog_comes_from_columns(self, ss):
+        ss.save_game(_Player(), None)
+        ss.save_to_slot(3, _Player(), None)
+        ss.autosave(_Player(), None, reason="level_up")
+        entries = ss.list_saves()
+        assert [e["kind"] for e in entries] == ["quicksave", "autosave", "manual"]
+        # Порча payload не мешает списку: сводка лежит в столбцах
+        with sqlite3.connect(_db_path()) as conn:
+            conn.execute("UPDATE saves SET payload = x'00'")
+        meta = ss.read_entry_metadata(entries[1])
+        assert meta["valid"] and meta["reason"] == "level_up"
+        assert ss.load_from_slot(3) is None
+
+    def test_existing_file_saves_are_imported_once(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        files = SaveSystem(backend="files")
+        files.save_to_slot(4, _Player(), None)
+        files.autosave(_Player(), None, reason="periodic")
+        ss = SaveSystem(backend="sqlite")
+        try:
+            assert ss.slot_exists(4)
+            assert [i["reason"] for i in ss.list_autosaves()] == ["periodic"]
+            ss.delete_slot(4)
+        finally:
+            ss.shutdown()
+        # Повторный запуск не импортирует файлы снова
+        ss = SaveSystem(backend="sqlite")
+        try:
+            assert not ss.slot_exists(4)
+        finally:
+            ss.shutdown()
+
+    def test_store_has_saves_for_menu(self, ss):
+        assert store_has_saves(_db_path()) is False
+        ss.save_to_slot(1, _Player(), None)
+        assert store_has_saves(_db_path()) is True
+        assert store_has_saves(_db_path(), "quicksave") is False
+        assert store_has_saves(os.path.join("saves", "missing.db")) is False
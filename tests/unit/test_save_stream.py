@@ -0,0 +1,176 @@
+"""
+Тесты потоковой записи/чтения сейвов (save_stream, save_codec v3):
+JSON и .sav пачками, старый порядок ключей JSON, границы буфера,
+пиковая память при записи и чтении большого мира, загрузка в менеджеры
+пачками, оборванный файл.
+"""
+import io
+import json
+import os
+import tracemalloc
+
+import pytest
+
+from src.systems import save_stream
+from src.systems.save_codec import decode_save, encode_save, iter_save_events
+from src.systems.save_stream import (
+    RowStream, StreamedSave, iter_json_events, write_json,
+)
+from src.systems.save_system import SaveSystem
+
+
+def _pickup(i):
+    return {"type": "coin", "x": float(i), "y": 2.5, "lifetime": 30.0, "value": i % 7}
+
+
+def _enemy(i):
+    return {"type": "light", "x": float(i), "y": 50.0, "health": 3,
+            "attack_cooldown_timer": 0.0}
+
+
+def _save_data(enemies, pickups):
+    return {
+        "version": "1.1",
+        "timestamp": "2025-01-01T00:00:00Z",
+        "player": {"x": 10, "y": 20, "health": 5, "max_health": 10},
+        "world": {"current_map": "main_world"},
+        "enemies": {"enemies": enemies, "target_counts": {"light": 5},
+                    "respawn_timer": 1.5},
+        "pickups": pickups,
+        "game_stats": {"enemies_killed": 4, "play_time": 12.5},
+    }
+
+
+def _streamed(n):
+    """Тот же save_data, но коллекции — генераторы без списка в памяти."""
+    return _save_data(RowStream(lambda: (_enemy(i) for i in range(n))),
+                      RowStream(lambda: (_pickup(i) for i in range(n))))
+
+
+@pytest.fixture()
+def small_batches(monkeypatch):
+    monkeypatch.setattr(save_stream, "ROW_BATCH", 3)
+    monkeypatch.setattr(save_stream, "_READ_SIZE", 7)
+
+
+class TestFormats:
+
+    def test_json_stream_roundtrip_puts_rows_last(self, small_batches):
+        out = io.BytesIO()
+        write_json(out, _streamed(10))
+        text = out.getvalue().decode("utf-8")
+        data = json.loads(text)
+        assert data.pop("checksum").startswith("crc32:")
+        assert data == _save_data([_enemy(i) for i in range(10)],
+                                  [_pickup(i) for i in range(10)])
+        assert text.index('"game_stats"') < text.index('"pickups"')
+        save = StreamedSave(iter_json_events(io.BytesIO(out.getvalue())))
+        assert save.head["game_stats"]["enemies_killed"] == 4
+        batches = list(save.batches())
+        assert [len(rows) for name, rows in batches] == [3, 3, 3, 1] * 2
+
+    def test_old_json_key_order_and_empty_collections(self, small_batches):
+        data = _save_data([_enemy(i) for i in range(5)], [])
+        blob = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        save = StreamedSave(iter_json_events(io.BytesIO(blob)))
+        # Строки врагов стоят раньше game_stats — голова дочитывается потом
+        assert "game_stats" not in save.head
+        assert save.materialize() == data
+
+    def test_binary_writes_collections_in_chunks(self, small_batches):
+        data = _save_data([_enemy(i) for i in range(7)], [_pickup(i) for i in range(7)])
+        data["pickups"][4]["extra"] = "вне схемы"
+        blob = encode_save(data, "zlib")
+        events = list(iter_save_events(io.BytesIO(blob)))
+        rows = [len(e[2]) for e in events if e[0] == "rows"]
+        assert rows == [3, 3, 1, 3, 3, 1]
+        assert decode_save(blob) == data
+
+
+class _Player:
+    x, y, health, max_health = 1.0, 2.0, 3, 4
+    facing_direction = "down"
+    level, xp, coins, damage_bonus = 1, 0, 7, 0
+
+    class stats:
+        iframe_timer = 0.0
+
+
+@pytest.fixture()
+def ss(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return SaveSystem
+
+
+class _Rows:
+    """Менеджер-приёмник: считает строки, не храня их."""
+
+    def __init__(self):
+        self.restored = 0
+        self.state = None
+
+    @property
+    def enemies(self):
+        return range(self.restored)
+
+    def count(self):
+        return self.restored
+
+    def deserialize(self, data):
+        self.restored = 0
+
+    def restore_rows(self, rows):
+        self.restored += len(rows)
+
+    def restore_state(self, data):
+        self.state = data
+
+
+@pytest.mark.parametrize("save_format", ["json", "binary"])
+class TestSaveSystemStreaming:
+
+    def _peak(self, fn):
+        tracemalloc.start()
+        try:
+            fn()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def test_peak_memory_does_not_grow_with_world(self, ss, save_format, monkeypatch):
+        monkeypatch.setattr(save_stream, "ROW_BATCH", 128)
+        system = ss(save_format=save_format)
+        peaks = {}
+        for n in (1_000, 8_000):
+            path = os.path.join("saves", f"big_{n}")
+
+            def load():
+                with system._open_stream(path) as save:
+                    for _ in save.batches():
+                        pass
+            write_peak = self._peak(lambda: system._write_save_data(path, _streamed(n)))
+            peaks[n] = (write_peak, self._peak(load))
+        # 8x строк — пик почти тот же (пачки, буферы), а не 8x
+        for small, big in zip(peaks[1_000], peaks[8_000]):
+            assert big < small * 1.5 + 64 * 1024
+
+    def test_stream_load_applies_batches_to_managers(self, ss, save_format):
+        system = ss(save_format=save_format)
+        system._write_save_data(os.path.join("saves", "quicksave") + system._ext,
+                                _streamed(9_000))
+        save = system.load_game(stream=True)
+        assert save.head["player"]["health"] == 5
+        enemies, pickups = _Rows(), _Rows()
+        assert system.apply_save_stream(save, enemies, pickups) is True
+        assert (enemies.count(), pickups.count()) == (9_000, 9_000)
+        assert enemies.state == {"target_counts": {"light": 5}, "respawn_timer": 1.5}
+
+    def test_truncated_file_fails_mid_stream(self, ss, save_format):
+        system = ss(save_format=save_format)
+        path = os.path.join("saves", "quicksave") + system._ext
+        system._write_save_data(path, _streamed(20_000))
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) * 2 // 3)
+        save = system.load_game(stream=True)
+        assert save is not None  # голова цела
+        assert system.apply_save_stream(save, _Rows(), _Rows()) is False
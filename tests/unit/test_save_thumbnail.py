@@ -0,0 +1,164 @@
+"""
+Тесты превью миникарты слотов (save_thumbnail): отрисовка области вокруг
+игрока, PNG рядом со слотом с mtime сейва, устаревшее превью после
+перезаписи без мира, удаление вместе со слотом, автосейв и SQLite,
+подгрузка в SaveLoadMenu с кэшем по mtime.
+"""
+import os
+
+import pygame
+import pytest
+
+from src.systems.enemy_manager import EnemyManager
+from src.systems.save_system import SaveSystem
+from src.systems.save_thumbnail import capture_thumbnail, is_fresh
+from src.ui.save_load_menu import THUMBNAIL_SIZE, SaveLoadMenu
+from src.world.world import World
+
+MAP_FILE = os.path.abspath(os.path.join("data", "main_world.txt"))
+
+
+class _Player:
+    x, y, health, max_health = 500.0, 500.0, 3, 4
+    width = height = 32
+    facing_direction = "down"
+    level, xp, coins, damage_bonus = 2, 0, 7, 0
+    rect = pygame.Rect(500, 500, 32, 32)
+
+    class stats:
+        iframe_timer = 0.0
+
+
+class _Positions:
+    def __init__(self, *points):
+        self.points = list(points)
+
+    def positions_in(self, left, top, right, bottom):
+        return [(x, y) for x, y in self.points
+                if left <= x < right and top <= y < bottom]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture(scope="module")
+def world():
+    return World(MAP_FILE, width=2000, height=2000)
+
+
+@pytest.fixture()
+def ss(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = SaveSystem(save_format="json")
+    yield system
+    system.shutdown()
+
+
+def test_render_marks_player_and_entities(world):
+    player = _Player()
+    player.rect = pygame.Rect(400, 400, 32, 32)
+    render = capture_thumbnail(world, player, _Positions((416, 480)),
+                               _Positions((900, 900), (1900, 1900)),
+                               size=100, area=1000)
+    surface = render()
+    assert surface.get_size() == (100, 100)
+    # Область прижата к краю мира (0..1000): центр игрока (416, 416) — (41, 41)
+    assert surface.get_at((41, 41))[:3] == (255, 255, 255)
+    assert surface.get_at((41, 48))[:3] == (220, 60, 60)
+    assert surface.get_at((90, 90))[:3] == (255, 215, 0)
+    assert capture_thumbnail(None, _Player()) is None
+
+
+def test_terrain_grid_built_once(world):
+    grid = world.terrain_grid()
+    assert grid is world.terrain_grid()
+    tiles_x, tiles_y, cells, palette = grid
+    assert len(cells) == tiles_x * tiles_y and max(cells) < len(palette)
+
+
+class TestSaveSystemThumbnails:
+
+    def test_slot_thumbnail_follows_slot_version(self, ss, world):
+        ss.save_to_slot(2, _Player(), world)
+        ss.wait_for_pending()
+        path = ss.thumbnail_path("manual", 2)
+        assert path == os.path.join("saves", "manual", "slot_02.png")
+        entry = ss.list_saves()[0]
+        assert is_fresh(path, entry["mtime"])
+        assert ss.entry_thumbnail(entry).get_size() == (96, 96)
+        # Перезапись без мира — старая картинка не выдаётся за новую
+        os.utime(ss._slot_filepath(2), (1, 1))
+        ss.save_to_slot(2, _Player(), None)
+        ss.wait_for_pending()
+        assert ss.entry_thumbnail(ss.list_saves()[0]) is None
+        ss.delete_slot(2)
+        ss.wait_for_pending()
+        assert not os.path.exists(path)
+
+    def test_autosave_thumbnail_for_picked_slot(self, ss, world):
+        ss.autosave_async(_Player(), world, limit=2)
+        ss.autosave_async(_Player(), world, limit=2)
+        ss.wait_for_pending()
+        entries = ss.list_saves()
+        assert sorted(e["slot_id"] for e in entries) == [1, 2]
+        assert all(ss.entry_thumbnail(e) is not None for e in entries)
+
+    def test_async_autosave_draws_enemies_from_captured_rows(self, ss, world,
+                                                             monkeypatch):
+        enemies = EnemyManager(world)
+        enemies.restore_rows([{"type": "light", "x": 520, "y": 560}])
+
+        def scan_in_frame(*bounds):
+            raise AssertionError("positions_in в кадре")
+        monkeypatch.setattr(enemies, "positions_in", scan_in_frame)
+        ss.autosave_async(_Player(), world, enemy_manager=enemies)
+        # Враг ушёл после снимка — на превью он там, где был при сейве
+        enemies.enemies.clear()
+        ss.wait_for_pending()
+        surface = ss.entry_thumbnail(ss.list_saves()[0])
+        assert surface is not None
+        assert any(surface.get_at((x, y))[:3] == (220, 60, 60)
+                   for x in range(96) for y in range(96))
+
+    def test_sqlite_thumbnail_stamped_with_saved_at(self, tmp_path, monkeypatch, world):
+        monkeypatch.chdir(tmp_path)
+        system = SaveSystem(backend="sqlite")
+        try:
+            system.save_game(_Player(), world)
+            system.wait_for_pending()
+            (entry,) = system.list_saves()
+            assert os.path.exists(os.path.join("saves", "quicksave.png"))
+            assert system.entry_thumbnail(entry, 40).get_size() == (40, 40)
+        finally:
+            system.shutdown()
+
+    def test_disabled_in_config(self, ss, world):
+        ss.thumbnails = False
+        ss.save_to_slot(1, _Player(), world)
+        ss.wait_for_pending()
+        assert not os.path.exists(ss.thumbnail_path("manual", 1))
+
+
+def test_menu_streams_thumbnails_and_caches_by_mtime(ss, world, monkeypatch):
+    ss.save_to_slot(1, _Player(), world)
+    ss.save_to_slot(3, _Player(), None)
+    menu = SaveLoadMenu(ss, mode=SaveLoadMenu.MODE_LOAD)
+    menu.wait_for_metadata()
+    first, second = (menu._thumbnail(e["source"]) for e in menu.entries)
+    assert first.get_size() == (THUMBNAIL_SIZE, THUMBNAIL_SIZE)
+    assert second is None
+    menu.draw(pygame.Surface((1024, 768)))
+    # Повторное открытие: неизменившийся слот не перечитывается
+    calls = []
+    real = ss.entry_thumbnail
+    monkeypatch.setattr(ss, "entry_thumbnail",
+                        lambda entry, size=None: calls.append(entry["slot_id"])
+                        or real(entry, size))
+    menu.refresh()
+    menu.wait_for_metadata()
+    assert calls == [3]
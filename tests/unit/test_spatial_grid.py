@@ -0,0 +1,39 @@
+"""
+Тесты для SpatialGrid.
+"""
+from src.utils.spatial_grid import SpatialGrid
+
+
+class _Obj:
+    pass
+
+
+class TestSpatialGrid:
+
+    def test_query_returns_only_nearby_cells(self):
+        grid = SpatialGrid(50)
+        a, b = _Obj(), _Obj()
+        grid.insert(a, 10, 10)
+        grid.insert(b, 1000, 1000)
+        found = grid.query_rect(0, 0, 60, 60)
+        assert a in found
+        assert b not in found
+
+    def test_move_across_cells(self):
+        grid = SpatialGrid(50)
+        a = _Obj()
+        grid.insert(a, 10, 10)
+        grid.move(a, 510, 10)
+        assert a not in grid.query_rect(0, 0, 40, 40)
+        assert a in grid.query_rect(500, 0, 520, 20)
+        assert len(grid) == 1
+        assert grid.cell_count == 1
+
+    def test_remove_drops_empty_cell(self):
+        grid = SpatialGrid(50)
+        a = _Obj()
+        grid.insert(a, -30, -30)  # отрицательные координаты тоже валидны
+        grid.remove(a)
+        grid.remove(a)  # повторное удаление — no-op
+        assert a not in grid
+        assert grid.cell_count == 0
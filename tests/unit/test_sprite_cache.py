@@ -0,0 +1,78 @@
+"""
+Тесты для SpriteCache и батч-отрисовки врагов/пикапов.
+"""
+import pygame
+import pytest
+from unittest.mock import MagicMock
+
+from src.entities.enemy import Enemy, EnemyStats
+from src.entities.enemy_ai import IdleBehavior
+from src.entities.pickup import CoinPickup, HeartPickup, XPOrbPickup
+from src.systems.enemy_manager import EnemyManager
+from src.systems.pickup_manager import PickupManager
+from src.utils.sprite_cache import SpriteCache, blit_batch
+
+
+@pytest.fixture
+def stats():
+    return EnemyStats(name='Light', max_health=4, speed=80, width=24,
+                      height=24, color=(200, 80, 80), damage=1)
+
+
+def _enemy(stats, x=100, y=100):
+    return Enemy(x, y, stats, IdleBehavior(), pygame.Rect(0, 0, 400, 400))
+
+
+class TestSpriteCache:
+
+    def test_surfaces_are_reused(self, stats):
+        cache = SpriteCache()
+        assert cache.pickup(CoinPickup) is cache.pickup(CoinPickup)
+        assert cache.enemy(stats) is cache.enemy(stats)
+        assert cache.enemy(stats, flashing=True) is not cache.enemy(stats)
+
+    def test_health_bar_steps(self):
+        cache = SpriteCache()
+        assert cache.health_bar(24, 1, 4) is not cache.health_bar(24, 2, 4)
+        assert cache.health_bar(24, 2, 4) is cache.health_bar(24, 2, 4)
+        bar = cache.health_bar(24, 2, 4)
+        assert bar.get_at((0, 0))[:3] == (60, 200, 60)
+        assert bar.get_at((23, 0))[:3] == (40, 40, 40)
+
+    @pytest.mark.parametrize('cls', [HeartPickup, CoinPickup, XPOrbPickup])
+    def test_pickup_sprite_matches_direct_draw(self, cls):
+        direct = pygame.Surface((64, 64))
+        cached = pygame.Surface((64, 64))
+        cls(20.0, 30.0).draw(direct, 0, 0)
+        blit_batch(cached, [(SpriteCache().pickup(cls), (20, 30))])
+        for x in range(64):
+            for y in range(64):
+                assert direct.get_at((x, y)) == cached.get_at((x, y))
+
+
+class TestBatchedDraw:
+
+    def test_enemy_manager_matches_enemy_draw(self, stats):
+        world = MagicMock()
+        manager = EnemyManager(world)
+        enemy = _enemy(stats)
+        enemy.health = 2  # с полоской HP
+        manager.enemies.append(enemy)
+
+        direct = pygame.Surface((320, 240))
+        batched = pygame.Surface((320, 240))
+        enemy.draw(direct, 50, 50)
+        manager.draw(batched, 50, 50)
+        assert pygame.image.tobytes(direct, 'RGB') == \
+            pygame.image.tobytes(batched, 'RGB')
+
+    def test_pickup_manager_culls_offscreen(self):
+        pm = PickupManager()
+        pm.spawn(CoinPickup(10.0, 10.0))
+        pm.spawn(CoinPickup(5000.0, 5000.0))
+        screen = MagicMock()
+        screen.get_width.return_value = 320
+        screen.get_height.return_value = 240
+        pm.draw(screen, 0, 0)
+        batch = (screen.fblits.call_args or screen.blits.call_args).args[0]
+        assert len(batch) == 1
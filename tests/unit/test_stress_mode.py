@@ -0,0 +1,127 @@
+"""
+Тесты stress-режима «орда»: распределение популяции, порционный доспавн,
+StageTimer и панель.
+"""
+import os
+
+import pygame
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+pygame.init()
+
+from src.core.config_loader import load_config
+load_config()
+
+from src.systems.enemy_manager import EnemyManager
+from src.systems.stress_mode import (
+    StressMode, split_population, resolve_stress_population,
+)
+from src.utils.stage_timer import StageTimer, NULL_STAGE_TIMER
+
+
+class _OpenWorld:
+    """Большой мир без препятствий — спавн всегда успешен."""
+    width = 8000
+    height = 8000
+
+    def check_collision(self, rect):
+        return False
+
+
+@pytest.fixture
+def manager():
+    return EnemyManager(_OpenWorld())
+
+
+class TestSplitPopulation:
+
+    def test_sum_is_exact(self):
+        for population in (1, 7, 1000, 5000, 20000):
+            counts = split_population(population, (5, 2, 3))
+            assert sum(counts.values()) == population
+
+    def test_proportional(self):
+        counts = split_population(1000, (5, 2, 3))
+        assert counts == {'light': 500, 'heavy': 200, 'fast': 300}
+
+    def test_zero_weight_type_gets_nothing(self):
+        counts = split_population(100, (1, 0, 1))
+        assert counts['heavy'] == 0
+
+
+class TestStressMode:
+
+    def test_top_up_respects_per_frame_limit(self, manager):
+        stress = StressMode(manager, 100, mix=(1, 1, 1), spawn_per_frame=30)
+        spawned = stress.update(player_x=0, player_y=0)
+        assert spawned == 30
+        assert len(manager.enemies) == 30
+
+    def test_population_reached_and_kept(self, manager):
+        stress = StressMode(manager, 60, mix=(1, 1, 1), spawn_per_frame=25)
+        for _ in range(5):
+            stress.update(player_x=0, player_y=0)
+        assert len(manager.enemies) == 60
+        assert manager.alive_by_type() == {'light': 20, 'heavy': 20, 'fast': 20}
+
+        # Убиваем часть — следующий кадр доспавнивает
+        for e in manager.enemies[:10]:
+            e.health = 0
+        manager.update(0.016)
+        assert len(manager.enemies) == 50
+        stress.update(player_x=0, player_y=0)
+        assert len(manager.enemies) == 60
+
+    def test_manager_respawn_is_batched(self, manager):
+        StressMode(manager, 90, mix=(1, 1, 1), spawn_per_frame=10)
+        manager._respawn_timer = 0
+        manager.update(0.016, player_x=0, player_y=0)
+        assert len(manager.enemies) == 10
+
+    def test_resolve_population_cli_wins(self):
+        assert resolve_stress_population(5000) == 5000
+        assert resolve_stress_population(0) is None
+
+
+class TestStageTimer:
+
+    def test_measure_records_time(self):
+        timer = StageTimer()
+        with timer.measure('ai'):
+            sum(range(1000))
+        assert timer.get('ai') > 0
+        assert 'ai' in timer.snapshot()
+
+    def test_ema_smoothing(self):
+        timer = StageTimer(smoothing=0.5)
+        timer.add('render', 10.0)
+        timer.add('render', 20.0)
+        assert timer.get('render') == pytest.approx(15.0)
+        assert timer.last('render') == pytest.approx(20.0)
+
+    def test_null_timer_is_noop(self):
+        with NULL_STAGE_TIMER.measure('ai'):
+            pass
+        assert NULL_STAGE_TIMER.get('ai') == 0.0
+        assert NULL_STAGE_TIMER.snapshot() == {}
+
+    def test_manager_reports_ai_and_loot(self, manager):
+        timer = StageTimer()
+        manager.stage_timer = timer
+        manager.update(0.016)
+        snap = timer.snapshot()
+        assert 'ai' in snap and 'loot' in snap
+
+
+class TestStressPanel:
+
+    def test_draw_does_not_crash(self, manager):
+        from src.ui.stress_panel import StressPanel
+        pygame.init()  # другие модули тестов могли вызвать pygame.quit()
+        screen = pygame.Surface((1024, 768))
+        stress = StressMode(manager, 10, mix=(1, 1, 1), spawn_per_frame=10)
+        stress.update(0, 0)
+        timer = StageTimer()
+        timer.add('render', 3.5)
+        StressPanel().draw(screen, timer, stress, pickup_count=5, fps=60.0)
@@ -0,0 +1,65 @@
+"""
+Тесты общего текстового слоя (src/ui/text.py): общие шрифты, кэш строк,
+сброс кэша при pygame.quit, экраны без создания шрифтов в draw.
+"""
+import os
+from unittest.mock import patch
+
+import pygame
+import pytest
+
+from src.core.game_stats import GameStats
+from src.systems.save_system import SaveSystem
+from src.ui import text
+from src.ui.game_over import GameOverScreen
+from src.ui.menu import MainMenu
+from src.ui.save_load_menu import SaveLoadMenu
+
+
+@pytest.fixture(autouse=True)
+def display():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_fonts_and_strings_are_shared():
+    assert text.get_font(32) is text.get_font(32)
+    first = text.render_text("Новая игра", 48, (255, 255, 0))
+    assert text.render_text("Новая игра", 48, (255, 255, 0)) is first
+    assert text.render_text("Новая игра", 48, (255, 255, 255)) is not first
+    rect = text.draw_text(pygame.Surface((200, 100)), "Новая игра", 48, (255, 255, 0),
+                          center=(100, 50))
+    assert rect.size == first.get_size() and rect.center == (100, 50)
+
+
+def test_cache_dropped_on_quit_and_bounded(monkeypatch):
+    text.render_text("abc", 20, (255, 255, 255))
+    pygame.quit()
+    assert not text._fonts and not text._strings
+    pygame.init()
+    monkeypatch.setattr(text, "_STRING_CACHE_LIMIT", 3)
+    for i in range(5):
+        text.render_text(str(i), 20, (255, 255, 255))
+    assert [key[-1] for key in text._strings] == ["2", "3", "4"]
+
+
+def test_screens_draw_without_creating_fonts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    screen = pygame.Surface((1024, 768))
+    menu = MainMenu()
+    game_over = GameOverScreen(1024, 768, GameStats())
+    save_system = SaveSystem()
+    try:
+        slots = SaveLoadMenu(save_system, mode=SaveLoadMenu.MODE_SAVE)
+        screens = (menu, game_over, slots)
+        for ui in screens:
+            ui.draw(screen)
+        with patch("pygame.font.Font") as font_cls:
+            for _ in range(3):
+                for ui in screens:
+                    ui.draw(screen)
+            assert not font_cls.called
+    finally:
+        save_system.shutdown()
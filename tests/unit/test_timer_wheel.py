@@ -0,0 +1,114 @@
+"""
+Тесты для TimerWheel, Countdown и перевода сущностей на общие часы.
+"""
+import pytest
+
+from src.utils.timer_wheel import Clock, Countdown, TimerWheel, bind_countdowns
+
+
+class _Entity:
+    cooldown = Countdown()
+
+    def __init__(self, timers):
+        self.timers = timers
+
+
+class TestTimerWheel:
+
+    def test_fires_not_before_deadline(self):
+        wheel = TimerWheel()
+        fired = []
+        wheel.schedule(0.5, fired.append, 'a')
+        wheel.advance(0.49)
+        assert fired == []
+        wheel.advance(0.02)
+        assert fired == ['a']
+        assert len(wheel) == 0
+
+    def test_fires_in_deadline_order_within_one_advance(self):
+        wheel = TimerWheel()
+        fired = []
+        wheel.schedule(3.0, fired.append, 3)
+        wheel.schedule(1.0, fired.append, 1)
+        wheel.schedule(2.0, fired.append, 2)
+        wheel.advance(5.0)
+        assert fired == [1, 2, 3]
+
+    def test_far_deadline_cascades_through_levels(self):
+        wheel = TimerWheel()
+        fired = []
+        wheel.schedule(600.0, fired.append, 'far')  # > 64*64 тиков
+        for _ in range(599):
+            wheel.advance(1.0)
+        assert fired == []
+        wheel.advance(1.01)
+        assert fired == ['far']
+
+    def test_cancel(self):
+        wheel = TimerWheel()
+        fired = []
+        handle = wheel.schedule(0.1, fired.append, 'x')
+        handle.cancel()
+        wheel.advance(1.0)
+        assert fired == []
+        assert len(wheel) == 0
+
+    def test_callback_can_reschedule(self):
+        wheel = TimerWheel()
+        fired = []
+
+        def tick():
+            fired.append(wheel.now)
+            if len(fired) < 3:
+                wheel.schedule(1.0, tick)
+        wheel.schedule(1.0, tick)
+        for _ in range(40):
+            wheel.advance(0.1)
+        assert len(fired) == 3
+
+
+class TestCountdown:
+
+    def test_counts_down_without_ticking(self):
+        clock = Clock()
+        e = _Entity(clock)
+        assert e.cooldown == 0.0
+        e.cooldown = 0.5
+        clock.advance(0.2)
+        assert e.cooldown == pytest.approx(0.3)
+        clock.advance(1.0)
+        assert e.cooldown == 0.0
+
+    def test_bind_keeps_remaining(self):
+        own = Clock()
+        e = _Entity(own)
+        e.cooldown = 0.5
+        own.advance(0.1)
+        shared = TimerWheel(now=100.0)
+        bind_countdowns(e, shared)
+        assert e.timers is shared
+        assert e.cooldown == pytest.approx(0.4)
+
+
+class TestSharedTimers:
+
+    def test_enemy_manager_drives_enemy_countdowns(self):
+        from unittest.mock import MagicMock
+        from src.core.config_loader import load_config
+        from src.systems.enemy_manager import EnemyManager
+        load_config()
+        world = MagicMock()
+        world.width = world.height = 4000
+        world.check_collision.return_value = False
+        manager = EnemyManager(world)
+        enemy = manager.spawn_enemy('light', 0, 0)
+        assert enemy.timers is manager.timers
+        enemy.attack_cooldown_timer = 0.5
+        manager.update(0.3)
+        assert enemy.attack_cooldown_timer == pytest.approx(0.2)
+
+        shared = TimerWheel()
+        manager.bind_timers(shared)
+        assert enemy.timers is shared
+        manager.update(0.1)  # общие часы двигает владелец, не менеджер
+        assert enemy.attack_cooldown_timer == pytest.approx(0.2)
@@ -0,0 +1,113 @@
+"""
+Тесты Tracer: no-op без записи, формат Chrome trace, предел буфера,
+сборки мусора на таймлайне, запись по F4 в Game.
+"""
+import gc
+import glob
+import json
+import os
+import threading
+
+import pygame
+import pytest
+
+from src.utils.trace import Tracer, TRACER
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestTracer:
+
+    def test_idle_tracer_records_nothing(self):
+        tracer = Tracer()
+        with tracer.span('frame') as span:
+            span.annotate(ignored=True)
+        tracer.instant('level_up')
+        tracer.counter('entities', enemies=3)
+        assert tracer.event_count == 0
+        # Без записи — один общий no-op на все вызовы
+        assert tracer.span('a') is tracer.span('b')
+
+    def test_chrome_events_and_file(self, tmp_path):
+        tracer = Tracer()
+        tracer.start()
+        with tracer.span('respawn', cat='enemies') as span:
+            span.annotate(spawned=4)
+        tracer.instant('level_up', level=2)
+        tracer.counter('entities', enemies=10, pickups=2)
+        worker = threading.Thread(target=lambda: tracer.instant('write'), name="SaveWriter")
+        worker.start()
+        worker.join()
+        tracer.stop()
+
+        path = tracer.write(str(tmp_path))
+        with open(path, encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+        by_name = {e["name"]: e for e in events}
+        respawn = by_name["respawn"]
+        assert respawn["ph"] == "X" and respawn["cat"] == "enemies"
+        assert respawn["dur"] >= 0 and respawn["args"] == {"spawned": 4}
+        assert by_name["level_up"]["ph"] == "i"
+        assert by_name["entities"]["args"] == {"enemies": 10, "pickups": 2}
+        # Поток записи — своя дорожка с именем
+        threads = {e["args"]["name"]: e["tid"] for e in events
+                   if e["name"] == "thread_name"}
+        assert by_name["write"]["tid"] == threads["SaveWriter"] != respawn["tid"]
+
+    def test_buffer_limit_drops_overflow(self):
+        tracer = Tracer(max_events=3)
+        tracer.start()
+        for i in range(5):
+            tracer.counter('n', value=i)
+        assert tracer.event_count == 3 and tracer.dropped == 2
+        assert tracer.to_chrome()["otherData"]["dropped"] == 2
+        tracer.stop()
+
+    def test_gc_collections_on_timeline(self):
+        tracer = Tracer()
+        tracer.start()
+        gc.collect()
+        tracer.stop()
+        assert tracer._on_gc not in gc.callbacks
+        collections = [e for e in tracer.to_chrome()["traceEvents"] if e["name"] == "gc"]
+        assert collections and collections[-1]["args"]["generation"] == 2
+
+
+def test_game_f4_writes_trace(tmp_path, monkeypatch):
+    from src.core.game import Game, TRACE_KEY
+    (tmp_path / "data").symlink_to(os.path.abspath("data"))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("ZELDA_TRACE", raising=False)
+    game = Game()
+    try:
+        game.start_new_game()
+        press = pygame.event.Event(pygame.KEYDOWN, key=TRACE_KEY)
+        game._handle_playing_key(press)
+        assert TRACER.recording
+        for _ in range(3):
+            game.update(1 / 60)
+            game.draw()
+            game._trace_counters()
+        assert game.trigger_autosave(reason="test")
+        game.save_system.wait_for_pending()
+        game._handle_playing_key(press)
+        assert not TRACER.recording and TRACER.event_count == 0
+
+        (path,) = glob.glob(os.path.join("logs", "trace_*.json"))
+        with open(path, encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+        names = {e["name"] for e in events}
+        assert {'autosave.capture', 'autosave.write', 'world.background',
+                'entities'} <= names
+        tids = {e["name"]: e["tid"] for e in events if e["ph"] == "X"}
+        assert tids['autosave.write'] != tids['autosave.capture']
+    finally:
+        TRACER.stop()
+        TRACER.clear()
+        game.save_system.shutdown()